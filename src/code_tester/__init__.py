@@ -1,11 +1,24 @@
 """Code Tester - Dynamic testing framework for Python code."""
 
-from .config import AppConfig, ExitCode
-from .logging import LogLevel
-from .execution import DynamicTester
-from .cli import run_from_cli
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
 from .__version__ import __version__
 
+if TYPE_CHECKING:
+    from .config import AppConfig, ExitCode
+    from .logging import LogLevel
+    from .execution import DynamicTester
+    from .cli import run_from_cli
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "DynamicTester": ".execution",
+    "AppConfig": ".config",
+    "ExitCode": ".config",
+    "LogLevel": ".logging",
+    "run_from_cli": ".cli",
+})
+
 __all__ = [
     "DynamicTester",
     "AppConfig", 
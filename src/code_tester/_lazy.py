@@ -0,0 +1,36 @@
+"""Deferred imports of package exports."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module ``__getattr__`` and ``__dir__`` functions importing exports on first access.
+
+    Keeps ``import code_tester.<package>`` cheap: the module defining an
+    export, and its heavy dependencies, are imported only when the export is
+    used. The value is then stored in the package namespace, so later
+    lookups do not go through ``__getattr__``.
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Exported names mapped to the relative name of the module defining them
+
+    Returns:
+        ``__getattr__`` and ``__dir__`` for the package module
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
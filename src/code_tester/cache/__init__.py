@@ -0,0 +1,16 @@
+"""Caching module for compiled solutions and test artifacts."""
+
+from .code_cache import CodeCache, get_code_cache
+from .result_cache import CachedCheck, CachedResult, ResultCache
+from .test_case_cache import LoadedTestCase, TestCaseCache, get_test_case_cache
+
+__all__ = [
+    "CodeCache",
+    "get_code_cache",
+    "CachedCheck",
+    "CachedResult",
+    "ResultCache",
+    "LoadedTestCase",
+    "TestCaseCache",
+    "get_test_case_cache",
+]
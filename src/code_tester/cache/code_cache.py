@@ -0,0 +1,169 @@
+"""Compiled code cache for solution modules."""
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import CodeType
+
+
+class CodeCache:
+    """Content-addressed cache of compiled solution code objects.
+
+    Solutions are compiled once per distinct source and path; every following
+    isolation block only executes the cached module body. An optional on-disk
+    store keeps marshalled code objects so that several worker processes
+    grading the same solution share a single compile.
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: Path | None = None):
+        """Initialize the code cache.
+
+        Args:
+            max_entries: Maximum number of code objects kept in memory
+            cache_dir: Optional directory for the shared on-disk marshal store
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self._max_entries = max_entries
+        self._cache_dir = cache_dir
+        self._entries: OrderedDict[str, CodeType] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Get the directory of the on-disk store, if enabled."""
+        return self._cache_dir
+
+    @staticmethod
+    def make_key(path: Path, source: bytes) -> str:
+        """Build the cache key for a solution source.
+
+        The path is part of the key because it is baked into the code object
+        and shows up in tracebacks reported to students.
+
+        Args:
+            path: Path of the solution file
+            source: Raw source bytes
+
+        Returns:
+            Hex digest identifying the compiled code
+        """
+        digest = hashlib.sha256(source)
+        digest.update(b"\0")
+        digest.update(str(path).encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def get_code(self, path: Path, source: bytes) -> CodeType:
+        """Get the compiled code object for a solution source.
+
+        Args:
+            path: Path of the solution file
+            source: Raw source bytes
+
+        Returns:
+            Compiled module code object
+
+        Raises:
+            SyntaxError: If the source cannot be compiled
+        """
+        key = self.make_key(path, source)
+
+        with self._lock:
+            code = self._entries.get(key)
+            if code is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return code
+
+        code = self._load_from_disk(key)
+        if code is None:
+            code = compile(source, str(path), "exec", dont_inherit=True)
+            self._store_on_disk(key, code)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = code
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return code
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.{sys.implementation.cache_tag}.marshal"
+
+    def _load_from_disk(self, key: str) -> CodeType | None:
+        if self._cache_dir is None:
+            return None
+
+        try:
+            data = self._disk_path(key).read_bytes()
+        except OSError:
+            return None
+
+        try:
+            code = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            return None
+
+        return code if isinstance(code, CodeType) else None
+
+    def _store_on_disk(self, key: str, code: CodeType) -> None:
+        if self._cache_dir is None:
+            return
+
+        # Write to a temporary file first so concurrent workers never observe
+        # a partially written entry.
+        tmp_name = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                marshal.dump(code, tmp_file)
+            os.replace(tmp_name, self._disk_path(key))
+        except OSError:
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+
+_shared_caches: dict[Path | None, CodeCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_code_cache(cache_dir: Path | None = None) -> CodeCache:
+    """Get the process-wide code cache for the given on-disk directory.
+
+    Args:
+        cache_dir: Optional directory for the on-disk store
+
+    Returns:
+        Shared CodeCache instance
+    """
+    key = cache_dir.resolve() if cache_dir is not None else None
+
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = CodeCache(cache_dir=key)
+            _shared_caches[key] = cache
+        return cache
@@ -0,0 +1,297 @@
+"""Persistent cache of test case results."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from ..__version__ import __version__
+from ..config import CheckConfig, TestCaseConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    passed INTEGER NOT NULL,
+    failed_checks TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS check_results (
+    key TEXT PRIMARY KEY,
+    passed INTEGER NOT NULL,
+    error_message TEXT,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+"""
+
+_TABLES = ("results", "check_results")
+
+
+@dataclass
+class CachedResult:
+    """Outcome of a completed test case run stored in the result cache."""
+
+    passed: bool
+    failed_checks: List[Tuple[int, Optional[str]]] = field(default_factory=list)
+
+
+@dataclass
+class CachedCheck:
+    """Outcome of a single check stored in the result cache."""
+
+    passed: bool
+    error_message: Optional[str] = None
+
+
+def canonical_json(value: BaseModel | Sequence[BaseModel]) -> str:
+    """Serialize configuration models to canonical JSON independent of key order and formatting."""
+    if isinstance(value, BaseModel):
+        data = value.model_dump(mode="json")
+    else:
+        data = [item.model_dump(mode="json") for item in value]
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def _input_files(checks: Iterable[CheckConfig]) -> List[str]:
+    """List the files checks read besides the solution: read file targets and reference images."""
+    paths = []
+    for check in checks:
+        perform = check.spec.perform
+        if perform.action == "read_file_content" and isinstance(perform.target, str):
+            paths.append(perform.target)
+        for name in type(check.spec.expect).model_fields:
+            expect = getattr(check.spec.expect, name)
+            for config in expect if isinstance(expect, list) else [expect]:
+                if config is not None and config.assertion.startswith("image_") and isinstance(config.value, str):
+                    paths.append(config.value)
+    return paths
+
+
+def _file_digest(path: str) -> str:
+    try:
+        with open(path, "rb") as file:
+            return hashlib.file_digest(file, "sha256").hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _digest(source: bytes, parts: Iterable[object]) -> str:
+    digest = hashlib.sha256(source)
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(str(part).encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed cache of test case results.
+
+    Whole runs are keyed by the solution source, the canonicalized test case,
+    the contents of the files its checks read, the framework version and the
+    options that change the outcome.
+    Single checks are keyed by their own configuration and the checks they
+    depend on, so editing one check invalidates only it and its dependents.
+    Each operation opens its own connection, so the cache can be shared
+    between threads and worker processes.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 10000, max_age: float | None = None):
+        """Initialize the result cache.
+
+        Args:
+            path: Path of the SQLite database file
+            max_entries: Maximum number of stored results, least recently used are evicted first
+            max_age: Maximum age of a result in seconds, None keeps results forever
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+
+        self._path = path
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> Path:
+        """Get the path of the database file."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=30)
+
+    @staticmethod
+    def make_key(solution_path: Path, source: bytes, test_case: TestCaseConfig, *options: object) -> str:
+        """Build the cache key of a run.
+
+        Contents of files the checks read, such as reference images, are part
+        of the key, so editing them invalidates the stored result.
+
+        Args:
+            solution_path: Path of the solution file, part of reported tracebacks
+            source: Raw solution source bytes
+            test_case: Parsed test case configuration
+            *options: Run options that influence the outcome
+
+        Returns:
+            Hex digest identifying the run
+        """
+        files = [f"{path}:{_file_digest(path)}" for path in _input_files(test_case.checks)]
+        return _digest(source, (solution_path, canonical_json(test_case), __version__, *files, *options))
+
+    @staticmethod
+    def make_check_key(
+        solution_path: Path,
+        source: bytes,
+        test_case: TestCaseConfig,
+        check: CheckConfig,
+        upstream: Sequence[CheckConfig],
+        *options: object,
+    ) -> str:
+        """Build the cache key of a single check.
+
+        Contents of files the checks read, such as reference images, are part
+        of the key, so editing them invalidates the stored result.
+
+        Args:
+            solution_path: Path of the solution file, part of reported tracebacks
+            source: Raw solution source bytes
+            test_case: Test case the check belongs to; only its type and setup actions are used
+            check: Check configuration
+            upstream: Checks the check depends on, in execution order
+            *options: Run options that influence the outcome
+
+        Returns:
+            Hex digest identifying the check result
+        """
+        parts = (
+            solution_path,
+            __version__,
+            test_case.test_type,
+            canonical_json(test_case.setup_actions),
+            canonical_json(check),
+            canonical_json(upstream),
+            *(f"{path}:{_file_digest(path)}" for path in _input_files([*upstream, check])),
+            *options,
+        )
+        return _digest(source, parts)
+
+    def get(self, key: str) -> CachedResult | None:
+        """Get a cached result.
+
+        Args:
+            key: Cache key built by ``make_key``
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT passed, failed_checks, created_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self._max_age is not None and now - row[2] > self._max_age:
+                connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+
+        self.hits += 1
+        failed_checks = [(check_id, message) for check_id, message in json.loads(row[1])]
+        return CachedResult(passed=bool(row[0]), failed_checks=failed_checks)
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store a result and evict entries beyond the size and age limits.
+
+        Args:
+            key: Cache key built by ``make_key``
+            result: Result to store
+        """
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, int(result.passed), json.dumps(result.failed_checks), now, now),
+            )
+            self._evict(connection, "results", now)
+
+    def get_checks(self, keys: Iterable[str]) -> Dict[str, CachedCheck]:
+        """Get cached results of single checks.
+
+        Args:
+            keys: Cache keys built by ``make_check_key``
+
+        Returns:
+            Cached results of the keys that are present and not expired
+        """
+        keys = list(keys)
+        now = time.time()
+        found: Dict[str, CachedCheck] = {}
+
+        with closing(self._connect()) as connection, connection:
+            for key in keys:
+                row = connection.execute(
+                    "SELECT passed, error_message, created_at FROM check_results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or (self._max_age is not None and now - row[2] > self._max_age):
+                    continue
+                found[key] = CachedCheck(passed=bool(row[0]), error_message=row[1])
+
+            connection.executemany(
+                "UPDATE check_results SET accessed_at = ? WHERE key = ?", ((now, key) for key in found)
+            )
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_checks(self, results: Dict[str, CachedCheck]) -> None:
+        """Store results of single checks and evict entries beyond the size and age limits.
+
+        Args:
+            results: Results keyed by cache keys built by ``make_check_key``
+        """
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO check_results VALUES (?, ?, ?, ?, ?)",
+                ((key, int(result.passed), result.error_message, now, now) for key, result in results.items()),
+            )
+            self._evict(connection, "check_results", now)
+
+    def _evict(self, connection: sqlite3.Connection, table: str, now: float) -> None:
+        if self._max_age is not None:
+            connection.execute(f"DELETE FROM {table} WHERE created_at < ?", (now - self._max_age,))
+        connection.execute(
+            f"DELETE FROM {table} WHERE key NOT IN "
+            f"(SELECT key FROM {table} ORDER BY accessed_at DESC LIMIT ?)",
+            (self._max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with closing(self._connect()) as connection, connection:
+            for table in _TABLES:
+                connection.execute(f"DELETE FROM {table}")
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
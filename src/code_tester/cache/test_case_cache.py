@@ -0,0 +1,209 @@
+"""Cache of parsed and validated test cases."""
+
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Tuple
+
+from ..__version__ import __version__
+from ..config import TestCaseConfig
+from ..utils.helpers import construct_pydantic_from_dict, create_pydantic_from_dict
+
+_STORE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class LoadedTestCase:
+    """A validated test case and the digest of the file content it was read from."""
+
+    config: TestCaseConfig
+    digest: str
+
+
+class TestCaseCache:
+    """Cache of validated test cases keyed by file content.
+
+    Reading a test case normally decodes the JSON and validates every model.
+    The cache keeps validated configurations in memory, keyed by the SHA-256
+    of the file content; a file whose path, modification time and size are
+    unchanged since it was last read is not even read again. An optional
+    on-disk store keeps the dumped models of previously validated content,
+    which are rebuilt without validation, so worker processes and later runs
+    validate each test case only once.
+    """
+
+    def __init__(self, max_entries: int = 64, cache_dir: Path | None = None):
+        """Initialize the test case cache.
+
+        Args:
+            max_entries: Maximum number of test cases kept in memory
+            cache_dir: Optional directory for the on-disk store of validated test cases
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self._max_entries = max_entries
+        self._cache_dir = cache_dir
+        self._entries: OrderedDict[str, TestCaseConfig] = OrderedDict()
+        self._file_digests: Dict[Path, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Get the directory of the on-disk store, if enabled."""
+        return self._cache_dir
+
+    @staticmethod
+    def make_key(source: bytes) -> str:
+        """Build the cache key of raw test case content."""
+        return hashlib.sha256(source).hexdigest()
+
+    def load(self, path: Path) -> LoadedTestCase:
+        """Get the validated test case stored in a file.
+
+        Args:
+            path: Path of the test case JSON file
+
+        Returns:
+            Validated test case with the digest of the file content
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+            pydantic.ValidationError: If the test case is invalid
+        """
+        resolved = path.resolve()
+        stat = resolved.stat()
+
+        with self._lock:
+            known = self._file_digests.get(resolved)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                config = self._entries.get(known[2])
+                if config is not None:
+                    self._entries.move_to_end(known[2])
+                    self.hits += 1
+                    return LoadedTestCase(config, known[2])
+
+        source = resolved.read_bytes()
+        loaded = self.get(source)
+        with self._lock:
+            self._file_digests[resolved] = (stat.st_mtime_ns, stat.st_size, loaded.digest)
+        return loaded
+
+    def get(self, source: bytes) -> LoadedTestCase:
+        """Get the validated test case of raw JSON content.
+
+        Args:
+            source: Raw test case file content
+
+        Returns:
+            Validated test case with the digest of the content
+
+        Raises:
+            json.JSONDecodeError: If the content is not valid JSON
+            pydantic.ValidationError: If the test case is invalid
+        """
+        key = self.make_key(source)
+
+        with self._lock:
+            config = self._entries.get(key)
+            if config is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return LoadedTestCase(config, key)
+
+        config = self._load_from_disk(key)
+        if config is None:
+            config = create_pydantic_from_dict(TestCaseConfig, json.loads(source.decode("utf-8")))
+            self._store_on_disk(key, config)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = config
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return LoadedTestCase(config, key)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._file_digests.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, key: str) -> Path:
+        # Validators may change between versions, so entries of other versions are never trusted.
+        return self._cache_dir / f"{key}.{__version__}.testcase"
+
+    def _load_from_disk(self, key: str) -> TestCaseConfig | None:
+        if self._cache_dir is None:
+            return None
+
+        try:
+            data = marshal.loads(self._disk_path(key).read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(data, tuple) or len(data) != 2 or data[0] != _STORE_FORMAT:
+            return None
+        try:
+            return construct_pydantic_from_dict(TestCaseConfig, data[1])
+        except (AttributeError, TypeError):
+            return None
+
+    def _store_on_disk(self, key: str, config: TestCaseConfig) -> None:
+        if self._cache_dir is None:
+            return
+
+        data = (_STORE_FORMAT, config.model_dump(exclude_unset=True))
+        tmp_name = None
+        try:
+            payload = marshal.dumps(data)
+            fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_name, self._disk_path(key))
+        except (OSError, ValueError):
+            # Values marshal cannot store are only cached in memory.
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+
+_shared_caches: dict[Path | None, TestCaseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_test_case_cache(cache_dir: Path | None = None) -> TestCaseCache:
+    """Get the process-wide test case cache for the given on-disk directory.
+
+    Args:
+        cache_dir: Optional directory for the on-disk store
+
+    Returns:
+        Shared TestCaseCache instance
+    """
+    key = cache_dir.resolve() if cache_dir is not None else None
+
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = TestCaseCache(cache_dir=key)
+            _shared_caches[key] = cache
+        return cache
@@ -1,9 +1,18 @@
 """CLI module for command line interface."""
 
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
 from .main import run_from_cli
-from .commands import app
+
+if TYPE_CHECKING:
+    from .commands import app
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "app": ".commands",
+})
 
 __all__ = [
     "run_from_cli",
     "app",
-]
\ No newline at end of file
+]
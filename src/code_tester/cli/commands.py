@@ -1,17 +1,21 @@
+import json
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich.console import Console as RichConsole
-from rich.panel import Panel
-from rich.text import Text
 
 from ..__version__ import __version__
-from ..config import AppConfig, ExitCode
-from ..execution import DynamicTester
+from ..config import BatchExecutor, ExitCode, IsolationMode, ParallelBackend
 from ..utils.exceptions import CodeTesterError
-from ..logging import LogConfig, LogLevel, setup_logger, Console, generate_trace_id, set_trace_id
+from ..logging import LogLevel
+
+if TYPE_CHECKING:
+    from rich.console import Console as RichConsole
+
+# Commands import rich, pydantic, loguru and the execution engine only when
+# they run, so --version, --help and validate start quickly.
 
 app = typer.Typer(
     name="code-tester",
@@ -19,15 +23,42 @@ app = typer.Typer(
     add_completion=False,
 )
 
-rich_console = RichConsole()
+
+@lru_cache(maxsize=None)
+def get_rich_console() -> "RichConsole":
+    """Get the rich console used for command output."""
+    from rich.console import Console as RichConsole
+
+    return RichConsole()
+
+
+def print_panel(message: str, **kwargs) -> None:
+    """Print a message in a rich panel; keyword arguments are passed to ``Panel``."""
+    from rich.panel import Panel
+
+    get_rich_console().print(Panel(message, **kwargs))
 
 
 def version_callback(value: bool):
     if value:
-        rich_console.print(f"[bold blue]code-tester[/bold blue] version [green]{__version__}[/green]")
+        get_rich_console().print(f"[bold blue]code-tester[/bold blue] version [green]{__version__}[/green]")
         raise typer.Exit()
 
 
+@app.callback()
+def main(
+    version: Optional[bool] = typer.Option(
+        None,
+        "--version",
+        "-v",
+        callback=version_callback,
+        is_eager=True,
+        help="Show version and exit",
+    ),
+):
+    """Dynamic testing framework for Python code using declarative JSON scenarios."""
+
+
 @app.command()
 def run(
     solution_path: Path = typer.Argument(
@@ -77,6 +108,70 @@ def run(
         "-x",
         help="Exit instantly on the first failed check",
     ),
+    isolation: IsolationMode = typer.Option(
+        IsolationMode.MODULE,
+        "--isolation",
+        help="Re-import the solution for every check (module) or once per run (session)",
+        case_sensitive=False,
+    ),
+    parallel_checks: int = typer.Option(
+        1,
+        "--parallel-checks",
+        "-p",
+        help="Number of workers running independent checks concurrently",
+        min=1,
+    ),
+    parallel_backend: ParallelBackend = typer.Option(
+        ParallelBackend.AUTO,
+        "--parallel-backend",
+        help="Run independent checks on threads, processes, or pick by test type (auto)",
+        case_sensitive=False,
+    ),
+    max_output_bytes: int = typer.Option(
+        10 * 1024 * 1024,
+        "--max-output-bytes",
+        help="Maximum captured bytes per output stream of an action (0 for no limit)",
+        min=0,
+    ),
+    code_cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--code-cache-dir",
+        help="Directory for compiled solution code shared between runs",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    test_case_cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--test-case-cache-dir",
+        help="Directory for validated test cases shared between runs",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    reference_store_dir: Optional[Path] = typer.Option(
+        None,
+        "--reference-store-dir",
+        help="Directory for decoded reference images shared between runs (defaults to the user cache)",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    stream_test_case: bool = typer.Option(
+        False,
+        "--stream",
+        help="Read checks one at a time while running; 'checks' must be the last field (for very large test cases)",
+    ),
+    result_cache: Optional[Path] = typer.Option(
+        None,
+        "--result-cache",
+        help="SQLite file caching results of unchanged solutions and test cases",
+        file_okay=True,
+        dir_okay=False,
+    ),
+    result_cache_max_age: Optional[float] = typer.Option(
+        None,
+        "--result-cache-max-age",
+        help="Discard cached results older than this many seconds",
+        min=1,
+    ),
     version: Optional[bool] = typer.Option(
         None,
         "--version",
@@ -87,6 +182,9 @@ def run(
     ),
 ):
     """Execute a Python solution against a dynamic test case."""
+    from ..config import AppConfig
+    from ..execution import DynamicTester
+    from ..logging import LogConfig, setup_logger, Console, generate_trace_id, set_trace_id
     
     log_config = LogConfig(
         level=log_level,
@@ -108,17 +206,27 @@ def run(
         is_quiet=quiet,
         exit_on_first_error=exit_on_first_error,
         max_messages=max_messages,
+        isolation_mode=isolation,
+        parallel_checks=parallel_checks,
+        parallel_backend=parallel_backend,
+        max_output_bytes=max_output_bytes,
+        code_cache_dir=code_cache_dir,
+        test_case_cache_dir=test_case_cache_dir,
+        reference_store_dir=reference_store_dir,
+        stream_test_case=stream_test_case,
+        result_cache_path=result_cache,
+        result_cache_max_age=result_cache_max_age,
     )
     console.print(f"Tester config: {config}", level=LogLevel.TRACE)
 
     try:
         if not quiet:
-            rich_console.print(Panel(
+            print_panel(
                 f"[bold]Testing:[/bold] {solution_path.name}\n"
                 f"[bold]Test Case:[/bold] {test_case_path.name}",
                 title="[bold blue]Code Tester[/bold blue]",
                 border_style="blue"
-            ))
+            )
 
         tester = DynamicTester(config, console)
 
@@ -128,45 +236,375 @@ def run(
 
         if all_passed:
             if not quiet:
-                rich_console.print(Panel(
+                print_panel(
                     "[bold green]✅ All tests passed![/bold green]",
                     border_style="green"
-                ))
+                )
             sys.exit(ExitCode.SUCCESS)
         else:
             failed_count = len(tester.failed_checks_ids)
             total_count = len(tester.test_case_config.checks) if tester.test_case_config else 0
             
             if not quiet:
-                rich_console.print(Panel(
+                print_panel(
                     f"[bold red]❌ Some tests failed[/bold red]\n"
                     f"Failed: {failed_count} of {total_count}",
                     border_style="red"
-                ))
+                )
             sys.exit(ExitCode.TESTS_FAILED)
 
     except CodeTesterError as e:
-        rich_console.print(Panel(
+        print_panel(
             f"[bold red]Framework Error:[/bold red] {e}",
             border_style="red"
-        ))
+        )
         sys.exit(ExitCode.TESTS_FAILED)
     except FileNotFoundError as e:
-        rich_console.print(Panel(
+        print_panel(
             f"[bold red]File Not Found:[/bold red] {e.filename}",
             border_style="red"
-        ))
+        )
         sys.exit(ExitCode.FILE_NOT_FOUND)
     except Exception as e:
-        rich_console.print(Panel(
+        print_panel(
             f"[bold red]Unexpected Error:[/bold red] {e.__class__.__name__}\n"
             f"See logs for detailed traceback.",
             border_style="red"
-        ))
+        )
         console.print(f"Exception details: {e}", level=LogLevel.CRITICAL, exc_info=True)
         sys.exit(ExitCode.UNEXPECTED_ERROR)
 
 
+@app.command()
+def batch(
+    solutions: str = typer.Argument(
+        ...,
+        help="Directory with Python solution files or a glob pattern matching them",
+    ),
+    test_case_paths: List[Path] = typer.Argument(
+        ...,
+        help="One or more JSON test case files to run against every solution",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        help="Number of worker processes (defaults to the number of CPUs)",
+        min=1,
+    ),
+    executor: BatchExecutor = typer.Option(
+        BatchExecutor.POOL,
+        "--executor",
+        help="Grade in a process pool or in children of a pre-warmed fork server",
+        case_sensitive=False,
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Print one JSON object per result instead of a summary line",
+    ),
+    exit_on_first_error: bool = typer.Option(
+        False,
+        "--exit-on-first-error",
+        "-x",
+        help="Stop each test case on its first failed check",
+    ),
+    isolation: IsolationMode = typer.Option(
+        IsolationMode.MODULE,
+        "--isolation",
+        help="Re-import the solution for every check (module) or once per run (session)",
+        case_sensitive=False,
+    ),
+    code_cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--code-cache-dir",
+        help="Directory for compiled solution code shared between workers",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    test_case_cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--test-case-cache-dir",
+        help="Directory for validated test cases shared between workers",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    reference_store_dir: Optional[Path] = typer.Option(
+        None,
+        "--reference-store-dir",
+        help="Directory for decoded reference images shared between workers (defaults to the user cache)",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    result_cache: Optional[Path] = typer.Option(
+        None,
+        "--result-cache",
+        help="SQLite file caching results of unchanged solutions and test cases",
+        file_okay=True,
+        dir_okay=False,
+    ),
+    result_cache_max_age: Optional[float] = typer.Option(
+        None,
+        "--result-cache-max-age",
+        help="Discard cached results older than this many seconds",
+        min=1,
+    ),
+):
+    """Grade many solutions against test cases across a process pool."""
+    from ..workers import BatchRunner, collect_solutions, read_test_types
+
+    solution_paths = collect_solutions(solutions)
+    if not solution_paths:
+        print_panel(
+            f"[bold red]No solutions found:[/bold red] {solutions}",
+            border_style="red"
+        )
+        sys.exit(ExitCode.FILE_NOT_FOUND)
+
+    runner = BatchRunner(
+        max_workers=workers,
+        executor=executor,
+        test_types=read_test_types(test_case_paths),
+    )
+    jobs = runner.make_jobs(
+        solution_paths,
+        test_case_paths,
+        exit_on_first_error=exit_on_first_error,
+        isolation_mode=isolation,
+        code_cache_dir=code_cache_dir,
+        test_case_cache_dir=test_case_cache_dir,
+        reference_store_dir=reference_store_dir,
+        result_cache_path=result_cache,
+        result_cache_max_age=result_cache_max_age,
+    )
+
+    passed_count = 0
+    for result in runner.run(jobs):
+        passed_count += result.passed
+
+        if json_output:
+            print(json.dumps(result.to_dict(), ensure_ascii=False), flush=True)
+            continue
+
+        status = "[green]✅ PASS[/green]" if result.passed else "[red]❌ FAIL[/red]"
+        detail = result.error or f"{result.total_checks - len(result.failed_check_ids)}/{result.total_checks} checks"
+        get_rich_console().print(
+            f"{status} {result.solution_path} × {Path(result.test_case_path).name} "
+            f"({detail}, {result.duration:.2f}s)"
+        )
+
+    if not json_output:
+        border_style = "green" if passed_count == len(jobs) else "red"
+        print_panel(
+            f"[bold]Passed:[/bold] {passed_count} of {len(jobs)}",
+            title="[bold blue]Batch Result[/bold blue]",
+            border_style=border_style
+        )
+
+    sys.exit(ExitCode.SUCCESS if passed_count == len(jobs) else ExitCode.TESTS_FAILED)
+
+
+@app.command()
+def serve(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        "-s",
+        help="Unix domain socket to listen on (defaults to a per-user socket in the temp directory)",
+        file_okay=True,
+        dir_okay=False,
+    ),
+    preload: List[str] = typer.Option(
+        [],
+        "--preload",
+        help="Test type whose dependencies are imported on start (repeatable)",
+    ),
+    log_level: LogLevel = typer.Option(
+        LogLevel.INFO,
+        "--log",
+        "-l",
+        help="Set the logging level",
+        case_sensitive=False,
+    ),
+    code_cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--code-cache-dir",
+        help="Directory for compiled solution code shared between jobs",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    reference_store_dir: Optional[Path] = typer.Option(
+        None,
+        "--reference-store-dir",
+        help="Directory for decoded reference images shared between jobs (defaults to the user cache)",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    result_cache: Optional[Path] = typer.Option(
+        None,
+        "--result-cache",
+        help="SQLite file caching results of unchanged solutions and test cases",
+        file_okay=True,
+        dir_okay=False,
+    ),
+    result_cache_max_age: Optional[float] = typer.Option(
+        None,
+        "--result-cache-max-age",
+        help="Discard cached results older than this many seconds",
+        min=1,
+    ),
+    job_timeout: float = typer.Option(
+        60.0,
+        "--job-timeout",
+        help="Kill a job that runs longer than this many seconds",
+        min=0.1,
+    ),
+    client_timeout: float = typer.Option(
+        30.0,
+        "--client-timeout",
+        help="Close connections that send no request for this many seconds",
+        min=0.1,
+    ),
+):
+    """Keep the framework loaded and grade jobs sent by `submit` over a Unix socket."""
+    import signal
+    from ..logging import LogConfig, setup_logger, Console
+    from ..workers import DEFAULT_SOCKET_PATH, GradingDaemon
+
+    logger = setup_logger(LogConfig(level=log_level, console_enabled=True))
+    console = Console(logger, use_rich=False)
+
+    daemon = GradingDaemon(
+        socket_path or DEFAULT_SOCKET_PATH,
+        test_types=preload,
+        console=console,
+        code_cache_dir=code_cache_dir,
+        reference_store_dir=reference_store_dir,
+        result_cache_path=result_cache,
+        result_cache_max_age=result_cache_max_age,
+        job_timeout=job_timeout,
+        client_timeout=client_timeout,
+    )
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except CodeTesterError as e:
+        print_panel(
+            f"[bold red]Framework Error:[/bold red] {e}",
+            border_style="red"
+        )
+        sys.exit(ExitCode.UNEXPECTED_ERROR)
+
+
+@app.command()
+def submit(
+    solution_path: Path = typer.Argument(
+        ...,
+        help="Path to the Python solution file to grade",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    test_case_path: Optional[Path] = typer.Argument(
+        None,
+        help="Path to the JSON file with the test case",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    test_case_json: Optional[str] = typer.Option(
+        None,
+        "--test-case-json",
+        help="Test case given inline as JSON instead of a file path",
+    ),
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        "-s",
+        help="Unix domain socket of the daemon (defaults to the per-user socket)",
+    ),
+    exit_on_first_error: bool = typer.Option(
+        False,
+        "--exit-on-first-error",
+        "-x",
+        help="Stop the test case on its first failed check",
+    ),
+    isolation: IsolationMode = typer.Option(
+        IsolationMode.MODULE,
+        "--isolation",
+        help="Re-import the solution for every check (module) or once per run (session)",
+        case_sensitive=False,
+    ),
+    timeout: Optional[float] = typer.Option(
+        None,
+        "--timeout",
+        help="Seconds to wait for the result",
+        min=0,
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Print the result as a JSON object instead of a summary",
+    ),
+):
+    """Grade a solution in a running `serve` daemon."""
+    from ..workers import DEFAULT_SOCKET_PATH, GradingJob, submit_job
+    from ..workers.job import INLINE_TEST_CASE_PATH
+
+    if (test_case_path is None) == (test_case_json is None):
+        print_panel(
+            "[bold red]Usage Error:[/bold red] pass either a test case path or --test-case-json",
+            border_style="red"
+        )
+        sys.exit(ExitCode.UNEXPECTED_ERROR)
+
+    try:
+        test_case_data = json.loads(test_case_json) if test_case_json is not None else None
+    except json.JSONDecodeError as e:
+        print_panel(
+            f"[bold red]Invalid JSON:[/bold red] {e}",
+            border_style="red"
+        )
+        sys.exit(ExitCode.JSON_ERROR)
+
+    job = GradingJob(
+        solution_path=solution_path,
+        test_case_path=test_case_path or INLINE_TEST_CASE_PATH,
+        exit_on_first_error=exit_on_first_error,
+        isolation_mode=isolation,
+        test_case_data=test_case_data,
+    )
+
+    try:
+        result = submit_job(socket_path or DEFAULT_SOCKET_PATH, job, timeout=timeout)
+    except CodeTesterError as e:
+        print_panel(
+            f"[bold red]Framework Error:[/bold red] {e}",
+            border_style="red"
+        )
+        sys.exit(ExitCode.UNEXPECTED_ERROR)
+
+    if json_output:
+        print(json.dumps(result.to_dict(), ensure_ascii=False), flush=True)
+    else:
+        status = "[green]✅ PASS[/green]" if result.passed else "[red]❌ FAIL[/red]"
+        detail = result.error or f"{result.total_checks - len(result.failed_check_ids)}/{result.total_checks} checks"
+        get_rich_console().print(f"{status} {result.solution_path} ({detail}, {result.duration:.2f}s)")
+        for message in result.messages:
+            get_rich_console().print(f"  {message}")
+
+    sys.exit(ExitCode.SUCCESS if result.passed else ExitCode.TESTS_FAILED)
+
+
 @app.command()
 def validate(
     test_case_path: Path = typer.Argument(
@@ -184,12 +622,12 @@ def validate(
         from ..utils import create_dataclass_from_dict
         from ..config import TestCaseConfig
         
-        rich_console.print(f"[blue]Validating:[/blue] {test_case_path}")
+        get_rich_console().print(f"[blue]Validating:[/blue] {test_case_path}")
         
         raw_data = json.loads(test_case_path.read_text("utf-8"))
         test_config = create_dataclass_from_dict(TestCaseConfig, raw_data)
         
-        rich_console.print(Panel(
+        print_panel(
             f"[bold green]✅ Valid test case![/bold green]\n"
             f"[bold]Test ID:[/bold] {test_config.test_id}\n"
             f"[bold]Test Name:[/bold] {test_config.test_name}\n"
@@ -197,19 +635,19 @@ def validate(
             f"[bold]Checks:[/bold] {len(test_config.checks)}",
             title="[bold blue]Validation Result[/bold blue]",
             border_style="green"
-        ))
+        )
         
     except json.JSONDecodeError as e:
-        rich_console.print(Panel(
+        print_panel(
             f"[bold red]Invalid JSON:[/bold red] {e}",
             border_style="red"
-        ))
+        )
         sys.exit(ExitCode.JSON_ERROR)
     except Exception as e:
-        rich_console.print(Panel(
+        print_panel(
             f"[bold red]Validation Error:[/bold red] {e}",
             border_style="red"
-        ))
+        )
         sys.exit(ExitCode.JSON_ERROR)
 
 
@@ -227,7 +665,7 @@ def init(
     project_path = output_dir / project_name
     
     if project_path.exists():
-        rich_console.print(f"[red]Error:[/red] Directory {project_path} already exists")
+        get_rich_console().print(f"[red]Error:[/red] Directory {project_path} already exists")
         sys.exit(1)
     
     try:
@@ -295,7 +733,7 @@ code-tester validate test_cases/sample_test.json
 '''
         (project_path / "README.md").write_text(readme_content)
         
-        rich_console.print(Panel(
+        print_panel(
             f"[bold green]✅ Project initialized![/bold green]\n"
             f"[bold]Location:[/bold] {project_path}\n"
             f"[bold]Files created:[/bold]\n"
@@ -304,15 +742,15 @@ code-tester validate test_cases/sample_test.json
             f"  • README.md",
             title=f"[bold blue]{project_name}[/bold blue]",
             border_style="green"
-        ))
+        )
         
-        rich_console.print(f"\n[blue]Next steps:[/blue]")
-        rich_console.print(f"  cd {project_name}")
-        rich_console.print(f"  code-tester run solutions/sample_solution.py test_cases/sample_test.json")
+        get_rich_console().print(f"\n[blue]Next steps:[/blue]")
+        get_rich_console().print(f"  cd {project_name}")
+        get_rich_console().print(f"  code-tester run solutions/sample_solution.py test_cases/sample_test.json")
         
     except Exception as e:
-        rich_console.print(Panel(
+        print_panel(
             f"[bold red]Error creating project:[/bold red] {e}",
             border_style="red"
-        ))
+        )
         sys.exit(1)
\ No newline at end of file
@@ -1,8 +1,19 @@
 """Main CLI interface for the code tester."""
 
-from .commands import app
+import sys
+
+from ..__version__ import __version__
+
+VERSION_FLAGS = ("--version", "-v")
 
 
 def run_from_cli() -> None:
     """Main CLI entry point."""
-    app()
\ No newline at end of file
+    # Answer a bare version query before importing typer and the commands.
+    if len(sys.argv) == 2 and sys.argv[1] in VERSION_FLAGS:
+        print(f"code-tester version {__version__}")
+        return
+
+    from .commands import app
+
+    app()
@@ -1,14 +1,42 @@
-from .app import AppConfig
-from .test_case import TestCaseConfig, CheckConfig, CheckSpec, Expectation, SetupActionConfig
-from .actions import PerformConfig
-from .assertions import ExpectConfig
-from .mocks import MockConfig
-from .enums import ExitCode
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+from .enums import BatchExecutor, ExitCode, IsolationMode, ParallelBackend
 from ..logging import LogLevel
 
+if TYPE_CHECKING:
+    from .app import AppConfig
+    from .test_case import (
+        TestCaseConfig, TestCaseHeader, CheckConfig, CheckSpec, Expectation, ParametrizeRow, SetupActionConfig
+    )
+    from .streaming import StreamedTestCase, load_streamed_test_case
+    from .actions import PerformConfig
+    from .assertions import ExpectConfig
+    from .mocks import MockConfig
+
+# The pydantic models are imported on first use, the enums are cheap.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AppConfig": ".app",
+    "TestCaseConfig": ".test_case",
+    "TestCaseHeader": ".test_case",
+    "CheckConfig": ".test_case",
+    "CheckSpec": ".test_case",
+    "Expectation": ".test_case",
+    "SetupActionConfig": ".test_case",
+    "ParametrizeRow": ".test_case",
+    "PerformConfig": ".actions",
+    "ExpectConfig": ".assertions",
+    "MockConfig": ".mocks",
+    "StreamedTestCase": ".streaming",
+    "load_streamed_test_case": ".streaming",
+})
+
 __all__ = [
     "AppConfig",
     "TestCaseConfig",
+    "TestCaseHeader",
+    "StreamedTestCase",
+    "load_streamed_test_case",
     "CheckConfig", 
     "CheckSpec",
     "Expectation",
@@ -16,6 +44,10 @@ __all__ = [
     "ExpectConfig",
     "MockConfig",
     "ExitCode",
+    "BatchExecutor",
+    "IsolationMode",
+    "ParallelBackend",
     "SetupActionConfig",
+    "ParametrizeRow",
     "LogLevel",
-]
\ No newline at end of file
+]
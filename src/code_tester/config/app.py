@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 from ..logging import LogLevel
+from .enums import IsolationMode, ParallelBackend
 
 
 class AppConfig(BaseModel):
@@ -13,6 +14,24 @@ class AppConfig(BaseModel):
     is_quiet: bool = Field(False, description="Suppress all stdout output")
     exit_on_first_error: bool = Field(False, description="Exit instantly on the first failed check")
     max_messages: int = Field(0, description="Maximum number of failed check messages to display (0 for no limit)")
+    isolation_mode: IsolationMode = Field(
+        IsolationMode.MODULE, description="How solution modules are isolated between checks"
+    )
+    parallel_checks: int = Field(1, description="Number of workers running independent checks (1 runs sequentially)")
+    parallel_backend: ParallelBackend = Field(ParallelBackend.AUTO, description="Worker type for parallel checks")
+    max_output_bytes: int = Field(
+        10 * 1024 * 1024, description="Maximum captured bytes per output stream of an action (0 for no limit)"
+    )
+    code_cache_dir: Optional[Path] = Field(None, description="Directory for the shared compiled code cache")
+    test_case_cache_dir: Optional[Path] = Field(None, description="Directory for the shared validated test case cache")
+    reference_store_dir: Optional[Path] = Field(
+        None, description="Directory for the shared store of decoded reference images, the user cache by default"
+    )
+    stream_test_case: bool = Field(False, description="Read checks from the test case file one at a time while running")
+    result_cache_path: Optional[Path] = Field(None, description="SQLite file caching results of unchanged runs")
+    result_cache_max_entries: int = Field(10000, description="Maximum number of cached results")
+    result_cache_max_age: Optional[float] = Field(None, description="Maximum age of cached results in seconds")
+    plugin_manifest_path: Optional[Path] = Field(None, description="Plugin manifest file, the user cache by default")
     
     @field_validator('solution_path', 'test_case_path')
     @classmethod
@@ -31,6 +50,34 @@ class AppConfig(BaseModel):
             raise ValueError("max_messages must be non-negative")
         return v
     
+    @field_validator('max_output_bytes')
+    @classmethod
+    def validate_max_output_bytes(cls, v):
+        if v < 0:
+            raise ValueError("max_output_bytes must be non-negative")
+        return v
+    
+    @field_validator('result_cache_max_entries')
+    @classmethod
+    def validate_result_cache_max_entries(cls, v):
+        if v < 1:
+            raise ValueError("result_cache_max_entries must be at least 1")
+        return v
+    
+    @field_validator('result_cache_max_age')
+    @classmethod
+    def validate_result_cache_max_age(cls, v):
+        if v is not None and v <= 0:
+            raise ValueError("result_cache_max_age must be positive")
+        return v
+    
+    @field_validator('parallel_checks')
+    @classmethod
+    def validate_parallel_checks(cls, v):
+        if v < 1:
+            raise ValueError("parallel_checks must be at least 1")
+        return v
+    
     model_config = ConfigDict(
         use_enum_values=True,
         validate_assignment=True
@@ -8,6 +8,9 @@ class ExpectConfig(BaseModel):
     value: Optional[Any] = Field(None, description="Expected value for the assertion")
     target_mock: Optional[str] = Field(None, description="Target mock for mock assertions")
     tolerance: Optional[float] = Field(None, description="Tolerance for numeric comparisons")
+    rtol: Optional[float] = Field(None, description="Relative tolerance for array comparisons")
+    threshold: Optional[float] = Field(None, description="Minimum similarity score for image comparisons")
+    stream: bool = Field(False, description="Match stdout/stderr while it is written instead of after the action")
     
     @field_validator('assertion')
     @classmethod
@@ -16,7 +19,7 @@ class ExpectConfig(BaseModel):
             raise ValueError("Assertion name cannot be empty")
         return v.strip()
     
-    @field_validator('tolerance')
+    @field_validator('tolerance', 'rtol', 'threshold')
     @classmethod
     def validate_tolerance(cls, v):
         if v is not None and v < 0:
@@ -1,4 +1,4 @@
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 
 
 class ExitCode(IntEnum):
@@ -6,4 +6,35 @@ class ExitCode(IntEnum):
     TESTS_FAILED = 1
     FILE_NOT_FOUND = 2
     JSON_ERROR = 3
-    UNEXPECTED_ERROR = 10
\ No newline at end of file
+    UNEXPECTED_ERROR = 10
+
+
+class IsolationMode(StrEnum):
+    """How solution modules are isolated between checks.
+
+    MODULE re-executes the solution for every isolation block. SESSION imports
+    it once per run and restores a snapshot of the module globals before each
+    block; class-level state and import-time output are not replayed.
+    """
+
+    MODULE = "module"
+    SESSION = "session"
+
+
+class BatchExecutor(StrEnum):
+    """Process model used to grade a batch of solutions."""
+
+    POOL = "pool"
+    FORK = "fork"
+
+
+class ParallelBackend(StrEnum):
+    """Worker type used to run independent checks concurrently.
+
+    AUTO picks threads for I/O-bound test types (api, flask) and processes
+    for CPU-bound ones.
+    """
+
+    AUTO = "auto"
+    THREAD = "thread"
+    PROCESS = "process"
@@ -0,0 +1,241 @@
+"""Incremental reading of test case files with very many checks."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, TextIO, Tuple
+
+from ..utils.exceptions import TestCaseParsingError
+from .test_case import CheckConfig, TestCaseHeader
+
+_CHUNK_SIZE = 1 << 16
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters a number cut at the end of a chunk may continue with.
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+_NO_ITEM = object()
+
+
+class _JsonScanner:
+    """Reads the top-level structure of a JSON document from a text stream.
+
+    Values are decoded one at a time with ``JSONDecoder.raw_decode``, so only
+    the value being decoded and the rest of the current chunk are in memory.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = _CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self, min_size: int = 0) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(max(self._chunk_size, min_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and get the next character, an empty string at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                return ""
+
+    def consume(self, expected: str) -> None:
+        """Skip the next character, which must be ``expected``."""
+        if self.peek() != expected:
+            raise json.JSONDecodeError(f"Expecting '{expected}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may continue in the next chunk; read at least as much again to stay linear.
+                if self._read_more(len(self._buffer) - self._pos):
+                    continue
+                raise
+            # A number cut at the end of the buffer decodes as a shorter number.
+            if _NUMBER_TAIL.match(self._buffer, end) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def array_items(self) -> Iterator[Any]:
+        """Decode the items of the next array one at a time."""
+        self.consume("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.consume("]")
+            return
+
+    def members(self, streamed_key: str) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the members of the next object.
+
+        The value of ``streamed_key`` is an iterator over its items if it is an
+        array; it must be exhausted before the next member is requested.
+        """
+        self.consume("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+            self.consume(":")
+            if key == streamed_key and self.peek() == "[":
+                yield key, self.array_items()
+            else:
+                yield key, self.value()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.consume("}")
+            return
+
+    def expect_end(self) -> None:
+        """Ensure nothing but whitespace follows."""
+        if self.peek():
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+
+
+class StreamedChecks:
+    """Checks of a test case file, read and validated one at a time on every iteration."""
+
+    def __init__(self, path: Path, count: int | None = None):
+        """Initialize the checks.
+
+        Args:
+            path: Path of the test case JSON file
+            count: Number of checks in the file, counted on the first complete iteration if omitted
+        """
+        self._path = path
+        self._count = count
+
+    @property
+    def count(self) -> int | None:
+        """Get the number of checks if an iteration has completed, without reading the file."""
+        return self._count
+
+    def __len__(self) -> int:
+        """Get the number of checks, reading through the file if no iteration has completed yet."""
+        if self._count is None:
+            for _ in self._raw_checks():
+                pass
+        return self._count
+
+    def __iter__(self) -> Iterator[CheckConfig]:
+        """Yield validated checks in file order.
+
+        Raises:
+            TestCaseParsingError: If a check is invalid or reuses the ID of an earlier check
+        """
+        check_ids = set()
+        for index, raw_check in enumerate(self._raw_checks()):
+            try:
+                check = CheckConfig.model_validate(raw_check)
+            except ValueError as e:
+                raise TestCaseParsingError(f"Invalid check #{index + 1}: {e}", path=self._path) from e
+            if check.check_id in check_ids:
+                raise TestCaseParsingError(f"Duplicate check ID: {check.check_id}", path=self._path)
+            check_ids.add(check.check_id)
+            yield check
+
+    def _raw_checks(self) -> Iterator[Any]:
+        count = 0
+        with open(self._path, encoding="utf-8") as stream:
+            members = _JsonScanner(stream).members("checks")
+            for key, value in members:
+                if key != "checks":
+                    continue
+                for raw_check in value:
+                    count += 1
+                    yield raw_check
+                break
+            # The header was read up to the checks, so fields after them would be silently ignored.
+            for key, _ in members:
+                raise TestCaseParsingError(
+                    f"'checks' must be the last field of a streamed test case, found '{key}' after it", path=self._path
+                )
+        self._count = count
+
+
+class StreamedTestCase:
+    """Test case whose checks are read from its file while they run.
+
+    Exposes the attributes of ``TestCaseConfig``; ``checks`` reads the file
+    again on every iteration, so only one check at a time is held in memory.
+    """
+
+    def __init__(self, header: TestCaseHeader, checks: StreamedChecks):
+        """Initialize the test case.
+
+        Args:
+            header: Validated test case fields other than the checks
+            checks: Checks read from the file on iteration
+        """
+        self.header = header
+        self.checks = checks
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a field of the header."""
+        if name == "header":
+            raise AttributeError(name)
+        return getattr(self.header, name)
+
+
+def load_streamed_test_case(path: Path) -> StreamedTestCase:
+    """Read the header of a test case file, which ends at its checks.
+
+    Only the fields before ``checks`` and its first check are read, so
+    checks can start running without a pass over the file; they are
+    validated, and counted, when they are iterated. The checks must be the
+    last field of the file.
+
+    Args:
+        path: Path of the test case JSON file
+
+    Returns:
+        Test case whose checks are read on iteration
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the header is not valid JSON
+        pydantic.ValidationError: If a field other than the checks is invalid
+        TestCaseParsingError: If the test case has no list of checks or no check
+    """
+    header: Dict[str, Any] = {}
+
+    with open(path, encoding="utf-8") as stream:
+        for key, value in _JsonScanner(stream).members("checks"):
+            if key != "checks":
+                header[key] = value
+                continue
+            if not isinstance(value, Iterator):
+                raise TestCaseParsingError("'checks' must be a list", path=path)
+            if next(value, _NO_ITEM) is _NO_ITEM:
+                raise TestCaseParsingError("At least one check is required", path=path)
+            break
+        else:
+            raise TestCaseParsingError("At least one check is required", path=path)
+
+    return StreamedTestCase(TestCaseHeader.model_validate(header), StreamedChecks(path))
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 
 from .actions import PerformConfig
 from .assertions import ExpectConfig
@@ -11,7 +11,7 @@ class Expectation(BaseModel):
     return_value: Optional[ExpectConfig] = Field(None, description="Expected return value")
     stdout: Optional[ExpectConfig] = Field(None, description="Expected stdout output")
     stderr: Optional[ExpectConfig] = Field(None, description="Expected stderr output")
-    image: Optional[ExpectConfig] = Field(None, description="Expected image output (for arcade)")
+    image: Optional[ExpectConfig] = Field(None, description="Expected screenshot (for arcade)")
     http_response: Optional[ExpectConfig] = Field(None, description="Expected HTTP response (for flask)")
     mock_calls: Optional[List[ExpectConfig]] = Field(None, description="Expected mock calls (for api)")
     
@@ -27,10 +27,38 @@ class Expectation(BaseModel):
     )
 
 
+class ParametrizeRow(BaseModel):
+    args: List[Any] = Field(default_factory=list, description="Positional arguments replacing those of the action")
+    kwargs: Dict[str, Any] = Field(default_factory=dict, description="Keyword arguments added to those of the action")
+    expected: Any = Field(None, description="Expected return value of this row, the check's value if omitted")
+    id: Optional[str] = Field(None, description="Label of the row in error messages")
+    
+    model_config = ConfigDict(
+        validate_assignment=True
+    )
+
+
 class CheckSpec(BaseModel):
     perform: PerformConfig = Field(..., description="Action to perform")
     expect: Expectation = Field(..., description="Expected results")
     mocks: List[MockConfig] = Field(default_factory=list, description="Mock configurations")
+    parametrize: Optional[List[ParametrizeRow]] = Field(
+        None, description="Rows of arguments and expected values checked in one isolation block"
+    )
+    
+    @model_validator(mode='after')
+    def validate_parametrize(self):
+        if self.parametrize is None:
+            return self
+        if not self.parametrize:
+            raise ValueError("Parametrize rows cannot be empty if provided")
+        if self.perform.save_as:
+            raise ValueError("save_as cannot be used with parametrize")
+        if any(expect and expect.stream for expect in (self.expect.stdout, self.expect.stderr)):
+            raise ValueError("Streamed output cannot be used with parametrize")
+        if self.expect.return_value is None and any("expected" in row.model_fields_set for row in self.parametrize):
+            raise ValueError("Rows with 'expected' require a return_value expectation")
+        return self
     
     model_config = ConfigDict(
         validate_assignment=True
@@ -81,12 +109,11 @@ class SetupActionConfig(BaseModel):
     )
 
 
-class TestCaseConfig(BaseModel):
+class TestCaseHeader(BaseModel):
     test_id: int = Field(..., description="Unique test case ID")
     test_name: str = Field(..., description="Human-readable test name")
     description: str = Field(..., description="Test description")
     test_type: str = Field(..., description="Type of test (py_general, api, flask, arcade)")
-    checks: List[CheckConfig] = Field(..., description="List of checks to perform")
     setup_actions: List[SetupActionConfig] = Field(default_factory=list, description="Setup actions")
     teardown_actions: List[SetupActionConfig] = Field(default_factory=list, description="Teardown actions")
     
@@ -112,6 +139,14 @@ class TestCaseConfig(BaseModel):
             raise ValueError(f"Test type must be one of: {valid_types}")
         return v
     
+    model_config = ConfigDict(
+        validate_assignment=True
+    )
+
+
+class TestCaseConfig(TestCaseHeader):
+    checks: List[CheckConfig] = Field(..., description="List of checks to perform")
+    
     @field_validator('checks')
     @classmethod
     def validate_checks(cls, v):
@@ -124,7 +159,3 @@ class TestCaseConfig(BaseModel):
             raise ValueError("Check IDs must be unique")
         
         return v
-    
-    model_config = ConfigDict(
-        validate_assignment=True
-    )
\ No newline at end of file
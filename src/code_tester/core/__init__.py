@@ -4,6 +4,7 @@
 Этот пакет содержит основные компоненты новой архитектуры:
 - DependencyContainer: IoC контейнер для управления зависимостями
 - PluginManager: система управления плагинами
+- PluginManifest: обнаружение плагинов через entry points
 - ValidationService: валидация конфигураций
 - TestSession: изолированное выполнение тестов
 """
@@ -22,6 +23,13 @@ from .plugins import (
     PluginRegistry,
     plugin_provider,
 )
+from .discovery import (
+    ENTRY_POINT_GROUP,
+    ManifestEntry,
+    PluginManifest,
+    create_plugin_manager,
+    load_provider,
+)
 
 __all__ = [
     "DependencyContainer",
@@ -34,4 +42,9 @@ __all__ = [
     "PluginManager",
     "PluginRegistry",
     "plugin_provider",
+    "ENTRY_POINT_GROUP",
+    "ManifestEntry",
+    "PluginManifest",
+    "create_plugin_manager",
+    "load_provider",
 ]
\ No newline at end of file
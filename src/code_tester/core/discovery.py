@@ -0,0 +1,235 @@
+"""Discovery of plugin providers through package entry points.
+
+Installed distributions expose providers in the ``code_tester.plugins``
+entry point group. Importing a provider is the only way to read its
+metadata, so the metadata of all providers is summarized once into an
+on-disk manifest. Later processes read the manifest and import a provider
+only when a test case of one of its test types is run.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..__version__ import __version__
+from ..utils.exceptions import PluginError
+from .container import DependencyContainer
+from .plugins import ComponentMetadata, ComponentProvider, PluginManager, PluginRegistry
+
+ENTRY_POINT_GROUP = "code_tester.plugins"
+MANIFEST_FORMAT = 1
+
+# Providers shipped with the framework; they are available even when the package metadata is stale.
+BUILTIN_PLUGINS: Dict[str, str] = {
+    "core_actions": "code_tester.plugins.core_actions:CoreActionsProvider",
+    "core_assertions": "code_tester.plugins.core_assertions:CoreAssertionsProvider",
+    "numeric_assertions": "code_tester.plugins.numeric_assertions:NumericAssertionsProvider",
+    "image_assertions": "code_tester.plugins.image_assertions:ImageAssertionsProvider",
+    "arcade_actions": "code_tester.plugins.arcade_actions:ArcadeActionsProvider",
+    "arcade_assertions": "code_tester.plugins.arcade_assertions:ArcadeAssertionsProvider",
+}
+
+
+def default_manifest_path() -> Path:
+    """Get the manifest location in the user cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "code-tester" / "plugin_manifest.json"
+
+
+def load_provider(target: str) -> ComponentProvider:
+    """Import a provider from an entry point value.
+
+    Args:
+        target: ``module:attribute`` path of a provider class or instance
+
+    Returns:
+        Provider instance; classes decorated with ``@plugin_provider`` get
+        the metadata given to the decorator
+
+    Raises:
+        PluginError: If the target cannot be imported or is not a provider
+    """
+    module_name, _, attribute = target.partition(":")
+    try:
+        value = importlib.import_module(module_name)
+        for part in filter(None, attribute.split(".")):
+            value = getattr(value, part)
+    except (ImportError, AttributeError) as e:
+        raise PluginError(f"Cannot import plugin provider '{target}': {e}") from e
+
+    if isinstance(value, ComponentProvider):
+        return value
+    if isinstance(value, type) and issubclass(value, ComponentProvider):
+        return value.__dict__.get("_provider_class", value)()
+    raise PluginError(f"'{target}' is not a plugin provider")
+
+
+def _module_stamp(target: str) -> str:
+    """Get the modification time and size of the source of a provider module without importing it."""
+    try:
+        spec = importlib.util.find_spec(target.partition(":")[0])
+        stat = os.stat(spec.origin)
+    except (ImportError, AttributeError, TypeError, ValueError, OSError):
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _declared_targets() -> Dict[str, Tuple[str, str]]:
+    """Get provider targets and the distribution declaring them, keyed by plugin entry name."""
+    # The version of a development checkout does not change with its code, so edits of builtin providers
+    # are detected from their source files.
+    targets = {
+        name: (target, f"code-tester {__version__} {_module_stamp(target)}") for name, target in BUILTIN_PLUGINS.items()
+    }
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in targets:
+            continue
+        dist = getattr(entry_point, "dist", None)
+        origin = f"{dist.name} {dist.version}" if dist is not None else ""
+        targets[entry_point.name] = (entry_point.value, origin)
+    return targets
+
+
+def _fingerprint(targets: Dict[str, Tuple[str, str]]) -> str:
+    payload = json.dumps([MANIFEST_FORMAT, sorted(targets.items())], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Metadata of a discovered provider and where to import it from."""
+
+    name: str
+    version: str
+    test_types: List[str]
+    entry_point: str
+    dependencies: List[str] = field(default_factory=list)
+
+    @property
+    def metadata(self) -> ComponentMetadata:
+        """Get the component metadata of the provider."""
+        return ComponentMetadata(self.name, self.version, list(self.test_types), list(self.dependencies))
+
+
+class PluginManifest:
+    """Summary of all discoverable providers."""
+
+    def __init__(self, entries: List[ManifestEntry], fingerprint: str = "", errors: Optional[Dict[str, str]] = None):
+        """Initialize the manifest.
+
+        Args:
+            entries: Discovered providers
+            fingerprint: Hash of the declared entry points the manifest was built from
+            errors: Import errors of providers left out, keyed by entry point value
+        """
+        self._entries = {entry.name: entry for entry in entries}
+        self.fingerprint = fingerprint
+        self.errors = errors or {}
+
+    @property
+    def entries(self) -> List[ManifestEntry]:
+        """Get all discovered providers."""
+        return list(self._entries.values())
+
+    def get(self, name: str) -> ManifestEntry | None:
+        """Get a provider by plugin name."""
+        return self._entries.get(name)
+
+    def for_test_type(self, test_type: str) -> List[ManifestEntry]:
+        """Get the providers serving a test type."""
+        return [entry for entry in self._entries.values() if test_type in entry.test_types]
+
+    @classmethod
+    def discover(cls) -> "PluginManifest":
+        """Build the manifest by importing every declared provider.
+
+        Providers that fail to import, e.g. because an optional dependency is
+        missing, are left out and reported in ``errors``.
+        """
+        targets = _declared_targets()
+        entries: List[ManifestEntry] = []
+        errors: Dict[str, str] = {}
+
+        for target, _ in targets.values():
+            try:
+                metadata = load_provider(target).metadata
+            except Exception as e:
+                errors[target] = f"{e.__class__.__name__}: {e}"
+                continue
+            entries.append(ManifestEntry(
+                name=metadata.name,
+                version=metadata.version,
+                test_types=list(metadata.test_types),
+                entry_point=target,
+                dependencies=list(metadata.dependencies),
+            ))
+
+        return cls(entries, _fingerprint(targets), errors)
+
+    @classmethod
+    def load(cls, path: Path | None = None, refresh: bool = False) -> "PluginManifest":
+        """Read the manifest from disk, rebuilding it when the declared entry points changed.
+
+        Reading entry points only parses distribution metadata; providers are
+        imported only when the manifest is rebuilt. A manifest that cannot be
+        written is still returned.
+
+        Args:
+            path: Manifest file, the user cache location by default
+            refresh: Rebuild even if the stored manifest is current
+        """
+        path = path or default_manifest_path()
+        fingerprint = _fingerprint(_declared_targets())
+
+        if not refresh:
+            try:
+                data = json.loads(path.read_text("utf-8"))
+                if data.get("format") == MANIFEST_FORMAT and data.get("fingerprint") == fingerprint:
+                    return cls([ManifestEntry(**entry) for entry in data["plugins"]], fingerprint)
+            except (OSError, ValueError, TypeError, KeyError):
+                pass
+
+        manifest = cls.discover()
+        try:
+            manifest.save(path)
+        except OSError:
+            pass
+        return manifest
+
+    def save(self, path: Path) -> None:
+        """Write the manifest atomically."""
+        data = {
+            "format": MANIFEST_FORMAT,
+            "fingerprint": self.fingerprint,
+            "plugins": [asdict(entry) for entry in self._entries.values()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(data, indent=2), "utf-8")
+        os.replace(temporary, path)
+
+
+def create_plugin_manager(manifest_path: Path | None = None) -> PluginManager:
+    """Create a plugin manager that loads providers per test type.
+
+    Providers that are already imported, e.g. through ``@plugin_provider``,
+    are registered right away; the others are imported from the manifest by
+    ``PluginManager.load_plugins_for_test_type``.
+
+    Args:
+        manifest_path: Manifest file, the user cache location by default
+    """
+    plugin_manager = PluginManager(DependencyContainer(), PluginManifest.load(manifest_path))
+    registered = set()
+    for provider in PluginRegistry().get_all_providers():
+        # A re-imported plugin module registers its provider again; the first one wins.
+        if provider.metadata.name not in registered:
+            plugin_manager.register_plugin(provider)
+            registered.add(provider.metadata.name)
+    return plugin_manager
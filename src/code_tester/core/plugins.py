@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 
 from .container import DependencyContainer
 from ..utils.exceptions import PluginError
 
+if TYPE_CHECKING:
+    from .discovery import PluginManifest
+
 
 @dataclass
 class ComponentMetadata:
@@ -35,11 +38,16 @@ class PluginDescriptor:
 
 
 class PluginManager:
-    def __init__(self, container: DependencyContainer):
+    def __init__(self, container: DependencyContainer, manifest: Optional['PluginManifest'] = None):
         self._container = container
+        self._manifest = manifest
         self._plugins: Dict[str, PluginDescriptor] = {}
         self._loaded_order: List[str] = []
     
+    @property
+    def container(self) -> DependencyContainer:
+        return self._container
+    
     def register_plugin(self, provider: ComponentProvider) -> None:
         metadata = provider.metadata
         
@@ -73,6 +81,19 @@ class PluginManager:
         for plugin_name in self._plugins:
             self.load_plugin(plugin_name)
     
+    def load_plugins_for_test_type(self, test_type: str) -> List[str]:
+        # Providers known only from the manifest are imported here, on first use.
+        if self._manifest is not None:
+            for entry in self._manifest.for_test_type(test_type):
+                self._register_from_manifest(entry.name)
+        
+        loaded = []
+        for descriptor in list(self._plugins.values()):
+            if test_type in descriptor.metadata.test_types:
+                self.load_plugin(descriptor.name)
+                loaded.append(descriptor.name)
+        return loaded
+    
     def get_providers_for_test_type(self, test_type: str) -> List[ComponentProvider]:
         providers = []
         for descriptor in self._plugins.values():
@@ -80,8 +101,21 @@ class PluginManager:
                 providers.append(descriptor.provider)
         return providers
     
+    def _register_from_manifest(self, plugin_name: str) -> None:
+        if plugin_name in self._plugins or self._manifest is None:
+            return
+        
+        entry = self._manifest.get(plugin_name)
+        if entry is None:
+            return
+        
+        from .discovery import load_provider
+        
+        self.register_plugin(load_provider(entry.entry_point))
+    
     def _load_dependencies(self, descriptor: PluginDescriptor) -> None:
         for dep_name in descriptor.metadata.dependencies:
+            self._register_from_manifest(dep_name)
             if dep_name not in self._plugins:
                 raise PluginError(f"Plugin '{descriptor.name}' depends on '{dep_name}' which is not registered")
             
@@ -117,6 +151,8 @@ def plugin_provider(metadata: ComponentMetadata) -> Callable[[Type[ComponentProv
         registry = PluginRegistry()
         registry.register(WrappedProvider())
         
+        # Lets entry points name the decorated class and still get the metadata.
+        cls._provider_class = WrappedProvider
         return cls
     
     return decorator
\ No newline at end of file
@@ -1,9 +1,23 @@
 """Execution module for test execution and environment management."""
 
-from .environment import ExecutionEnvironment
-from .tester import DynamicTester
-from .context import ExecutionContext, ObjectStore
-from .check_handler import CheckHandler, CheckResult
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .environment import ExecutionEnvironment
+    from .tester import DynamicTester
+    from .context import ExecutionContext, ObjectStore
+    from .check_handler import CheckHandler, CheckResult
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ExecutionEnvironment": ".environment",
+    "DynamicTester": ".tester",
+    "ExecutionContext": ".context",
+    "ObjectStore": ".context",
+    "CheckHandler": ".check_handler",
+    "CheckResult": ".check_handler",
+})
 
 __all__ = [
     "ExecutionEnvironment",
@@ -12,4 +26,4 @@ __all__ = [
     "ObjectStore",
     "CheckHandler",
     "CheckResult",
-]
\ No newline at end of file
+]
@@ -0,0 +1,170 @@
+"""Pooled text capture of solution output."""
+
+import io
+import threading
+from collections.abc import Mapping
+from typing import Callable, Iterator, List, Optional
+
+TRUNCATION_MARKER = "\n[output truncated after {limit} bytes]\n"
+
+
+def _byte_length(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8", "surrogatepass"))
+
+
+class OutputCapture(io.TextIOBase):
+    """Text stream collecting written strings without encoding them.
+
+    Writes are appended to a list of chunks and joined once on ``getvalue``.
+    Output beyond ``max_bytes`` is dropped and replaced by a truncation
+    marker; a disabled capture drops everything. An optional listener sees
+    every written chunk, kept or not.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        super().__init__()
+        self._encoding = encoding
+        self._chunks: List[str] = []
+        self._size = 0
+        self._max_bytes = 0
+        self._enabled = True
+        self._truncated = False
+        self._listener: Optional[Callable[[str], None]] = None
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    @property
+    def truncated(self) -> bool:
+        """Check whether output exceeded the byte cap."""
+        return self._truncated
+
+    def reset(
+        self,
+        max_bytes: int = 0,
+        enabled: bool = True,
+        listener: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Prepare the capture for a new isolation block.
+
+        Args:
+            max_bytes: Maximum number of UTF-8 bytes kept, 0 for no limit
+            enabled: Whether written output is kept at all
+            listener: Callable receiving every written chunk after it is stored
+        """
+        self._chunks.clear()
+        self._size = 0
+        self._max_bytes = max_bytes
+        self._enabled = enabled
+        self._truncated = False
+        self._listener = listener
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        if text:
+            self._store(text)
+            if self._listener is not None:
+                self._listener(text)
+        return len(text)
+
+    def _store(self, text: str) -> None:
+        if not self._enabled or self._truncated:
+            return
+
+        size = _byte_length(text)
+        if self._max_bytes and self._size + size > self._max_bytes:
+            remaining = self._max_bytes - self._size
+            kept = text[:remaining].encode("utf-8", "surrogatepass")[:remaining].decode("utf-8", "ignore")
+            if kept:
+                self._chunks.append(kept)
+            self._chunks.append(TRUNCATION_MARKER.format(limit=self._max_bytes))
+            self._size = self._max_bytes
+            self._truncated = True
+            return
+
+        self._chunks.append(text)
+        self._size += size
+
+    def getvalue(self) -> str:
+        """Get the captured output."""
+        if len(self._chunks) > 1:
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+
+class CapturePool:
+    """Reusable output captures shared by isolation blocks of a process."""
+
+    def __init__(self, max_size: int = 32):
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum number of idle captures kept for reuse
+        """
+        self._max_size = max_size
+        self._idle: List[OutputCapture] = []
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        max_bytes: int = 0,
+        enabled: bool = True,
+        listener: Optional[Callable[[str], None]] = None,
+    ) -> OutputCapture:
+        """Get a cleared capture.
+
+        Args:
+            max_bytes: Maximum number of UTF-8 bytes kept, 0 for no limit
+            enabled: Whether written output is kept at all
+            listener: Callable receiving every written chunk
+        """
+        with self._lock:
+            capture = self._idle.pop() if self._idle else OutputCapture()
+        capture.reset(max_bytes, enabled, listener)
+        return capture
+
+    def release(self, capture: OutputCapture) -> None:
+        """Return a capture to the pool, dropping its content."""
+        capture.reset()
+        with self._lock:
+            if len(self._idle) < self._max_size:
+                self._idle.append(capture)
+
+
+class CapturedOutput(Mapping):
+    """Read-only ``stdout``/``stderr`` mapping yielded by ``run_in_isolation``.
+
+    Values reflect the output written so far while the isolation block is
+    running and are fixed once it exits.
+    """
+
+    def __init__(self, stdout: OutputCapture, stderr: OutputCapture):
+        self._streams = {"stdout": stdout, "stderr": stderr}
+        self._values: dict[str, str] | None = None
+
+    def freeze(self) -> None:
+        """Fix the captured values so the underlying captures can be reused."""
+        if self._values is None:
+            self._values = {name: stream.getvalue() for name, stream in self._streams.items()}
+
+    def __getitem__(self, key: str) -> str:
+        if self._values is not None:
+            return self._values[key]
+        return self._streams[key].getvalue()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._streams)
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+
+capture_pool = CapturePool()
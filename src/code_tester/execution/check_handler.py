@@ -1,6 +1,9 @@
-from typing import Any, Dict, Type
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Type
 
-from ..config import CheckConfig, PerformConfig, ExpectConfig
+from ..config import CheckConfig, PerformConfig, ExpectConfig, ParametrizeRow, SetupActionConfig
+from ..core import DependencyContainer
 from ..plugins.core_actions import Action, ActionResult
 from ..plugins.core_assertions import Assertion
 from ..utils.exceptions import ActionError, AssertionError
@@ -8,6 +11,8 @@ from ..utils.placeholder_resolver import PlaceholderResolver
 from ..logging import LogLevel, Console, set_check_id
 from .environment import ExecutionEnvironment
 from .context import ExecutionContext
+from .plan import CompiledCheck, CompiledRow
+from .streaming import STREAM_NAMES, OutputMonitor, StreamVerdictReached
 
 
 class CheckResult:
@@ -17,18 +22,30 @@ class CheckResult:
         passed: bool,
         action_result: ActionResult = None,
         error_message: str = None,
-        exception: Exception = None
+        exception: Exception = None,
+        sub_results: List['CheckResult'] | None = None
     ):
         self.check_id = check_id
         self.passed = passed
         self.action_result = action_result
         self.error_message = error_message
         self.exception = exception
+        # Results of the rows of a parametrized check, in row order.
+        self.sub_results = sub_results or []
 
 
 class CheckHandler:
-    def __init__(self, console: Console):
+    def __init__(
+        self,
+        console: Console,
+        container: DependencyContainer | None = None,
+        reference_store_dir: Path | None = None
+    ):
         self._console = console
+        # Plugins register extra actions and assertions as "action_<name>" / "assertion_<name>" factories.
+        self._container = container
+        # Image assertions decode reference images into this store, the user cache directory by default.
+        self._reference_store_dir = reference_store_dir
         self._action_factories: Dict[str, Type[Action]] = {}
         self._assertion_factories: Dict[str, Type[Assertion]] = {}
         self._placeholder_resolver = PlaceholderResolver()
@@ -41,7 +58,7 @@ class CheckHandler:
             CallMethodAction, GetAttributeAction, ReadFileContentAction
         )
         from ..plugins.core_assertions import (
-            EqualsAssertion, ContainsAssertion, IsInRangeAssertion,
+            EqualsAssertion, ContainsAssertion, MatchesRegexAssertion, IsInRangeAssertion,
             IsCloseToAssertion, IsInstanceOfAssertion, RaisesExceptionAssertion,
             HasLengthAssertion
         )
@@ -58,6 +75,7 @@ class CheckHandler:
         self._assertion_factories = {
             "equals": EqualsAssertion,
             "contains": ContainsAssertion,
+            "matches_regex": MatchesRegexAssertion,
             "is_in_range": IsInRangeAssertion,
             "is_close_to": IsCloseToAssertion,
             "is_instance_of": IsInstanceOfAssertion,
@@ -69,121 +87,449 @@ class CheckHandler:
         self,
         check_config: CheckConfig,
         environment: ExecutionEnvironment,
-        context: ExecutionContext
+        context: ExecutionContext,
+        compiled: CompiledCheck | None = None
     ) -> CheckResult:
-        set_check_id(str(check_config.check_id))
-        
-        self._console.print(
-            f"Executing check {check_config.check_id}: {check_config.name_for_output}",
-            level=LogLevel.DEBUG
-        )
+        self._start_check(check_config)
         
         try:
-            action_result = self._execute_action(
-                check_config.spec.perform,
-                environment,
-                context
-            )
+            # Checks of an execution plan come precompiled; others are compiled for this run only.
+            compiled = compiled or self.compile_check(check_config)
+            if compiled.rows:
+                with self._monitored_output(compiled, environment, None):
+                    action_results = compiled.action.execute_rows(
+                        environment, context.get_all_objects(), [row.row for row in compiled.rows]
+                    )
+                return self._evaluate_rows(compiled, action_results)
             
-            if action_result.exception:
-                if self._should_check_exception(check_config.spec.expect):
-                    passed = self._check_expectations(check_config.spec.expect, action_result)
-                    return CheckResult(check_config.check_id, passed, action_result)
-                else:
-                    return CheckResult(
-                        check_config.check_id,
-                        False,
-                        action_result,
-                        f"Action failed with exception: {action_result.exception}",
-                        action_result.exception
+            output_monitor = self._create_output_monitor(compiled)
+            with self._monitored_output(compiled, environment, output_monitor):
+                try:
+                    action_result = self._execute_action(
+                        check_config.spec.perform,
+                        environment,
+                        context,
+                        compiled.action
                     )
+                except StreamVerdictReached as stop:
+                    action_result = self._stopped_action_result(stop)
             
-            passed = self._check_expectations(check_config.spec.expect, action_result)
+            return self._evaluate_check(compiled, action_result, output_monitor)
             
-            if not passed:
-                error_message = self._format_error_message(
-                    check_config.reason_for_output,
-                    action_result,
-                    check_config.spec.expect
-                )
-            else:
-                error_message = None
+        except Exception as e:
+            return self._failed_check_result(check_config, e)
+    
+    async def execute_check_async(
+        self,
+        check_config: CheckConfig,
+        environment: ExecutionEnvironment,
+        context: ExecutionContext,
+        compiled: CompiledCheck | None = None
+    ) -> CheckResult:
+        self._start_check(check_config)
+        
+        try:
+            # Checks of an execution plan come precompiled; others are compiled for this run only.
+            compiled = compiled or self.compile_check(check_config)
+            if compiled.rows:
+                with self._monitored_output(compiled, environment, None):
+                    action_results = await compiled.action.execute_rows_async(
+                        environment, context.get_all_objects(), [row.row for row in compiled.rows]
+                    )
+                return self._evaluate_rows(compiled, action_results)
+            
+            output_monitor = self._create_output_monitor(compiled)
+            with self._monitored_output(compiled, environment, output_monitor):
+                try:
+                    action_result = await self._execute_action_async(
+                        check_config.spec.perform,
+                        environment,
+                        context,
+                        compiled.action
+                    )
+                except StreamVerdictReached as stop:
+                    action_result = self._stopped_action_result(stop)
             
-            return CheckResult(check_config.check_id, passed, action_result, error_message)
+            return self._evaluate_check(compiled, action_result, output_monitor)
             
         except Exception as e:
-            self._console.print(
-                f"Error executing check {check_config.check_id}: {e}",
-                level=LogLevel.ERROR
+            return self._failed_check_result(check_config, e)
+    
+    def compile_check(self, check_config: CheckConfig) -> CompiledCheck:
+        expectation = check_config.spec.expect
+        assertions = {
+            field_name: self._create_expectation_assertion(field_name, getattr(expectation, field_name))
+            for field_name in ("return_value", *STREAM_NAMES, "image")
+            if getattr(expectation, field_name) is not None
+        }
+        
+        streamed = []
+        for stream_name in STREAM_NAMES:
+            expect_config = getattr(expectation, stream_name)
+            if expect_config is None or not expect_config.stream:
+                continue
+            if assertions[stream_name].stream_matcher() is None:
+                self._console.print(
+                    f"Assertion '{expect_config.assertion}' cannot stream, checking {stream_name} after the action",
+                    level=LogLevel.DEBUG
+                )
+                continue
+            streamed.append(stream_name)
+        
+        # The action may only be interrupted if nothing else depends on it running to the end.
+        only_streamed = all(
+            getattr(expectation, stream_name) is None or stream_name in streamed
+            for stream_name in STREAM_NAMES
+        )
+        stop_when_decided = (
+            bool(streamed)
+            and only_streamed
+            and not check_config.spec.perform.save_as
+            and expectation.return_value is None
+            and expectation.image is None
+            and expectation.http_response is None
+            and not expectation.mock_calls
+        )
+        
+        template = check_config.reason_for_output
+        capture_streams = tuple(
+            (getattr(expectation, stream_name) is not None and stream_name not in streamed)
+            or f"{{{stream_name}}}" in template
+            for stream_name in STREAM_NAMES
+        )
+        rows = tuple(
+            self._compile_row(check_config, index, row, assertions, template)
+            for index, row in enumerate(check_config.spec.parametrize or ())
+        )
+        if expectation.return_value:
+            template = self._placeholder_resolver.resolve(template, {"expected": expectation.return_value.value})
+        
+        return CompiledCheck(
+            config=check_config,
+            action=self._create_action(check_config.spec.perform),
+            assertions=assertions,
+            streamed=tuple(streamed),
+            stop_when_decided=stop_when_decided,
+            capture_streams=capture_streams,
+            message_template=template,
+            rows=rows,
+        )
+    
+    def _compile_row(
+        self,
+        check_config: CheckConfig,
+        index: int,
+        row: ParametrizeRow,
+        assertions: Mapping[str, Assertion],
+        template: str
+    ) -> CompiledRow:
+        expect_config = check_config.spec.expect.return_value
+        if expect_config is not None and "expected" in row.model_fields_set:
+            expect_config = expect_config.model_copy(update={"value": row.expected})
+            assertions = {**assertions, "return_value": self._create_assertion(expect_config)}
+        if expect_config is not None:
+            template = self._placeholder_resolver.resolve(template, {"expected": expect_config.value})
+        
+        return CompiledRow(
+            row=row,
+            label=row.id or f"#{index + 1}",
+            assertions=assertions,
+            message_template=template,
+        )
+    
+    def compile_action(self, action_config: PerformConfig | SetupActionConfig) -> Action:
+        if isinstance(action_config, SetupActionConfig):
+            action_config = PerformConfig(
+                action=action_config.action,
+                target=action_config.target,
+                params=action_config.params
             )
+        return self._create_action(action_config)
+    
+    def _start_check(self, check_config: CheckConfig) -> None:
+        set_check_id(str(check_config.check_id))
+        
+        self._console.print(
+            f"Executing check {check_config.check_id}: {check_config.name_for_output}",
+            level=LogLevel.DEBUG
+        )
+    
+    @contextmanager
+    def _monitored_output(
+        self,
+        compiled: CompiledCheck,
+        environment: ExecutionEnvironment,
+        output_monitor: OutputMonitor | None
+    ) -> Iterator[None]:
+        capture_streams = environment.capture_streams
+        output_listeners = environment.output_listeners
+        environment.capture_streams = compiled.capture_streams
+        environment.output_listeners = output_monitor.listeners() if output_monitor else (None, None)
+        try:
+            yield
+        finally:
+            environment.capture_streams = capture_streams
+            environment.output_listeners = output_listeners
+    
+    def _stopped_action_result(self, stop: StreamVerdictReached) -> ActionResult:
+        self._console.print("Output verdict reached, action stopped early", level=LogLevel.DEBUG)
+        captured_output = stop.captured_output or {}
+        return ActionResult(stdout=captured_output.get("stdout"), stderr=captured_output.get("stderr"))
+    
+    def _evaluate_check(
+        self,
+        compiled: CompiledCheck,
+        action_result: ActionResult,
+        output_monitor: OutputMonitor | None
+    ) -> CheckResult:
+        stream_verdicts = output_monitor.finish() if output_monitor else {}
+        return self._evaluate_result(
+            compiled.config, action_result, stream_verdicts, compiled.assertions, compiled.message_template
+        )
+    
+    def _evaluate_rows(self, compiled: CompiledCheck, action_results: List[ActionResult]) -> CheckResult:
+        check_config = compiled.config
+        if len(action_results) != len(compiled.rows):
+            # Rows without a result must not count as passed.
             return CheckResult(
                 check_config.check_id,
                 False,
-                None,
-                f"Check execution failed: {e}",
-                e
+                error_message=f"Expected results of {len(compiled.rows)} rows, got {len(action_results)}"
             )
+        
+        sub_results = [
+            self._evaluate_result(check_config, action_result, {}, row.assertions, row.message_template)
+            for row, action_result in zip(compiled.rows, action_results, strict=True)
+        ]
+        
+        failed_rows = [
+            f"Row {row.label}: {result.error_message}"
+            for row, result in zip(compiled.rows, sub_results, strict=True)
+            if not result.passed
+        ]
+        self._console.print(
+            f"Check {check_config.check_id}: {len(sub_results) - len(failed_rows)}/{len(sub_results)} rows passed",
+            level=LogLevel.DEBUG
+        )
+        
+        return CheckResult(
+            check_config.check_id,
+            not failed_rows,
+            error_message="\n".join(failed_rows) or None,
+            sub_results=sub_results
+        )
+    
+    def _evaluate_result(
+        self,
+        check_config: CheckConfig,
+        action_result: ActionResult,
+        stream_verdicts: Dict[str, bool],
+        assertions: Mapping[str, Assertion],
+        message_template: str
+    ) -> CheckResult:
+        if action_result.exception:
+            if self._should_check_exception(check_config.spec.expect):
+                passed = self._check_expectations(
+                    check_config.spec.expect, action_result, stream_verdicts, assertions
+                )
+                return CheckResult(check_config.check_id, passed, action_result)
+            else:
+                return CheckResult(
+                    check_config.check_id,
+                    False,
+                    action_result,
+                    f"Action failed with exception: {action_result.exception}",
+                    action_result.exception
+                )
+        
+        passed = self._check_expectations(
+            check_config.spec.expect, action_result, stream_verdicts, assertions
+        )
+        
+        if not passed:
+            # The compiled template already has the expected value filled in.
+            error_message = self._format_error_message(message_template, action_result)
+            details = self._describe_mismatch(check_config.spec.expect, action_result, assertions)
+            if details:
+                error_message = f"{error_message}\n{details}"
+        else:
+            error_message = None
+        
+        return CheckResult(check_config.check_id, passed, action_result, error_message)
+    
+    def _failed_check_result(self, check_config: CheckConfig, error: Exception) -> CheckResult:
+        self._console.print(
+            f"Error executing check {check_config.check_id}: {error}",
+            level=LogLevel.ERROR
+        )
+        return CheckResult(
+            check_config.check_id,
+            False,
+            None,
+            f"Check execution failed: {error}",
+            error
+        )
+    
+    def _create_output_monitor(self, compiled: CompiledCheck) -> OutputMonitor | None:
+        if not compiled.streamed:
+            return None
+        
+        # Matchers keep state while the action writes, so every run gets new ones.
+        matchers = {
+            stream_name: compiled.assertions[stream_name].stream_matcher()
+            for stream_name in compiled.streamed
+        }
+        return OutputMonitor(matchers, stop_when_decided=compiled.stop_when_decided)
     
     def _execute_action(
         self,
         perform_config: PerformConfig,
         environment: ExecutionEnvironment,
-        context: ExecutionContext
+        context: ExecutionContext,
+        action: Action | None = None
+    ) -> ActionResult:
+        action = action or self._create_action(perform_config)
+        
+        # Convert ExecutionContext to dict for backward compatibility
+        context_dict = context.get_all_objects()
+        
+        result = action.execute(environment, context_dict)
+        
+        self._save_action_result(perform_config, result, context)
+        return result
+    
+    async def _execute_action_async(
+        self,
+        perform_config: PerformConfig,
+        environment: ExecutionEnvironment,
+        context: ExecutionContext,
+        action: Action | None = None
     ) -> ActionResult:
+        action = action or self._create_action(perform_config)
+        
+        context_dict = context.get_all_objects()
+        
+        result = await action.execute_async(environment, context_dict)
+        
+        self._save_action_result(perform_config, result, context)
+        return result
+    
+    def _create_action(self, perform_config: PerformConfig) -> Action:
         action_name = perform_config.action
+        action_class = self._action_factories.get(action_name) or self._resolve_component(f"action_{action_name}")
         
-        if action_name not in self._action_factories:
+        if action_class is None:
             raise ActionError(
                 f"Unknown action: {action_name}",
                 check_id=0,
                 action=action_name
             )
         
-        action_class = self._action_factories[action_name]
-        action = action_class(perform_config)
-        
-        # Convert ExecutionContext to dict for backward compatibility
-        context_dict = context.get_all_objects()
-        
-        result = action.execute(environment, context_dict)
-        
+        return action_class(perform_config)
+    
+    def _resolve_component(self, service_name: str) -> Type | None:
+        if self._container is None or not self._container.is_registered(service_name):
+            return None
+        return self._container.resolve(service_name)
+    
+    def _save_action_result(self, perform_config: PerformConfig, result: ActionResult, context: ExecutionContext) -> None:
         # Save result if save_as is specified
         if perform_config.save_as and result.return_value is not None:
             context.save_object(perform_config.save_as, result.return_value)
-        
-        return result
     
-    def _check_expectations(self, expectation, action_result: ActionResult) -> bool:
+    def _check_expectations(
+        self,
+        expectation,
+        action_result: ActionResult,
+        stream_verdicts: Dict[str, bool] | None = None,
+        assertions: Mapping[str, Assertion] | None = None
+    ) -> bool:
+        stream_verdicts = stream_verdicts or {}
+        assertions = assertions or {}
+        
         if expectation.return_value:
             # Special handling for exception assertions
             if expectation.return_value.assertion == "raises_exception":
-                if not self._check_assertion(expectation.return_value, action_result.exception):
+                if not self._check_assertion(
+                    expectation.return_value, action_result.exception, assertions.get("return_value")
+                ):
                     return False
             else:
-                if not self._check_assertion(expectation.return_value, action_result.return_value):
+                if not self._check_assertion(
+                    expectation.return_value, action_result.return_value, assertions.get("return_value")
+                ):
                     return False
         
         if expectation.stdout:
-            if not self._check_assertion(expectation.stdout, action_result.stdout):
+            if "stdout" in stream_verdicts:
+                if not stream_verdicts["stdout"]:
+                    return False
+            elif not self._check_assertion(expectation.stdout, action_result.stdout, assertions.get("stdout")):
                 return False
         
         if expectation.stderr:
-            if not self._check_assertion(expectation.stderr, action_result.stderr):
+            if "stderr" in stream_verdicts:
+                if not stream_verdicts["stderr"]:
+                    return False
+            elif not self._check_assertion(expectation.stderr, action_result.stderr, assertions.get("stderr")):
+                return False
+        
+        if expectation.image:
+            assertion = assertions.get("image") or self._create_expectation_assertion("image", expectation.image)
+            if not self._check_assertion(expectation.image, action_result.screenshot, assertion):
                 return False
         
         return True
     
-    def _check_assertion(self, expect_config: ExpectConfig, actual_value: Any) -> bool:
+    def _create_assertion(self, expect_config: ExpectConfig, **options: Any) -> Assertion:
         assertion_name = expect_config.assertion
+        assertion_class = (
+            self._assertion_factories.get(assertion_name)
+            or self._resolve_component(f"assertion_{assertion_name}")
+        )
         
-        if assertion_name not in self._assertion_factories:
+        if assertion_class is None:
             raise AssertionError(f"Unknown assertion: {assertion_name}")
         
-        assertion_class = self._assertion_factories[assertion_name]
-        assertion = assertion_class(expect_config)
-        
+        return assertion_class(expect_config, **options)
+    
+    def _create_expectation_assertion(self, field_name: str, expect_config: ExpectConfig) -> Assertion:
+        if field_name == "image":
+            return self._create_assertion(expect_config, reference_store_dir=self._reference_store_dir)
+        return self._create_assertion(expect_config)
+    
+    def _check_assertion(
+        self,
+        expect_config: ExpectConfig,
+        actual_value: Any,
+        assertion: Assertion | None = None
+    ) -> bool:
+        assertion = assertion or self._create_assertion(expect_config)
         return assertion.check(actual_value)
     
+    def _describe_mismatch(
+        self,
+        expectation,
+        action_result: ActionResult,
+        assertions: Mapping[str, Assertion]
+    ) -> str | None:
+        actual_values = {
+            "return_value": action_result.return_value,
+            "stdout": action_result.stdout,
+            "stderr": action_result.stderr,
+            "image": action_result.screenshot,
+        }
+        for field_name, actual_value in actual_values.items():
+            assertion = assertions.get(field_name)
+            if getattr(expectation, field_name) is None or assertion is None:
+                continue
+            if field_name == "return_value" and self._should_check_exception(expectation):
+                continue
+            details = assertion.describe_mismatch(actual_value)
+            if details:
+                return details
+        return None
+    
     def _should_check_exception(self, expectation) -> bool:
         return (expectation.return_value and 
                 expectation.return_value.assertion == "raises_exception")
@@ -192,14 +538,14 @@ class CheckHandler:
         self,
         template: str,
         action_result: ActionResult,
-        expectation
+        expectation=None
     ) -> str:
         context = {}
         
         if action_result.return_value is not None:
             context["actual"] = action_result.return_value
         
-        if expectation.return_value:
+        if expectation is not None and expectation.return_value:
             context["expected"] = expectation.return_value.value
         
         if action_result.stdout:
@@ -1,36 +1,198 @@
 """Execution environment for isolated test execution."""
 
+import copy
 import io
 import sys
 import uuid
 from contextlib import contextmanager
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
-from types import ModuleType
+from types import FunctionType, ModuleType
+from typing import Callable
 
-from ..config import LogLevel
+from ..cache import CodeCache, get_code_cache
+from ..config import IsolationMode, LogLevel
 from ..utils.exceptions import SolutionImportError
 from ..logging import Console, log_initialization
+from .capture import CapturedOutput, capture_pool
+from .stdio import stdio_router
+from .streaming import StreamVerdictReached
+
+_MISSING = object()
+
+
+def _is_dunder(name: str) -> bool:
+    """Check whether an attribute name is a special ``__name__``."""
+    return name.startswith("__") and name.endswith("__")
 
 
 class ExecutionEnvironment:
     """Manages isolated execution environment for solution code."""
     
     @log_initialization(level=LogLevel.TRACE)
-    def __init__(self, solution_path: Path, console: Console):
+    def __init__(
+        self,
+        solution_path: Path,
+        console: Console,
+        code_cache: CodeCache | None = None,
+        isolation_mode: IsolationMode = IsolationMode.MODULE,
+        max_output_bytes: int = 0,
+    ):
         """Initialize execution environment.
         
         Args:
             solution_path: Path to the solution file to execute
             console: Console instance for logging
+            code_cache: Cache of compiled solution code, process-wide cache by default
+            isolation_mode: How the solution module is isolated between checks
+            max_output_bytes: Maximum captured bytes per stream, 0 for no limit
         """
         self._solution_path = solution_path
         self._console = console
+        self._code_cache = code_cache if code_cache is not None else get_code_cache()
+        self._isolation_mode = IsolationMode(isolation_mode)
         self._module: ModuleType | None = None
+        self._session_active = False
+        self._session_module: ModuleType | None = None
+        self._session_snapshot: list[tuple[object, dict[str, object]]] | None = None
+        self._session_dirty = False
+        self._max_output_bytes = max_output_bytes
+        self._capture_stdout = True
+        self._capture_stderr = True
+        self._output_listeners: tuple[Callable[[str], None] | None, Callable[[str], None] | None] = (None, None)
         self._console.print(f"Environment created for: {self._solution_path}", level=LogLevel.DEBUG)
 
+    @property
+    def isolation_mode(self) -> IsolationMode:
+        """Get the isolation mode of this environment."""
+        return self._isolation_mode
+
+    @contextmanager
+    def session(self):
+        """Context manager sharing one imported solution module between isolation blocks.
+
+        In session isolation mode the solution is imported on first use, its
+        globals, class attributes and function defaults are snapshotted right
+        after import and restored before every following isolation block. In module isolation mode this is a no-op.
+        """
+        if self._isolation_mode != IsolationMode.SESSION or self._session_active:
+            yield
+            return
+
+        self._session_active = True
+        self._console.print("Solution session started.", level=LogLevel.DEBUG)
+        try:
+            yield
+        finally:
+            self._session_active = False
+            if self._session_module is not None:
+                sys.modules.pop(self._session_module.__name__, None)
+                self._console.print(
+                    f"Unloaded session module '{self._session_module.__name__}'.", level=LogLevel.DEBUG
+                )
+            self._session_module = None
+            self._session_snapshot = None
+            self._session_dirty = False
+
+    def _acquire_session_module(self) -> ModuleType:
+        """Get the session module, importing it or restoring its state as needed."""
+        if self._session_module is None:
+            # Import-time output belongs to no check, so it is discarded.
+            with stdio_router.redirect(io.StringIO(""), io.StringIO(), io.StringIO()):
+                module = self._import_solution_module()
+
+            self._session_snapshot = self._copy_state(self._collect_state(module))
+            self._session_module = module
+        elif self._session_dirty:
+            self._restore_state(self._copy_state(self._session_snapshot))
+            self._console.print("Restored session module state.", level=LogLevel.TRACE)
+
+        self._session_dirty = True
+        return self._session_module
+
+    @staticmethod
+    def _collect_state(module: ModuleType) -> list[tuple[object, dict[str, object]]]:
+        """Collect the mutable state of a solution module by its owner.
+
+        Besides the module globals this covers the attributes of classes and
+        the default arguments of functions defined in the solution, which
+        checks reach through the shared functions and classes.
+        """
+        state: list[tuple[object, dict[str, object]]] = [(module, dict(module.__dict__))]
+        seen = {id(module)}
+        pending = list(module.__dict__.values())
+        while pending:
+            value = pending.pop()
+            if isinstance(value, (staticmethod, classmethod)):
+                value = value.__func__
+            if id(value) in seen or getattr(value, "__module__", None) != module.__name__:
+                continue
+            if isinstance(value, type):
+                seen.add(id(value))
+                namespace = vars(value)
+                state.append((value, {name: item for name, item in namespace.items() if not _is_dunder(name)}))
+                pending.extend(namespace.values())
+            elif isinstance(value, FunctionType):
+                seen.add(id(value))
+                state.append((value, {"defaults": value.__defaults__, "kwdefaults": value.__kwdefaults__}))
+        return state
+
+    @staticmethod
+    def _copy_state(state: list[tuple[object, dict[str, object]]]) -> list[tuple[object, dict[str, object]]]:
+        """Deep-copy collected state, keeping uncopyable values by reference.
+
+        A single memo is shared between values so aliases inside the module
+        stay aliases in the copy. Functions, classes and modules are kept as
+        they are, which also keeps their identity stable across checks.
+        """
+        memo: dict[int, object] = {}
+        # Defaults of types from other libraries are often identity sentinels,
+        # e.g. those of dataclass initializers, so they are never copied.
+        own_types = {"builtins", state[0][0].__name__}
+        for owner, namespace in state:
+            if isinstance(owner, FunctionType):
+                for value in (*(namespace["defaults"] or ()), *(namespace["kwdefaults"] or {}).values()):
+                    if type(value).__module__ not in own_types:
+                        memo[id(value)] = value
+
+        result = []
+        for owner, namespace in state:
+            copied = {}
+            for name, value in namespace.items():
+                if _is_dunder(name):
+                    copied[name] = value
+                    continue
+                try:
+                    copied[name] = copy.deepcopy(value, memo)
+                except Exception:
+                    copied[name] = value
+            result.append((owner, copied))
+        return result
+
+    @staticmethod
+    def _restore_state(state: list[tuple[object, dict[str, object]]]) -> None:
+        """Put copied state back on the module, its classes and functions."""
+        for owner, namespace in state:
+            if isinstance(owner, ModuleType):
+                owner.__dict__.clear()
+                owner.__dict__.update(namespace)
+            elif isinstance(owner, type):
+                current = vars(owner)
+                for name in [name for name in current if not _is_dunder(name) and name not in namespace]:
+                    delattr(owner, name)
+                for name, value in namespace.items():
+                    # Unchanged attributes are skipped, e.g. enum members refuse reassignment.
+                    if current.get(name, _MISSING) is not value:
+                        setattr(owner, name, value)
+            else:
+                owner.__defaults__ = namespace["defaults"]
+                owner.__kwdefaults__ = namespace["kwdefaults"]
+
     def _import_solution_module(self) -> ModuleType:
         """Import solution module with unique name to avoid conflicts.
+
+        The source is compiled through the code cache, so only the module body
+        is executed when the same solution is imported again.
         
         Returns:
             Imported module instance
@@ -42,32 +204,63 @@ class ExecutionEnvironment:
         if not self._solution_path.exists():
             raise FileNotFoundError(f"Solution file not found: {self._solution_path}")
 
+        unique_module_name = f"solution_{self._solution_path.stem}_{uuid.uuid4().hex}"
         try:
-            unique_module_name = f"solution_{self._solution_path.stem}_{uuid.uuid4().hex}"
             self._console.print(f"Importing solution as '{unique_module_name}'", level=LogLevel.DEBUG)
 
             spec = spec_from_file_location(unique_module_name, self._solution_path)
             if not spec or not spec.loader:
                 raise ImportError("Could not create module spec from file.")
 
+            code = self._code_cache.get_code(self._solution_path, self._solution_path.read_bytes())
+
             module = module_from_spec(spec)
             sys.modules[unique_module_name] = module
-            spec.loader.exec_module(module)
+            exec(code, module.__dict__)
 
             self._console.print(f"Module '{unique_module_name}' imported successfully.", level=LogLevel.DEBUG)
             return module
         except Exception as e:
+            sys.modules.pop(unique_module_name, None)
             raise SolutionImportError(str(e), path=self._solution_path) from e
+        except BaseException:
+            sys.modules.pop(unique_module_name, None)
+            raise
+
+    @property
+    def capture_streams(self) -> tuple[bool, bool]:
+        """Get which of stdout and stderr following isolation blocks keep."""
+        return self._capture_stdout, self._capture_stderr
+
+    @capture_streams.setter
+    def capture_streams(self, streams: tuple[bool, bool]) -> None:
+        """Select which of stdout and stderr following isolation blocks keep.
+
+        Output of a disabled stream is discarded as it is written.
+        """
+        self._capture_stdout, self._capture_stderr = streams
+
+    @property
+    def output_listeners(self) -> tuple[Callable[[str], None] | None, Callable[[str], None] | None]:
+        """Get the callables receiving stdout and stderr chunks of following isolation blocks."""
+        return self._output_listeners
+
+    @output_listeners.setter
+    def output_listeners(self, listeners: tuple[Callable[[str], None] | None, Callable[[str], None] | None]) -> None:
+        """Set the callables receiving stdout and stderr chunks as they are written."""
+        self._output_listeners = listeners
 
     @contextmanager
-    def run_in_isolation(self, stdin_text: str | None = None):
+    def run_in_isolation(self, stdin_text: str | None = None, fresh: bool = False):
         """Context manager for isolated execution with captured I/O.
         
         Args:
             stdin_text: Optional stdin input for the solution
+            fresh: Always import a new module, even inside a session
             
         Yields:
-            Tuple of (module, captured_output) where captured_output is dict with 'stdout' and 'stderr'
+            Tuple of (module, captured_output) where captured_output maps 'stdout' and 'stderr'
+            to the output written so far
         """
         self._console.print("Entering isolated I/O context.", level=LogLevel.TRACE)
         if stdin_text:
@@ -75,36 +268,36 @@ class ExecutionEnvironment:
                 'Providing stdin: "{}"...'.format(stdin_text[:50].replace("\n", "\\n")), level=LogLevel.TRACE
             )
 
-        original_stdin, original_stdout, original_stderr = sys.stdin, sys.stdout, sys.stderr
-
-        # noinspection PyTypeChecker
-        stdout_wrapper = io.TextIOWrapper(io.BytesIO(), encoding=sys.stdout.encoding)
-        # noinspection PyTypeChecker
-        stderr_wrapper = io.TextIOWrapper(io.BytesIO(), encoding=sys.stderr.encoding)
+        stdout_listener, stderr_listener = self._output_listeners
+        stdout_capture = capture_pool.acquire(self._max_output_bytes, self._capture_stdout, stdout_listener)
+        stderr_capture = capture_pool.acquire(self._max_output_bytes, self._capture_stderr, stderr_listener)
+        captured_output = CapturedOutput(stdout_capture, stderr_capture)
 
-        sys.stdout = stdout_wrapper
-        sys.stderr = stderr_wrapper
-        sys.stdin = io.StringIO(stdin_text or "")
-
-        captured_output = {"stdout": "", "stderr": ""}
+        use_session = self._session_active and not fresh
 
         try:
-            self._module = self._import_solution_module()
-            yield self._module, captured_output
+            with stdio_router.redirect(io.StringIO(stdin_text or ""), stdout_capture, stderr_capture):
+                if use_session:
+                    self._module = self._acquire_session_module()
+                else:
+                    self._module = self._import_solution_module()
+                yield self._module, captured_output
+        except StreamVerdictReached as stop:
+            stop.captured_output = captured_output
+            raise
         finally:
-            sys.stdout.flush()
-            sys.stderr.flush()
-
-            stdout_wrapper.seek(0)
-            stderr_wrapper.seek(0)
-            captured_output["stdout"] = stdout_wrapper.read()
-            captured_output["stderr"] = stderr_wrapper.read()
+            captured_output.freeze()
+            if stdout_capture.truncated or stderr_capture.truncated:
+                self._console.print(
+                    f"Captured output truncated at {self._max_output_bytes} bytes.", level=LogLevel.WARNING
+                )
+            capture_pool.release(stdout_capture)
+            capture_pool.release(stderr_capture)
 
-            sys.stdin, sys.stdout, sys.stderr = original_stdin, original_stdout, original_stderr
             self._console.print("Exited isolated I/O context.", level=LogLevel.TRACE)
 
-            if self._module and self._module.__name__ in sys.modules:
+            if self._module and not use_session and self._module.__name__ in sys.modules:
                 del sys.modules[self._module.__name__]
                 self._console.print(f"Unloaded module '{self._module.__name__}'.", level=LogLevel.DEBUG)
 
-            self._module = None
\ No newline at end of file
+            self._module = None
@@ -0,0 +1,55 @@
+"""Event loops for awaiting coroutines returned by solutions."""
+
+import asyncio
+import contextvars
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+_thread_state = threading.local()
+_helper_lock = threading.Lock()
+_helper_executor: ThreadPoolExecutor | None = None
+
+
+def get_thread_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop reused by all synchronous awaits of the current thread."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
+def _run_on_thread_loop(awaitable: Any) -> Any:
+    return get_thread_event_loop().run_until_complete(awaitable)
+
+
+def resolve_awaitable(value: Any) -> Any:
+    """Wait for a value if it is awaitable, return it unchanged otherwise.
+
+    Awaitables run on the reused loop of the calling thread. If that thread
+    already runs an event loop, they run on a helper thread with its own
+    reused loop instead; the current context is kept in both cases so
+    redirected standard streams still apply.
+
+    Args:
+        value: Value returned by solution code
+
+    Returns:
+        Result of the awaitable or the value itself
+    """
+    if not inspect.isawaitable(value):
+        return value
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_on_thread_loop(value)
+
+    global _helper_executor
+    with _helper_lock:
+        if _helper_executor is None:
+            _helper_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="code-tester-await")
+    context = contextvars.copy_context()
+    return _helper_executor.submit(context.run, _run_on_thread_loop, value).result()
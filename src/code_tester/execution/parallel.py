@@ -0,0 +1,261 @@
+"""Concurrent execution of independent check groups."""
+
+import contextvars
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..cache import get_code_cache
+from ..config import AppConfig, CheckConfig, IsolationMode, ParallelBackend
+from ..core import PluginManager, create_plugin_manager
+from ..logging import Console, LogConfig, LogLevel, setup_logger
+from ..plugins.core_actions import ActionResult
+from .check_handler import CheckHandler, CheckResult
+from .context import ExecutionContext
+from .environment import ExecutionEnvironment
+from .plan import ExecutionPlan
+from .stdio import stdio_router
+
+THREAD_TEST_TYPES = frozenset({"api", "flask"})
+
+
+def resolve_parallel_backend(backend: ParallelBackend, test_type: str) -> ParallelBackend:
+    """Resolve the AUTO backend for a test type."""
+    if backend != ParallelBackend.AUTO:
+        return ParallelBackend(backend)
+    return ParallelBackend.THREAD if test_type in THREAD_TEST_TYPES else ParallelBackend.PROCESS
+
+
+def run_check_group(
+    checks: Sequence[CheckConfig],
+    environment: ExecutionEnvironment,
+    check_handler: CheckHandler,
+    exit_on_first_error: bool = False,
+    plan: Optional[ExecutionPlan] = None,
+) -> List[CheckResult]:
+    """Run dependent checks sequentially with their own context.
+
+    Args:
+        checks: Checks of one group in execution order
+        environment: Environment used only by this group
+        check_handler: Handler executing the checks
+        exit_on_first_error: Stop the group on its first failed check
+        plan: Plan holding precompiled checks, checks are compiled per run without it
+
+    Returns:
+        Results of the executed checks
+    """
+    context = ExecutionContext()
+    results = []
+
+    with environment.session():
+        for check_config in checks:
+            compiled = plan.get(check_config.check_id) if plan is not None else None
+            result = check_handler.execute_check(check_config, environment, context, compiled=compiled)
+            results.append(result)
+            if not result.passed and exit_on_first_error:
+                break
+
+    return results
+
+
+async def run_check_group_async(
+    checks: Sequence[CheckConfig],
+    environment: ExecutionEnvironment,
+    check_handler: CheckHandler,
+    exit_on_first_error: bool = False,
+    context: Optional[ExecutionContext] = None,
+    plan: Optional[ExecutionPlan] = None,
+) -> List[CheckResult]:
+    """Run dependent checks sequentially on the running event loop.
+
+    Args:
+        checks: Checks of one group in execution order
+        environment: Environment used only by this group
+        check_handler: Handler executing the checks
+        exit_on_first_error: Stop the group on its first failed check
+        context: Context holding saved objects, a new one by default
+        plan: Plan holding precompiled checks, checks are compiled per run without it
+
+    Returns:
+        Results of the executed checks
+    """
+    context = context if context is not None else ExecutionContext()
+    results = []
+
+    with environment.session():
+        for check_config in checks:
+            compiled = plan.get(check_config.check_id) if plan is not None else None
+            result = await check_handler.execute_check_async(check_config, environment, context, compiled=compiled)
+            results.append(result)
+            if not result.passed and exit_on_first_error:
+                break
+
+    return results
+
+
+def _transferable(value: Any) -> Any:
+    """Return the value if it can be pickled, its representation otherwise."""
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:
+        return repr(value)
+
+
+def make_transferable(result: CheckResult) -> CheckResult:
+    """Strip values that cannot leave a worker process from a check result.
+
+    Objects created from the solution module belong to a module that only
+    exists in the worker, so they are replaced by their representation.
+    """
+    action_result = None
+    if result.action_result is not None:
+        original = result.action_result
+        exception = original.exception
+        if exception is not None and _transferable(exception) is not exception:
+            exception = RuntimeError(f"{type(exception).__name__}: {exception}")
+        action_result = ActionResult(
+            return_value=_transferable(original.return_value),
+            stdout=original.stdout,
+            stderr=original.stderr,
+            exception=exception,
+        )
+
+    exception = result.exception
+    if exception is not None and _transferable(exception) is not exception:
+        exception = RuntimeError(f"{type(exception).__name__}: {exception}")
+
+    sub_results = [make_transferable(sub_result) for sub_result in result.sub_results]
+    return CheckResult(result.check_id, result.passed, action_result, result.error_message, exception, sub_results)
+
+
+_process_console: Console | None = None
+_process_plugin_manager: PluginManager | None = None
+
+
+def _run_group_in_process(
+    solution_path: Path,
+    isolation_mode: IsolationMode,
+    code_cache_dir: Optional[Path],
+    reference_store_dir: Optional[Path],
+    max_output_bytes: int,
+    checks: List[CheckConfig],
+    exit_on_first_error: bool,
+    test_type: str = "py_general",
+    plugin_manifest_path: Optional[Path] = None,
+) -> List[CheckResult]:
+    global _process_console, _process_plugin_manager
+    if _process_console is None:
+        logger = setup_logger(LogConfig(level=LogLevel.ERROR, console_enabled=False))
+        _process_console = Console(logger, is_quiet=True, use_rich=False)
+    if _process_plugin_manager is None:
+        _process_plugin_manager = create_plugin_manager(plugin_manifest_path)
+    _process_plugin_manager.load_plugins_for_test_type(test_type)
+
+    environment = ExecutionEnvironment(
+        solution_path,
+        _process_console,
+        code_cache=get_code_cache(code_cache_dir),
+        isolation_mode=isolation_mode,
+        max_output_bytes=max_output_bytes,
+    )
+    check_handler = CheckHandler(_process_console, _process_plugin_manager.container, reference_store_dir)
+    results = run_check_group(checks, environment, check_handler, exit_on_first_error)
+    return [make_transferable(result) for result in results]
+
+
+class ParallelCheckRunner:
+    """Runs independent check groups on a thread or process pool."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        console: Console,
+        check_handler: CheckHandler,
+        test_type: str,
+        plan: Optional[ExecutionPlan] = None,
+    ):
+        """Initialize the parallel runner.
+
+        Args:
+            config: Application configuration
+            console: Console instance for logging
+            check_handler: Handler used by thread workers
+            test_type: Test type used to resolve the AUTO backend
+            plan: Plan whose precompiled checks thread workers share; process
+                workers compile the checks they receive
+        """
+        self._config = config
+        self._console = console
+        self._check_handler = check_handler
+        self._plan = plan
+        self._test_type = test_type
+        self._backend = resolve_parallel_backend(config.parallel_backend, test_type)
+
+    @property
+    def backend(self) -> ParallelBackend:
+        """Get the resolved worker type."""
+        return self._backend
+
+    def run(self, groups: Sequence[Sequence[CheckConfig]]) -> Dict[int, CheckResult]:
+        """Run check groups concurrently.
+
+        Args:
+            groups: Independent groups of dependent checks
+
+        Returns:
+            Results of executed checks keyed by check ID
+        """
+        max_workers = min(self._config.parallel_checks, len(groups))
+        self._console.print(
+            f"Running {len(groups)} check groups on {max_workers} {self._backend} workers",
+            level=LogLevel.DEBUG,
+        )
+
+        if self._backend == ParallelBackend.THREAD:
+            with stdio_router.routing(), ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, self._run_group_in_thread, list(group))
+                    for group in groups
+                ]
+                return self._collect(futures)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_group_in_process,
+                    self._config.solution_path,
+                    self._config.isolation_mode,
+                    self._config.code_cache_dir,
+                    self._config.reference_store_dir,
+                    self._config.max_output_bytes,
+                    list(group),
+                    self._config.exit_on_first_error,
+                    self._test_type,
+                    self._config.plugin_manifest_path,
+                )
+                for group in groups
+            ]
+            return self._collect(futures)
+
+    def _run_group_in_thread(self, checks: List[CheckConfig]) -> List[CheckResult]:
+        environment = ExecutionEnvironment(
+            self._config.solution_path,
+            self._console,
+            code_cache=get_code_cache(self._config.code_cache_dir),
+            isolation_mode=self._config.isolation_mode,
+            max_output_bytes=self._config.max_output_bytes,
+        )
+        return run_check_group(
+            checks, environment, self._check_handler, self._config.exit_on_first_error, self._plan
+        )
+
+    @staticmethod
+    def _collect(futures: List[Any]) -> Dict[int, CheckResult]:
+        results: Dict[int, CheckResult] = {}
+        for future in futures:
+            for result in future.result():
+                results[result.check_id] = result
+        return results
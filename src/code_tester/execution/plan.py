@@ -0,0 +1,226 @@
+"""Compiled execution plans of test cases."""
+
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from ..config import CheckConfig, ParametrizeRow, SetupActionConfig, TestCaseConfig
+from ..utils.exceptions import CodeTesterError
+from .scheduler import build_check_dependencies, get_upstream_checks, group_dependent_checks
+
+if TYPE_CHECKING:
+    from ..core import DependencyContainer
+    from ..plugins.core_actions import Action
+    from ..plugins.core_assertions import Assertion
+    from .check_handler import CheckHandler
+
+
+@dataclass(frozen=True)
+class CompiledRow:
+    """A row of a parametrized check with its expected value bound.
+
+    Attributes:
+        row: Row configuration
+        label: Label of the row in error messages
+        assertions: Assertions of the check with the row's return value assertion swapped in
+        message_template: ``reason_for_output`` with the row's expected value resolved
+    """
+
+    row: ParametrizeRow
+    label: str
+    assertions: Mapping[str, "Assertion"]
+    message_template: str = ""
+
+
+@dataclass(frozen=True)
+class CompiledCheck:
+    """A check with its action and assertions instantiated once.
+
+    Attributes:
+        config: Check configuration
+        action: Action bound to the check's perform configuration
+        assertions: Assertions keyed by expectation field (``return_value``, ``stdout``, ``stderr``)
+        streamed: Streams whose assertion is matched while the action writes
+        stop_when_decided: Whether the action may be interrupted once the streamed verdicts are known
+        capture_streams: Whether stdout and stderr must be kept after the action
+        message_template: ``reason_for_output`` with placeholders known before running resolved
+        rows: Compiled rows of a parametrized check, run in one isolation block
+    """
+
+    config: CheckConfig
+    action: "Action"
+    assertions: Mapping[str, "Assertion"]
+    streamed: Tuple[str, ...] = ()
+    stop_when_decided: bool = False
+    capture_streams: Tuple[bool, bool] = (True, True)
+    message_template: str = ""
+    rows: Tuple[CompiledRow, ...] = ()
+
+    @property
+    def check_id(self) -> int:
+        """Get the ID of the check."""
+        return self.config.check_id
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Immutable plan of a test case that can be executed against any number of solutions.
+
+    Checks or setup actions that cannot be compiled, e.g. because they name
+    an unknown action, are left out and fail when they are executed.
+
+    Attributes:
+        test_case: Validated test case configuration
+        checks: Compiled checks in execution order
+        dependencies: IDs of the checks whose saved objects each check uses
+        upstream: IDs of all checks each check transitively depends on, in execution order
+        groups: Independent groups of dependent checks, as check IDs
+        setup_actions: Actions run before the checks, None where compilation failed
+        teardown_actions: Actions run after the checks, None where compilation failed
+    """
+
+    test_case: TestCaseConfig
+    checks: Tuple[CompiledCheck, ...]
+    dependencies: Mapping[int, FrozenSet[int]] = field(default_factory=dict)
+    upstream: Mapping[int, Tuple[int, ...]] = field(default_factory=dict)
+    groups: Tuple[Tuple[int, ...], ...] = ()
+    setup_actions: Tuple[Optional["Action"], ...] = ()
+    teardown_actions: Tuple[Optional["Action"], ...] = ()
+    _by_id: Mapping[int, CompiledCheck] = field(default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_by_id", MappingProxyType({check.check_id: check for check in self.checks}))
+
+    def get(self, check_id: int) -> CompiledCheck | None:
+        """Get a compiled check by ID, None if it could not be compiled."""
+        return self._by_id.get(check_id)
+
+
+class PlanCompiler:
+    """Turns validated test cases into execution plans."""
+
+    def __init__(self, check_handler: "CheckHandler"):
+        """Initialize the compiler.
+
+        Args:
+            check_handler: Handler resolving action and assertion names
+        """
+        self._check_handler = check_handler
+
+    def compile(self, test_case: TestCaseConfig) -> ExecutionPlan:
+        """Compile a test case.
+
+        Args:
+            test_case: Validated test case configuration
+
+        Returns:
+            Execution plan of the test case
+        """
+        checks = test_case.checks
+        dependencies = build_check_dependencies(checks)
+        upstream = get_upstream_checks(checks)
+
+        return ExecutionPlan(
+            test_case=test_case,
+            checks=tuple(filter(None, map(self._compile_check, checks))),
+            dependencies=MappingProxyType({check_id: frozenset(deps) for check_id, deps in dependencies.items()}),
+            upstream=MappingProxyType({check_id: tuple(ids) for check_id, ids in upstream.items()}),
+            groups=tuple(tuple(check.check_id for check in group) for group in group_dependent_checks(checks)),
+            setup_actions=tuple(map(self._compile_action, test_case.setup_actions)),
+            teardown_actions=tuple(map(self._compile_action, test_case.teardown_actions)),
+        )
+
+    def _compile_check(self, check: CheckConfig) -> CompiledCheck | None:
+        try:
+            return self._check_handler.compile_check(check)
+        except CodeTesterError:
+            return None
+
+    def _compile_action(self, action: SetupActionConfig) -> Optional["Action"]:
+        try:
+            return self._check_handler.compile_action(action)
+        except CodeTesterError:
+            return None
+
+
+def make_plan_key(source: bytes | Dict[str, Any]) -> str:
+    """Build the plan cache key of a test case source.
+
+    Args:
+        source: Raw test case file content or already decoded test case data
+
+    Returns:
+        Hex digest identifying the test case
+    """
+    if isinstance(source, dict):
+        source = json.dumps(source, sort_keys=True, separators=(",", ":"), default=repr).encode("utf-8")
+    return hashlib.sha256(source).hexdigest()
+
+
+class PlanCache:
+    """LRU cache of execution plans keyed by test case content."""
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the plan cache.
+
+        Args:
+            max_entries: Maximum number of plans kept
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self._max_entries = max_entries
+        self._plans: OrderedDict[str, ExecutionPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> ExecutionPlan | None:
+        """Get a cached plan, None if missing."""
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def put(self, key: str, plan: ExecutionPlan) -> None:
+        """Store a plan, evicting the least recently used ones beyond the limit."""
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self._max_entries:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all plans."""
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+_plan_caches: "weakref.WeakKeyDictionary[DependencyContainer, PlanCache]" = weakref.WeakKeyDictionary()
+_plan_caches_lock = threading.Lock()
+
+
+def get_plan_cache(container: "DependencyContainer") -> PlanCache:
+    """Get the plan cache of a plugin container.
+
+    Plans hold actions and assertions resolved through the container, so they
+    are shared only by testers using the same plugins, e.g. all jobs of a
+    grading daemon, and are dropped together with the container.
+    """
+    with _plan_caches_lock:
+        cache = _plan_caches.get(container)
+        if cache is None:
+            cache = _plan_caches[container] = PlanCache()
+        return cache
@@ -0,0 +1,117 @@
+"""Dependency analysis between checks that share saved objects."""
+
+from typing import Dict, List, Sequence, Set
+
+from ..config import CheckConfig, PerformConfig
+
+
+def get_referenced_objects(perform_config: PerformConfig) -> Set[str]:
+    """Get names of context objects an action reads.
+
+    Args:
+        perform_config: Action configuration
+
+    Returns:
+        Set of referenced object names
+    """
+    references = set()
+
+    if perform_config.params and isinstance(perform_config.params.get("object_ref"), str):
+        references.add(perform_config.params["object_ref"])
+
+    if perform_config.start_from_object_ref:
+        references.add(perform_config.start_from_object_ref)
+
+    return references
+
+
+def build_check_dependencies(checks: Sequence[CheckConfig]) -> Dict[int, Set[int]]:
+    """Build the dependency graph of checks from ``save_as`` and object references.
+
+    A check depends on the latest earlier check that saved an object it
+    references. A check that saves a name also depends on every earlier check
+    that used that name, so overwrites keep their original order.
+
+    Args:
+        checks: Checks in execution order
+
+    Returns:
+        Mapping of check ID to the IDs of checks it depends on
+    """
+    dependencies: Dict[int, Set[int]] = {check.check_id: set() for check in checks}
+    last_writer: Dict[str, int] = {}
+    users: Dict[str, Set[int]] = {}
+
+    for check in checks:
+        perform = check.spec.perform
+        check_deps = dependencies[check.check_id]
+
+        for name in get_referenced_objects(perform):
+            if name in last_writer:
+                check_deps.add(last_writer[name])
+            users.setdefault(name, set()).add(check.check_id)
+
+        if perform.save_as:
+            check_deps.update(users.get(perform.save_as, set()))
+            if perform.save_as in last_writer:
+                check_deps.add(last_writer[perform.save_as])
+            last_writer[perform.save_as] = check.check_id
+            users.setdefault(perform.save_as, set()).add(check.check_id)
+
+        check_deps.discard(check.check_id)
+
+    return dependencies
+
+
+def group_dependent_checks(checks: Sequence[CheckConfig]) -> List[List[CheckConfig]]:
+    """Split checks into independent groups that can run concurrently.
+
+    Checks connected through dependencies end up in the same group, which
+    keeps the original order; groups are ordered by their first check.
+
+    Args:
+        checks: Checks in execution order
+
+    Returns:
+        List of check groups
+    """
+    dependencies = build_check_dependencies(checks)
+    parent = {check.check_id: check.check_id for check in checks}
+
+    def find(check_id: int) -> int:
+        while parent[check_id] != check_id:
+            parent[check_id] = parent[parent[check_id]]
+            check_id = parent[check_id]
+        return check_id
+
+    for check_id, check_deps in dependencies.items():
+        for dep_id in check_deps:
+            parent[find(check_id)] = find(dep_id)
+
+    groups: Dict[int, List[CheckConfig]] = {}
+    for check in checks:
+        groups.setdefault(find(check.check_id), []).append(check)
+
+    return list(groups.values())
+
+
+def get_upstream_checks(checks: Sequence[CheckConfig]) -> Dict[int, List[int]]:
+    """Get every check each check transitively depends on.
+
+    Args:
+        checks: Checks in execution order
+
+    Returns:
+        Mapping of check ID to upstream check IDs in execution order
+    """
+    dependencies = build_check_dependencies(checks)
+    upstream: Dict[int, Set[int]] = {}
+
+    for check in checks:
+        closure = set(dependencies[check.check_id])
+        for dep_id in dependencies[check.check_id]:
+            closure.update(upstream[dep_id])
+        upstream[check.check_id] = closure
+
+    order = {check.check_id: index for index, check in enumerate(checks)}
+    return {check_id: sorted(closure, key=order.__getitem__) for check_id, closure in upstream.items()}
@@ -0,0 +1,117 @@
+"""Standard stream redirection that is safe for concurrent isolation blocks."""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import IO, Iterator, Optional, Tuple
+
+StdioTargets = Tuple[IO[str], IO[str], IO[str]]
+
+_stdio_targets: ContextVar[Optional[StdioTargets]] = ContextVar("stdio_targets", default=None)
+
+
+class _RoutedStream(io.TextIOBase):
+    """Stream proxy that forwards to the target of the current context.
+
+    Contexts without a redirection (the main thread, log handlers) keep
+    talking to the stream that was installed before routing started.
+    """
+
+    def __init__(self, index: int, fallback: IO[str]):
+        super().__init__()
+        self._index = index
+        self._fallback = fallback
+
+    def _target(self) -> IO[str]:
+        targets = _stdio_targets.get()
+        return targets[self._index] if targets is not None else self._fallback
+
+    @property
+    def encoding(self):
+        return getattr(self._target(), "encoding", "utf-8")
+
+    def readable(self) -> bool:
+        return self._index == 0
+
+    def writable(self) -> bool:
+        return self._index != 0
+
+    def read(self, size: int = -1) -> str:
+        return self._target().read(size)
+
+    def readline(self, size: int = -1) -> str:
+        return self._target().readline(size)
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def fileno(self) -> int:
+        return self._target().fileno()
+
+
+class StdioRouter:
+    """Process-wide switch between direct and context-routed redirection.
+
+    While routing is active ``sys.stdin``, ``sys.stdout`` and ``sys.stderr``
+    are proxies, and each thread or asyncio task redirects only its own
+    streams through a context variable. Activation is reference counted so
+    nested concurrent runners share one installation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._originals: Optional[StdioTargets] = None
+
+    @property
+    def is_active(self) -> bool:
+        """Check whether context routing is installed."""
+        return self._depth > 0
+
+    @contextmanager
+    def routing(self) -> Iterator[None]:
+        """Install routed proxies for the duration of the context."""
+        with self._lock:
+            if self._depth == 0:
+                self._originals = (sys.stdin, sys.stdout, sys.stderr)
+                sys.stdin, sys.stdout, sys.stderr = (
+                    _RoutedStream(index, stream) for index, stream in enumerate(self._originals)
+                )
+            self._depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    sys.stdin, sys.stdout, sys.stderr = self._originals
+                    self._originals = None
+
+    @contextmanager
+    def redirect(self, stdin: IO[str], stdout: IO[str], stderr: IO[str]) -> Iterator[None]:
+        """Redirect the standard streams of the current context."""
+        if self.is_active:
+            token = _stdio_targets.set((stdin, stdout, stderr))
+            try:
+                yield
+            finally:
+                _stdio_targets.reset(token)
+            return
+
+        originals = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        try:
+            yield
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = originals
+
+
+stdio_router = StdioRouter()
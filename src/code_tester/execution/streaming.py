@@ -0,0 +1,67 @@
+"""Incremental matching of solution output while it is written."""
+
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..plugins.stream_matchers import StreamMatcher
+
+STREAM_NAMES = ("stdout", "stderr")
+
+
+class StreamVerdictReached(BaseException):
+    """Raised from a write to stop the action once every stream verdict is decided.
+
+    It derives from BaseException so ``except Exception`` blocks in solutions
+    do not swallow it.
+    """
+
+    def __init__(self):
+        super().__init__("Output verdict reached")
+        self.captured_output: Mapping[str, str] | None = None
+
+
+class OutputMonitor:
+    """Feeds output chunks to stream matchers as the solution writes them."""
+
+    def __init__(self, matchers: Dict[str, "StreamMatcher"], stop_when_decided: bool = False):
+        """Initialize the monitor.
+
+        Args:
+            matchers: Matchers keyed by stream name (``stdout`` or ``stderr``)
+            stop_when_decided: Interrupt the action once every matcher has a verdict
+        """
+        unknown = set(matchers) - set(STREAM_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown output streams: {', '.join(sorted(unknown))}")
+
+        self._matchers = matchers
+        self._stop_when_decided = stop_when_decided
+
+    @property
+    def streams(self) -> Tuple[str, ...]:
+        """Get names of the monitored streams."""
+        return tuple(self._matchers)
+
+    @property
+    def decided(self) -> bool:
+        """Check whether every matcher has a verdict."""
+        return all(matcher.decided for matcher in self._matchers.values())
+
+    def listeners(self) -> Tuple[Optional[Callable[[str], None]], ...]:
+        """Get write listeners for stdout and stderr, None for unmonitored streams."""
+        return tuple(
+            self._make_listener(self._matchers[name]) if name in self._matchers else None
+            for name in STREAM_NAMES
+        )
+
+    def _make_listener(self, matcher: "StreamMatcher") -> Callable[[str], None]:
+        def listener(text: str) -> None:
+            matcher.feed(text)
+            if self._stop_when_decided and matcher.decided and self.decided:
+                raise StreamVerdictReached()
+
+        return listener
+
+    def finish(self) -> Dict[str, bool]:
+        """Close the streams and get the verdict of every matcher."""
+        return {name: matcher.finish() for name, matcher in self._matchers.items()}
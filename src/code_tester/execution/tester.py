@@ -1,46 +1,76 @@
 """Main tester class for executing test cases."""
 
+import asyncio
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ..config import AppConfig, TestCaseConfig
-from ..core import DependencyContainer, PluginManager, PluginRegistry
+from ..cache import CachedCheck, CachedResult, ResultCache, get_code_cache, get_test_case_cache
+from ..config import AppConfig, CheckConfig, StreamedTestCase, TestCaseConfig, load_streamed_test_case
+from ..core import PluginManager, create_plugin_manager
 from .environment import ExecutionEnvironment
 from .context import ExecutionContext
 from .check_handler import CheckHandler, CheckResult
+from .parallel import ParallelCheckRunner, run_check_group_async
+from .plan import CompiledCheck, ExecutionPlan, PlanCompiler, get_plan_cache, make_plan_key
+from .stdio import stdio_router
+from .scheduler import group_dependent_checks
 from ..utils.exceptions import CodeTesterError, TestCaseParsingError
 from ..logging import LogLevel, Console, set_test_case, set_check_id, log_initialization
 from ..utils import create_dataclass_from_dict
 
+if TYPE_CHECKING:
+    from ..plugins.core_actions import Action, ActionResult
+
 
 class DynamicTester:
     """Main class for executing dynamic test cases."""
     
     @log_initialization(level=LogLevel.DEBUG)
-    def __init__(self, config: AppConfig, console: Console):
+    def __init__(
+        self,
+        config: AppConfig,
+        console: Console,
+        plugin_manager: PluginManager | None = None,
+        test_case_data: dict | None = None,
+    ):
         """Initialize the dynamic tester.
         
         Args:
             config: Application configuration
             console: Console instance for output
+            plugin_manager: Manager with all plugins already loaded, reused
+                instead of initializing the plugin system again
+            test_case_data: Raw test case used instead of reading ``config.test_case_path``
         """
         self._config = config
         self._console = console
-        self._container = DependencyContainer()
-        self._plugin_manager = PluginManager(self._container)
+        self._test_case_data = test_case_data
         self._environment: ExecutionEnvironment | None = None
-        self._test_case_config: TestCaseConfig | None = None
+        self._test_case_config: TestCaseConfig | StreamedTestCase | None = None
+        self._plan: ExecutionPlan | None = None
+        self._plan_key: str | None = None
         self._context: ExecutionContext | None = None
         self._check_handler: CheckHandler | None = None
         self._failed_checks: list[CheckResult] = []
+        self._run_error: str | None = None
+        self._result_cache: ResultCache | None = None
+        self._result_cache_key: str | None = None
+        self._check_cache_keys: dict[int, str] = {}
+        self._cached_checks: dict[int, CheckResult] = {}
+        self._checks_to_run: set[int] | None = None
         
-        self._initialize_plugins()
+        if plugin_manager is None:
+            self._plugin_manager = self.create_plugin_manager(console, config.plugin_manifest_path)
+        else:
+            self._plugin_manager = plugin_manager
+        self._container = self._plugin_manager.container
         self._initialize_components()
 
     def _initialize_components(self) -> None:
         """Initialize core components."""
         self._context = ExecutionContext()
-        self._check_handler = CheckHandler(self._console)
+        self._check_handler = CheckHandler(self._console, self._container, self._config.reference_store_dir)
 
     @property
     def failed_checks_ids(self) -> list[int]:
@@ -48,39 +78,234 @@ class DynamicTester:
         return [check.check_id for check in self._failed_checks]
 
     @property
-    def test_case_config(self) -> TestCaseConfig | None:
+    def failed_checks(self) -> list[CheckResult]:
+        """Get results of failed checks in execution order."""
+        return list(self._failed_checks)
+
+    @property
+    def run_error(self) -> str | None:
+        """Get the error that aborted the run before all checks completed, if any."""
+        return self._run_error
+
+    @property
+    def test_case_config(self) -> TestCaseConfig | StreamedTestCase | None:
         """Get the loaded test case configuration."""
         return self._test_case_config
 
-    def _initialize_plugins(self) -> None:
-        """Initialize the plugin system."""
-        self._console.print("Initializing plugins with new architecture...", level=LogLevel.DEBUG)
+    @property
+    def execution_plan(self) -> ExecutionPlan | None:
+        """Get the compiled execution plan of the loaded test case."""
+        return self._plan
+
+    @staticmethod
+    def create_plugin_manager(console: Console, manifest_path: Path | None = None) -> PluginManager:
+        """Initialize the plugin system.
         
-        registry = PluginRegistry()
-        providers = registry.get_all_providers()
+        Providers are discovered through entry points and summarized in an
+        on-disk manifest; they are imported when a test case of a matching
+        type is loaded. The returned manager can be shared by testers created
+        later in the same process, which then skip plugin initialization.
+        
+        Args:
+            console: Console instance for output
+            manifest_path: Plugin manifest file, the user cache location by default
         
-        for provider in providers:
-            self._plugin_manager.register_plugin(provider)
+        Returns:
+            Plugin manager loading providers per test type
+        """
+        console.print("Initializing plugins with new architecture...", level=LogLevel.DEBUG)
         
-        self._plugin_manager.load_all_plugins()
+        plugin_manager = create_plugin_manager(manifest_path)
         
-        self._console.print(f"Loaded {len(providers)} plugin providers", level=LogLevel.DEBUG)
+        console.print("Plugin manifest loaded", level=LogLevel.DEBUG)
+        return plugin_manager
+
+    def _load_plugins(self) -> None:
+        """Load the plugins serving the test type of the loaded test case."""
+        test_type = self._test_case_config.test_type
+        loaded = self._plugin_manager.load_plugins_for_test_type(test_type)
+        self._console.print(f"Loaded {len(loaded)} plugin providers for '{test_type}'", level=LogLevel.DEBUG)
 
     def _load_and_parse_test_case(self) -> None:
-        """Load and parse test case configuration from JSON file."""
+        """Load and parse test case configuration from JSON file.
+        
+        Test case files are validated once per content and then taken from
+        the test case cache. A test case whose plan was compiled before by a
+        tester sharing the plugin container also reuses that plan.
+        
+        With ``stream_test_case`` only the fields other than the checks are
+        loaded; checks are read from the file while they run.
+        """
         self._console.print(f"Loading test case from: {self._config.test_case_path}", level=LogLevel.DEBUG)
         try:
-            raw_data = json.loads(self._config.test_case_path.read_text("utf-8"))
-            self._test_case_config = create_dataclass_from_dict(TestCaseConfig, raw_data)
-        except json.JSONDecodeError as e:
+            if self._is_streamed():
+                self._test_case_config = load_streamed_test_case(self._config.test_case_path)
+                self._console.print("Streaming checks from the test case file", level=LogLevel.DEBUG)
+            elif self._test_case_data is not None:
+                self._plan_key = make_plan_key(self._test_case_data)
+                self._plan = get_plan_cache(self._container).get(self._plan_key)
+                if self._plan is None:
+                    self._test_case_config = create_dataclass_from_dict(TestCaseConfig, self._test_case_data)
+            else:
+                loaded = get_test_case_cache(self._config.test_case_cache_dir).load(self._config.test_case_path)
+                self._plan_key = loaded.digest
+                self._plan = get_plan_cache(self._container).get(self._plan_key)
+                self._test_case_config = loaded.config
+            
+            if self._plan is not None:
+                self._console.print("Reusing compiled execution plan of the test case", level=LogLevel.DEBUG)
+                self._test_case_config = self._plan.test_case
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise TestCaseParsingError(f"Invalid JSON: {e}", path=self._config.test_case_path) from e
         except (TypeError, KeyError) as e:
             raise TestCaseParsingError(f"Malformed structure: {e}", path=self._config.test_case_path) from e
 
+    def _is_streamed(self) -> bool:
+        """Check whether checks are read from the test case file while they run."""
+        return self._config.stream_test_case and self._test_case_data is None
+
+    def _compile_plan(self) -> None:
+        """Compile the loaded test case into an execution plan unless it came from the plan cache.
+        
+        Streamed checks are compiled one at a time when they run.
+        """
+        if self._plan is not None or self._is_streamed():
+            return
+        
+        self._plan = PlanCompiler(self._check_handler).compile(self._test_case_config)
+        get_plan_cache(self._container).put(self._plan_key, self._plan)
+        self._console.print(
+            f"Compiled execution plan with {len(self._plan.checks)} checks",
+            level=LogLevel.DEBUG,
+        )
+
+    def _load_cached_result(self) -> bool | None:
+        """Restore the outcome of an identical earlier run from the result cache.
+        
+        Returns:
+            Cached verdict, or None if caching is disabled or no result is cached
+        """
+        if self._config.result_cache_path is None or not self._test_case_config:
+            return None
+        
+        if self._is_streamed():
+            self._console.print("Result cache is not used for streamed test cases", level=LogLevel.DEBUG)
+            return None
+        
+        try:
+            source = self._config.solution_path.read_bytes()
+        except OSError:
+            return None
+        
+        self._result_cache = ResultCache(
+            self._config.result_cache_path,
+            max_entries=self._config.result_cache_max_entries,
+            max_age=self._config.result_cache_max_age,
+        )
+        self._result_cache_key = ResultCache.make_key(
+            self._config.solution_path,
+            source,
+            self._test_case_config,
+            self._config.exit_on_first_error,
+            self._config.isolation_mode,
+            self._config.max_output_bytes,
+        )
+        
+        cached = self._result_cache.get(self._result_cache_key)
+        if cached is None:
+            self._console.print("No cached result found, running checks", level=LogLevel.DEBUG)
+            self._load_cached_checks(source)
+            return None
+        
+        self._console.print("Reusing cached result of an identical run", level=LogLevel.INFO)
+        self._failed_checks = [
+            CheckResult(check_id, False, error_message=error_message)
+            for check_id, error_message in cached.failed_checks
+        ]
+        self._report_errors()
+        return cached.passed
+
+    def _load_cached_checks(self, source: bytes) -> None:
+        """Load cached results of single checks and select the checks that must run.
+        
+        A check runs if its result is not cached or if a check depending on it
+        must run, since the objects it saves are needed again.
+        
+        Args:
+            source: Raw solution source bytes
+        """
+        checks = self._test_case_config.checks
+        checks_by_id = {check.check_id: check for check in checks}
+        upstream = self._plan.upstream
+        
+        self._check_cache_keys = {
+            check.check_id: ResultCache.make_check_key(
+                self._config.solution_path,
+                source,
+                self._test_case_config,
+                check,
+                [checks_by_id[check_id] for check_id in upstream[check.check_id]],
+                self._config.isolation_mode,
+                self._config.max_output_bytes,
+            )
+            for check in checks
+        }
+        
+        cached = self._result_cache.get_checks(self._check_cache_keys.values())
+        self._cached_checks = {
+            check_id: CheckResult(check_id, cached[key].passed, error_message=cached[key].error_message)
+            for check_id, key in self._check_cache_keys.items()
+            if key in cached
+        }
+        
+        self._checks_to_run = set()
+        for check in checks:
+            if check.check_id not in self._cached_checks:
+                self._checks_to_run.add(check.check_id)
+                self._checks_to_run.update(upstream[check.check_id])
+        
+        self._console.print(
+            f"Reusing {len(checks) - len(self._checks_to_run)} cached check results, "
+            f"running {len(self._checks_to_run)} checks",
+            level=LogLevel.DEBUG,
+        )
+
+    def _must_run(self, check_config: CheckConfig) -> bool:
+        """Check whether a check must be executed instead of taken from the cache."""
+        return self._checks_to_run is None or check_config.check_id in self._checks_to_run
+
+    def _store_check_results(self, results: list[CheckResult]) -> None:
+        """Save results of executed checks to the result cache."""
+        if self._result_cache is None or not results:
+            return
+        
+        self._result_cache.put_checks({
+            self._check_cache_keys[result.check_id]: CachedCheck(passed=result.passed, error_message=result.error_message)
+            for result in results
+        })
+
+    def _store_result(self, passed: bool) -> None:
+        """Save the outcome of a completed run to the result cache."""
+        if self._result_cache is None or self._result_cache_key is None or self._run_error is not None:
+            return
+        
+        failed_checks = [(check.check_id, check.error_message) for check in self._failed_checks]
+        self._result_cache.put(self._result_cache_key, CachedResult(passed=passed, failed_checks=failed_checks))
+
     def _setup_environment(self) -> None:
         """Setup the execution environment."""
         self._console.print("Preparing execution environment...", level=LogLevel.DEBUG)
-        self._environment = ExecutionEnvironment(self._config.solution_path, self._console)
+        self._environment = self._create_environment()
+
+    def _create_environment(self) -> ExecutionEnvironment:
+        """Create an execution environment for the configured solution."""
+        return ExecutionEnvironment(
+            self._config.solution_path,
+            self._console,
+            code_cache=get_code_cache(self._config.code_cache_dir),
+            isolation_mode=self._config.isolation_mode,
+            max_output_bytes=self._config.max_output_bytes,
+        )
 
     def _execute_setup_actions(self) -> bool:
         """Execute setup actions before running checks.
@@ -104,7 +329,7 @@ class DynamicTester:
                     params=setup_action.params
                 )
                 
-                result = self._execute_single_action(perform_config)
+                result = self._execute_single_action(perform_config, self._planned_action("setup_actions", i))
                 
                 if result.exception:
                     self._console.print(f"Setup action {i+1} failed: {result.exception}", level=LogLevel.ERROR)
@@ -117,11 +342,18 @@ class DynamicTester:
                 return False
         return True
     
-    def _execute_single_action(self, perform_config) -> 'ActionResult':
+    def _planned_action(self, kind: str, index: int) -> 'Action | None':
+        """Get a precompiled setup or teardown action of the plan, None if it must be created."""
+        if self._plan is None:
+            return None
+        return getattr(self._plan, kind)[index]
+    
+    def _execute_single_action(self, perform_config, action=None) -> 'ActionResult':
         """Execute a single action and return the result.
         
         Args:
             perform_config: Configuration for the action to perform
+            action: Precompiled action, created from the configuration if None
             
         Returns:
             ActionResult with the execution result
@@ -129,7 +361,7 @@ class DynamicTester:
         if not self._check_handler or not self._environment or not self._context:
             raise RuntimeError("Components not properly initialized")
         
-        return self._check_handler._execute_action(perform_config, self._environment, self._context)
+        return self._check_handler._execute_action(perform_config, self._environment, self._context, action)
     
     def _execute_teardown_actions(self) -> None:
         """Execute teardown actions after running checks.
@@ -152,7 +384,7 @@ class DynamicTester:
                     params=teardown_action.params
                 )
                 
-                result = self._execute_single_action(perform_config)
+                result = self._execute_single_action(perform_config, self._planned_action("teardown_actions", i))
                 
                 if result.exception:
                     self._console.print(f"Teardown action {i+1} failed: {result.exception}", level=LogLevel.WARNING)
@@ -169,12 +401,45 @@ class DynamicTester:
         
         set_test_case(self._test_case_config.test_name)
         
-        self._console.print(f"Executing {len(self._test_case_config.checks)} checks...", level=LogLevel.INFO)
+        if self._is_streamed():
+            # Streamed checks run in file order as they are read; their number is known only at the end.
+            self._console.print("Executing checks as they are read...", level=LogLevel.INFO)
+            precomputed_results = None
+        else:
+            self._console.print(f"Executing {len(self._test_case_config.checks)} checks...", level=LogLevel.INFO)
+            checks_to_run = [check for check in self._test_case_config.checks if self._must_run(check)]
+            precomputed_results = self._execute_checks_in_parallel(checks_to_run)
+        executed_results = []
+        
+        try:
+            self._collect_check_results(precomputed_results, executed_results)
+        finally:
+            self._store_check_results(executed_results)
+
+    def _collect_check_results(
+        self,
+        precomputed_results: dict[int, CheckResult] | None,
+        executed_results: list[CheckResult],
+    ) -> None:
+        """Run or look up the result of every check in order.
         
+        Args:
+            precomputed_results: Results of checks that already ran in parallel
+            executed_results: Receives results of checks executed by this run
+        """
         for check_config in self._test_case_config.checks:
-            self._console.print(f"Running check {check_config.check_id}: {check_config.name_for_output}", level=LogLevel.DEBUG)
-            
-            result = self._check_handler.execute_check(check_config, self._environment, self._context)
+            if not self._must_run(check_config):
+                result = self._cached_checks[check_config.check_id]
+                self._console.print(f"Using cached result of check {check_config.check_id}", level=LogLevel.DEBUG)
+            elif precomputed_results is not None:
+                result = precomputed_results[check_config.check_id]
+                executed_results.append(result)
+            else:
+                self._console.print(f"Running check {check_config.check_id}: {check_config.name_for_output}", level=LogLevel.DEBUG)
+                result = self._check_handler.execute_check(
+                    check_config, self._environment, self._context, compiled=self._compiled(check_config)
+                )
+                executed_results.append(result)
             
             if not result.passed:
                 self._failed_checks.append(result)
@@ -186,6 +451,86 @@ class DynamicTester:
             else:
                 self._console.print(f"Check {check_config.check_id} passed", level=LogLevel.DEBUG)
 
+    def _compiled(self, check_config: CheckConfig) -> CompiledCheck | None:
+        """Get the precompiled form of a check, None if the plan lacks it."""
+        return self._plan.get(check_config.check_id) if self._plan is not None else None
+
+    def _execute_checks_in_parallel(self, checks: list[CheckConfig]) -> dict[int, CheckResult] | None:
+        """Run independent groups of checks concurrently when enabled.
+        
+        Args:
+            checks: Checks that must be executed, in order
+        
+        Returns:
+            Results keyed by check ID, or None if checks should run sequentially
+        """
+        if self._config.parallel_checks <= 1:
+            return None
+        
+        groups = group_dependent_checks(checks)
+        if len(groups) <= 1:
+            return None
+        
+        runner = ParallelCheckRunner(
+            self._config, self._console, self._check_handler, self._test_case_config.test_type, self._plan
+        )
+        return runner.run(groups)
+
+    async def _execute_checks_async(self) -> None:
+        """Execute all checks, running independent groups concurrently on the event loop."""
+        if not self._test_case_config or not self._environment or not self._check_handler or not self._context:
+            raise RuntimeError("Components not properly initialized")
+        
+        if self._is_streamed():
+            # Groups are only known after reading all checks, so streamed checks run one by one.
+            await asyncio.to_thread(self._execute_checks)
+            return
+        
+        set_test_case(self._test_case_config.test_name)
+        
+        self._console.print(f"Executing {len(self._test_case_config.checks)} checks...", level=LogLevel.INFO)
+        
+        checks_to_run = [check for check in self._test_case_config.checks if self._must_run(check)]
+        groups = group_dependent_checks(checks_to_run)
+        semaphore = asyncio.Semaphore(self._config.parallel_checks)
+        
+        group_results = await asyncio.gather(
+            *(self._run_check_group_async(group, semaphore, shared=len(groups) == 1) for group in groups)
+        )
+        precomputed_results = {result.check_id: result for results in group_results for result in results}
+        executed_results = []
+        
+        try:
+            self._collect_check_results(precomputed_results, executed_results)
+        finally:
+            self._store_check_results(executed_results)
+
+    async def _run_check_group_async(
+        self,
+        checks: list[CheckConfig],
+        semaphore: asyncio.Semaphore,
+        shared: bool,
+    ) -> list[CheckResult]:
+        """Run one group of dependent checks once the semaphore admits it.
+        
+        Args:
+            checks: Checks of the group in execution order
+            semaphore: Semaphore bounding the number of concurrent groups
+            shared: Use the main environment and context instead of fresh ones
+        
+        Returns:
+            Results of the executed checks
+        """
+        async with semaphore:
+            if shared:
+                environment, context = self._environment, self._context
+            else:
+                environment, context = self._create_environment(), ExecutionContext()
+            
+            return await run_check_group_async(
+                checks, environment, self._check_handler, self._config.exit_on_first_error, context, self._plan
+            )
+
     def _report_errors(self) -> None:
         """Report failed checks to the user."""
         max_errors = self._config.max_messages
@@ -216,10 +561,65 @@ class DynamicTester:
         Returns:
             True if all tests passed, False otherwise
         """
+        verdict = self._prepare_run()
+        if verdict is not None:
+            return verdict
+        
+        with self._environment.session():
+            passed = self._run_test_case()
+        
+        self._store_result(passed)
+        return passed
+
+    async def run_async(self) -> bool:
+        """Run the test case on the running event loop.
+        
+        Independent groups of checks run concurrently, at most ``parallel_checks``
+        at a time. Coroutine functions of the solution are awaited on the loop
+        and blocking calls run on worker threads, so I/O-bound checks overlap.
+        
+        Returns:
+            True if all tests passed, False otherwise
+        """
+        verdict = self._prepare_run()
+        if verdict is not None:
+            return verdict
+        
+        with stdio_router.routing(), self._environment.session():
+            passed = await self._run_test_case_async()
+        
+        self._store_result(passed)
+        return passed
+
+    def prepare(self) -> None:
+        """Load the test case and compile its execution plan without running the solution.
+        
+        The parsed test case and the plan are kept in the caches shared by
+        testers using the same plugin container, so a process can prepare
+        them once before forking the workers that run solutions.
+        
+        Raises:
+            FileNotFoundError: If the test case file does not exist
+            CodeTesterError: If the test case is invalid
+        """
+        self._load_and_parse_test_case()
+        self._load_plugins()
+        self._compile_plan()
+
+    def _prepare_run(self) -> bool | None:
+        """Load the test case and prepare the environment.
+        
+        Returns:
+            Verdict if the run ended before executing checks, None if checks should run
+        """
         try:
-            self._load_and_parse_test_case()
+            self.prepare()
+            cached_verdict = self._load_cached_result()
+            if cached_verdict is not None:
+                return cached_verdict
             self._setup_environment()
         except (FileNotFoundError, CodeTesterError) as e:
+            self._run_error = str(e)
             self._console.print(str(e), level=LogLevel.CRITICAL, show_user=True)
             return False
 
@@ -228,10 +628,24 @@ class DynamicTester:
             return False
 
         self._console.print("New architecture: Plugin system initialized successfully", level=LogLevel.DEBUG)
+        return None
+
+    def _run_test_case(self) -> bool:
+        """Run setup actions, checks and teardown actions.
+        
+        Returns:
+            True if all tests passed, False otherwise
+        """
+        if self._all_checks_cached():
+            self._console.print("All check results are cached, skipping execution", level=LogLevel.INFO)
+            self._execute_checks()
+            self._report_errors()
+            return len(self._failed_checks) == 0
         
         try:
             # Execute setup actions first
             if not self._execute_setup_actions():
+                self._run_error = "Setup actions failed"
                 self._console.print("Setup actions failed, aborting test execution", level=LogLevel.ERROR, show_user=True)
                 return False
             
@@ -243,8 +657,40 @@ class DynamicTester:
             return len(self._failed_checks) == 0
             
         except Exception as e:
-            self._console.print(f"Error during test execution: {e}", level=LogLevel.CRITICAL, show_user=True)
+            self._run_error = f"Error during test execution: {e}"
+            self._console.print(self._run_error, level=LogLevel.CRITICAL, show_user=True)
             return False
         finally:
             # Always execute teardown actions, even if tests failed
-            self._execute_teardown_actions()
\ No newline at end of file
+            self._execute_teardown_actions()
+
+    async def _run_test_case_async(self) -> bool:
+        """Run setup actions, checks and teardown actions on the event loop.
+        
+        Returns:
+            True if all tests passed, False otherwise
+        """
+        if self._all_checks_cached():
+            return self._run_test_case()
+        
+        try:
+            if not await asyncio.to_thread(self._execute_setup_actions):
+                self._run_error = "Setup actions failed"
+                self._console.print("Setup actions failed, aborting test execution", level=LogLevel.ERROR, show_user=True)
+                return False
+            
+            await self._execute_checks_async()
+            self._report_errors()
+            
+            return len(self._failed_checks) == 0
+            
+        except Exception as e:
+            self._run_error = f"Error during test execution: {e}"
+            self._console.print(self._run_error, level=LogLevel.CRITICAL, show_user=True)
+            return False
+        finally:
+            await asyncio.to_thread(self._execute_teardown_actions)
+
+    def _all_checks_cached(self) -> bool:
+        """Check whether every check result comes from the result cache."""
+        return self._checks_to_run is not None and not self._checks_to_run
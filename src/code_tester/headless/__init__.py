@@ -0,0 +1,65 @@
+"""Headless execution of arcade games."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .backend import headless_arcade
+    from .benchmark import FrameTimings, LoadBenchmark, measure_frames
+    from .display_list import PRIMITIVE_KINDS, RECORD_DTYPE, DisplayList
+    from .input_script import InputEvent, InputScript
+    from .simulation import (
+        DEFAULT_DELTA_TIME,
+        SimulationResult,
+        record_trajectory,
+        replay_input,
+        simulate_frames,
+        snapshot,
+    )
+    from .trajectory import Trajectory, TrajectoryRecorder
+    from .window import EVENT_HANDLED, HeadlessWindow
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "headless_arcade": ".backend",
+    "FrameTimings": ".benchmark",
+    "LoadBenchmark": ".benchmark",
+    "measure_frames": ".benchmark",
+    "PRIMITIVE_KINDS": ".display_list",
+    "RECORD_DTYPE": ".display_list",
+    "DisplayList": ".display_list",
+    "InputEvent": ".input_script",
+    "InputScript": ".input_script",
+    "DEFAULT_DELTA_TIME": ".simulation",
+    "SimulationResult": ".simulation",
+    "record_trajectory": ".simulation",
+    "replay_input": ".simulation",
+    "simulate_frames": ".simulation",
+    "snapshot": ".simulation",
+    "Trajectory": ".trajectory",
+    "TrajectoryRecorder": ".trajectory",
+    "EVENT_HANDLED": ".window",
+    "HeadlessWindow": ".window",
+})
+
+__all__ = [
+    "headless_arcade",
+    "FrameTimings",
+    "LoadBenchmark",
+    "measure_frames",
+    "PRIMITIVE_KINDS",
+    "RECORD_DTYPE",
+    "DisplayList",
+    "InputEvent",
+    "InputScript",
+    "DEFAULT_DELTA_TIME",
+    "SimulationResult",
+    "record_trajectory",
+    "replay_input",
+    "simulate_frames",
+    "snapshot",
+    "Trajectory",
+    "TrajectoryRecorder",
+    "EVENT_HANDLED",
+    "HeadlessWindow",
+]
@@ -0,0 +1,120 @@
+"""Replacement of arcade's window backend for headless runs."""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from .recorder import record_sprite_list, recording_functions
+from .window import HeadlessWindow, current_window
+
+# arcade's window functions are module globals, so headless sessions in one process run one at a time.
+_session_lock = threading.RLock()
+
+# Attributes that did not exist before the session, like draw functions removed from arcade.
+_MISSING = object()
+
+
+def _run(view: Any = None) -> None:
+    # The harness drives frames itself; showing the view is all the main loop would do first.
+    window = current_window()
+    if window is not None and view is not None:
+        window.show_view(view)
+
+
+def _exit() -> None:
+    window = current_window()
+    if window is not None:
+        window.close()
+
+
+def _close_window() -> None:
+    import arcade
+
+    _exit()
+    arcade.set_window(None)
+
+
+def _schedule(function: Callable[[float], Any], interval: float) -> None:
+    window = current_window()
+    if window is not None:
+        window.schedule(function, interval)
+
+
+def _schedule_once(function: Callable[[float], Any], delay: float) -> None:
+    window = current_window()
+    if window is not None:
+        window.schedule(function, delay, repeat=False)
+
+
+def _unschedule(function: Callable[[float], Any]) -> None:
+    window = current_window()
+    if window is not None:
+        window.unschedule(function)
+
+
+def _skip(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+_REPLACEMENTS: Dict[str, Any] = {
+    "Window": HeadlessWindow,
+    "run": _run,
+    "exit": _exit,
+    "close_window": _close_window,
+    "schedule": _schedule,
+    "schedule_once": _schedule_once,
+    "unschedule": _unschedule,
+    **recording_functions(),
+}
+
+_SPRITE_LIST_REPLACEMENTS: Dict[str, Any] = {
+    # Sprite lists allocate GPU buffers on creation; without them they still hold and update sprites.
+    "_init_deferred": _skip,
+    "draw": record_sprite_list,
+    "draw_hit_boxes": _skip,
+}
+
+
+def _patches(arcade: Any) -> List[Tuple[Any, str, Any]]:
+    return [
+        *((arcade, name, replacement) for name, replacement in _REPLACEMENTS.items()),
+        *((arcade.SpriteList, name, replacement) for name, replacement in _SPRITE_LIST_REPLACEMENTS.items()),
+    ]
+
+
+@contextmanager
+def headless_arcade() -> Iterator[None]:
+    """Swap arcade's window backend for :class:`HeadlessWindow` while the block runs.
+
+    Modules imported inside the block subclass ``HeadlessWindow`` when they
+    subclass ``arcade.Window``, the main loop functions return immediately
+    and scheduled functions follow the simulated clock of the window. Draw
+    functions, including ones removed in arcade 3.0, and
+    ``arcade.SpriteList.draw`` record into the display list of the window.
+    Everything, including the current window, is restored on exit.
+    Sessions in different threads wait for each other.
+
+    Yields:
+        None
+    """
+    with _session_lock:
+        import arcade
+
+        patches = _patches(arcade)
+        originals = [(owner, name, getattr(owner, name, _MISSING)) for owner, name, _ in patches]
+        try:
+            previous_window = arcade.get_window()
+        except RuntimeError:
+            previous_window = None
+
+        for owner, name, replacement in patches:
+            setattr(owner, name, replacement)
+        try:
+            yield
+        finally:
+            for owner, name, original in originals:
+                if original is _MISSING:
+                    delattr(owner, name)
+                else:
+                    setattr(owner, name, original)
+            arcade.set_window(previous_window)
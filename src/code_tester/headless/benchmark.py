@@ -0,0 +1,141 @@
+"""Frame time measurement of headless windows."""
+
+import gc
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, List
+
+import numpy as np
+
+from .simulation import DEFAULT_DELTA_TIME
+
+PHASES = ("update", "draw", "total")
+
+_PERCENTILE = re.compile(r"p(\d{1,2}(?:\.\d+)?)")
+
+
+def validate_statistic(name: str) -> None:
+    """Check a statistic name: ``median``, ``mean``, ``min``, ``max`` or a percentile like ``p95``.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name not in ("median", "mean", "min", "max") and _PERCENTILE.fullmatch(name) is None:
+        raise ValueError(f"Unknown statistic '{name}', expected median, mean, min, max or a percentile like p95")
+
+
+@dataclass(frozen=True)
+class FrameTimings:
+    """Frame times of a window with a number of entities.
+
+    Attributes:
+        entities: Number of entities added to the window
+        update_times: Seconds each measured frame spent in updates
+        draw_times: Seconds each measured frame spent in ``on_draw``, if drawing was measured
+    """
+
+    entities: int
+    update_times: np.ndarray
+    draw_times: np.ndarray | None = None
+
+    def times(self, phase: str = "update") -> np.ndarray:
+        """Get the frame times of a phase: ``update``, ``draw`` or their ``total``.
+
+        Raises:
+            ValueError: If the phase is unknown or drawing was not measured
+        """
+        if phase not in PHASES:
+            raise ValueError(f"Unknown phase '{phase}', expected one of {', '.join(PHASES)}")
+        if phase == "update":
+            return self.update_times
+        if self.draw_times is None:
+            raise ValueError("Draw times were not measured")
+        return self.draw_times if phase == "draw" else self.update_times + self.draw_times
+
+    def statistic(self, name: str, phase: str = "update") -> float:
+        """Compute a statistic of the frame times of a phase in seconds, see :func:`validate_statistic`.
+
+        Raises:
+            ValueError: If the statistic or the phase is unknown
+        """
+        validate_statistic(name)
+        times = self.times(phase)
+        if name in ("median", "mean", "min", "max"):
+            return float(getattr(np, name)(times))
+        return float(np.percentile(times, float(name[1:])))
+
+
+@dataclass(frozen=True)
+class LoadBenchmark:
+    """Frame timings of a window class for several numbers of entities.
+
+    Attributes:
+        runs: Timings ordered as the entity counts were given
+    """
+
+    runs: List[FrameTimings]
+
+    @property
+    def entities(self) -> List[int]:
+        """Get the entity counts of the runs."""
+        return [run.entities for run in self.runs]
+
+    def for_entities(self, entities: int) -> FrameTimings | None:
+        """Get the run with a number of entities, if measured."""
+        return next((run for run in self.runs if run.entities == entities), None)
+
+
+def measure_frames(
+    window: Any,
+    entities: int,
+    frames: int,
+    warmup: int = 10,
+    delta_time: float = DEFAULT_DELTA_TIME,
+    measure_draw: bool = False
+) -> FrameTimings:
+    """Time the frames of a headless window.
+
+    Warm-up frames run first and are not measured. Garbage is collected
+    before measuring, the collector stays enabled as in a real game.
+
+    Args:
+        window: Window created inside :func:`~code_tester.headless.headless_arcade`
+        entities: Number of entities the window was populated with, for reporting
+        frames: Number of frames to measure
+        warmup: Number of frames to run before measuring
+        delta_time: Seconds of game time per frame
+        measure_draw: Also time recording ``on_draw`` after every update
+
+    Returns:
+        Timings of the measured frames
+
+    Raises:
+        ValueError: If ``frames`` is not positive, ``warmup`` is negative or ``delta_time`` is not positive
+    """
+    if frames < 1:
+        raise ValueError("frames must be positive")
+    if warmup < 0:
+        raise ValueError("warmup must be non-negative")
+    if delta_time <= 0:
+        raise ValueError("delta_time must be positive")
+
+    advance, draw, clock = window.advance, window.draw, time.perf_counter
+    for _ in range(warmup):
+        advance(delta_time)
+        if measure_draw:
+            draw()
+
+    gc.collect()
+    update_times = np.empty(frames)
+    draw_times = np.empty(frames) if measure_draw else None
+    for frame in range(frames):
+        started = clock()
+        advance(delta_time)
+        updated = clock()
+        update_times[frame] = updated - started
+        if measure_draw:
+            draw()
+            draw_times[frame] = clock() - updated
+
+    return FrameTimings(entities, update_times, draw_times)
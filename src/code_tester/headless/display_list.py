@@ -0,0 +1,172 @@
+"""Array-backed display lists of recorded draw calls."""
+
+from typing import Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+PRIMITIVE_KINDS: Tuple[str, ...] = (
+    "circle", "ellipse", "arc", "rectangle", "line", "point", "triangle", "polygon", "parabola", "text", "sprite",
+)
+
+# One row per draw call: bounding box center and size, and the color as RGBA.
+RECORD_DTYPE = np.dtype([
+    ("kind", np.uint8),
+    ("filled", np.bool_),
+    ("x", np.float64),
+    ("y", np.float64),
+    ("width", np.float64),
+    ("height", np.float64),
+    ("color", np.uint8, (4,)),
+])
+
+_KIND_CODES = {kind: code for code, kind in enumerate(PRIMITIVE_KINDS)}
+# Kinds rendered as the ellipse inscribed in their bounding box rather than as the box.
+_ROUND_KINDS = frozenset(_KIND_CODES[kind] for kind in ("circle", "ellipse", "arc"))
+_TEXT_KIND = _KIND_CODES["text"]
+
+
+def kind_code(kind: str) -> int:
+    """Get the code stored in the ``kind`` column for a primitive kind.
+
+    Raises:
+        ValueError: If the kind is unknown
+    """
+    try:
+        return _KIND_CODES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown primitive kind '{kind}', expected one of {', '.join(PRIMITIVE_KINDS)}") from None
+
+
+def rgba(color: Iterable[int]) -> Tuple[int, int, int, int]:
+    """Convert an RGB or RGBA color to an RGBA tuple.
+
+    Raises:
+        ValueError: If the color does not have 3 or 4 components
+    """
+    components = tuple(int(c) for c in color)
+    if len(components) == 3:
+        return components + (255,)
+    if len(components) != 4:
+        raise ValueError(f"Expected an RGB or RGBA color, got {components}")
+    return components
+
+
+class DisplayList:
+    """Draw calls of a frame stored as rows of a structured numpy array.
+
+    Rows use :data:`RECORD_DTYPE`. Texts of ``draw_text`` calls are kept
+    separately by row index.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Initialize an empty display list with room for ``capacity`` draw calls."""
+        self._records = np.zeros(capacity, dtype=RECORD_DTYPE)
+        self._size = 0
+        self.texts: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """Get the number of recorded draw calls."""
+        return self._size
+
+    @property
+    def records(self) -> np.ndarray:
+        """Get the recorded rows (a view, valid until the next record or clear)."""
+        return self._records[:self._size]
+
+    def record(
+        self,
+        kind: str,
+        filled: bool,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        color: Iterable[int],
+        text: str | None = None
+    ) -> None:
+        """Append a draw call."""
+        if self._size == len(self._records):
+            self._records = np.resize(self._records, 2 * len(self._records))
+        self._records[self._size] = (_KIND_CODES[kind], filled, x, y, width, height, rgba(color))
+        if text is not None:
+            self.texts[self._size] = text
+        self._size += 1
+
+    def clear(self) -> None:
+        """Forget all draw calls, keeping the allocated rows."""
+        self._size = 0
+        self.texts.clear()
+
+    def select(
+        self,
+        kind: str | None = None,
+        filled: bool | None = None,
+        color: Sequence[int] | None = None,
+    ) -> np.ndarray:
+        """Get the indices of draw calls matching all given filters.
+
+        Args:
+            kind: Primitive kind from :data:`PRIMITIVE_KINDS`
+            filled: Whether the primitive is filled rather than outlined
+            color: RGB color, which ignores alpha, or RGBA color
+
+        Returns:
+            Indices into :attr:`records`
+
+        Raises:
+            ValueError: If the kind or the color is invalid
+        """
+        records = self.records
+        mask = np.ones(len(records), dtype=bool)
+        if kind is not None:
+            mask &= records["kind"] == kind_code(kind)
+        if filled is not None:
+            mask &= records["filled"] == filled
+        if color is not None:
+            channels = 3 if len(color) == 3 else 4
+            mask &= (records["color"][:, :channels] == rgba(color)[:channels]).all(axis=1)
+        return np.flatnonzero(mask)
+
+    def describe(self, index: int) -> str:
+        """Describe a draw call for error messages, e.g. ``filled circle at (x=10, y=20)``."""
+        row = self._records[index]
+        kind = PRIMITIVE_KINDS[row["kind"]]
+        style = "" if kind in ("text", "sprite", "point", "line") else ("filled " if row["filled"] else "outlined ")
+        name = f'text "{self.texts[index]}"' if kind == "text" else f"{style}{kind}"
+        return f"{name} at (x={row['x']:g}, y={row['y']:g})"
+
+    def render(self, width: int, height: int, background: Sequence[int] = (0, 0, 0)) -> np.ndarray:
+        """Rasterize the draw calls into a screenshot.
+
+        Only the bounding box of each draw call is recorded, so circles,
+        ellipses and arcs are drawn as the ellipse inscribed in their box and
+        every other primitive as the box itself, which is exact for
+        unrotated rectangles, sprites and axis-aligned lines. Texts are not
+        drawn. Colors are blended by their alpha in the order of the calls.
+
+        Args:
+            width: Width of the window in pixels
+            height: Height of the window in pixels
+            background: RGB or RGBA color the window was cleared with
+
+        Returns:
+            Array of shape (height, width, 3) with y growing downwards like image files
+        """
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGB", (width, height), rgba(background)[:3])
+        draw = ImageDraw.Draw(image, "RGBA")
+        for row in self.records:
+            if row["kind"] == _TEXT_KIND:
+                continue
+            # Arcade's y axis points up, the image's down.
+            left = row["x"] - row["width"] / 2
+            top = height - (row["y"] + row["height"] / 2)
+            box = (left, top, max(left, left + row["width"] - 1), max(top, top + row["height"] - 1))
+            color = tuple(row["color"].tolist())
+            shape = draw.ellipse if row["kind"] in _ROUND_KINDS else draw.rectangle
+            if row["filled"]:
+                shape(box, fill=color)
+            else:
+                shape(box, outline=color)
+        return np.asarray(image)
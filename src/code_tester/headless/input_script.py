@@ -0,0 +1,169 @@
+"""Timelines of keyboard and mouse events for headless windows.
+
+Input scripts are text files with one event per line::
+
+    # frame  event         arguments
+    0        mouse_motion  400 300
+    10       key_press     LEFT
+    14       key_release   LEFT
+    30       mouse_press   200 150 LEFT SHIFT
+    31       mouse_drag    220 160 LEFT
+    32       mouse_scroll  220 160 0 -1
+
+Keys, mouse buttons and modifiers are names from ``arcade.key`` and
+``arcade.MOUSE_BUTTON_*`` or integers; several modifiers are joined with
+``+``. Motion and drag events take the new mouse position, the movement is
+computed from the previous one. Blank lines and text after ``#`` are
+ignored.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class InputEvent:
+    """Event dispatched to a window before the update of a frame.
+
+    Attributes:
+        frame: Number of frames simulated before the event
+        event_type: Name of the window handler, e.g. ``on_key_press``
+        args: Arguments of the handler
+    """
+
+    frame: int
+    event_type: str
+    args: Tuple[Any, ...]
+
+
+def _lookup(module: Any, prefix: str, name: str, kind: str) -> int:
+    if name.lstrip("-").isdigit():
+        return int(name)
+    value = getattr(module, prefix + name.upper(), None)
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown {kind} '{name}'")
+    return value
+
+
+def _key(name: str) -> int:
+    import arcade
+
+    return _lookup(arcade.key, "", name, "key")
+
+
+def _button(name: str) -> int:
+    import arcade
+
+    return _lookup(arcade, "MOUSE_BUTTON_", name, "mouse button")
+
+
+def _modifier(name: str) -> int:
+    import arcade
+
+    return _lookup(arcade.key, "MOD_", name, "modifier")
+
+
+def _modifiers(names: List[str]) -> int:
+    modifiers = 0
+    for name in "+".join(names).split("+"):
+        if name:
+            modifiers |= _modifier(name)
+    return modifiers
+
+
+class _Parser:
+    def __init__(self):
+        self.mouse_x = 0.0
+        self.mouse_y = 0.0
+
+    def _move(self, x: str, y: str) -> Tuple[float, float, float, float]:
+        new_x, new_y = float(x), float(y)
+        dx, dy = new_x - self.mouse_x, new_y - self.mouse_y
+        self.mouse_x, self.mouse_y = new_x, new_y
+        return new_x, new_y, dx, dy
+
+    def parse(self, event: str, args: List[str]) -> Tuple[str, Tuple[Any, ...]]:
+        try:
+            return self._parse(event, args)
+        except (IndexError, TypeError):
+            raise ValueError(f"Invalid arguments for '{event}'") from None
+
+    def _parse(self, event: str, args: List[str]) -> Tuple[str, Tuple[Any, ...]]:
+        if event in ("key_press", "key_release"):
+            return f"on_{event}", (_key(args[0]), _modifiers(args[1:]))
+        if event == "mouse_motion":
+            return "on_mouse_motion", self._move(*args)
+        if event in ("mouse_press", "mouse_release"):
+            x, y = self._move(args[0], args[1])[:2]
+            button = _button(args[2]) if len(args) > 2 else _button("LEFT")
+            return f"on_{event}", (x, y, button, _modifiers(args[3:]))
+        if event == "mouse_drag":
+            buttons = _button(args[2]) if len(args) > 2 else _button("LEFT")
+            return "on_mouse_drag", (*self._move(args[0], args[1]), buttons, _modifiers(args[3:]))
+        if event == "mouse_scroll":
+            x, y = self._move(args[0], args[1])[:2]
+            return "on_mouse_scroll", (x, y, float(args[2]), float(args[3]))
+        raise ValueError(f"Unknown event '{event}'")
+
+
+class InputScript:
+    """Events of an input script grouped by frame for replay."""
+
+    def __init__(self, events: Iterable[InputEvent]):
+        """Initialize the script with events in any order."""
+        self.events = sorted(events, key=lambda event: event.frame)
+        self._by_frame: Dict[int, List[Tuple[str, Tuple[Any, ...]]]] = {}
+        for event in self.events:
+            self._by_frame.setdefault(event.frame, []).append((event.event_type, event.args))
+
+    def __len__(self) -> int:
+        """Get the number of events."""
+        return len(self.events)
+
+    @property
+    def last_frame(self) -> int:
+        """Get the frame of the last event, or 0 for an empty script."""
+        return self.events[-1].frame if self.events else 0
+
+    def events_at(self, frame: int) -> List[Tuple[str, Tuple[Any, ...]]]:
+        """Get the handler names and arguments of the events of a frame."""
+        return self._by_frame.get(frame, [])
+
+    @classmethod
+    def parse(cls, lines: Iterable[str]) -> "InputScript":
+        """Parse the lines of an input script.
+
+        Raises:
+            ValueError: If a line is not a valid event
+        """
+        entries = []
+        for number, line in enumerate(lines, 1):
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            if len(fields) < 2 or not fields[0].isdigit():
+                raise ValueError(f"Line {number}: expected '<frame> <event> [arguments]', got '{line.strip()}'")
+            entries.append((int(fields[0]), number, fields[1], fields[2:]))
+
+        # Mouse movement is relative to the previous position in time, not in the file.
+        entries.sort(key=lambda entry: entry[0])
+        parser = _Parser()
+        events = []
+        for frame, number, event, args in entries:
+            try:
+                events.append(InputEvent(frame, *parser.parse(event, args)))
+            except ValueError as e:
+                raise ValueError(f"Line {number}: {e}") from e
+        return cls(events)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "InputScript":
+        """Read and parse an input script file.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If a line is not a valid event
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.parse(f)
@@ -0,0 +1,144 @@
+"""Recording of arcade draw calls into display lists."""
+
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+from .window import current_window
+
+_WHITE = (255, 255, 255, 255)
+
+
+def _box(left: float, right: float, bottom: float, top: float) -> Tuple[float, float, float, float]:
+    return (left + right) / 2, (bottom + top) / 2, abs(right - left), abs(top - bottom)
+
+
+def _points_box(points: Iterable[Sequence[float]]) -> Tuple[float, float, float, float]:
+    xs, ys = np.asarray([tuple(point)[:2] for point in points], dtype=float).reshape(-1, 2).T
+    if not len(xs):
+        return 0.0, 0.0, 0.0, 0.0
+    return _box(xs.min(), xs.max(), ys.min(), ys.max())
+
+
+# Geometry of each draw function, taking the parameters of arcade's signature (or of arcade 2.x for legacy names).
+
+def _circle(center_x, center_y, radius, color, *args, **kwargs):
+    return center_x, center_y, 2 * radius, 2 * radius, color
+
+
+def _centered(center_x, center_y, width, height, color, *args, **kwargs):
+    return center_x, center_y, width, height, color
+
+
+def _rect(rect, color, *args, **kwargs):
+    return rect.x, rect.y, rect.width, rect.height, color
+
+
+def _lrbt(left, right, bottom, top, color, *args, **kwargs):
+    return (*_box(left, right, bottom, top), color)
+
+
+def _lrtb(left, right, top, bottom, color, *args, **kwargs):
+    return (*_box(left, right, bottom, top), color)
+
+
+def _lbwh(left, bottom, width, height, color, *args, **kwargs):
+    return left + width / 2, bottom + height / 2, width, height, color
+
+
+def _xywh(bottom_left_x, bottom_left_y, width, height, color, *args, **kwargs):
+    return bottom_left_x + width / 2, bottom_left_y + height / 2, width, height, color
+
+
+def _line(start_x, start_y, end_x, end_y, color, *args, **kwargs):
+    return (*_box(start_x, end_x, start_y, end_y), color)
+
+
+def _point(x, y, color, size=1.0, *args, **kwargs):
+    return x, y, size, size, color
+
+
+def _triangle(x1, y1, x2, y2, x3, y3, color, *args, **kwargs):
+    return (*_points_box([(x1, y1), (x2, y2), (x3, y3)]), color)
+
+
+def _point_list(point_list, color, *args, **kwargs):
+    return (*_points_box(point_list), color)
+
+
+def _parabola(start_x, start_y, end_x, height, color, *args, **kwargs):
+    return (*_box(start_x, end_x, start_y, start_y + height), color)
+
+
+def _text(text, x, y, color=_WHITE, *args, **kwargs):
+    return x, y, 0, 0, color, str(text)
+
+
+def _sprite(sprite, *args, **kwargs):
+    return sprite.center_x, sprite.center_y, sprite.width, sprite.height, sprite.color
+
+
+def _sprite_rect(sprite, rect, *args, **kwargs):
+    return rect.x, rect.y, rect.width, rect.height, sprite.color
+
+
+DRAW_FUNCTIONS: Dict[str, Tuple[str, bool, Callable[..., tuple]]] = {
+    "draw_circle_filled": ("circle", True, _circle),
+    "draw_circle_outline": ("circle", False, _circle),
+    "draw_ellipse_filled": ("ellipse", True, _centered),
+    "draw_ellipse_outline": ("ellipse", False, _centered),
+    "draw_arc_filled": ("arc", True, _centered),
+    "draw_arc_outline": ("arc", False, _centered),
+    "draw_rect_filled": ("rectangle", True, _rect),
+    "draw_rect_outline": ("rectangle", False, _rect),
+    "draw_lrbt_rectangle_filled": ("rectangle", True, _lrbt),
+    "draw_lrbt_rectangle_outline": ("rectangle", False, _lrbt),
+    "draw_lbwh_rectangle_filled": ("rectangle", True, _lbwh),
+    "draw_lbwh_rectangle_outline": ("rectangle", False, _lbwh),
+    "draw_line": ("line", False, _line),
+    "draw_lines": ("line", False, _point_list),
+    "draw_line_strip": ("line", False, _point_list),
+    "draw_point": ("point", True, _point),
+    "draw_points": ("point", True, _point_list),
+    "draw_triangle_filled": ("triangle", True, _triangle),
+    "draw_triangle_outline": ("triangle", False, _triangle),
+    "draw_polygon_filled": ("polygon", True, _point_list),
+    "draw_polygon_outline": ("polygon", False, _point_list),
+    "draw_parabola_filled": ("parabola", True, _parabola),
+    "draw_parabola_outline": ("parabola", False, _parabola),
+    "draw_text": ("text", True, _text),
+    "draw_sprite": ("sprite", True, _sprite),
+    "draw_sprite_rect": ("sprite", True, _sprite_rect),
+    # Removed in arcade 3.0 but still common in course material.
+    "draw_rectangle_filled": ("rectangle", True, _centered),
+    "draw_rectangle_outline": ("rectangle", False, _centered),
+    "draw_lrtb_rectangle_filled": ("rectangle", True, _lrtb),
+    "draw_lrtb_rectangle_outline": ("rectangle", False, _lrtb),
+    "draw_xywh_rectangle_filled": ("rectangle", True, _xywh),
+    "draw_xywh_rectangle_outline": ("rectangle", False, _xywh),
+}
+
+
+def recording_function(kind: str, filled: bool, geometry: Callable[..., tuple]) -> Callable[..., None]:
+    """Create a stand-in for a draw function that records into the display list of the current window."""
+    def record(*args: Any, **kwargs: Any) -> None:
+        window = current_window()
+        if window is not None:
+            window.display_list.record(kind, filled, *geometry(*args, **kwargs))
+
+    return record
+
+
+def record_sprite_list(sprite_list: Iterable[Any], *args: Any, **kwargs: Any) -> None:
+    """Stand-in for ``arcade.SpriteList.draw`` that records every visible sprite."""
+    window = current_window()
+    if window is None:
+        return
+    for sprite in sprite_list:
+        if sprite.visible:
+            window.display_list.record("sprite", True, *_sprite(sprite))
+
+
+def recording_functions() -> Dict[str, Callable[..., None]]:
+    """Get the stand-ins for all draw functions by arcade attribute name."""
+    return {name: recording_function(*entry) for name, entry in DRAW_FUNCTIONS.items()}
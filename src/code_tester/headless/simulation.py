@@ -0,0 +1,179 @@
+"""Fixed-step simulation of headless arcade windows."""
+
+import copy
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+
+from .input_script import InputScript
+from .trajectory import Trajectory, TrajectoryRecorder
+
+DEFAULT_DELTA_TIME = 1 / 60
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Outcome of simulating frames of a window.
+
+    Attributes:
+        window: The simulated window
+        frames: Number of frames simulated
+        simulated_time: Seconds of game time the frames covered
+        elapsed: Wall-clock seconds the simulation took
+    """
+
+    window: Any
+    frames: int
+    simulated_time: float
+    elapsed: float
+
+
+def simulate_frames(
+    window: Any,
+    frames: int,
+    delta_time: float = DEFAULT_DELTA_TIME,
+    draw_every_frame: bool = False
+) -> SimulationResult:
+    """Advance a headless window by a number of frames with a fixed timestep.
+
+    Frames run back to back, as fast as the updates allow.
+
+    Args:
+        window: Window created inside :func:`~code_tester.headless.headless_arcade`
+        frames: Number of frames to simulate
+        delta_time: Seconds of game time per frame
+        draw_every_frame: Record ``on_draw`` after every update, leaving the last frame in the display list
+
+    Returns:
+        Result with the window and timing information
+
+    Raises:
+        ValueError: If ``frames`` is negative or ``delta_time`` is not positive
+    """
+    if frames < 0:
+        raise ValueError("frames must be non-negative")
+    if delta_time <= 0:
+        raise ValueError("delta_time must be positive")
+
+    advance = window.advance
+    started = time.perf_counter()
+    if draw_every_frame:
+        for _ in range(frames):
+            advance(delta_time)
+            window.draw()
+    else:
+        for _ in range(frames):
+            advance(delta_time)
+
+    return SimulationResult(window, frames, frames * delta_time, time.perf_counter() - started)
+
+
+def snapshot(window: Any, frame: int, attributes: Iterable[str]) -> Dict[str, Any]:
+    """Copy attributes of a window, given as dotted paths like ``paddle.x``.
+
+    Returns:
+        Mapping of ``frame`` and every path to its value
+
+    Raises:
+        AttributeError: If an attribute does not exist
+    """
+    state: Dict[str, Any] = {"frame": frame}
+    for path in attributes:
+        value = window
+        for name in path.split("."):
+            value = getattr(value, name)
+        state[path] = copy.deepcopy(value)
+    return state
+
+
+def replay_input(
+    window: Any,
+    script: InputScript,
+    frames: int | None = None,
+    delta_time: float = DEFAULT_DELTA_TIME,
+    snapshot_frames: Iterable[int] = (),
+    attributes: Iterable[str] = ()
+) -> List[Dict[str, Any]]:
+    """Dispatch the events of an input script between fixed-step updates of a window.
+
+    At frame ``n``, after ``n`` updates, the events of that frame are
+    dispatched, a snapshot is taken if requested and the next update runs.
+
+    Args:
+        window: Window created inside :func:`~code_tester.headless.headless_arcade`
+        script: Events to dispatch
+        frames: Number of frames to simulate, by default up to the last event
+        delta_time: Seconds of game time per frame
+        snapshot_frames: Frames to take snapshots at
+        attributes: Dotted attribute paths copied into each snapshot
+
+    Returns:
+        Snapshots ordered by frame, see :func:`snapshot`
+
+    Raises:
+        ValueError: If ``frames`` is negative or ``delta_time`` is not positive
+    """
+    if frames is None:
+        frames = script.last_frame
+    if frames < 0:
+        raise ValueError("frames must be non-negative")
+    if delta_time <= 0:
+        raise ValueError("delta_time must be positive")
+
+    attributes = list(attributes)
+    pending = set(snapshot_frames)
+    snapshots = []
+    advance, dispatch_event, events_at = window.advance, window.dispatch_event, script.events_at
+
+    for frame in range(frames + 1):
+        for event_type, args in events_at(frame):
+            dispatch_event(event_type, *args)
+        if frame in pending:
+            snapshots.append(snapshot(window, frame, attributes))
+        if frame < frames:
+            advance(delta_time)
+
+    return snapshots
+
+
+def record_trajectory(
+    window: Any,
+    paths: Iterable[str],
+    frames: int,
+    delta_time: float = DEFAULT_DELTA_TIME,
+    every: int = 1
+) -> Trajectory:
+    """Advance a window with a fixed timestep and sample attribute paths of it.
+
+    The first sample is taken before the first update, then one after
+    every ``every`` frames.
+
+    Args:
+        window: Window created inside :func:`~code_tester.headless.headless_arcade`
+        paths: Attribute paths relative to the window, see :func:`~code_tester.headless.trajectory.compile_path`
+        frames: Number of frames to simulate
+        delta_time: Seconds of game time per frame
+        every: Number of frames between samples
+
+    Returns:
+        The recorded trajectory
+
+    Raises:
+        ValueError: If a path is malformed, ``frames`` is negative or ``delta_time`` or ``every`` is not positive
+    """
+    if frames < 0:
+        raise ValueError("frames must be non-negative")
+    if delta_time <= 0:
+        raise ValueError("delta_time must be positive")
+    if every < 1:
+        raise ValueError("every must be positive")
+
+    recorder = TrajectoryRecorder(paths, capacity=frames // every + 1)
+    advance, sample = window.advance, recorder.sample
+    sample(window, 0, 0.0)
+    for frame in range(1, frames + 1):
+        advance(delta_time)
+        if frame % every == 0:
+            sample(window, frame, frame * delta_time)
+
+    return recorder.trajectory()
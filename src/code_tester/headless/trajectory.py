@@ -0,0 +1,151 @@
+"""Recording of attribute values over many frames into numpy columns."""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+_SEGMENT = re.compile(r"([A-Za-z_]\w*)((?:\[(?:\*|-?\d+)\])*)")
+_INDEX = re.compile(r"\[(\*|-?\d+)\]")
+
+# Steps of a compiled path: ("attr", name), ("index", i) or ("each", None).
+Step = Tuple[str, Any]
+
+
+def compile_path(path: str) -> List[Step]:
+    """Compile an attribute path like ``balls[*].x`` or ``paddle.x``.
+
+    Segments are attribute names separated by dots, each optionally
+    followed by ``[i]`` to index a sequence or ``[*]`` to take every item.
+
+    Raises:
+        ValueError: If the path is malformed
+    """
+    steps: List[Step] = []
+    for segment in path.split("."):
+        match = _SEGMENT.fullmatch(segment)
+        if match is None:
+            raise ValueError(f"Invalid attribute path '{path}'")
+        steps.append(("attr", match.group(1)))
+        for index in _INDEX.findall(match.group(2)):
+            steps.append(("each", None) if index == "*" else ("index", int(index)))
+    return steps
+
+
+def resolve_path(root: Any, steps: List[Step]) -> List[Any]:
+    """Get the values a compiled path selects, one per item of every ``[*]``."""
+    values = [root]
+    for kind, argument in steps:
+        if kind == "attr":
+            values = [getattr(value, argument) for value in values]
+        elif kind == "index":
+            values = [value[argument] for value in values]
+        else:
+            values = [item for value in values for item in value]
+    return values
+
+
+class Trajectory:
+    """Sampled values of attribute paths.
+
+    Every path maps to a float array with one row per sample and one column
+    per selected value. Columns of items that did not exist at a sample are
+    NaN.
+
+    Attributes:
+        frames: Frame number of every sample
+        times: Simulated time of every sample in seconds
+    """
+
+    def __init__(self, frames: np.ndarray, times: np.ndarray, columns: Dict[str, np.ndarray]):
+        """Initialize the trajectory from sample arrays and one column per attribute path."""
+        self.frames = frames
+        self.times = times
+        self._columns = columns
+
+    def __len__(self) -> int:
+        """Get the number of samples."""
+        return len(self.frames)
+
+    def __contains__(self, path: str) -> bool:
+        """Check whether an attribute path was recorded."""
+        return path in self._columns
+
+    def __getitem__(self, path: str) -> np.ndarray:
+        """Get the recorded values of an attribute path, one per sample."""
+        return self._columns[path]
+
+    @property
+    def paths(self) -> List[str]:
+        """Get the recorded attribute paths."""
+        return list(self._columns)
+
+    @staticmethod
+    def label(path: str, column: int) -> str:
+        """Name a column for error messages, e.g. ``balls[1].x`` for column 1 of ``balls[*].x``."""
+        if "[*]" not in path:
+            return path
+        if path.count("[*]") == 1:
+            return path.replace("[*]", f"[{column}]")
+        return f"{path} #{column}"
+
+
+class TrajectoryRecorder:
+    """Sample attribute paths of an object into growable numpy columns."""
+
+    def __init__(self, paths: Iterable[str], capacity: int = 1024):
+        """Initialize the recorder.
+
+        Args:
+            paths: Attribute paths, see :func:`compile_path`
+            capacity: Number of samples to allocate up front
+
+        Raises:
+            ValueError: If a path is malformed
+        """
+        self._paths = {path: compile_path(path) for path in paths}
+        self._size = 0
+        self._frames = np.zeros(capacity, dtype=np.int64)
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._columns = {path: np.full((capacity, 1), np.nan) for path in self._paths}
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._frames)
+        self._frames = np.resize(self._frames, capacity)
+        self._times = np.resize(self._times, capacity)
+        for path, column in self._columns.items():
+            grown = np.full((capacity, column.shape[1]), np.nan)
+            grown[:self._size] = column[:self._size]
+            self._columns[path] = grown
+
+    def sample(self, root: Any, frame: int, time: float) -> None:
+        """Record the current values of all paths.
+
+        Raises:
+            AttributeError: If an attribute does not exist
+            TypeError, ValueError: If a value is not a number
+        """
+        if self._size == len(self._frames):
+            self._grow()
+        row = self._size
+        self._frames[row] = frame
+        self._times[row] = time
+
+        for path, steps in self._paths.items():
+            values = resolve_path(root, steps)
+            column = self._columns[path]
+            if len(values) > column.shape[1]:
+                widened = np.full((len(column), len(values)), np.nan)
+                widened[:, :column.shape[1]] = column
+                self._columns[path] = column = widened
+            column[row, :len(values)] = values
+        self._size += 1
+
+    def trajectory(self) -> Trajectory:
+        """Get the samples recorded so far."""
+        size = self._size
+        return Trajectory(
+            self._frames[:size].copy(),
+            self._times[:size].copy(),
+            {path: column[:size].copy() for path, column in self._columns.items()},
+        )
@@ -0,0 +1,278 @@
+"""GPU-free stand-in for ``arcade.Window``."""
+
+from typing import Any, Callable, List, Tuple
+
+from .display_list import DisplayList
+
+EVENT_HANDLED = True
+
+# Slack for comparing simulated times, which accumulate rounding errors of the frame durations.
+_TIME_EPSILON = 1e-9
+
+
+def current_window() -> "HeadlessWindow | None":
+    """Get the current arcade window if it is headless."""
+    import arcade
+
+    try:
+        window = arcade.get_window()
+    except RuntimeError:
+        return None
+    return window if isinstance(window, HeadlessWindow) else None
+
+
+class HeadlessWindow:
+    """Window with the interface of ``arcade.Window`` that never opens a display.
+
+    Solutions imported inside :func:`~code_tester.headless.headless_arcade`
+    subclass this class instead of ``arcade.Window``. It keeps the size,
+    title and background color, dispatches events to the current view
+    before the window like pyglet's handler stack, and advances a simulated
+    clock with :meth:`advance` instead of a real event loop. :meth:`draw`
+    records the draw calls of ``on_draw`` into :attr:`display_list`
+    instead of rendering them.
+    """
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        title: str | None = "Arcade Window",
+        *args: Any,
+        update_rate: float = 1 / 60,
+        fixed_rate: float = 1 / 60,
+        **kwargs: Any
+    ):
+        """Initialize the window and make it the current arcade window.
+
+        Arguments of ``arcade.Window`` that only concern the display are accepted and ignored.
+        """
+        import arcade
+
+        self._width = int(width)
+        self._height = int(height)
+        self._title = title
+        self._update_rate = update_rate
+        self._fixed_rate = fixed_rate
+        self._fixed_time_pending = 0.0
+        self._time = 0.0
+        self._current_view = None
+        self._scheduled: List[List[Any]] = []
+        self.background_color = arcade.color.BLACK
+        self.closed = False
+        self.ctx = None
+        self.display_list = DisplayList()
+
+        arcade.set_window(self)
+
+    @property
+    def width(self) -> int:
+        """Get the width of the window."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Get the height of the window."""
+        return self._height
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Get the width and height of the window."""
+        return self._width, self._height
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Get the center of the window."""
+        return self._width / 2, self._height / 2
+
+    @property
+    def center_x(self) -> float:
+        """Get the horizontal center of the window."""
+        return self._width / 2
+
+    @property
+    def center_y(self) -> float:
+        """Get the vertical center of the window."""
+        return self._height / 2
+
+    @property
+    def title(self) -> str | None:
+        """Get the title of the window."""
+        return self._title
+
+    @property
+    def time(self) -> float:
+        """Get the simulated time elapsed since the window was created."""
+        return self._time
+
+    @property
+    def current_view(self):
+        """Get the view shown in the window, if any."""
+        return self._current_view
+
+    def get_size(self) -> Tuple[int, int]:
+        """Get the width and height of the window."""
+        return self.size
+
+    def set_size(self, width: int, height: int) -> None:
+        """Resize the window and dispatch ``on_resize``."""
+        self._width, self._height = int(width), int(height)
+        self.dispatch_event("on_resize", self._width, self._height)
+
+    def set_caption(self, title: str) -> None:
+        """Set the title of the window."""
+        self._title = title
+
+    def set_update_rate(self, rate: float) -> None:
+        """Set the interval between ``on_update`` calls of the real event loop."""
+        self._update_rate = rate
+
+    def set_draw_rate(self, rate: float) -> None:
+        """Accept the draw rate; frames are only drawn on demand."""
+
+    def show_view(self, new_view) -> None:
+        """Hide the current view and show ``new_view`` in the window."""
+        if self._current_view is not None:
+            self._current_view.on_hide_view()
+        self._current_view = new_view
+        new_view.window = self
+        new_view.on_show_view()
+
+    def hide_view(self) -> None:
+        """Hide the current view without showing another one."""
+        if self._current_view is not None:
+            self._current_view.on_hide_view()
+        self._current_view = None
+
+    def close(self) -> None:
+        """Mark the window as closed."""
+        self.closed = True
+
+    def clear(self, *args: Any, **kwargs: Any) -> None:
+        """Clear the window by discarding the recorded draw calls."""
+        self.display_list.clear()
+
+    def flip(self) -> None:
+        """Do nothing; there is no buffer to swap."""
+
+    def run(self, *args: Any, **kwargs: Any) -> None:
+        """Return immediately; frames are simulated with :meth:`advance`."""
+
+    def set_mouse_visible(self, visible: bool = True) -> None:
+        """Do nothing; there is no cursor."""
+
+    def set_fullscreen(self, *args: Any, **kwargs: Any) -> None:
+        """Do nothing; there is no display."""
+
+    def set_visible(self, visible: bool = True) -> None:
+        """Do nothing; the window is never shown."""
+
+    def set_vsync(self, vsync: bool) -> None:
+        """Do nothing; there is no display to synchronize with."""
+
+    def center_window(self) -> None:
+        """Do nothing; there is no screen to center on."""
+
+    def activate(self) -> None:
+        """Do nothing; there is no OpenGL context."""
+
+    def switch_to(self) -> None:
+        """Do nothing; there is no OpenGL context."""
+
+    def minimize(self) -> None:
+        """Do nothing; the window is never shown."""
+
+    def maximize(self) -> None:
+        """Do nothing; the window is never shown."""
+
+    def on_draw(self) -> None:
+        """Handle drawing a frame; overridden by solutions."""
+
+    def on_update(self, delta_time: float) -> None:
+        """Handle a frame update; overridden by solutions."""
+
+    def on_fixed_update(self, delta_time: float) -> None:
+        """Handle a fixed-rate update; overridden by solutions."""
+
+    def on_resize(self, width: int, height: int) -> None:
+        """Handle a resize of the window; overridden by solutions."""
+
+    def on_key_press(self, symbol: int, modifiers: int) -> None:
+        """Handle a key press; overridden by solutions."""
+
+    def on_key_release(self, symbol: int, modifiers: int) -> None:
+        """Handle a key release; overridden by solutions."""
+
+    def on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> None:
+        """Handle mouse motion; overridden by solutions."""
+
+    def on_mouse_press(self, x: int, y: int, button: int, modifiers: int) -> None:
+        """Handle a mouse button press; overridden by solutions."""
+
+    def on_mouse_release(self, x: int, y: int, button: int, modifiers: int) -> None:
+        """Handle a mouse button release; overridden by solutions."""
+
+    def on_mouse_drag(self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int) -> None:
+        """Handle mouse motion with buttons held; overridden by solutions."""
+
+    def on_mouse_scroll(self, x: int, y: int, scroll_x: int, scroll_y: int) -> None:
+        """Handle mouse scrolling; overridden by solutions."""
+
+    def dispatch_event(self, event_type: str, *args: Any) -> bool:
+        """Call an event handler of the current view, then of the window unless the view handled it.
+
+        Returns:
+            Whether a handler returned ``EVENT_HANDLED``
+        """
+        if self._current_view is not None:
+            handler = getattr(self._current_view, event_type, None)
+            if handler is not None and handler(*args) is EVENT_HANDLED:
+                return True
+        return getattr(self, event_type)(*args) is EVENT_HANDLED
+
+    def draw(self) -> DisplayList:
+        """Record the draw calls of one ``on_draw`` of the current view or the window.
+
+        Returns:
+            The display list, which is reused by the next call
+        """
+        self.display_list.clear()
+        self.dispatch_event("on_draw")
+        return self.display_list
+
+    def schedule(self, function: Callable[[float], Any], interval: float, repeat: bool = True) -> None:
+        """Call ``function`` with the elapsed time every ``interval`` simulated seconds."""
+        self._scheduled.append([function, interval, self._time + interval, self._time, repeat])
+
+    def unschedule(self, function: Callable[[float], Any]) -> None:
+        """Stop calling a function scheduled with :meth:`schedule`."""
+        self._scheduled = [entry for entry in self._scheduled if entry[0] != function]
+
+    def advance(self, delta_time: float) -> None:
+        """Simulate one frame of ``delta_time`` seconds.
+
+        Runs the fixed updates that became due, ``on_update`` and the
+        scheduled functions that became due, in the order of arcade's loop.
+        """
+        self._time += delta_time
+
+        self._fixed_time_pending += delta_time
+        while self._fixed_time_pending >= self._fixed_rate:
+            self._fixed_time_pending -= self._fixed_rate
+            self.dispatch_event("on_fixed_update", self._fixed_rate)
+
+        self.dispatch_event("on_update", delta_time)
+
+        if self._scheduled:
+            self._run_scheduled()
+
+    def _run_scheduled(self) -> None:
+        for entry in list(self._scheduled):
+            function, interval, due, last_call, repeat = entry
+            if due > self._time + _TIME_EPSILON:
+                continue
+            if repeat:
+                entry[2], entry[3] = due + interval, self._time
+            else:
+                self._scheduled.remove(entry)
+            function(self._time - last_call)
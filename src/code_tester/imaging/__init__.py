@@ -0,0 +1,53 @@
+"""Comparison of screenshots with reference images."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .compare import (
+        ImageComparison,
+        compare_exact,
+        compare_phash,
+        compare_ssim,
+        compare_within_tolerance,
+        perceptual_hash,
+        structural_similarity,
+    )
+    from .images import load_image
+    from .pyramid import ImagePyramid, downsample
+    from .store import ReferenceImage, ReferenceImageStore, default_reference_dir, get_reference_store
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ImageComparison": ".compare",
+    "compare_exact": ".compare",
+    "compare_phash": ".compare",
+    "compare_ssim": ".compare",
+    "compare_within_tolerance": ".compare",
+    "perceptual_hash": ".compare",
+    "structural_similarity": ".compare",
+    "load_image": ".images",
+    "ImagePyramid": ".pyramid",
+    "downsample": ".pyramid",
+    "ReferenceImage": ".store",
+    "ReferenceImageStore": ".store",
+    "default_reference_dir": ".store",
+    "get_reference_store": ".store",
+})
+
+__all__ = [
+    "ImageComparison",
+    "compare_exact",
+    "compare_phash",
+    "compare_ssim",
+    "compare_within_tolerance",
+    "perceptual_hash",
+    "structural_similarity",
+    "load_image",
+    "ImagePyramid",
+    "downsample",
+    "ReferenceImage",
+    "ReferenceImageStore",
+    "default_reference_dir",
+    "get_reference_store",
+]
@@ -0,0 +1,237 @@
+"""Comparisons of screenshots with reference images."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .pyramid import ImagePyramid
+
+HASH_SIZE = 8
+# Side of the grayscale thumbnail whose low DCT frequencies form the perceptual hash.
+_HASH_SOURCE_SIZE = HASH_SIZE * 4
+_GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+# Smallest side of the pyramid level that exact and tolerance compares check first.
+COARSE_LEVEL_SIZE = 32
+# Slack for the float32 block averages of coarse levels, far below the smallest channel step of 1.
+_LEVEL_EPSILON = 1e-3
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    k = np.arange(size)[:, np.newaxis]
+    n = np.arange(size)[np.newaxis, :]
+    return np.cos(np.pi * (2 * n + 1) * k / (2 * size)).astype(np.float32)
+
+
+_DCT = _dct_matrix(_HASH_SOURCE_SIZE)
+
+
+@dataclass(frozen=True)
+class ImageComparison:
+    """Outcome of comparing an image with a reference.
+
+    Attributes:
+        passed: Whether the image matches the reference
+        score: Measure the verdict is based on: differing pixels, largest
+            channel difference, SSIM or hash distance
+        level: Pyramid level that decided the verdict, 0 being full resolution
+        details: Description of the difference if the image does not match
+    """
+
+    passed: bool
+    score: float
+    level: int = 0
+    details: str | None = None
+
+
+def _shape_mismatch(actual: ImagePyramid, reference: ImagePyramid) -> ImageComparison | None:
+    if actual.shape == reference.shape:
+        return None
+    (height, width), (expected_height, expected_width) = actual.shape[:2], reference.shape[:2]
+    return ImageComparison(
+        False, float("inf"), details=f"Expected a {expected_width}x{expected_height} image, got {width}x{height}"
+    )
+
+
+def _pixel_mismatch(
+    actual: np.ndarray, reference: np.ndarray, differing: np.ndarray, score: float, what: str
+) -> ImageComparison:
+    count = int(np.count_nonzero(differing))
+    if count == 0:
+        return ImageComparison(True, score)
+
+    y, x = np.unravel_index(int(np.argmax(differing)), differing.shape)
+    details = (
+        f"{count} of {differing.size} pixels {what}, first at (x={x}, y={y}): "
+        f"{tuple(actual[y, x].tolist())} != {tuple(reference[y, x].tolist())}"
+    )
+    return ImageComparison(False, score, details=details)
+
+
+def _coarse_mismatch(
+    actual: ImagePyramid, reference: ImagePyramid, tolerance: float, min_size: int, what: str, count_score: bool
+) -> ImageComparison | None:
+    # The average of a block differs by at most the largest difference of its pixels, so an average
+    # differing by more than the tolerance proves that a full resolution pixel does too.
+    level = actual.coarsest_index(min_size)
+    if level == 0:
+        return None
+
+    difference = np.abs(actual.level(level) - reference.level(level)).max(axis=2)
+    differing = difference > tolerance + _LEVEL_EPSILON
+    count = int(np.count_nonzero(differing))
+    if count == 0:
+        return None
+
+    # Only the first differing block is read at full resolution, to name a pixel that exceeds the tolerance.
+    scale = 2 ** level
+    block_y, block_x = np.unravel_index(int(np.argmax(differing)), differing.shape)
+    rows = slice(block_y * scale, (block_y + 1) * scale)
+    columns = slice(block_x * scale, (block_x + 1) * scale)
+    block = np.abs(actual.image[rows, columns].astype(np.int16) - reference.image[rows, columns]).max(axis=2)
+    y, x = np.unravel_index(int(np.argmax(block)), block.shape)
+    y, x = y + rows.start, x + columns.start
+
+    details = (
+        f"Pixels {what} in {count} of {differing.size} {scale}x{scale} blocks, first at (x={x}, y={y}): "
+        f"{tuple(actual.image[y, x].tolist())} != {tuple(reference.image[y, x].tolist())}"
+    )
+    score = float(count) if count_score else float(difference.max())
+    return ImageComparison(False, score, level, details)
+
+
+def compare_exact(actual: ImagePyramid, reference: ImagePyramid, min_size: int = COARSE_LEVEL_SIZE) -> ImageComparison:
+    """Require every pixel to be equal.
+
+    Blocks of the smallest pyramid level whose sides are at least
+    ``min_size`` are compared first: a block whose average differs already
+    fails the image, and the reference's levels are precomputed by the
+    store. Otherwise every pixel is compared at full resolution.
+
+    Args:
+        actual: Pyramid of the image to check
+        reference: Pyramid of the reference image
+        min_size: Smallest side of the coarse level
+
+    Returns:
+        Comparison whose score is the number of differing pixels, or of
+        differing blocks if a coarse level decided
+    """
+    mismatch = _shape_mismatch(actual, reference)
+    if mismatch is not None:
+        return mismatch
+
+    mismatch = _coarse_mismatch(actual, reference, 0, min_size, "differ", count_score=True)
+    if mismatch is not None:
+        return mismatch
+
+    differing = np.any(actual.image != reference.image, axis=2)
+    return _pixel_mismatch(actual.image, reference.image, differing, float(np.count_nonzero(differing)), "differ")
+
+
+def compare_within_tolerance(
+    actual: ImagePyramid, reference: ImagePyramid, tolerance: float, min_size: int = COARSE_LEVEL_SIZE
+) -> ImageComparison:
+    """Require every channel of every pixel to be within ``tolerance`` of the reference.
+
+    Like :func:`compare_exact`, a coarse level whose block averages differ
+    by more than ``tolerance`` fails the image before full resolution.
+
+    Args:
+        actual: Pyramid of the image to check
+        reference: Pyramid of the reference image
+        tolerance: Largest allowed channel difference
+        min_size: Smallest side of the coarse level
+
+    Returns:
+        Comparison whose score is the largest channel difference, of block
+        averages if a coarse level decided
+    """
+    mismatch = _shape_mismatch(actual, reference)
+    if mismatch is not None:
+        return mismatch
+
+    mismatch = _coarse_mismatch(
+        actual, reference, tolerance, min_size, f"differ by more than {tolerance}", count_score=False
+    )
+    if mismatch is not None:
+        return mismatch
+
+    difference = np.abs(actual.image.astype(np.int16) - reference.image).max(axis=2)
+    return _pixel_mismatch(
+        actual.image,
+        reference.image,
+        difference > tolerance,
+        float(difference.max()),
+        f"differ by more than {tolerance}",
+    )
+
+
+def structural_similarity(actual: np.ndarray, reference: np.ndarray) -> float:
+    """Compute the mean SSIM of two images of equal shape over all channels."""
+    from skimage.metrics import structural_similarity as ssim
+
+    # The sliding window must fit the image and have an odd side.
+    smallest_side = min(actual.shape[:2])
+    win_size = min(7, smallest_side if smallest_side % 2 else smallest_side - 1)
+    return float(ssim(actual, reference, win_size=max(win_size, 1), channel_axis=2, data_range=255))
+
+
+def compare_ssim(actual: ImagePyramid, reference: ImagePyramid, threshold: float) -> ImageComparison:
+    """Require the structural similarity to reach ``threshold``.
+
+    SSIM is always decided at full resolution: scores of coarser pyramid
+    levels bound neither side, e.g. averaging removes fine noise but keeps
+    smooth brightness changes. Identical images pass without computing SSIM.
+
+    Args:
+        actual: Pyramid of the image to check
+        reference: Pyramid of the reference image
+        threshold: Minimum SSIM, at most 1
+
+    Returns:
+        Comparison whose score is the SSIM
+    """
+    mismatch = _shape_mismatch(actual, reference)
+    if mismatch is not None:
+        return mismatch
+
+    if np.array_equal(actual.image, reference.image):
+        return ImageComparison(True, 1.0)
+
+    score = structural_similarity(actual.image, reference.image)
+    if score >= threshold:
+        return ImageComparison(True, score)
+    return ImageComparison(False, score, details=f"SSIM {score:.4f} is below the threshold {threshold}")
+
+
+def perceptual_hash(image: ImagePyramid) -> int:
+    """Compute the 64-bit DCT perceptual hash of an image.
+
+    The grayscale thumbnail the hash is computed from is taken from the
+    smallest pyramid level that is still larger than the thumbnail, so
+    the full resolution image is only read once to build the pyramid.
+    """
+    from PIL import Image
+
+    level = image.level(image.coarsest_index(_HASH_SOURCE_SIZE))
+    gray = level.astype(np.float32) @ _GRAY_WEIGHTS
+    thumbnail = np.asarray(
+        Image.fromarray(gray).resize((_HASH_SOURCE_SIZE, _HASH_SOURCE_SIZE), Image.Resampling.BOX)
+    )
+
+    low_frequencies = (_DCT @ thumbnail @ _DCT.T)[:HASH_SIZE, :HASH_SIZE]
+    bits = (low_frequencies > np.median(low_frequencies)).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def compare_phash(actual: ImagePyramid, reference_hash: int, max_distance: int) -> ImageComparison:
+    """Require the perceptual hashes to differ in at most ``max_distance`` bits.
+
+    The score is the Hamming distance of the hashes.
+    """
+    distance = (perceptual_hash(actual) ^ reference_hash).bit_count()
+    if distance <= max_distance:
+        return ImageComparison(True, float(distance))
+    return ImageComparison(
+        False, float(distance), details=f"Perceptual hashes differ in {distance} bits, at most {max_distance} allowed"
+    )
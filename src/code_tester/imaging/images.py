@@ -0,0 +1,52 @@
+"""Conversion of screenshots and reference images to pixel arrays."""
+
+import io
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+def load_image(source: Any) -> np.ndarray:
+    """Convert an image to an RGB pixel array.
+
+    Args:
+        source: ``PIL.Image.Image``, array of shape (H, W), (H, W, 3) or
+            (H, W, 4), path of an image file, or encoded image bytes
+
+    Returns:
+        Array of shape (H, W, 3) and dtype uint8; alpha channels are dropped
+
+    Raises:
+        OSError: If an image file cannot be read or decoded
+        ValueError: If the source is not an image
+    """
+    if isinstance(source, (str, Path, bytes, bytearray)):
+        from PIL import Image
+
+        data = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+        with Image.open(data) as image:
+            return np.asarray(image.convert("RGB"))
+
+    if hasattr(source, "convert") and hasattr(source, "mode"):
+        return np.asarray(source.convert("RGB"))
+
+    return _normalize_array(np.asarray(source))
+
+
+def _normalize_array(array: np.ndarray) -> np.ndarray:
+    if array.dtype.kind not in "buif":
+        raise ValueError(f"Image arrays must be numeric, got dtype {array.dtype}")
+    if array.ndim == 2:
+        array = array[:, :, np.newaxis]
+    if array.ndim != 3 or array.shape[2] not in (1, 3, 4) or 0 in array.shape:
+        raise ValueError(f"Expected an image array of shape (H, W[, 1|3|4]), got {array.shape}")
+
+    if array.shape[2] == 1:
+        array = np.repeat(array, 3, axis=2)
+    elif array.shape[2] == 4:
+        array = array[:, :, :3]
+
+    if array.dtype != np.uint8:
+        array = np.clip(np.rint(array), 0, 255).astype(np.uint8)
+    return np.ascontiguousarray(array)
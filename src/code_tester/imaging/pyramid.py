@@ -0,0 +1,94 @@
+"""Image pyramids for coarse-to-fine comparisons."""
+
+import threading
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+
+def downsample(image: np.ndarray) -> np.ndarray:
+    """Halve an image by averaging 2x2 blocks.
+
+    An odd last row or column is dropped.
+
+    Args:
+        image: Array of shape (H, W, C)
+
+    Returns:
+        Float32 array of shape (H // 2, W // 2, C)
+    """
+    height, width = image.shape[0] // 2, image.shape[1] // 2
+    blocks = image[:height * 2, :width * 2].reshape(height, 2, width, 2, image.shape[2])
+    return blocks.mean(axis=(1, 3), dtype=np.float32)
+
+
+class ImagePyramid:
+    """Successively halved versions of an image.
+
+    Level 0 is the image itself and every further level averages 2x2 blocks
+    of the previous one, so level ``n`` has ``1 / 4**n`` of the pixels.
+    Levels are built on first use; a pyramid can be shared between threads.
+    """
+
+    def __init__(self, image: np.ndarray, coarser_levels: Mapping[int, np.ndarray] | None = None):
+        """Initialize the pyramid.
+
+        Args:
+            image: Full resolution array of shape (H, W, C)
+            coarser_levels: Already built levels by number, e.g. memory-mapped from a store
+        """
+        self._levels: Dict[int, np.ndarray] = {0: image, **(coarser_levels or {})}
+        self._lock = threading.Lock()
+
+    @property
+    def image(self) -> np.ndarray:
+        """Get the full resolution image."""
+        return self._levels[0]
+
+    @property
+    def built_levels(self) -> Dict[int, np.ndarray]:
+        """Get the levels built so far by number, full resolution first."""
+        return dict(sorted(self._levels.items()))
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Get the shape of the full resolution image."""
+        return self._levels[0].shape
+
+    def level(self, index: int) -> np.ndarray:
+        """Get a level of the pyramid, building it from the nearest finer built level if needed.
+
+        Args:
+            index: Level number, 0 being full resolution
+
+        Returns:
+            Image of the level
+
+        Raises:
+            IndexError: If the level would have no pixels
+        """
+        level = self._levels.get(index)
+        if level is not None:
+            return level
+
+        with self._lock:
+            finest = max(built for built in self._levels if built <= index)
+            level = self._levels[finest]
+            for number in range(finest + 1, index + 1):
+                if min(level.shape[:2]) < 2:
+                    raise IndexError(f"Pyramid of shape {self.shape} has no level {index}")
+                level = downsample(level)
+                self._levels[number] = level
+            return level
+
+    def coarsest_index(self, min_size: int) -> int:
+        """Get the number of the smallest level whose sides are all at least ``min_size``.
+
+        Returns 0 when even the full resolution image is smaller.
+        """
+        index = 0
+        height, width = self.shape[:2]
+        while min(height, width) // 2 >= min_size:
+            height, width = height // 2, width // 2
+            index += 1
+        return index
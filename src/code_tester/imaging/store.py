@@ -0,0 +1,230 @@
+"""Store of decoded reference images shared between checks, processes and runs."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from ..__version__ import __version__
+from .compare import COARSE_LEVEL_SIZE, perceptual_hash
+from .images import load_image
+from .pyramid import ImagePyramid
+
+_STORE_FORMAT = 2
+
+
+def default_reference_dir() -> Path:
+    """Get the reference store location in the user cache directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "code-tester" / "references"
+
+
+@dataclass(frozen=True)
+class ReferenceImage:
+    """A decoded reference image with its precomputed variants.
+
+    Attributes:
+        key: SHA-256 of the encoded image, or of the pixels of an in-memory image
+        pyramid: Pyramid with the full resolution image and the coarse level
+            exact and tolerance compares check first, memory-mapped when read from disk
+        phash: Perceptual hash of the image
+    """
+
+    key: str
+    pyramid: ImagePyramid
+    phash: int
+
+
+class ReferenceImageStore:
+    """Reference images decoded once per content.
+
+    Decoding a PNG and building its pyramid and perceptual hash is done once
+    per distinct file content. The results are kept in memory and, when a
+    directory is given, saved as ``.npy`` arrays that later processes
+    memory-map instead of decoding the PNG again, so a cohort of solutions
+    graded by many workers shares one decoded copy through the page cache.
+    A file whose path, modification time and size are unchanged since it
+    was last loaded is not even read again.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_entries: int = 256):
+        """Initialize the store.
+
+        Args:
+            cache_dir: Optional directory for the decoded arrays
+            max_entries: Maximum number of reference images kept in memory
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, ReferenceImage] = OrderedDict()
+        self._file_keys: Dict[Path, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Get the directory of the decoded arrays, if enabled."""
+        return self._cache_dir
+
+    def load(self, source: Any) -> ReferenceImage:
+        """Get the decoded reference image of a file or an in-memory image.
+
+        Args:
+            source: Path of an image file, or anything ``load_image`` accepts
+
+        Returns:
+            Reference image with its pyramid and perceptual hash
+
+        Raises:
+            OSError: If the file cannot be read or decoded
+            ValueError: If the source is not an image
+        """
+        if isinstance(source, (str, Path)):
+            return self._load_file(Path(source))
+
+        image = load_image(source)
+        digest = hashlib.sha256(repr(image.shape).encode("ascii"))
+        digest.update(image.tobytes())
+        return self._get(digest.hexdigest(), lambda: image)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._file_keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of reference images in memory."""
+        return len(self._entries)
+
+    def _load_file(self, path: Path) -> ReferenceImage:
+        resolved = path.resolve()
+        stat = resolved.stat()
+
+        with self._lock:
+            known = self._file_keys.get(resolved)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                reference = self._entries.get(known[2])
+                if reference is not None:
+                    self._entries.move_to_end(known[2])
+                    self.hits += 1
+                    return reference
+
+        data = resolved.read_bytes()
+        reference = self._get(hashlib.sha256(data).hexdigest(), lambda: load_image(data))
+        with self._lock:
+            self._file_keys[resolved] = (stat.st_mtime_ns, stat.st_size, reference.key)
+        return reference
+
+    def _get(self, key: str, decode: Callable[[], np.ndarray]) -> ReferenceImage:
+        with self._lock:
+            reference = self._entries.get(key)
+            if reference is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return reference
+
+        reference = self._load_from_disk(key)
+        if reference is None:
+            reference = self._build(key, decode())
+            self._store_on_disk(reference)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = reference
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return reference
+
+    @staticmethod
+    def _build(key: str, image: np.ndarray) -> ReferenceImage:
+        pyramid = ImagePyramid(image)
+        phash = perceptual_hash(pyramid)
+        # Only the levels compares read are kept; the hash is all that perceptual compares need.
+        coarse = pyramid.coarsest_index(COARSE_LEVEL_SIZE)
+        return ReferenceImage(key, ImagePyramid(image, {coarse: pyramid.level(coarse)}), phash)
+
+    def _entry_dir(self, key: str) -> Path:
+        # Downsampling or hashing may change between versions, so entries of other versions are never trusted.
+        return self._cache_dir / f"{key}.{__version__}"
+
+    def _load_from_disk(self, key: str) -> ReferenceImage | None:
+        if self._cache_dir is None:
+            return None
+
+        entry_dir = self._entry_dir(key)
+        try:
+            meta = json.loads((entry_dir / "meta.json").read_text("utf-8"))
+            if meta.get("format") != _STORE_FORMAT:
+                return None
+            levels = {int(index): np.load(entry_dir / f"level{index}.npy", mmap_mode="r") for index in meta["levels"]}
+            phash = int(meta["phash"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        image = levels.pop(0, None)
+        if image is None or image.dtype != np.uint8 or image.ndim != 3:
+            return None
+        return ReferenceImage(key, ImagePyramid(image, levels), phash)
+
+    def _store_on_disk(self, reference: ReferenceImage) -> None:
+        if self._cache_dir is None:
+            return
+
+        levels = reference.pyramid.built_levels
+        tmp_dir = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(dir=self._cache_dir, suffix=".tmp")
+            for index, level in levels.items():
+                np.save(os.path.join(tmp_dir, f"level{index}.npy"), level)
+            meta = {"format": _STORE_FORMAT, "levels": list(levels), "phash": reference.phash}
+            Path(tmp_dir, "meta.json").write_text(json.dumps(meta), "utf-8")
+            # Renaming the directory publishes the entry atomically; another process may have won the race.
+            os.rename(tmp_dir, self._entry_dir(reference.key))
+            tmp_dir = None
+        except OSError:
+            # An unwritable store only loses the sharing between processes.
+            pass
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+_shared_stores: dict[Path | None, ReferenceImageStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def get_reference_store(cache_dir: Path | None = None) -> ReferenceImageStore:
+    """Get the process-wide reference image store for a directory.
+
+    Args:
+        cache_dir: Directory of the decoded arrays, the user cache directory if omitted
+
+    Returns:
+        Shared ReferenceImageStore instance
+    """
+    key = (cache_dir or default_reference_dir()).resolve()
+
+    with _shared_stores_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = ReferenceImageStore(cache_dir=key)
+            _shared_stores[key] = store
+        return store
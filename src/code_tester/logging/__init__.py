@@ -1,8 +1,31 @@
-from .logger import Logger, setup_logger, get_logger, set_trace_id, set_test_case, set_check_id, generate_trace_id
-from .config import LogConfig, LogLevel
-from .console import Console
-from .decorators import log_initialization
-from .formatters import ConsoleFormatter, FileFormatter, JsonFormatter
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+from .levels import LogLevel
+
+if TYPE_CHECKING:
+    from .logger import Logger, setup_logger, get_logger, set_trace_id, set_test_case, set_check_id, generate_trace_id
+    from .config import LogConfig
+    from .console import Console
+    from .decorators import log_initialization
+    from .formatters import ConsoleFormatter, FileFormatter, JsonFormatter
+
+# loguru, rich and pydantic are imported when the first export that needs them is used.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Logger": ".logger",
+    "setup_logger": ".logger",
+    "get_logger": ".logger",
+    "set_trace_id": ".logger",
+    "set_test_case": ".logger",
+    "set_check_id": ".logger",
+    "generate_trace_id": ".logger",
+    "LogConfig": ".config",
+    "Console": ".console",
+    "log_initialization": ".decorators",
+    "ConsoleFormatter": ".formatters",
+    "FileFormatter": ".formatters",
+    "JsonFormatter": ".formatters",
+})
 
 __all__ = [
     "Logger",
@@ -19,4 +42,4 @@ __all__ = [
     "ConsoleFormatter",
     "FileFormatter",
     "JsonFormatter",
-]
\ No newline at end of file
+]
@@ -1,18 +1,9 @@
-from enum import StrEnum
 from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
-
-class LogLevel(StrEnum):
-    TRACE = "TRACE"
-    DEBUG = "DEBUG" 
-    INFO = "INFO"
-    SUCCESS = "SUCCESS"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
+from .levels import LogLevel
 
 
 class LogConfig(BaseModel):
@@ -1,7 +1,27 @@
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
 from .core_actions import CoreActionsProvider
 from .core_assertions import CoreAssertionsProvider
 
+if TYPE_CHECKING:
+    from .arcade_actions import ArcadeActionsProvider
+    from .arcade_assertions import ArcadeAssertionsProvider
+    from .image_assertions import ImageAssertionsProvider
+    from .numeric_assertions import NumericAssertionsProvider
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ArcadeActionsProvider": ".arcade_actions",
+    "ArcadeAssertionsProvider": ".arcade_assertions",
+    "ImageAssertionsProvider": ".image_assertions",
+    "NumericAssertionsProvider": ".numeric_assertions",
+})
+
 __all__ = [
+    "ArcadeActionsProvider",
+    "ArcadeAssertionsProvider",
     "CoreActionsProvider",
     "CoreAssertionsProvider",
-]
\ No newline at end of file
+    "ImageAssertionsProvider",
+    "NumericAssertionsProvider",
+]
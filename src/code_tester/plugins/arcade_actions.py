@@ -0,0 +1,201 @@
+import random
+from typing import Any, Dict
+
+from ..core import ComponentMetadata, ComponentProvider, DependencyContainer, plugin_provider
+from ..config import PerformConfig
+from ..execution import ExecutionEnvironment
+from ..headless import (
+    DEFAULT_DELTA_TIME, InputScript, LoadBenchmark, headless_arcade, measure_frames, record_trajectory, replay_input,
+    simulate_frames
+)
+from ..headless.trajectory import compile_path, resolve_path
+from .core_actions import Action, ActionResult
+
+DEFAULT_FRAMES = 60
+DEFAULT_BENCHMARK_FRAMES = 120
+DEFAULT_WARMUP_FRAMES = 10
+
+
+class WindowAction(Action):
+    def _params(self) -> Dict[str, Any]:
+        return self.config.params or {}
+
+    def _continued_window(self, context: Dict[str, Any]) -> Any:
+        object_ref = self.config.start_from_object_ref
+        if object_ref not in context:
+            raise ValueError(f"Object reference '{object_ref}' not found in context")
+        window = context[object_ref]
+        # Each session restores the previous window on exit, so the continued one must become current again.
+        import arcade
+        arcade.set_window(window)
+        return window
+
+    def _create_window(self, window_class: type) -> Any:
+        params = self._params()
+        if params.get("seed") is not None:
+            random.seed(params["seed"])
+        window = window_class(*params.get("args", []), **params.get("kwargs", {}))
+        if params.get("setup", True) and hasattr(window, "setup"):
+            window.setup()
+        return window
+
+    def _prepare(self) -> None:
+        # Loads everything the run needs before the solution is imported; errors here are test case errors.
+        pass
+
+    def _drive(self, window: Any, module: Any) -> Any:
+        # Runs the window and returns the result value of the action.
+        raise NotImplementedError
+
+    def execute(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> ActionResult:
+        params = self._params()
+        continuing = self.config.start_from_object_ref is not None
+        self._prepare()
+
+        # The solution is imported inside the headless session so its window class subclasses the stand-in.
+        with headless_arcade(), environment.run_in_isolation(fresh=not continuing) as (module, captured_output):
+            class_name = self.config.target
+            if not continuing and not hasattr(module, class_name):
+                raise AttributeError(f"Class '{class_name}' not found in module")
+
+            try:
+                if continuing:
+                    window = self._continued_window(context)
+                else:
+                    window = self._create_window(getattr(module, class_name))
+                result = self._drive(window, module)
+                screenshot = None
+                if params.get("draw", True) or params.get("screenshot", False):
+                    display_list = window.draw()
+                    if params.get("screenshot", False):
+                        screenshot = display_list.render(window.width, window.height, window.background_color)
+
+                # The window is saved even when the result is something else, so later checks can continue it.
+                if self.config.save_as:
+                    context[self.config.save_as] = window
+
+                return ActionResult(
+                    return_value=result,
+                    stdout=captured_output["stdout"],
+                    stderr=captured_output["stderr"],
+                    screenshot=screenshot
+                )
+            except Exception as e:
+                return ActionResult(
+                    exception=e,
+                    stdout=captured_output["stdout"],
+                    stderr=captured_output["stderr"]
+                )
+
+
+class SimulateFramesAction(WindowAction):
+    def _drive(self, window: Any, module: Any) -> Any:
+        params = self._params()
+        simulate_frames(
+            window,
+            params.get("frames", DEFAULT_FRAMES),
+            params.get("delta_time", DEFAULT_DELTA_TIME),
+            params.get("draw_every_frame", False)
+        )
+        return window
+
+
+class ReplayInputAction(WindowAction):
+    def __init__(self, config: PerformConfig):
+        super().__init__(config)
+        # Compiled plans reuse the action for every solution, so the script is parsed once.
+        self._script: InputScript | None = None
+
+    def _prepare(self) -> None:
+        if self._script is not None:
+            return
+        params = self._params()
+        if params.get("script") is not None:
+            self._script = InputScript.load(params["script"])
+        else:
+            self._script = InputScript.parse(params.get("events", []))
+
+    def _drive(self, window: Any, module: Any) -> Any:
+        params = self._params()
+        snapshot_frames = params.get("snapshot_frames", [])
+        snapshots = replay_input(
+            window,
+            self._script,
+            params.get("frames"),
+            params.get("delta_time", DEFAULT_DELTA_TIME),
+            snapshot_frames,
+            params.get("snapshot_attributes", [])
+        )
+        # Checks of replays with snapshots compare the snapshots; others inspect the window.
+        return snapshots if snapshot_frames else window
+
+
+class RecordTrajectoryAction(WindowAction):
+    def _drive(self, window: Any, module: Any) -> Any:
+        params = self._params()
+        return record_trajectory(
+            window,
+            params.get("paths", []),
+            params.get("frames", DEFAULT_FRAMES),
+            params.get("delta_time", DEFAULT_DELTA_TIME),
+            params.get("every", 1)
+        )
+
+
+class BenchmarkFramesAction(WindowAction):
+    def _populate(self, window: Any, module: Any, entities: int) -> None:
+        params = self._params()
+        if params.get("populate"):
+            # A method of the game that adds the entities itself, e.g. spawn(count).
+            getattr(window, params["populate"])(entities)
+            return
+
+        factory_name = params.get("factory")
+        if not factory_name or not params.get("collection"):
+            raise ValueError("Benchmarks need 'populate', or 'factory' and 'collection'")
+        if not hasattr(module, factory_name):
+            raise AttributeError(f"Factory '{factory_name}' not found in module")
+        factory = getattr(module, factory_name)
+        collection = resolve_path(window, compile_path(params["collection"]))[0]
+        args, kwargs = params.get("factory_args", []), params.get("factory_kwargs", {})
+        for _ in range(entities):
+            collection.append(factory(*args, **kwargs))
+
+    def _drive(self, window: Any, module: Any) -> Any:
+        params = self._params()
+        runs = []
+        # Every entity count gets a new window, so earlier runs do not leave entities behind.
+        for index, entities in enumerate(params.get("entities", [0])):
+            if index:
+                window = self._create_window(type(window))
+            self._populate(window, module, entities)
+            runs.append(measure_frames(
+                window,
+                entities,
+                params.get("frames", DEFAULT_BENCHMARK_FRAMES),
+                params.get("warmup", DEFAULT_WARMUP_FRAMES),
+                params.get("delta_time", DEFAULT_DELTA_TIME),
+                params.get("measure_draw", False)
+            ))
+        return LoadBenchmark(runs)
+
+
+@plugin_provider(ComponentMetadata(
+    name="arcade_actions",
+    version="1.0.0",
+    test_types=["arcade"]
+))
+class ArcadeActionsProvider(ComponentProvider):
+    def register_components(self, container: DependencyContainer) -> None:
+        action_factories = {
+            "simulate_frames": SimulateFramesAction,
+            "replay_input": ReplayInputAction,
+            "record_trajectory": RecordTrajectoryAction,
+            "benchmark_frames": BenchmarkFramesAction,
+        }
+
+        for action_name, action_class in action_factories.items():
+            container.register_factory(
+                f"action_{action_name}",
+                lambda cls=action_class: cls
+            )
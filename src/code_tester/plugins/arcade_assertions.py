@@ -0,0 +1,385 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+from ..core import ComponentMetadata, ComponentProvider, DependencyContainer, plugin_provider
+from ..config import ExpectConfig
+from ..headless.benchmark import PHASES, FrameTimings, LoadBenchmark, validate_statistic
+from ..headless.display_list import DisplayList, rgba
+from ..headless.trajectory import Trajectory, compile_path
+from ..utils.exceptions import AssertionError
+from .core_assertions import Assertion
+
+
+def _display_list(value: Any) -> DisplayList | None:
+    # Actions return the window; its display list holds the last recorded frame.
+    if isinstance(value, DisplayList):
+        return value
+    display_list = getattr(value, "display_list", None)
+    return display_list if isinstance(display_list, DisplayList) else None
+
+
+def _format_color(color: Any) -> str:
+    return "(" + ", ".join(str(int(c)) for c in color) + ")"
+
+
+class MappingAssertion(Assertion):
+    # Expected values are mappings of options, validated once when the check is compiled.
+    def __init__(self, config: ExpectConfig):
+        super().__init__(config)
+        value = config.value if config.value is not None else {}
+        if not isinstance(value, dict):
+            raise AssertionError(f"'{config.assertion}' expects a mapping, got {type(value).__name__}")
+        self._expected: Dict[str, Any] = value
+        try:
+            self._validate(value)
+        except (KeyError, TypeError, ValueError) as e:
+            raise AssertionError(f"Invalid expectation for '{config.assertion}': {e}") from e
+
+    def _validate(self, value: Dict[str, Any]) -> None:
+        pass
+
+    def _evaluate(self, actual_value: Any) -> str | None:
+        # Returns None when the actual value meets the expectation, otherwise what is wrong.
+        raise NotImplementedError
+
+    def check(self, actual_value: Any) -> bool:
+        return self._evaluate(actual_value) is None
+
+    def describe_mismatch(self, actual_value: Any) -> str | None:
+        return self._evaluate(actual_value)
+
+
+class DrawAssertion(MappingAssertion):
+    # Keys of the expected value that select the draw calls to check.
+    filter_keys = ("kind", "filled", "color")
+
+    def _validate(self, value: Dict[str, Any]) -> None:
+        self._filters = {key: value[key] for key in self.filter_keys if key in value}
+        DisplayList(capacity=1).select(**self._filters)
+
+    def _subject(self) -> str:
+        words = []
+        if self._filters.get("filled") is not None:
+            words.append("filled" if self._filters["filled"] else "outlined")
+        words.append(f"{self._filters['kind']}s" if "kind" in self._filters else "draw calls")
+        if "color" in self._filters:
+            words.append(f"with color {_format_color(self._filters['color'])}")
+        return " ".join(words)
+
+    def _mismatch(self, actual_value: Any, display_list: DisplayList, selected: np.ndarray) -> str | None:
+        # Returns None when the selected draw calls meet the expectation.
+        raise NotImplementedError
+
+    def _evaluate(self, actual_value: Any) -> str | None:
+        display_list = _display_list(actual_value)
+        if display_list is None:
+            return f"Expected a recorded frame, got {type(actual_value).__name__}"
+        return self._mismatch(actual_value, display_list, display_list.select(**self._filters))
+
+
+class DrawCountAssertion(DrawAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if not {"count", "min", "max"} & value.keys():
+            raise ValueError("expected 'count', 'min' or 'max'")
+
+    def _mismatch(self, actual_value: Any, display_list: DisplayList, selected: np.ndarray) -> str | None:
+        count = len(selected)
+        expected_count = self._expected.get("count")
+        min_count = self._expected.get("min")
+        max_count = self._expected.get("max")
+
+        if expected_count is not None and count != expected_count:
+            expectation = str(expected_count)
+        elif min_count is not None and count < min_count:
+            expectation = f"at least {min_count}"
+        elif max_count is not None and count > max_count:
+            expectation = f"at most {max_count}"
+        else:
+            return None
+        return f"Drew {count} {self._subject()}, expected {expectation}"
+
+
+class DrawsWithinAssertion(DrawAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if value.get("bounds") is not None and len(value["bounds"]) != 4:
+            raise ValueError("bounds must be [left, bottom, right, top]")
+
+    def _bounds(self, actual_value: Any) -> tuple | None:
+        if self._expected.get("bounds") is not None:
+            return tuple(self._expected["bounds"])
+        # Without explicit bounds, draw calls have to stay on the screen of the window.
+        width, height = getattr(actual_value, "width", None), getattr(actual_value, "height", None)
+        return None if width is None or height is None else (0, 0, width, height)
+
+    def _mismatch(self, actual_value: Any, display_list: DisplayList, selected: np.ndarray) -> str | None:
+        bounds = self._bounds(actual_value)
+        if bounds is None:
+            return "No bounds given and the recorded frame has no window size"
+        left, bottom, right, top = bounds
+        tolerance = self.config.tolerance or 0
+
+        records = display_list.records[selected]
+        half_width, half_height = records["width"] / 2, records["height"] / 2
+        outside = (
+            (records["x"] - half_width < left - tolerance)
+            | (records["x"] + half_width > right + tolerance)
+            | (records["y"] - half_height < bottom - tolerance)
+            | (records["y"] + half_height > top + tolerance)
+        )
+        if not outside.any():
+            return None
+
+        first = display_list.describe(selected[np.argmax(outside)])
+        return (
+            f"{int(outside.sum())} of {len(selected)} {self._subject()} extend outside "
+            f"(left={left:g}, bottom={bottom:g}, right={right:g}, top={top:g}), first {first}"
+        )
+
+
+class DrawColorsAssertion(DrawAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        colors = value.get("colors")
+        if not colors:
+            raise ValueError("expected a non-empty list of 'colors'")
+        self._allowed = np.array([rgba(color) for color in colors], dtype=np.uint8)
+        # RGB colors match any alpha.
+        self._channels = np.array([[True] * 3 + [len(color) == 4] for color in colors])
+
+    def _mismatch(self, actual_value: Any, display_list: DisplayList, selected: np.ndarray) -> str | None:
+        colors = display_list.records["color"][selected]
+        matches = ((colors[:, None, :] == self._allowed[None]) | ~self._channels[None]).all(axis=2).any(axis=1)
+        if matches.all():
+            return None
+
+        index = np.argmin(matches)
+        return (
+            f"{display_list.describe(selected[index])} has color {_format_color(colors[index])}, expected one of "
+            + ", ".join(_format_color(color) for color in self._expected["colors"])
+        )
+
+
+class TrajectoryAssertion(MappingAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        # A single "path", or "paths" of the components of a vector such as the x and y of every ball.
+        self._paths: List[str] = list(value["paths"]) if "paths" in value else [value["path"]]
+        if not self._paths:
+            raise ValueError("expected at least one path")
+        for path in self._paths:
+            compile_path(path)
+
+    def _mismatch(self, trajectory: Trajectory, columns: np.ndarray) -> str | None:
+        # columns has shape (paths, samples, elements); returns None when the trajectory meets the expectation.
+        raise NotImplementedError
+
+    def _label(self, element: int) -> str:
+        labels = [Trajectory.label(path, element) for path in self._paths]
+        return labels[0] if len(labels) == 1 else "(" + ", ".join(labels) + ")"
+
+    def _evaluate(self, actual_value: Any) -> str | None:
+        if not isinstance(actual_value, Trajectory):
+            return f"Expected a recorded trajectory, got {type(actual_value).__name__}"
+        missing = [path for path in self._paths if path not in actual_value]
+        if missing:
+            return f"Path '{missing[0]}' was not recorded"
+
+        arrays = [actual_value[path] for path in self._paths]
+        width = max(array.shape[1] for array in arrays)
+        columns = np.full((len(arrays), len(actual_value), width), np.nan)
+        for component, array in enumerate(arrays):
+            columns[component, :, :array.shape[1]] = array
+        return self._mismatch(actual_value, columns)
+
+
+class TrajectoryWithinAssertion(TrajectoryAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if value.get("min") is None and value.get("max") is None:
+            raise ValueError("expected 'min' or 'max'")
+
+    def _mismatch(self, trajectory: Trajectory, columns: np.ndarray) -> str | None:
+        tolerance = self.config.tolerance or 0
+        min_val, max_val = self._expected.get("min"), self._expected.get("max")
+        outside = np.zeros(columns.shape, dtype=bool)
+        if min_val is not None:
+            outside |= columns < min_val - tolerance
+        if max_val is not None:
+            outside |= columns > max_val + tolerance
+        if not outside.any():
+            return None
+
+        component, sample, element = np.unravel_index(np.argmax(outside), outside.shape)
+        return (
+            f"{Trajectory.label(self._paths[component], element)} = {columns[component, sample, element]:g} "
+            f"at frame {trajectory.frames[sample]} is outside [{min_val}, {max_val}] "
+            f"({int(outside.sum())} samples outside)"
+        )
+
+
+class TrajectoryMonotonicAssertion(TrajectoryAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if value.get("direction", "increasing") not in ("increasing", "decreasing"):
+            raise ValueError("direction must be 'increasing' or 'decreasing'")
+
+    def _mismatch(self, trajectory: Trajectory, columns: np.ndarray) -> str | None:
+        tolerance = self.config.tolerance or 0
+        increasing = self._expected.get("direction", "increasing") == "increasing"
+        steps = np.diff(columns, axis=1)
+        if not increasing:
+            steps = -steps
+        # NaN steps, from items that appear or disappear, are not violations.
+        violations = steps <= 0 if self._expected.get("strict", False) else steps < -tolerance
+        if not violations.any():
+            return None
+
+        component, sample, element = np.unravel_index(np.argmax(violations), violations.shape)
+        before, after = columns[component, sample, element], columns[component, sample + 1, element]
+        return (
+            f"{Trajectory.label(self._paths[component], element)} goes from {before:g} to {after:g} "
+            f"at frame {trajectory.frames[sample + 1]}, expected it to keep {'increasing' if increasing else 'decreasing'}"
+        )
+
+
+class TrajectoryMaxSpeedAssertion(TrajectoryAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if value.get("max") is None:
+            raise ValueError("expected 'max'")
+        if value.get("per", "second") not in ("second", "frame"):
+            raise ValueError("per must be 'second' or 'frame'")
+
+    def _mismatch(self, trajectory: Trajectory, columns: np.ndarray) -> str | None:
+        per = self._expected.get("per", "second")
+        intervals = np.diff(trajectory.times if per == "second" else trajectory.frames.astype(float))
+        distances = np.sqrt((np.diff(columns, axis=1) ** 2).sum(axis=0))
+        speeds = distances / intervals[:, None]
+        too_fast = speeds > self._expected["max"] + (self.config.tolerance or 0)
+        if not too_fast.any():
+            return None
+
+        sample, element = np.unravel_index(np.argmax(too_fast), too_fast.shape)
+        return (
+            f"{self._label(element)} moves at {speeds[sample, element]:g} per {per} "
+            f"at frame {trajectory.frames[sample + 1]}, expected at most {self._expected['max']}"
+        )
+
+
+class TrajectoryConservedAssertion(TrajectoryAssertion):
+    def _mismatch(self, trajectory: Trajectory, columns: np.ndarray) -> str | None:
+        # One path conserves the sum over its items, several the sum of squared magnitudes (e.g. kinetic energy).
+        if len(self._paths) == 1:
+            quantity, name = np.nansum(columns[0], axis=1), f"Sum of {self._paths[0]}"
+        else:
+            quantity, name = np.nansum(columns ** 2, axis=(0, 2)), f"Sum of squares of {', '.join(self._paths)}"
+        if not len(quantity):
+            return None
+
+        initial = quantity[0]
+        allowed = (self.config.tolerance or 0) + (self.config.rtol or 0) * abs(initial)
+        changed = np.abs(quantity - initial) > allowed
+        if not changed.any():
+            return None
+
+        sample = np.argmax(changed)
+        return f"{name} changes from {initial:g} to {quantity[sample]:g} at frame {trajectory.frames[sample]}"
+
+
+class FrameTimeAssertion(MappingAssertion):
+    default_statistic = "p95"
+
+    def _validate(self, value: Dict[str, Any]) -> None:
+        self._statistic = value.get("statistic", self.default_statistic)
+        self._phase = value.get("phase", "update")
+        validate_statistic(self._statistic)
+        if self._phase not in PHASES:
+            raise ValueError(f"phase must be one of {', '.join(PHASES)}")
+
+    def _mismatch(self, runs: List[FrameTimings]) -> str | None:
+        raise NotImplementedError
+
+    def _evaluate(self, actual_value: Any) -> str | None:
+        if not isinstance(actual_value, LoadBenchmark):
+            return f"Expected a frame time benchmark, got {type(actual_value).__name__}"
+        if self._phase != "update" and any(run.draw_times is None for run in actual_value.runs):
+            return "Draw times were not measured"
+        return self._mismatch(actual_value.runs)
+
+
+class FrameTimeBudgetAssertion(FrameTimeAssertion):
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if value.get("max_ms") is None:
+            raise ValueError("expected 'max_ms'")
+
+    def _mismatch(self, runs: List[FrameTimings]) -> str | None:
+        entities = self._expected.get("entities")
+        selected = [run for run in runs if entities is None or run.entities == entities]
+        if not selected:
+            return f"No frames were measured with {entities} entities"
+
+        budget = self._expected["max_ms"]
+        for run in selected:
+            milliseconds = run.statistic(self._statistic, self._phase) * 1000
+            if milliseconds > budget:
+                return (
+                    f"{self._statistic} {self._phase} time with {run.entities} entities is {milliseconds:.3g} ms, "
+                    f"budget {budget:g} ms"
+                )
+        return None
+
+
+class FrameTimeScalingAssertion(FrameTimeAssertion):
+    default_statistic = "median"
+
+    def _validate(self, value: Dict[str, Any]) -> None:
+        super()._validate(value)
+        if value.get("max_exponent") is None:
+            raise ValueError("expected 'max_exponent'")
+
+    def _mismatch(self, runs: List[FrameTimings]) -> str | None:
+        runs = [run for run in runs if run.entities > 0]
+        if len({run.entities for run in runs}) < 2:
+            return "Scaling needs frames measured with at least two positive entity counts"
+
+        # The slope of log(time) over log(entities) is the exponent k of time ~ entities^k.
+        counts = np.log([run.entities for run in runs])
+        times = np.log([max(run.statistic(self._statistic, self._phase), 1e-9) for run in runs])
+        exponent = float(np.polyfit(counts, times, 1)[0])
+        max_exponent = self._expected["max_exponent"]
+        if exponent <= max_exponent + (self.config.tolerance or 0):
+            return None
+        return (
+            f"{self._statistic} {self._phase} time grows like N^{exponent:.2f} between "
+            f"{min(run.entities for run in runs)} and {max(run.entities for run in runs)} entities, "
+            f"expected at most N^{max_exponent:g}"
+        )
+
+
+@plugin_provider(ComponentMetadata(
+    name="arcade_assertions",
+    version="1.0.0",
+    test_types=["arcade"]
+))
+class ArcadeAssertionsProvider(ComponentProvider):
+    def register_components(self, container: DependencyContainer) -> None:
+        assertion_factories = {
+            "draw_count": DrawCountAssertion,
+            "draws_within": DrawsWithinAssertion,
+            "draw_colors": DrawColorsAssertion,
+            "trajectory_within": TrajectoryWithinAssertion,
+            "trajectory_monotonic": TrajectoryMonotonicAssertion,
+            "trajectory_max_speed": TrajectoryMaxSpeedAssertion,
+            "trajectory_conserved": TrajectoryConservedAssertion,
+            "frame_time_budget": FrameTimeBudgetAssertion,
+            "frame_time_scaling": FrameTimeScalingAssertion,
+        }
+
+        for assertion_name, assertion_class in assertion_factories.items():
+            container.register_factory(
+                f"assertion_{assertion_name}",
+                lambda cls=assertion_class: cls
+            )
@@ -1,8 +1,11 @@
-from typing import Any, Dict
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
 
 from ..core import ComponentMetadata, ComponentProvider, DependencyContainer, plugin_provider
-from ..config import PerformConfig
+from ..config import ParametrizeRow, PerformConfig
 from ..execution import ExecutionEnvironment
+from ..execution.event_loop import resolve_awaitable
 
 
 class Action:
@@ -11,6 +14,53 @@ class Action:
     
     def execute(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> 'ActionResult':
         raise NotImplementedError
+    
+    async def execute_async(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> 'ActionResult':
+        return await asyncio.to_thread(self.execute, environment, context)
+    
+    def execute_rows(
+        self,
+        environment: ExecutionEnvironment,
+        context: Dict[str, Any],
+        rows: Sequence[ParametrizeRow]
+    ) -> List['ActionResult']:
+        # Actions without a tight loop of their own run once per row with the row's arguments.
+        return [
+            type(self)(self._row_config(args, kwargs)).execute(environment, context)
+            for args, kwargs in self._row_arguments(rows)
+        ]
+    
+    async def execute_rows_async(
+        self,
+        environment: ExecutionEnvironment,
+        context: Dict[str, Any],
+        rows: Sequence[ParametrizeRow]
+    ) -> List['ActionResult']:
+        return await asyncio.to_thread(self.execute_rows, environment, context, rows)
+    
+    def _row_arguments(self, rows: Sequence[ParametrizeRow]) -> Iterator[Tuple[list, dict]]:
+        # Row args replace those of the action when given, row kwargs are merged over them.
+        params = self.config.params or {}
+        base_args = params.get("args", [])
+        base_kwargs = params.get("kwargs", {})
+        for row in rows:
+            args = row.args if "args" in row.model_fields_set else base_args
+            yield args, {**base_kwargs, **row.kwargs}
+    
+    def _row_config(self, args: list, kwargs: dict) -> PerformConfig:
+        params = {**(self.config.params or {}), "args": args, "kwargs": kwargs}
+        return self.config.model_copy(update={"params": params})
+
+
+async def call_async(func: Callable, *args, **kwargs) -> Any:
+    # Coroutine functions run on the caller's loop, blocking functions on a worker thread.
+    if inspect.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    
+    result = await asyncio.to_thread(func, *args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
 
 
 class ActionResult:
@@ -37,7 +87,7 @@ class RunScriptAction(Action):
     def execute(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> ActionResult:
         stdin_text = self.config.params.get("stdin") if self.config.params else None
 
-        with environment.run_in_isolation(stdin_text) as (module, captured_output):
+        with environment.run_in_isolation(stdin_text, fresh=True) as (module, captured_output):
             if self.config.save_as:
                 context[self.config.save_as] = module
 
@@ -56,7 +106,68 @@ class CallFunctionAction(Action):
             
             func = getattr(module, function_name)
             try:
-                result = func(*args, **kwargs)
+                result = resolve_awaitable(func(*args, **kwargs))
+                
+                if self.config.save_as:
+                    context[self.config.save_as] = result
+                
+                return ActionResult(
+                    return_value=result,
+                    stdout=captured_output["stdout"],
+                    stderr=captured_output["stderr"]
+                )
+            except Exception as e:
+                return ActionResult(
+                    exception=e,
+                    stdout=captured_output["stdout"],
+                    stderr=captured_output["stderr"]
+                )
+    
+    def execute_rows(
+        self,
+        environment: ExecutionEnvironment,
+        context: Dict[str, Any],
+        rows: Sequence[ParametrizeRow]
+    ) -> List[ActionResult]:
+        function_name = self.config.target
+        capture_stdout, capture_stderr = environment.capture_streams
+        results = []
+        
+        with environment.run_in_isolation() as (module, captured_output):
+            if not hasattr(module, function_name):
+                raise AttributeError(f"Function '{function_name}' not found in module")
+            
+            func = getattr(module, function_name)
+            stdout_start = stderr_start = 0
+            for args, kwargs in self._row_arguments(rows):
+                try:
+                    result = ActionResult(return_value=resolve_awaitable(func(*args, **kwargs)))
+                except Exception as e:
+                    result = ActionResult(exception=e)
+                
+                # Each row gets the output written since the previous one; unused streams are not read.
+                if capture_stdout:
+                    stdout = captured_output["stdout"]
+                    result.stdout, stdout_start = stdout[stdout_start:], len(stdout)
+                if capture_stderr:
+                    stderr = captured_output["stderr"]
+                    result.stderr, stderr_start = stderr[stderr_start:], len(stderr)
+                results.append(result)
+        
+        return results
+    
+    async def execute_async(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> ActionResult:
+        function_name = self.config.target
+        args = self.config.params.get("args", []) if self.config.params else []
+        kwargs = self.config.params.get("kwargs", {}) if self.config.params else {}
+        
+        with environment.run_in_isolation() as (module, captured_output):
+            if not hasattr(module, function_name):
+                raise AttributeError(f"Function '{function_name}' not found in module")
+            
+            func = getattr(module, function_name)
+            try:
+                result = await call_async(func, *args, **kwargs)
                 
                 if self.config.save_as:
                     context[self.config.save_as] = result
@@ -105,11 +216,9 @@ class CreateObjectAction(Action):
 
 
 class CallMethodAction(Action):
-    def execute(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> ActionResult:
+    def _get_method(self, context: Dict[str, Any]) -> Callable:
         method_name = self.config.target
         object_ref = self.config.params.get("object_ref") if self.config.params else None
-        args = self.config.params.get("args", []) if self.config.params else []
-        kwargs = self.config.params.get("kwargs", {}) if self.config.params else {}
         
         if not object_ref or object_ref not in context:
             raise ValueError(f"Object reference '{object_ref}' not found in context")
@@ -119,9 +228,47 @@ class CallMethodAction(Action):
         if not hasattr(obj, method_name):
             raise AttributeError(f"Method '{method_name}' not found on object")
         
-        method = getattr(obj, method_name)
+        return getattr(obj, method_name)
+    
+    def execute(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> ActionResult:
+        args = self.config.params.get("args", []) if self.config.params else []
+        kwargs = self.config.params.get("kwargs", {}) if self.config.params else {}
+        
+        method = self._get_method(context)
+        try:
+            result = resolve_awaitable(method(*args, **kwargs))
+            
+            if self.config.save_as:
+                context[self.config.save_as] = result
+            
+            return ActionResult(return_value=result)
+        except Exception as e:
+            return ActionResult(exception=e)
+    
+    def execute_rows(
+        self,
+        environment: ExecutionEnvironment,
+        context: Dict[str, Any],
+        rows: Sequence[ParametrizeRow]
+    ) -> List[ActionResult]:
+        method = self._get_method(context)
+        results = []
+        
+        for args, kwargs in self._row_arguments(rows):
+            try:
+                results.append(ActionResult(return_value=resolve_awaitable(method(*args, **kwargs))))
+            except Exception as e:
+                results.append(ActionResult(exception=e))
+        
+        return results
+    
+    async def execute_async(self, environment: ExecutionEnvironment, context: Dict[str, Any]) -> ActionResult:
+        args = self.config.params.get("args", []) if self.config.params else []
+        kwargs = self.config.params.get("kwargs", {}) if self.config.params else {}
+        
+        method = self._get_method(context)
         try:
-            result = method(*args, **kwargs)
+            result = await call_async(method, *args, **kwargs)
             
             if self.config.save_as:
                 context[self.config.save_as] = result
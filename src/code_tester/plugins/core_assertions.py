@@ -1,7 +1,11 @@
+import re
 from typing import Any
 
 from ..core import ComponentMetadata, ComponentProvider, DependencyContainer, plugin_provider
 from ..config import ExpectConfig
+from .stream_matchers import (
+    GoldenOutputStreamMatcher, RegexLineStreamMatcher, StreamMatcher, SubstringStreamMatcher, is_line_scoped
+)
 
 
 class Assertion:
@@ -10,6 +14,13 @@ class Assertion:
     
     def check(self, actual_value: Any) -> bool:
         raise NotImplementedError
+    
+    def stream_matcher(self) -> StreamMatcher | None:
+        return None
+    
+    def describe_mismatch(self, actual_value: Any) -> str | None:
+        # Details appended to the error message of a failed check, e.g. where arrays differ.
+        return None
 
 
 class EqualsAssertion(Assertion):
@@ -20,6 +31,11 @@ class EqualsAssertion(Assertion):
             return actual_value.strip() == expected_value.strip()
 
         return actual_value == expected_value
+    
+    def stream_matcher(self) -> StreamMatcher | None:
+        if isinstance(self.config.value, str):
+            return GoldenOutputStreamMatcher(self.config.value)
+        return None
 
 
 class ContainsAssertion(Assertion):
@@ -37,6 +53,23 @@ class ContainsAssertion(Assertion):
             return False
         
         return False
+    
+    def stream_matcher(self) -> StreamMatcher | None:
+        return SubstringStreamMatcher(str(self.config.value))
+
+
+class MatchesRegexAssertion(Assertion):
+    def check(self, actual_value: Any) -> bool:
+        if not isinstance(actual_value, str):
+            return False
+        
+        return re.search(str(self.config.value), actual_value, re.MULTILINE) is not None
+    
+    def stream_matcher(self) -> StreamMatcher | None:
+        pattern = str(self.config.value)
+        if is_line_scoped(pattern):
+            return RegexLineStreamMatcher(pattern)
+        return None
 
 
 class IsInRangeAssertion(Assertion):
@@ -111,6 +144,7 @@ class CoreAssertionsProvider(ComponentProvider):
         assertion_factories = {
             "equals": EqualsAssertion,
             "contains": ContainsAssertion,
+            "matches_regex": MatchesRegexAssertion,
             "is_in_range": IsInRangeAssertion,
             "is_close_to": IsCloseToAssertion,
             "is_instance_of": IsInstanceOfAssertion,
@@ -0,0 +1,101 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..core import ComponentMetadata, ComponentProvider, DependencyContainer, plugin_provider
+from ..config import ExpectConfig
+from ..utils.exceptions import AssertionError
+from .core_assertions import Assertion
+
+# The imaging modules pull in numpy, so they are imported on first use: most py_general test cases compare no images.
+if TYPE_CHECKING:
+    from ..imaging.compare import ImageComparison
+    from ..imaging.pyramid import ImagePyramid
+
+
+class ImageAssertion(Assertion):
+    def __init__(self, config: ExpectConfig, reference_store_dir: Path | None = None):
+        from ..imaging.store import get_reference_store
+
+        super().__init__(config)
+        # References are decoded once per content and memory-mapped from the shared store afterwards.
+        try:
+            self._reference = get_reference_store(reference_store_dir).load(config.value)
+        except (OSError, ValueError) as e:
+            raise AssertionError(f"Cannot load reference image for '{config.assertion}': {e}") from e
+
+    def _compare(self, actual: 'ImagePyramid') -> 'ImageComparison':
+        raise NotImplementedError
+
+    def compare(self, actual_value: Any) -> 'ImageComparison | None':
+        from ..imaging.images import load_image
+        from ..imaging.pyramid import ImagePyramid
+
+        if actual_value is None:
+            return None
+        try:
+            image = load_image(actual_value)
+        except (OSError, ValueError):
+            return None
+        return self._compare(ImagePyramid(image))
+
+    def check(self, actual_value: Any) -> bool:
+        comparison = self.compare(actual_value)
+        return comparison is not None and comparison.passed
+
+    def describe_mismatch(self, actual_value: Any) -> str | None:
+        comparison = self.compare(actual_value)
+        if comparison is None:
+            return f"Expected an image, got {type(actual_value).__name__}"
+        return comparison.details
+
+
+class ImageEqualsAssertion(ImageAssertion):
+    def _compare(self, actual: 'ImagePyramid') -> 'ImageComparison':
+        from ..imaging.compare import compare_exact
+
+        return compare_exact(actual, self._reference.pyramid)
+
+
+class ImageCloseAssertion(ImageAssertion):
+    def _compare(self, actual: 'ImagePyramid') -> 'ImageComparison':
+        from ..imaging.compare import compare_within_tolerance
+
+        return compare_within_tolerance(actual, self._reference.pyramid, self.config.tolerance or 0)
+
+
+class ImageSSIMAssertion(ImageAssertion):
+    default_threshold = 0.95
+
+    def _compare(self, actual: 'ImagePyramid') -> 'ImageComparison':
+        from ..imaging.compare import compare_ssim
+
+        threshold = self.config.threshold if self.config.threshold is not None else self.default_threshold
+        return compare_ssim(actual, self._reference.pyramid, threshold)
+
+
+class ImagePHashAssertion(ImageAssertion):
+    def _compare(self, actual: 'ImagePyramid') -> 'ImageComparison':
+        from ..imaging.compare import compare_phash
+
+        return compare_phash(actual, self._reference.phash, int(self.config.tolerance or 0))
+
+
+@plugin_provider(ComponentMetadata(
+    name="image_assertions",
+    version="1.0.0",
+    test_types=["py_general", "arcade"]
+))
+class ImageAssertionsProvider(ComponentProvider):
+    def register_components(self, container: DependencyContainer) -> None:
+        assertion_factories = {
+            "image_equals": ImageEqualsAssertion,
+            "image_close": ImageCloseAssertion,
+            "image_ssim": ImageSSIMAssertion,
+            "image_phash": ImagePHashAssertion,
+        }
+
+        for assertion_name, assertion_class in assertion_factories.items():
+            container.register_factory(
+                f"assertion_{assertion_name}",
+                lambda cls=assertion_class: cls
+            )
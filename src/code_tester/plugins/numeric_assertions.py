@@ -0,0 +1,150 @@
+from typing import TYPE_CHECKING, Any
+
+from ..core import ComponentMetadata, ComponentProvider, DependencyContainer, plugin_provider
+from ..config import ExpectConfig
+from .core_assertions import Assertion
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# dtype kinds accepted as numbers: signed, unsigned, float and (for closeness) complex.
+_REAL_KINDS = "iuf"
+_NUMERIC_KINDS = "iufc"
+
+
+def _as_array(value: Any, kinds: str | None = None) -> 'np.ndarray | None':
+    import numpy as np
+
+    try:
+        array = np.asarray(value)
+    except (TypeError, ValueError):
+        # Ragged nested sequences cannot become arrays.
+        return None
+    if kinds is not None and array.dtype.kind not in kinds:
+        return None
+    return array
+
+
+def _format_index(index: tuple) -> str:
+    return "[" + ", ".join(str(int(i)) for i in index) + "]"
+
+
+class ArrayAssertion(Assertion):
+    # Number of mismatching elements listed in failure details.
+    max_reported = 5
+    kinds: str | None = _NUMERIC_KINDS
+
+    def __init__(self, config: ExpectConfig):
+        super().__init__(config)
+        # Expected values are converted once; compiled plans reuse the assertion for every solution.
+        self._expected = self._expected_array(config.value)
+
+    def _expected_array(self, value: Any) -> 'np.ndarray | None':
+        return _as_array(value, self.kinds)
+
+    def _mismatches(self, actual: 'np.ndarray') -> 'np.ndarray':
+        raise NotImplementedError
+
+    def _describe_element(self, actual: 'np.ndarray', index: tuple) -> str:
+        expected = self._expected if self._expected.ndim == 0 else self._expected[index]
+        return f"{actual[index].item()!r} != {expected.item()!r}"
+
+    def _compatible(self, actual: 'np.ndarray') -> bool:
+        return self._expected.ndim == 0 or actual.shape == self._expected.shape
+
+    def check(self, actual_value: Any) -> bool:
+        actual = _as_array(actual_value, self.kinds)
+        if actual is None or self._expected is None or not self._compatible(actual):
+            return False
+        return not self._mismatches(actual).any()
+
+    def describe_mismatch(self, actual_value: Any) -> str | None:
+        import numpy as np
+
+        if self._expected is None:
+            return f"Expected value of '{self.config.assertion}' is not a valid array"
+
+        actual = _as_array(actual_value, self.kinds)
+        if actual is None:
+            return f"Expected an array, got {type(actual_value).__name__}"
+        if not self._compatible(actual):
+            return f"Expected shape {self._expected.shape}, got {actual.shape}"
+
+        mismatches = np.broadcast_to(self._mismatches(actual), actual.shape)
+        positions = np.flatnonzero(mismatches)
+        if positions.size == 0:
+            return None
+
+        first = zip(*np.unravel_index(positions[:self.max_reported], actual.shape), strict=True)
+        elements = "; ".join(f"{_format_index(index)}: {self._describe_element(actual, index)}" for index in first)
+        return f"{positions.size} of {actual.size} elements differ, first at {elements}"
+
+
+class AllCloseAssertion(ArrayAssertion):
+    def _mismatches(self, actual: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+
+        # Unset tolerances default to those of numpy.allclose.
+        rtol = self.config.rtol if self.config.rtol is not None else 1e-05
+        atol = self.config.tolerance if self.config.tolerance is not None else 1e-08
+        return ~np.isclose(actual, self._expected, rtol=rtol, atol=atol)
+
+
+class ElementwiseEqualsAssertion(ArrayAssertion):
+    kinds = None
+
+    def _mismatches(self, actual: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+
+        tolerant = self.config.rtol or self.config.tolerance
+        if (
+            tolerant
+            and actual.dtype.kind in _NUMERIC_KINDS
+            and self._expected.dtype.kind in _NUMERIC_KINDS
+        ):
+            return ~np.isclose(actual, self._expected, rtol=self.config.rtol or 0.0, atol=self.config.tolerance or 0.0)
+        return np.asarray(actual != self._expected, dtype=bool)
+
+
+class AllInRangeAssertion(ArrayAssertion):
+    kinds = _REAL_KINDS
+
+    def _expected_array(self, value: Any) -> 'np.ndarray | None':
+        if not isinstance(value, dict) or "min" not in value or "max" not in value:
+            return None
+        bounds = _as_array([value["min"], value["max"]], self.kinds)
+        if bounds is None or bounds.shape != (2,):
+            return None
+        return bounds
+
+    def _compatible(self, actual: 'np.ndarray') -> bool:
+        return True
+
+    def _mismatches(self, actual: 'np.ndarray') -> 'np.ndarray':
+        min_val, max_val = self._expected
+        # NaN is outside every range.
+        return ~((actual >= min_val) & (actual <= max_val))
+
+    def _describe_element(self, actual: 'np.ndarray', index: tuple) -> str:
+        min_val, max_val = self._expected.tolist()
+        return f"{actual[index].item()!r} not in [{min_val!r}, {max_val!r}]"
+
+
+@plugin_provider(ComponentMetadata(
+    name="numeric_assertions",
+    version="1.0.0",
+    test_types=["py_general", "api", "flask", "arcade"]
+))
+class NumericAssertionsProvider(ComponentProvider):
+    def register_components(self, container: DependencyContainer) -> None:
+        assertion_factories = {
+            "all_close": AllCloseAssertion,
+            "all_in_range": AllInRangeAssertion,
+            "elementwise_equals": ElementwiseEqualsAssertion,
+        }
+
+        for assertion_name, assertion_class in assertion_factories.items():
+            container.register_factory(
+                f"assertion_{assertion_name}",
+                lambda cls=assertion_class: cls
+            )
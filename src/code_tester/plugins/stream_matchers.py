@@ -0,0 +1,181 @@
+import re
+from re import _constants as sre_constants
+from re import _parser as sre_parser
+
+# Character categories that include the line break.
+_LINE_BREAK_CATEGORIES = {
+    sre_constants.CATEGORY_SPACE,
+    sre_constants.CATEGORY_NOT_DIGIT,
+    sre_constants.CATEGORY_NOT_WORD,
+    sre_constants.CATEGORY_LINEBREAK,
+}
+_NEWLINE = ord("\n")
+
+
+class StreamMatcher:
+    def __init__(self):
+        self.verdict: bool | None = None
+
+    @property
+    def decided(self) -> bool:
+        return self.verdict is not None
+
+    def feed(self, text: str) -> None:
+        raise NotImplementedError
+
+    def finish(self) -> bool:
+        raise NotImplementedError
+
+
+class SubstringStreamMatcher(StreamMatcher):
+    def __init__(self, needle: str):
+        super().__init__()
+        self._needle = needle
+        self._tail = ""
+        if not needle:
+            self.verdict = True
+
+    def feed(self, text: str) -> None:
+        if self.decided:
+            return
+
+        # Keep the end of the previous chunk so matches across chunk boundaries are found.
+        window = self._tail + text
+        if self._needle in window:
+            self.verdict = True
+            self._tail = ""
+            return
+
+        self._tail = window[-(len(self._needle) - 1):] if len(self._needle) > 1 else ""
+
+    def finish(self) -> bool:
+        if not self.decided:
+            self.verdict = False
+        return self.verdict
+
+
+def is_line_scoped(pattern: str) -> bool:
+    """Check whether a regex only ever matches within a single line.
+
+    Such a pattern finds a match in a text searched in multiline mode exactly
+    when it finds one in some line of the text, so it can be matched line by
+    line. Patterns that cannot be parsed are reported as not line scoped.
+    """
+    try:
+        parsed = sre_parser.parse(pattern)
+    except (re.error, RecursionError):
+        return False
+    return not _can_match_line_break(parsed, parsed.state.flags)
+
+
+def _can_match_line_break(subpattern, flags: int) -> bool:
+    for op, av in subpattern:
+        if op is sre_constants.LITERAL:
+            if av == _NEWLINE:
+                return True
+        elif op is sre_constants.NOT_LITERAL:
+            if av != _NEWLINE:
+                return True
+        elif op is sre_constants.ANY:
+            if flags & sre_constants.SRE_FLAG_DOTALL:
+                return True
+        elif op is sre_constants.IN:
+            if _set_has_line_break(av):
+                return True
+        elif op is sre_constants.AT:
+            # \A and \Z match once per text, not once per line.
+            if av in (sre_constants.AT_BEGINNING_STRING, sre_constants.AT_END_STRING):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, item = av
+            if _can_match_line_break(item, (flags | add_flags) & ~del_flags):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_can_match_line_break(item, flags) for item in av[1]):
+                return True
+        elif op is sre_constants.GROUPREF_EXISTS:
+            if any(item is not None and _can_match_line_break(item, flags) for item in av[1:]):
+                return True
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if _can_match_line_break(av[1], flags):
+                return True
+        elif op is sre_constants.ATOMIC_GROUP:
+            if _can_match_line_break(av, flags):
+                return True
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT):
+            if _can_match_line_break(av[2], flags):
+                return True
+    return False
+
+
+def _set_has_line_break(items) -> bool:
+    negate = False
+    found = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            found = found or av == _NEWLINE
+        elif op is sre_constants.RANGE:
+            found = found or av[0] <= _NEWLINE <= av[1]
+        elif op is sre_constants.CATEGORY:
+            found = found or av in _LINE_BREAK_CATEGORIES
+    return found != negate
+
+
+# Matches line by line, which equals a multiline search only for line scoped patterns.
+class RegexLineStreamMatcher(StreamMatcher):
+    def __init__(self, pattern: str):
+        super().__init__()
+        self._pattern = re.compile(pattern)
+        self._line = ""
+
+    def feed(self, text: str) -> None:
+        if self.decided:
+            return
+
+        lines = (self._line + text).split("\n")
+        self._line = lines.pop()
+        if any(self._pattern.search(line) for line in lines):
+            self.verdict = True
+            self._line = ""
+
+    def finish(self) -> bool:
+        if not self.decided:
+            self.verdict = bool(self._pattern.search(self._line))
+            self._line = ""
+        return self.verdict
+
+
+# Streaming equivalent of comparing whitespace-stripped output to a golden text.
+class GoldenOutputStreamMatcher(StreamMatcher):
+    def __init__(self, expected: str):
+        super().__init__()
+        self._expected = expected.strip()
+        self._position = 0
+        self._started = False
+
+    def feed(self, text: str) -> None:
+        if self.decided:
+            return
+
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+
+        remaining = len(self._expected) - self._position
+        if text[:remaining] != self._expected[self._position:self._position + len(text)]:
+            self.verdict = False
+            return
+
+        self._position += min(len(text), remaining)
+        # Anything after the golden text may only be trailing whitespace.
+        if text[remaining:].strip():
+            self.verdict = False
+
+    def finish(self) -> bool:
+        if not self.decided:
+            self.verdict = self._position == len(self._expected)
+        return self.verdict
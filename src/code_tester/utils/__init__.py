@@ -1,6 +1,8 @@
 """Utilities module for helper functions and exceptions."""
 
-from .helpers import create_dataclass_from_dict, create_pydantic_from_dict
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
 from .exceptions import (
     CodeTesterError,
     ConfigError,
@@ -10,13 +12,24 @@ from .exceptions import (
     AssertionError as CodeTesterAssertionError,
 )
 
+if TYPE_CHECKING:
+    from .helpers import construct_pydantic_from_dict, create_dataclass_from_dict, create_pydantic_from_dict
+
+# The helpers import pydantic, so they are loaded on first use.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "create_dataclass_from_dict": ".helpers",
+    "create_pydantic_from_dict": ".helpers",
+    "construct_pydantic_from_dict": ".helpers",
+})
+
 __all__ = [
     "create_dataclass_from_dict",
     "create_pydantic_from_dict",
+    "construct_pydantic_from_dict",
     "CodeTesterError",
     "ConfigError", 
     "TestCaseParsingError",
     "SolutionImportError",
     "ActionError",
     "CodeTesterAssertionError",
-]
\ No newline at end of file
+]
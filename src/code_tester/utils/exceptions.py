@@ -80,4 +80,10 @@ class AssertionError(ExecutionError):
 # Исключения для системы моков
 class MockError(ExecutionError):
     """Exception raised when mock setup or execution fails."""
-    pass
\ No newline at end of file
+    pass
+
+
+# Исключения для воркеров
+class WorkerError(CodeTesterError):
+    """Exception raised when a grading worker cannot run a job."""
+    pass
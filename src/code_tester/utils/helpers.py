@@ -1,6 +1,7 @@
 """Helper functions for data conversion and utilities."""
 
-from typing import Any, Type, TypeVar
+from types import UnionType
+from typing import Any, Type, TypeVar, Union, get_args, get_origin
 
 from pydantic import BaseModel
 
@@ -26,6 +27,50 @@ def create_pydantic_from_dict(cls: Type[T], data: dict[str, Any]) -> T:
     return cls.model_validate(data)
 
 
+def construct_pydantic_from_dict(cls: Type[T], data: dict[str, Any]) -> T:
+    """Rebuild a Pydantic model from data it produced, skipping validation.
+    
+    Only for trusted data, e.g. the ``model_dump()`` of an instance that was
+    validated before. Nested models in fields annotated as a model, an
+    optional model or a list or dict of models are rebuilt as well.
+    
+    Args:
+        cls: The Pydantic model class to create
+        data: Dictionary from ``model_dump()`` of a validated instance
+        
+    Returns:
+        Instance of the Pydantic model
+    """
+    values = {}
+    for name, value in data.items():
+        field_info = cls.model_fields.get(name)
+        values[name] = _construct_value(field_info.annotation, value) if field_info else value
+    return cls.model_construct(_fields_set=set(data), **values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return construct_pydantic_from_dict(annotation, value)
+    
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (Union, UnionType):
+        models = [arg for arg in args if isinstance(arg, type) and issubclass(arg, BaseModel)]
+        containers = [arg for arg in args if get_origin(arg) in (list, dict)]
+        if len(models) == 1 and isinstance(value, dict):
+            return construct_pydantic_from_dict(models[0], value)
+        if len(containers) == 1:
+            return _construct_value(containers[0], value)
+        return value
+    if origin is list and args and isinstance(value, list):
+        return [_construct_value(args[0], item) for item in value]
+    if origin is dict and len(args) == 2 and isinstance(value, dict):
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+    return value
+
+
 def create_dataclass_from_dict(cls: Type[T], data: dict[str, Any]) -> T:
     """Legacy function for backward compatibility.
     
@@ -0,0 +1,21 @@
+"""Workers module for grading many solutions in separate processes."""
+
+from .job import GradingJob, GradingResult, run_grading_job
+from .fork_server import ForkServer, preload_dependencies
+from .batch import BatchRunner, collect_solutions, read_test_types
+from .daemon import DEFAULT_SOCKET_PATH, GradingDaemon, send_request, submit_job
+
+__all__ = [
+    "GradingJob",
+    "GradingResult",
+    "run_grading_job",
+    "ForkServer",
+    "preload_dependencies",
+    "BatchRunner",
+    "collect_solutions",
+    "read_test_types",
+    "DEFAULT_SOCKET_PATH",
+    "GradingDaemon",
+    "send_request",
+    "submit_job",
+]
@@ -0,0 +1,100 @@
+"""Batch grading of many solutions across worker processes."""
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence
+
+from ..config import BatchExecutor
+from ..utils.exceptions import WorkerError
+from .fork_server import PRELOAD_MODULES, ForkServer, preload_dependencies
+from .job import GradingJob, GradingResult, run_grading_job
+
+
+def collect_solutions(pattern: str) -> List[Path]:
+    """Resolve a directory or glob pattern to a sorted list of solution files.
+
+    Args:
+        pattern: Directory containing ``*.py`` files or a glob pattern
+
+    Returns:
+        Sorted list of matching Python files
+    """
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(candidate for candidate in path.glob("*.py") if candidate.is_file())
+
+    return sorted(Path(match) for match in glob.glob(pattern, recursive=True) if Path(match).is_file())
+
+
+def read_test_types(test_case_paths: Iterable[Path]) -> List[str]:
+    """Read the distinct ``test_type`` values of test case files without full validation."""
+    test_types = []
+    for test_case_path in test_case_paths:
+        try:
+            test_type = json.loads(test_case_path.read_text("utf-8")).get("test_type")
+        except (OSError, ValueError, AttributeError):
+            continue
+        if test_type and test_type not in test_types:
+            test_types.append(test_type)
+    return test_types
+
+
+class BatchRunner:
+    """Distributes grading jobs over a pool of worker processes."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        executor: BatchExecutor = BatchExecutor.POOL,
+        test_types: Sequence[str] = (),
+    ):
+        """Initialize the batch runner.
+
+        Args:
+            max_workers: Number of worker processes, CPU count by default
+            executor: Process model used to run jobs
+            test_types: Test types whose dependencies workers preload, unknown ones are ignored
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise WorkerError("max_workers must be positive")
+
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor = BatchExecutor(executor)
+        self._test_types = tuple(test_type for test_type in test_types if test_type in PRELOAD_MODULES)
+
+    @staticmethod
+    def make_jobs(solutions: Iterable[Path], test_case_paths: Sequence[Path], **job_options) -> List[GradingJob]:
+        """Build one job for every (solution, test case) pair."""
+        return [
+            GradingJob(solution_path=solution, test_case_path=test_case_path, **job_options)
+            for solution in solutions
+            for test_case_path in test_case_paths
+        ]
+
+    def run(self, jobs: Sequence[GradingJob]) -> Iterator[GradingResult]:
+        """Grade jobs, yielding results as soon as they complete.
+
+        Args:
+            jobs: Jobs to grade
+
+        Yields:
+            Results in completion order
+        """
+        if self._executor == BatchExecutor.FORK:
+            yield from ForkServer(self._test_types).imap(jobs, self._max_workers)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=preload_dependencies,
+            initargs=(self._test_types,),
+        ) as pool:
+            futures = {pool.submit(run_grading_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield GradingResult.from_error(futures[future], f"Worker failed: {e.__class__.__name__}: {e}")
@@ -0,0 +1,313 @@
+"""Long-lived grading daemon serving jobs over a Unix domain socket."""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..__version__ import __version__
+from ..config import IsolationMode
+from ..core import PluginManager
+from ..execution import DynamicTester
+from ..logging import Console, LogLevel
+from ..utils.exceptions import WorkerError
+from .fork_server import ForkServer
+from .job import INLINE_TEST_CASE_PATH, GradingJob, GradingResult, get_worker_console
+
+DEFAULT_SOCKET_PATH = Path(tempfile.gettempdir()) / f"code-tester-{os.getuid()}.sock"
+
+DEFAULT_JOB_TIMEOUT = 60.0
+
+DEFAULT_CLIENT_TIMEOUT = 30.0
+
+_ACCEPT_TIMEOUT = 0.5
+
+
+def job_to_request(job: GradingJob) -> Dict[str, Any]:
+    """Build the request a daemon grades a job from.
+
+    Paths are made absolute since the daemon may run in another directory.
+    """
+    request: Dict[str, Any] = {
+        "command": "grade",
+        "solution_path": str(Path(job.solution_path).resolve()),
+        "exit_on_first_error": job.exit_on_first_error,
+        "isolation_mode": str(job.isolation_mode),
+    }
+    if job.test_case_data is not None:
+        request["test_case"] = job.test_case_data
+    else:
+        request["test_case_path"] = str(Path(job.test_case_path).resolve())
+    return request
+
+
+def send_request(socket_path: Path, request: Dict[str, Any], timeout: float | None = None) -> Dict[str, Any]:
+    """Send one request to a grading daemon and wait for its response.
+
+    Args:
+        socket_path: Path of the daemon socket
+        request: JSON-serializable request
+        timeout: Seconds to wait for the response, None waits forever
+
+    Returns:
+        Decoded response
+
+    Raises:
+        WorkerError: If the daemon is unreachable or rejects the request
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(timeout)
+            connection.connect(str(socket_path))
+            with connection.makefile("rwb") as stream:
+                stream.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline()
+    except OSError as e:
+        raise WorkerError(f"Cannot reach grading daemon at {socket_path}: {e}") from e
+
+    if not line:
+        raise WorkerError(f"Grading daemon at {socket_path} closed the connection without a response")
+
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise WorkerError(f"Grading daemon rejected the request: {response.get('error')}")
+    return response
+
+
+def submit_job(socket_path: Path, job: GradingJob, timeout: float | None = None) -> GradingResult:
+    """Grade a job in a running daemon.
+
+    Args:
+        socket_path: Path of the daemon socket
+        job: Job to grade; only its solution, test case and run options are sent
+        timeout: Seconds to wait for the result, None waits forever
+
+    Returns:
+        Result of the job
+
+    Raises:
+        WorkerError: If the daemon is unreachable or rejects the job
+    """
+    response = send_request(socket_path, job_to_request(job), timeout)
+    return GradingResult(**response["result"])
+
+
+class GradingDaemon:
+    """Grading server that keeps the framework warm between jobs.
+
+    The plugin system and the dependencies of the served test types are
+    initialized once. Test cases are parsed and compiled in the daemon
+    itself, so each distinct test case is prepared once and every job then
+    only runs the solution. Clients send one JSON object per line and get one JSON line
+    back for each of them:
+
+    - ``{"command": "grade", "solution_path": ..., "test_case_path": ...}``
+      grades a solution; ``test_case`` may hold the test case itself instead
+      of a path, ``exit_on_first_error`` and ``isolation_mode`` are optional
+    - ``{"command": "ping"}`` reports the version and number of graded jobs
+    - ``{"command": "shutdown"}`` stops the daemon
+
+    Jobs are graded one at a time, each in a child forked from the warm
+    daemon, so solutions that exit, crash or hang cannot take it down.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path = DEFAULT_SOCKET_PATH,
+        test_types: Iterable[str] = (),
+        console: Console | None = None,
+        code_cache_dir: Optional[Path] = None,
+        reference_store_dir: Optional[Path] = None,
+        result_cache_path: Optional[Path] = None,
+        result_cache_max_age: Optional[float] = None,
+        job_timeout: Optional[float] = DEFAULT_JOB_TIMEOUT,
+        client_timeout: Optional[float] = DEFAULT_CLIENT_TIMEOUT,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Path of the Unix domain socket to listen on
+            test_types: Test types whose dependencies are imported on start
+            console: Console for logging, the worker console by default
+            code_cache_dir: Directory for compiled code shared by all jobs
+            reference_store_dir: Directory for decoded reference images shared by all jobs
+            result_cache_path: SQLite file caching results of all jobs
+            result_cache_max_age: Maximum age of cached results in seconds
+            job_timeout: Seconds a job may run before its child is killed, None waits forever
+            client_timeout: Seconds to wait for the next request of a connected client, None waits forever
+        """
+        self._socket_path = Path(socket_path)
+        self._test_types = tuple(test_types)
+        self._console = console or get_worker_console()
+        self._code_cache_dir = code_cache_dir
+        self._reference_store_dir = reference_store_dir
+        self._result_cache_path = result_cache_path
+        self._result_cache_max_age = result_cache_max_age
+        self._job_timeout = job_timeout
+        self._client_timeout = client_timeout
+        self._plugin_manager: PluginManager | None = None
+        self._fork_server: ForkServer | None = None
+        self._server: socket.socket | None = None
+        self._stopping = threading.Event()
+        self._ready = threading.Event()
+        self.jobs_graded = 0
+
+    @property
+    def socket_path(self) -> Path:
+        """Get the path of the listening socket."""
+        return self._socket_path
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """Wait until the daemon accepts connections.
+
+        Returns:
+            Whether the daemon is ready
+        """
+        return self._ready.wait(timeout)
+
+    def stop(self) -> None:
+        """Ask the serving loop to exit; safe to call from other threads and signal handlers."""
+        self._stopping.set()
+
+    def serve_forever(self) -> None:
+        """Warm up, then accept connections until stopped.
+
+        Raises:
+            WorkerError: If another daemon already listens on the socket
+        """
+        self._warm_up()
+        self._listen()
+        self._console.print(f"Grading daemon listening on {self._socket_path}", level=LogLevel.INFO)
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    connection, _ = self._server.accept()
+                except socket.timeout:
+                    continue
+                with connection:
+                    try:
+                        self._serve_connection(connection)
+                    except OSError as e:
+                        self._console.print(f"Client connection failed: {e}", level=LogLevel.WARNING)
+        finally:
+            self._close()
+            self._console.print("Grading daemon stopped", level=LogLevel.INFO)
+
+    def _warm_up(self) -> None:
+        self._plugin_manager = DynamicTester.create_plugin_manager(get_worker_console())
+        self._fork_server = ForkServer(self._test_types, self._console, self._plugin_manager)
+        # Also loads the plugins of the served test types, so children start with them.
+        self._fork_server.preload()
+
+    def _listen(self) -> None:
+        if self._socket_path.exists():
+            # A leftover socket file of a crashed daemon refuses connections and can be replaced.
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                if probe.connect_ex(str(self._socket_path)) == 0:
+                    raise WorkerError(f"A grading daemon is already listening on {self._socket_path}")
+            self._socket_path.unlink()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(self._socket_path))
+            os.chmod(self._socket_path, 0o600)
+            server.listen()
+            server.settimeout(_ACCEPT_TIMEOUT)
+        except OSError as e:
+            server.close()
+            raise WorkerError(f"Cannot listen on {self._socket_path}: {e}") from e
+
+        self._server = server
+        self._ready.set()
+
+    def _close(self) -> None:
+        self._ready.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        self._socket_path.unlink(missing_ok=True)
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        # A client that stops sending would otherwise block every other client.
+        connection.settimeout(self._client_timeout)
+        with connection.makefile("rwb") as stream:
+            for line in stream:
+                if not line.strip():
+                    continue
+                response = self.handle_request(line)
+                stream.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                stream.flush()
+                if self._stopping.is_set():
+                    return
+
+    def handle_request(self, line: bytes | str) -> Dict[str, Any]:
+        """Execute one request line.
+
+        Args:
+            line: JSON-encoded request
+
+        Returns:
+            Response with ``ok`` set, and ``error`` if the request was rejected
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise WorkerError("Request must be a JSON object")
+
+            command = request.get("command", "grade")
+            if command == "ping":
+                return {"ok": True, "version": __version__, "jobs_graded": self.jobs_graded}
+            if command == "shutdown":
+                self.stop()
+                return {"ok": True}
+            if command != "grade":
+                raise WorkerError(f"Unknown command: {command}")
+
+            job = self._make_job(request)
+            self._prepare(job)
+            result = self._fork_server.run(job, self._job_timeout)
+        except (json.JSONDecodeError, WorkerError, ValueError, TypeError) as e:
+            return {"ok": False, "error": f"{e.__class__.__name__}: {e}"}
+
+        self.jobs_graded += 1
+        self._console.print(
+            f"Graded {result.solution_path}: {'passed' if result.passed else 'failed'} in {result.duration:.3f}s",
+            level=LogLevel.DEBUG,
+        )
+        return {"ok": True, "result": result.to_dict()}
+
+    def _prepare(self, job: GradingJob) -> None:
+        # The test case is parsed and compiled in the daemon, whose caches outlive the children that inherit them.
+        try:
+            DynamicTester(job.to_app_config(), get_worker_console(), self._plugin_manager, job.test_case_data).prepare()
+        except Exception as e:
+            # The child fails the same way and reports the error in the result.
+            self._console.print(f"Cannot prepare test case {job.test_case_path}: {e}", level=LogLevel.DEBUG)
+
+    def _make_job(self, request: Dict[str, Any]) -> GradingJob:
+        if "solution_path" not in request:
+            raise WorkerError("Missing 'solution_path'")
+
+        test_case_data = request.get("test_case")
+        test_case_path = request.get("test_case_path")
+        if (test_case_data is None) == (test_case_path is None):
+            raise WorkerError("Exactly one of 'test_case_path' and 'test_case' is required")
+        if test_case_data is not None and not isinstance(test_case_data, dict):
+            raise WorkerError("'test_case' must be a JSON object")
+
+        return GradingJob(
+            solution_path=Path(request["solution_path"]),
+            test_case_path=Path(test_case_path) if test_case_path is not None else INLINE_TEST_CASE_PATH,
+            exit_on_first_error=bool(request.get("exit_on_first_error", False)),
+            isolation_mode=IsolationMode(request.get("isolation_mode", IsolationMode.MODULE)),
+            code_cache_dir=self._code_cache_dir,
+            reference_store_dir=self._reference_store_dir,
+            result_cache_path=self._result_cache_path,
+            result_cache_max_age=self._result_cache_max_age,
+            test_case_data=test_case_data,
+        )
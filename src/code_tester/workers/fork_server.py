@@ -0,0 +1,238 @@
+"""Fork server that grades solutions in children of a pre-warmed process."""
+
+import gc
+import importlib
+import os
+import pickle
+import selectors
+import signal
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from ..core import PluginManager
+from ..execution import DynamicTester
+from ..logging import Console, LogLevel
+from ..utils.exceptions import WorkerError
+from .job import GradingJob, GradingResult, get_worker_console, run_grading_job
+
+# Concrete modules, as the packages themselves import their contents lazily. Plugin modules are imported by
+# loading the plugins of each test type.
+FRAMEWORK_MODULES: Tuple[str, ...] = (
+    "pydantic",
+    "loguru",
+    "rich.console",
+    "code_tester.execution.tester",
+    "code_tester.execution.check_handler",
+    "code_tester.execution.environment",
+)
+
+PRELOAD_MODULES: Dict[str, Tuple[str, ...]] = {
+    "py_general": (),
+    "api": ("requests", "unittest.mock"),
+    "flask": ("flask", "werkzeug.test"),
+    "arcade": ("numpy", "PIL.Image", "skimage.metrics", "arcade", "code_tester.imaging.store"),
+}
+
+
+def preload_dependencies(test_types: Iterable[str], console: Console | None = None) -> List[str]:
+    """Import the framework and the dependency set of the given test types.
+
+    Modules that are not installed are skipped, since a worker may serve test
+    types whose optional dependencies are missing.
+
+    Args:
+        test_types: Test types whose dependencies should be imported
+        console: Console for logging, the worker console by default
+
+    Returns:
+        Names of the modules that were imported
+    """
+    console = console or get_worker_console()
+    names = list(FRAMEWORK_MODULES)
+    for test_type in test_types:
+        if test_type not in PRELOAD_MODULES:
+            raise WorkerError(f"Unknown test type for preloading: {test_type}")
+        names.extend(name for name in PRELOAD_MODULES[test_type] if name not in names)
+
+    imported = []
+    for name in names:
+        try:
+            importlib.import_module(name)
+            imported.append(name)
+        except Exception as e:
+            console.print(f"Skipping preload of '{name}': {e}", level=LogLevel.WARNING)
+
+    console.print(f"Preloaded {len(imported)} modules", level=LogLevel.DEBUG)
+    return imported
+
+
+class ForkServer:
+    """Zygote process that forks one child per grading job.
+
+    The framework and the heavy dependencies of the requested test types are
+    imported once in the server, and the plugins of those test types are
+    loaded into a plugin manager the children inherit. ``gc.freeze()`` then
+    moves every object into the permanent generation so that children do not
+    touch (and copy) the shared pages during garbage collection.
+    """
+
+    def __init__(
+        self,
+        test_types: Iterable[str] = tuple(PRELOAD_MODULES),
+        console: Console | None = None,
+        plugin_manager: PluginManager | None = None,
+    ):
+        """Initialize the fork server.
+
+        Args:
+            test_types: Test types whose dependencies and plugins are preloaded
+            console: Console for logging, the worker console by default
+            plugin_manager: Plugin manager inherited by the children, :meth:`preload` creates one by default
+
+        Raises:
+            WorkerError: If the platform does not support ``os.fork``
+        """
+        if not hasattr(os, "fork"):
+            raise WorkerError("Fork server requires a platform with os.fork()")
+
+        self._test_types = tuple(test_types)
+        self._console = console or get_worker_console()
+        self._plugin_manager = plugin_manager
+        self._preloaded = False
+
+    @property
+    def plugin_manager(self) -> PluginManager | None:
+        """Get the plugin manager inherited by the children, available after :meth:`preload`."""
+        return self._plugin_manager
+
+    def preload(self) -> None:
+        """Import shared dependencies, load plugins and freeze the heap before forking."""
+        if self._preloaded:
+            return
+
+        preload_dependencies(self._test_types, self._console)
+        if self._plugin_manager is None:
+            self._plugin_manager = DynamicTester.create_plugin_manager(self._console)
+        for test_type in self._test_types:
+            self._plugin_manager.load_plugins_for_test_type(test_type)
+
+        gc.collect()
+        gc.freeze()
+        self._preloaded = True
+
+    def run(self, job: GradingJob, timeout: float | None = None) -> GradingResult:
+        """Grade a single job in a forked child, see :meth:`imap`."""
+        return next(self.imap([job], max_workers=1, timeout=timeout))
+
+    def imap(
+        self,
+        jobs: Iterable[GradingJob],
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[GradingResult]:
+        """Grade jobs in forked children, yielding results as they complete.
+
+        Args:
+            jobs: Jobs to grade
+            max_workers: Maximum number of concurrent children, CPU count by default
+            timeout: Seconds a child may run before it is killed and its job fails, None waits forever
+
+        Yields:
+            Results in completion order
+        """
+        self.preload()
+        max_workers = max_workers or os.cpu_count() or 1
+        pending = iter(jobs)
+        running: Dict[int, Tuple[int, GradingJob, bytearray, float]] = {}
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                while True:
+                    while len(running) < max_workers:
+                        job = next(pending, None)
+                        if job is None:
+                            break
+                        read_fd, pid = self._spawn(job)
+                        deadline = time.monotonic() + timeout if timeout is not None else float("inf")
+                        running[read_fd] = (pid, job, bytearray(), deadline)
+                        selector.register(read_fd, selectors.EVENT_READ)
+
+                    if not running:
+                        return
+
+                    if timeout is not None:
+                        for read_fd in self._expired(running):
+                            selector.unregister(read_fd)
+                            pid, job, _, _ = running[read_fd]
+                            self._terminate({read_fd: running.pop(read_fd)})
+                            yield GradingResult.from_error(
+                                job, f"Worker {pid} timed out after {timeout}s", duration=timeout
+                            )
+                        if not running:
+                            continue
+
+                    wait = min(entry[3] for entry in running.values()) - time.monotonic()
+                    for key, _ in selector.select(None if wait == float("inf") else max(wait, 0)):
+                        read_fd = key.fd
+                        chunk = os.read(read_fd, 65536)
+                        if chunk:
+                            running[read_fd][2].extend(chunk)
+                            continue
+
+                        selector.unregister(read_fd)
+                        os.close(read_fd)
+                        pid, job, payload, _ = running.pop(read_fd)
+                        yield self._collect(pid, job, bytes(payload))
+        finally:
+            # A consumer that stops early leaves children running; they are killed and reaped.
+            self._terminate(running)
+
+    def _spawn(self, job: GradingJob) -> Tuple[int, int]:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            os.close(read_fd)
+            exit_code = 0
+            try:
+                try:
+                    result = run_grading_job(job, self._plugin_manager)
+                except BaseException as e:
+                    result = GradingResult.from_error(job, f"{e.__class__.__name__}: {e}")
+                with os.fdopen(write_fd, "wb") as pipe:
+                    pipe.write(pickle.dumps(result))
+            except BaseException:
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        os.close(write_fd)
+        self._console.print(f"Forked worker {pid} for {job.solution_path}", level=LogLevel.DEBUG)
+        return read_fd, pid
+
+    @staticmethod
+    def _expired(running: Dict[int, Tuple[int, GradingJob, bytearray, float]]) -> List[int]:
+        now = time.monotonic()
+        return [read_fd for read_fd, entry in running.items() if entry[3] <= now]
+
+    def _terminate(self, running: Dict[int, Tuple[int, GradingJob, bytearray, float]]) -> None:
+        for read_fd, (pid, _, _, _) in running.items():
+            os.close(read_fd)
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            os.waitpid(pid, 0)
+            self._console.print(f"Terminated worker {pid}", level=LogLevel.DEBUG)
+        running.clear()
+
+    def _collect(self, pid: int, job: GradingJob, payload: bytes) -> GradingResult:
+        _, status = os.waitpid(pid, 0)
+
+        if payload:
+            try:
+                return pickle.loads(payload)
+            except Exception as e:
+                return GradingResult.from_error(job, f"Corrupted worker result: {e}")
+
+        return GradingResult.from_error(job, f"Worker {pid} exited without a result (status {status})")
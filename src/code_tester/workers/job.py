@@ -0,0 +1,126 @@
+"""Grading jobs executed by worker processes."""
+
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import AppConfig, IsolationMode
+from ..core import PluginManager
+from ..execution import DynamicTester
+from ..logging import Console, LogConfig, LogLevel, setup_logger
+
+INLINE_TEST_CASE_PATH = Path("<inline>")
+
+
+@dataclass(frozen=True)
+class GradingJob:
+    """A single (solution, test case) pair to grade.
+
+    Jobs with ``test_case_data`` grade against that raw test case instead of
+    reading ``test_case_path``, which then only labels the result.
+    """
+
+    solution_path: Path
+    test_case_path: Path
+    exit_on_first_error: bool = False
+    isolation_mode: IsolationMode = IsolationMode.MODULE
+    code_cache_dir: Optional[Path] = None
+    test_case_cache_dir: Optional[Path] = None
+    reference_store_dir: Optional[Path] = None
+    result_cache_path: Optional[Path] = None
+    result_cache_max_age: Optional[float] = None
+    test_case_data: Optional[Dict[str, Any]] = field(default=None, compare=False)
+
+    def to_app_config(self) -> AppConfig:
+        """Build the application configuration for this job."""
+        return AppConfig(
+            solution_path=self.solution_path,
+            test_case_path=self.test_case_path,
+            log_level=LogLevel.ERROR,
+            is_quiet=True,
+            exit_on_first_error=self.exit_on_first_error,
+            isolation_mode=self.isolation_mode,
+            code_cache_dir=self.code_cache_dir,
+            test_case_cache_dir=self.test_case_cache_dir,
+            reference_store_dir=self.reference_store_dir,
+            result_cache_path=self.result_cache_path,
+            result_cache_max_age=self.result_cache_max_age,
+        )
+
+
+@dataclass
+class GradingResult:
+    """Outcome of a grading job that can be sent between processes."""
+
+    solution_path: str
+    test_case_path: str
+    passed: bool
+    failed_check_ids: List[int] = field(default_factory=list)
+    total_checks: int = 0
+    messages: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @classmethod
+    def from_error(cls, job: GradingJob, error: str, duration: float = 0.0) -> "GradingResult":
+        """Create a failed result for a job that could not be graded."""
+        return cls(
+            solution_path=str(job.solution_path),
+            test_case_path=str(job.test_case_path),
+            passed=False,
+            error=error,
+            duration=duration,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+_worker_console: Console | None = None
+
+
+def get_worker_console() -> Console:
+    """Get the quiet console shared by all jobs of the current process."""
+    global _worker_console
+    if _worker_console is None:
+        logger = setup_logger(LogConfig(level=LogLevel.ERROR, console_enabled=False))
+        _worker_console = Console(logger, is_quiet=True, use_rich=False)
+    return _worker_console
+
+
+def run_grading_job(job: GradingJob, plugin_manager: PluginManager | None = None) -> GradingResult:
+    """Grade one solution against one test case.
+
+    Args:
+        job: Job to execute
+        plugin_manager: Loaded plugin manager to reuse, a new one is created by default
+
+    Returns:
+        Result of the job; framework errors are reported in ``error``
+    """
+    started = time.perf_counter()
+
+    try:
+        tester = DynamicTester(
+            job.to_app_config(),
+            get_worker_console(),
+            plugin_manager=plugin_manager,
+            test_case_data=job.test_case_data,
+        )
+        passed = tester.run()
+    except Exception as e:
+        return GradingResult.from_error(job, f"{e.__class__.__name__}: {e}", time.perf_counter() - started)
+
+    test_case = tester.test_case_config
+    return GradingResult(
+        solution_path=str(job.solution_path),
+        test_case_path=str(job.test_case_path),
+        passed=passed,
+        failed_check_ids=tester.failed_checks_ids,
+        total_checks=len(test_case.checks) if test_case else 0,
+        messages=[check.error_message or "Check failed" for check in tester.failed_checks],
+        error=tester.run_error,
+        duration=time.perf_counter() - started,
+    )
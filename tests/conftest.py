@@ -1,12 +1,26 @@
+import os
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
-from code_tester.config import AppConfig, TestCaseConfig
+from code_tester.config import AppConfig, CheckConfig, TestCaseConfig
 from code_tester.logging import LogLevel, LogConfig, setup_logger, Console
 from code_tester.utils import create_dataclass_from_dict
 
 
+@pytest.fixture(autouse=True, scope="session")
+def cache_home(tmp_path_factory):
+    """Keep the plugin manifest and reference images out of the user cache directory."""
+    path = tmp_path_factory.mktemp("cache")
+    previous = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(path)
+    yield path
+    if previous is None:
+        del os.environ["XDG_CACHE_HOME"]
+    else:
+        os.environ["XDG_CACHE_HOME"] = previous
+
+
 @pytest.fixture
 def temp_dir():
     """Temporary directory for test files."""
@@ -61,6 +75,38 @@ def console(logger):
     return Console(logger, is_quiet=True)
 
 
+@pytest.fixture
+def write_solution(tmp_path):
+    """Factory writing solution source code to a temporary file."""
+    def write(source, name="solution.py"):
+        path = tmp_path / name
+        path.write_text(source, "utf-8")
+        return path
+    return write
+
+
+@pytest.fixture
+def make_check():
+    """Factory of raw check definitions as they appear in test case files."""
+    def make(check_id, perform, expect, reason="Got {actual}", **spec):
+        return {
+            "check_id": check_id,
+            "name_for_output": f"Check {check_id}",
+            "reason_for_output": reason,
+            "explain_for_error": "Explanation",
+            "spec": {"perform": perform, "expect": expect, **spec},
+        }
+    return make
+
+
+@pytest.fixture
+def make_check_config(make_check):
+    """Factory of validated check configurations, see ``make_check``."""
+    def make(*args, **kwargs):
+        return CheckConfig.model_validate(make_check(*args, **kwargs))
+    return make
+
+
 @pytest.fixture
 def fixtures_dir():
     """Path to fixtures directory."""
@@ -1,9 +1,13 @@
-import pytest
+import json
 from pathlib import Path
 
+import arcade
+import pytest
+from PIL import Image
+
 from code_tester.config import AppConfig
 from code_tester.execution.tester import DynamicTester
-from code_tester.logging import Console, LogLevel
+from code_tester.headless import DisplayList
 
 
 class TestSimpleGameIntegration:
@@ -16,10 +20,6 @@ class TestSimpleGameIntegration:
     def arcade_test_case_path(self):
         return Path("tests/fixtures/test_cases/arcade/simple_game_test.json")
     
-    @pytest.fixture
-    def console(self):
-        return Console(log_level=LogLevel.ERROR)
-    
     @pytest.mark.skip(reason="Arcade GUI testing not yet implemented")
     def test_arcade_game_scenario(self, arcade_solution_path, arcade_test_case_path, console):
         """Test Arcade game with simulated events."""
@@ -36,8 +36,34 @@ class TestSimpleGameIntegration:
         assert result is True, "Arcade game test should pass"
         assert len(tester.failed_checks_ids) == 0, f"No checks should fail, but failed: {tester.failed_checks_ids}"
     
-    @pytest.mark.skip(reason="Arcade GUI testing not yet implemented")
-    def test_arcade_screenshot_comparison(self, arcade_solution_path, console):
+    def test_arcade_screenshot_comparison(self, arcade_solution_path, tmp_path, make_check, console):
         """Test Arcade game screenshot comparison."""
-        # This will be implemented when Arcade system is ready
-        pass
\ No newline at end of file
+        # The balls and the paddle placed by setup(), drawn on the black background.
+        scene = DisplayList()
+        for x, y in [(400, 300), (200, 400), (600, 200)]:
+            scene.record("circle", True, x, y, 20, 20, arcade.color.WHITE)
+        scene.record("rectangle", True, 400, 50, 100, 20, arcade.color.BLUE)
+        reference_path = tmp_path / "reference.png"
+        Image.fromarray(scene.render(800, 600)).save(reference_path)
+
+        expect = {"image": {"assertion": "image_equals", "value": str(reference_path)}}
+        test_case = {
+            "test_id": 1,
+            "test_name": "Screenshot",
+            "description": "Compares screenshots of the game",
+            "test_type": "arcade",
+            "checks": [
+                make_check(1, {"action": "simulate_frames", "target": "SimpleGame",
+                               "params": {"frames": 0, "screenshot": True}}, expect),
+                make_check(2, {"action": "simulate_frames", "target": "SimpleGame",
+                               "params": {"frames": 30, "seed": 1, "screenshot": True}}, expect),
+            ],
+        }
+        test_case_path = tmp_path / "screenshot_test.json"
+        test_case_path.write_text(json.dumps(test_case), "utf-8")
+
+        config = AppConfig(solution_path=arcade_solution_path, test_case_path=test_case_path, exit_on_first_error=False)
+        tester = DynamicTester(config, console)
+
+        assert tester.run() is False
+        assert tester.failed_checks_ids == [2]
\ No newline at end of file
@@ -2,7 +2,7 @@ import json
 import pytest
 from pathlib import Path
 
-from code_tester.config import AppConfig
+from code_tester.config import AppConfig, IsolationMode
 from code_tester.execution.tester import DynamicTester
 from code_tester.logging import Console, LogLevel
 
@@ -38,6 +38,19 @@ class TestCalculatorIntegration:
         assert result is True, "Calculator test should pass completely"
         assert len(tester.failed_checks_ids) == 0, f"No checks should fail, but failed: {tester.failed_checks_ids}"
     
+    def test_calculator_full_scenario_in_session_mode(self, calculator_solution_path, calculator_test_case_path, console):
+        config = AppConfig(
+            solution_path=calculator_solution_path,
+            test_case_path=calculator_test_case_path,
+            isolation_mode=IsolationMode.SESSION,
+        )
+        
+        tester = DynamicTester(config, console)
+        result = tester.run()
+        
+        assert result is True, "Calculator test should pass in session mode"
+        assert len(tester.failed_checks_ids) == 0
+    
     def test_calculator_object_creation_and_methods(self, calculator_solution_path, calculator_test_case_path, console):
         config = AppConfig(
             solution_path=calculator_solution_path,
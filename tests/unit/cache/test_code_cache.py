@@ -0,0 +1,112 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from code_tester.cache import CodeCache, get_code_cache
+from code_tester.execution import ExecutionEnvironment
+from code_tester.logging import LogConfig, LogLevel, setup_logger, Console
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "solutions" / "py_general"
+
+
+class TestCodeCache(unittest.TestCase):
+    def test_same_source_is_compiled_once(self):
+        cache = CodeCache()
+        path = Path("solution.py")
+
+        code1 = cache.get_code(path, b"x = 1\n")
+        code2 = cache.get_code(path, b"x = 1\n")
+
+        self.assertIs(code1, code2)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_changed_source_is_recompiled(self):
+        cache = CodeCache()
+        path = Path("solution.py")
+
+        cache.get_code(path, b"x = 1\n")
+        code = cache.get_code(path, b"x = 2\n")
+
+        namespace = {}
+        exec(code, namespace)
+        self.assertEqual(namespace["x"], 2)
+        self.assertEqual(cache.misses, 2)
+
+    def test_path_is_part_of_key(self):
+        cache = CodeCache()
+
+        code1 = cache.get_code(Path("a.py"), b"x = 1\n")
+        code2 = cache.get_code(Path("b.py"), b"x = 1\n")
+
+        self.assertEqual(code1.co_filename, "a.py")
+        self.assertEqual(code2.co_filename, "b.py")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = CodeCache(max_entries=2)
+        path = Path("solution.py")
+
+        cache.get_code(path, b"a = 1\n")
+        cache.get_code(path, b"b = 1\n")
+        cache.get_code(path, b"a = 1\n")
+        cache.get_code(path, b"c = 1\n")
+
+        self.assertEqual(len(cache), 2)
+        cache.get_code(path, b"a = 1\n")
+        self.assertEqual(cache.hits, 2)
+
+    def test_syntax_error_is_propagated(self):
+        cache = CodeCache()
+
+        with self.assertRaises(SyntaxError):
+            cache.get_code(Path("broken.py"), b"def broken(:\n")
+
+    def test_disk_store_is_shared_between_instances(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path("solution.py")
+            CodeCache(cache_dir=Path(tmp_dir)).get_code(path, b"x = 1\n")
+
+            stored = list(Path(tmp_dir).glob("*.marshal"))
+            self.assertEqual(len(stored), 1)
+
+            other = CodeCache(cache_dir=Path(tmp_dir))
+            code = other.get_code(path, b"x = 1\n")
+            self.assertEqual(code.co_filename, "solution.py")
+
+    def test_corrupted_disk_entry_is_recompiled(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path("solution.py")
+            CodeCache(cache_dir=Path(tmp_dir)).get_code(path, b"x = 1\n")
+            stored = next(Path(tmp_dir).glob("*.marshal"))
+            stored.write_bytes(b"garbage")
+
+            code = CodeCache(cache_dir=Path(tmp_dir)).get_code(path, b"x = 1\n")
+
+            namespace = {}
+            exec(code, namespace)
+            self.assertEqual(namespace["x"], 1)
+
+    def test_shared_cache_is_reused(self):
+        self.assertIs(get_code_cache(), get_code_cache())
+
+
+class TestEnvironmentCodeCache(unittest.TestCase):
+    def setUp(self):
+        log_config = LogConfig(level=LogLevel.CRITICAL, console_enabled=False)
+        logger = setup_logger(log_config)
+        self.console = Console(logger, is_quiet=True)
+
+    def test_module_body_is_executed_without_recompiling(self):
+        cache = CodeCache()
+        env = ExecutionEnvironment(FIXTURES_DIR / "isolation.py", self.console, code_cache=cache)
+
+        for _ in range(3):
+            with env.run_in_isolation() as (module, _):
+                self.assertEqual(module.COUNTER, 1)
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+import json
+import shutil
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from code_tester.cache import CachedResult, ResultCache
+from code_tester.config import AppConfig, TestCaseConfig
+from code_tester.execution import CheckHandler, DynamicTester
+from code_tester.logging import LogConfig, LogLevel, setup_logger, Console
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
+SOLUTION_PATH = FIXTURES_DIR / "solutions" / "py_general" / "calculator.py"
+TEST_CASE_PATH = FIXTURES_DIR / "test_cases" / "py_general" / "calculator_test.json"
+
+
+def load_test_case(path=TEST_CASE_PATH):
+    return TestCaseConfig.model_validate(json.loads(path.read_text("utf-8")))
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "results.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_stored_result_is_returned(self):
+        cache = ResultCache(self.db_path)
+        cache.put("key", CachedResult(passed=False, failed_checks=[(3, "Wrong answer")]))
+
+        result = ResultCache(self.db_path).get("key")
+
+        self.assertFalse(result.passed)
+        self.assertEqual(result.failed_checks, [(3, "Wrong answer")])
+
+    def test_missing_key_counts_miss(self):
+        cache = ResultCache(self.db_path)
+
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.misses, 1)
+
+    def test_key_ignores_test_case_formatting(self):
+        test_case = load_test_case()
+        reformatted = TestCaseConfig.model_validate(
+            json.loads(json.dumps(json.loads(TEST_CASE_PATH.read_text("utf-8")), indent=4, sort_keys=True))
+        )
+
+        self.assertEqual(
+            ResultCache.make_key(SOLUTION_PATH, b"source", test_case),
+            ResultCache.make_key(SOLUTION_PATH, b"source", reformatted),
+        )
+
+    def test_key_depends_on_source_test_case_and_options(self):
+        test_case = load_test_case()
+        changed = test_case.model_copy(update={"test_name": "Other"})
+        key = ResultCache.make_key(SOLUTION_PATH, b"source", test_case, False)
+
+        self.assertNotEqual(key, ResultCache.make_key(SOLUTION_PATH, b"other", test_case, False))
+        self.assertNotEqual(key, ResultCache.make_key(SOLUTION_PATH, b"source", changed, False))
+        self.assertNotEqual(key, ResultCache.make_key(SOLUTION_PATH, b"source", test_case, True))
+
+    def test_keys_depend_on_contents_of_files_read_by_checks(self):
+        data_file = Path(self.tmp_dir.name) / "data.txt"
+        reference = Path(self.tmp_dir.name) / "reference.png"
+        data_file.write_text("first")
+        reference.write_bytes(b"first")
+        data = json.loads(TEST_CASE_PATH.read_text("utf-8"))
+        data["checks"][0]["spec"] = {
+            "perform": {"action": "read_file_content", "target": str(data_file)},
+            "expect": {"return_value": {"assertion": "image_equals", "value": str(reference)}},
+        }
+        test_case = TestCaseConfig.model_validate(data)
+        check = test_case.checks[0]
+
+        def keys():
+            return (
+                ResultCache.make_key(SOLUTION_PATH, b"source", test_case),
+                ResultCache.make_check_key(SOLUTION_PATH, b"source", test_case, check, []),
+            )
+
+        original = keys()
+        for path in (data_file, reference):
+            with self.subTest(path=path.name):
+                path.write_text("second")
+                changed = keys()
+                self.assertNotEqual(changed[0], original[0])
+                self.assertNotEqual(changed[1], original[1])
+                original = changed
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = ResultCache(self.db_path, max_entries=2)
+        cache.put("a", CachedResult(passed=True))
+        time.sleep(0.01)
+        cache.put("b", CachedResult(passed=True))
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", CachedResult(passed=True))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+    def test_expired_entries_are_ignored(self):
+        cache = ResultCache(self.db_path, max_age=60)
+        cache.put("key", CachedResult(passed=True))
+
+        with patch("code_tester.cache.result_cache.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get("key"))
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestTesterResultCache(unittest.TestCase):
+    def setUp(self):
+        log_config = LogConfig(level=LogLevel.CRITICAL, console_enabled=False)
+        self.console = Console(setup_logger(log_config), is_quiet=True)
+        self.tmp_dir = TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "results.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_config(self, solution_path=SOLUTION_PATH):
+        return AppConfig(solution_path=solution_path, test_case_path=TEST_CASE_PATH, result_cache_path=self.db_path)
+
+    def test_unchanged_run_skips_execution(self):
+        first = DynamicTester(self.make_config(), self.console)
+        self.assertTrue(first.run())
+
+        second = DynamicTester(self.make_config(), self.console)
+        with patch.object(DynamicTester, "_setup_environment") as setup_environment:
+            self.assertTrue(second.run())
+
+        setup_environment.assert_not_called()
+
+    def test_failed_checks_are_restored(self):
+        solution_path = Path(self.tmp_dir.name) / "calculator.py"
+        shutil.copy(SOLUTION_PATH, solution_path)
+        solution_path.write_text(solution_path.read_text("utf-8").replace("a + b", "a - b"), "utf-8")
+
+        first = DynamicTester(self.make_config(solution_path), self.console)
+        self.assertFalse(first.run())
+
+        second = DynamicTester(self.make_config(solution_path), self.console)
+        with patch.object(DynamicTester, "_setup_environment") as setup_environment:
+            self.assertFalse(second.run())
+
+        setup_environment.assert_not_called()
+        self.assertEqual(second.failed_checks_ids, first.failed_checks_ids)
+        self.assertEqual(
+            [check.error_message for check in second.failed_checks],
+            [check.error_message for check in first.failed_checks],
+        )
+
+
+class TestTesterCheckCache(unittest.TestCase):
+    def setUp(self):
+        log_config = LogConfig(level=LogLevel.CRITICAL, console_enabled=False)
+        self.console = Console(setup_logger(log_config), is_quiet=True)
+        self.tmp_dir = TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "results.sqlite"
+        self.test_case_path = Path(self.tmp_dir.name) / "calculator_test.json"
+        self.test_case = json.loads(TEST_CASE_PATH.read_text("utf-8"))
+        self.test_case_path.write_text(json.dumps(self.test_case), "utf-8")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def edit_check(self, check_id, value):
+        for check in self.test_case["checks"]:
+            if check["check_id"] == check_id:
+                check["spec"]["expect"]["return_value"]["value"] = value
+        self.test_case_path.write_text(json.dumps(self.test_case), "utf-8")
+
+    def run_tester(self):
+        config = AppConfig(
+            solution_path=SOLUTION_PATH,
+            test_case_path=self.test_case_path,
+            result_cache_path=self.db_path,
+        )
+        tester = DynamicTester(config, self.console)
+        with patch.object(CheckHandler, "execute_check", autospec=True, side_effect=CheckHandler.execute_check) as execute:
+            passed = tester.run()
+        executed = [call.args[1].check_id for call in execute.call_args_list]
+        return tester, passed, executed
+
+    def test_only_edited_check_and_its_upstream_are_rerun(self):
+        _, passed, executed = self.run_tester()
+        self.assertTrue(passed)
+        self.assertEqual(executed, [1, 2, 3])
+
+        self.edit_check(3, "ZeroDivisionError")
+        tester, passed, executed = self.run_tester()
+
+        self.assertFalse(passed)
+        self.assertEqual(executed, [1, 3])
+        self.assertEqual(tester.failed_checks_ids, [3])
+
+    def test_editing_upstream_check_reruns_dependents(self):
+        self.run_tester()
+
+        self.edit_check(1, "object")
+        tester, passed, executed = self.run_tester()
+
+        self.assertFalse(passed)
+        self.assertEqual(executed, [1, 2, 3])
+
+    def test_unchanged_checks_are_not_executed(self):
+        self.run_tester()
+
+        self.test_case["test_name"] = "Renamed calculator test"
+        self.test_case_path.write_text(json.dumps(self.test_case), "utf-8")
+        tester, passed, executed = self.run_tester()
+
+        self.assertTrue(passed)
+        self.assertEqual(executed, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import json
+import os
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from code_tester.cache import TestCaseCache, get_test_case_cache
+from code_tester.config import TestCaseConfig
+
+FIXTURE_PATH = Path(__file__).parent.parent.parent / "fixtures" / "test_cases" / "py_general" / "calculator_test.json"
+
+
+class TestTestCaseCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.tmp_dir = Path(self._tmp.name)
+        self.path = self.tmp_dir / "test_case.json"
+        self.path.write_bytes(FIXTURE_PATH.read_bytes())
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_unchanged_file_is_validated_once(self):
+        cache = TestCaseCache()
+
+        first = cache.load(self.path)
+        with patch.object(Path, "read_bytes") as read_bytes:
+            second = cache.load(self.path)
+
+        read_bytes.assert_not_called()
+        self.assertIs(first.config, second.config)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+    def test_modified_file_is_read_again(self):
+        cache = TestCaseCache()
+        first = cache.load(self.path)
+
+        data = json.loads(self.path.read_text("utf-8"))
+        data["test_name"] = "Renamed"
+        self.path.write_text(json.dumps(data), "utf-8")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cache.load(self.path)
+
+        self.assertNotEqual(first.digest, second.digest)
+        self.assertEqual(second.config.test_name, "Renamed")
+
+    def test_same_content_in_other_file_is_shared(self):
+        cache = TestCaseCache()
+        copy = self.tmp_dir / "copy.json"
+        copy.write_bytes(self.path.read_bytes())
+
+        self.assertIs(cache.load(self.path).config, cache.load(copy).config)
+
+    def test_disk_store_skips_validation(self):
+        store = self.tmp_dir / "store"
+        validated = TestCaseCache(cache_dir=store).load(self.path).config
+
+        with patch.object(TestCaseConfig, "model_validate") as validate:
+            restored = TestCaseCache(cache_dir=store).load(self.path).config
+
+        validate.assert_not_called()
+        self.assertEqual(restored, validated)
+        self.assertEqual(restored.model_fields_set, validated.model_fields_set)
+        self.assertEqual(restored.checks[0].spec.expect.return_value.value, "Calculator")
+
+    def test_corrupt_disk_entry_is_validated_again(self):
+        store = self.tmp_dir / "store"
+        TestCaseCache(cache_dir=store).load(self.path)
+        for entry in store.iterdir():
+            entry.write_bytes(b"garbage")
+
+        restored = TestCaseCache(cache_dir=store).load(self.path)
+
+        self.assertEqual(restored.config.test_name, "Calculator Class Test")
+
+    def test_invalid_test_case_is_not_cached(self):
+        self.path.write_text(json.dumps({"checks": []}), "utf-8")
+        cache = TestCaseCache(cache_dir=self.tmp_dir / "store")
+
+        with self.assertRaises(ValidationError):
+            cache.load(self.path)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(list((self.tmp_dir / "store").iterdir()), [])
+
+    def test_lru_eviction(self):
+        cache = TestCaseCache(max_entries=1)
+        other = self.tmp_dir / "other.json"
+        data = json.loads(self.path.read_text("utf-8"))
+        data["test_id"] = 2
+        other.write_text(json.dumps(data), "utf-8")
+
+        cache.load(self.path)
+        cache.load(other)
+        cache.load(self.path)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.misses, 3)
+
+    def test_shared_cache_per_directory(self):
+        self.assertIs(get_test_case_cache(self.tmp_dir), get_test_case_cache(self.tmp_dir))
+        self.assertIsNot(get_test_case_cache(self.tmp_dir), get_test_case_cache())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+import gc
+import json
+
 import pytest
 from pathlib import Path
 from typer.testing import CliRunner
@@ -9,6 +12,10 @@ class TestCLICommands:
     def setup_method(self):
         self.runner = CliRunner()
 
+    def teardown_method(self):
+        # Batch grading freezes the heap of the test process before forking workers.
+        gc.unfreeze()
+
     def test_help_command(self):
         result = self.runner.invoke(app, ["--help"])
         assert result.exit_code == 0
@@ -68,4 +75,34 @@ class TestCLICommands:
         
         result = self.runner.invoke(app, ["init", project_name, "--output", str(tmp_path)])
         assert result.exit_code == 1
-        assert "already exists" in result.stdout
\ No newline at end of file
+        assert "already exists" in result.stdout
+
+    def test_batch_command_help(self):
+        result = self.runner.invoke(app, ["batch", "--help"])
+        assert result.exit_code == 0
+        assert "Grade many solutions" in result.stdout
+
+    def test_batch_streams_json_results(self, tmp_path):
+        solutions_dir = tmp_path / "solutions"
+        solutions_dir.mkdir()
+        source = Path("tests/fixtures/solutions/py_general/calculator.py").read_text("utf-8")
+        (solutions_dir / "good.py").write_text(source)
+        (solutions_dir / "broken.py").write_text("def broken(:\n")
+
+        result = self.runner.invoke(app, [
+            "batch", str(solutions_dir), "tests/fixtures/test_cases/py_general/calculator_test.json",
+            "--workers", "2", "--json",
+        ])
+
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+        by_name = {Path(record["solution_path"]).name: record for record in records}
+        assert by_name["good.py"]["passed"] is True
+        assert by_name["broken.py"]["passed"] is False
+
+    def test_batch_without_solutions_fails(self, tmp_path):
+        result = self.runner.invoke(app, [
+            "batch", str(tmp_path / "*.py"), "tests/fixtures/test_cases/py_general/calculator_test.json",
+        ])
+        assert result.exit_code == 2
+        assert "No solutions found" in result.stdout
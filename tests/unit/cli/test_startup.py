@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import code_tester
+from code_tester import execution
+
+HEAVY_MODULES = (
+    "pydantic",
+    "rich.console",
+    "loguru",
+    "code_tester.core",
+    "code_tester.execution.tester",
+    "code_tester.plugins",
+)
+
+TEST_CASE_PATH = Path(__file__).parents[2] / "fixtures" / "test_cases" / "py_general" / "calculator_test.json"
+
+
+def imported_modules(code: str) -> dict[str, int]:
+    """Run code in a fresh interpreter and get cumulative import times in microseconds by module."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestStartupImports:
+    @pytest.mark.parametrize("code", [
+        "import code_tester",
+        "import code_tester.cli.commands",
+        "from code_tester.config import ExitCode, IsolationMode",
+        "from code_tester.logging import LogLevel",
+    ])
+    def test_heavy_modules_are_not_imported(self, code):
+        modules = imported_modules(code)
+
+        assert not [name for name in HEAVY_MODULES if name in modules]
+
+    def test_validate_does_not_import_execution(self):
+        code = (
+            "import sys\n"
+            f"sys.argv = ['code-tester', 'validate', {str(TEST_CASE_PATH)!r}]\n"
+            "from code_tester.cli import run_from_cli\n"
+            "run_from_cli()\n"
+        )
+
+        modules = imported_modules(code)
+
+        assert "pydantic" in modules
+        assert "code_tester.execution.tester" not in modules
+        assert "loguru" not in modules
+
+    def test_version_flag_skips_typer(self):
+        code = "import sys; sys.argv = ['code-tester', '--version']; from code_tester.cli import run_from_cli; run_from_cli()"
+
+        modules = imported_modules(code)
+
+        assert "typer" not in modules
+
+
+class TestLazyExports:
+    def test_exports_resolve_on_access(self):
+        from code_tester.execution.tester import DynamicTester
+
+        assert code_tester.DynamicTester is DynamicTester
+        assert execution.DynamicTester is DynamicTester
+
+    def test_exports_are_listed(self):
+        assert "DynamicTester" in dir(execution)
+        assert set(code_tester.__all__) <= set(dir(code_tester))
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            getattr(execution, "Missing")
@@ -0,0 +1,209 @@
+import io
+import json
+
+import pytest
+
+from code_tester.config import AppConfig, CheckConfig, load_streamed_test_case
+from code_tester.config.streaming import _JsonScanner
+from code_tester.execution import DynamicTester
+from code_tester.utils.exceptions import TestCaseParsingError
+
+
+def make_check(check_id, a=1, b=2, expected=3):
+    return {
+        "check_id": check_id,
+        "name_for_output": f"Add {a} and {b}",
+        "reason_for_output": "Expected {expected}, got {actual}",
+        "explain_for_error": "Check add",
+        "spec": {
+            "perform": {"action": "call_function", "target": "add", "params": {"args": [a, b]}},
+            "expect": {"return_value": {"assertion": "equals", "value": expected}},
+        },
+    }
+
+
+def make_test_case(checks, **fields):
+    return {
+        "test_id": 1,
+        "test_name": "Generated",
+        "description": "Generated test case",
+        "test_type": "py_general",
+        **fields,
+        "checks": checks,
+    }
+
+
+@pytest.fixture
+def write_test_case(tmp_path):
+    def write(data, indent=2):
+        path = tmp_path / "test_case.json"
+        path.write_text(json.dumps(data, indent=indent), "utf-8")
+        return path
+    return write
+
+
+class TestJsonScanner:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+    def test_items_match_json_loads(self, chunk_size):
+        document = {"a": 12345, "items": [1, 2.5e10, "x\"y", {"k": [None, True]}, []], "z": "tail"}
+        scanner = _JsonScanner(io.StringIO(json.dumps(document)), chunk_size=chunk_size)
+
+        members = {}
+        for key, value in scanner.members("items"):
+            members[key] = list(value) if key == "items" else value
+        scanner.expect_end()
+
+        assert members == document
+
+    def test_empty_array_and_object(self):
+        scanner = _JsonScanner(io.StringIO('{"items": [], "o": {}}'), chunk_size=2)
+
+        assert [(key, list(value) if key == "items" else value) for key, value in scanner.members("items")] == [
+            ("items", []), ("o", {}),
+        ]
+
+    @pytest.mark.parametrize("document", ['{"items": [1 2]}', '{"items": [1,', '[1]', '{"a": 1} x', '{1: 2}'])
+    def test_invalid_json_raises(self, document):
+        scanner = _JsonScanner(io.StringIO(document), chunk_size=4)
+
+        with pytest.raises(json.JSONDecodeError):
+            for key, value in scanner.members("items"):
+                if key == "items":
+                    list(value)
+            scanner.expect_end()
+
+
+class TestLoadStreamedTestCase:
+    def test_header_and_checks(self, write_test_case):
+        checks = [make_check(i) for i in range(1, 6)]
+        path = write_test_case(make_test_case(checks))
+
+        test_case = load_streamed_test_case(path)
+
+        assert test_case.test_name == "Generated"
+        assert test_case.test_type == "py_general"
+        assert len(test_case.checks) == 5
+        assert all(isinstance(check, CheckConfig) for check in test_case.checks)
+        assert [check.check_id for check in test_case.checks] == [1, 2, 3, 4, 5]
+
+    def test_only_header_and_first_check_are_read(self, write_test_case):
+        path = write_test_case(make_test_case([make_check(1), make_check(2)]))
+        # Everything after the first check is unreadable, which loading must not notice.
+        text = path.read_text("utf-8")
+        path.write_text(text[:text.index('"check_id": 2')] + "garbage", "utf-8")
+
+        test_case = load_streamed_test_case(path)
+
+        assert test_case.test_name == "Generated"
+        assert test_case.checks.count is None
+
+    def test_checks_are_counted_by_iteration(self, write_test_case):
+        test_case = load_streamed_test_case(write_test_case(make_test_case([make_check(1), make_check(2)])))
+
+        list(test_case.checks)
+
+        assert test_case.checks.count == 2
+
+    def test_fields_after_checks_raise(self, write_test_case):
+        setup_actions = [{"action": "call_function", "target": "add", "params": {"args": [1, 1]}}]
+        path = write_test_case({**make_test_case([make_check(1)]), "setup_actions": setup_actions})
+        test_case = load_streamed_test_case(path)
+
+        with pytest.raises(TestCaseParsingError, match="found 'setup_actions' after it"):
+            list(test_case.checks)
+
+    def test_checks_are_read_again_on_every_iteration(self, write_test_case):
+        path = write_test_case(make_test_case([make_check(1), make_check(2)]))
+        test_case = load_streamed_test_case(path)
+
+        first = list(test_case.checks)
+        second = list(test_case.checks)
+
+        assert [check.check_id for check in first] == [check.check_id for check in second]
+        assert first[0] is not second[0]
+
+    def test_no_checks_raises(self, write_test_case):
+        with pytest.raises(TestCaseParsingError, match="At least one check"):
+            load_streamed_test_case(write_test_case(make_test_case([])))
+
+    def test_checks_must_be_list(self, write_test_case):
+        with pytest.raises(TestCaseParsingError, match="must be a list"):
+            load_streamed_test_case(write_test_case(make_test_case("none")))
+
+    def test_invalid_check_raises_when_reached(self, write_test_case):
+        path = write_test_case(make_test_case([make_check(1), {"check_id": 2}]))
+        checks = iter(load_streamed_test_case(path).checks)
+
+        assert next(checks).check_id == 1
+        with pytest.raises(TestCaseParsingError, match="Invalid check #2"):
+            next(checks)
+
+    def test_duplicate_check_id_raises_when_reached(self, write_test_case):
+        path = write_test_case(make_test_case([make_check(1), make_check(1)]))
+
+        with pytest.raises(TestCaseParsingError, match="Duplicate check ID"):
+            list(load_streamed_test_case(path).checks)
+
+
+class TestStreamedExecution:
+    @pytest.fixture
+    def solution_path(self, tmp_path):
+        path = tmp_path / "solution.py"
+        path.write_text("calls = []\n\ndef add(a, b):\n    return a + b\n", "utf-8")
+        return path
+
+    def run(self, console, solution_path, test_case_path, **options):
+        config = AppConfig(
+            solution_path=solution_path, test_case_path=test_case_path, stream_test_case=True, **options
+        )
+        tester = DynamicTester(config, console)
+        return tester, tester.run()
+
+    def test_runs_all_checks(self, console, solution_path, write_test_case):
+        checks = [make_check(i, i, i, 2 * i) for i in range(1, 201)]
+
+        tester, passed = self.run(console, solution_path, write_test_case(make_test_case(checks), indent=None))
+
+        assert passed is True
+        assert len(tester.test_case_config.checks) == 200
+        assert tester.execution_plan is None
+
+    def test_stops_on_first_failure(self, console, solution_path, write_test_case):
+        checks = [make_check(1), make_check(2, expected=0), make_check(3, expected=0)]
+
+        tester, passed = self.run(
+            console, solution_path, write_test_case(make_test_case(checks)), exit_on_first_error=True
+        )
+
+        assert passed is False
+        assert tester.failed_checks_ids == [2]
+        assert tester.failed_checks[0].error_message == "Expected 0, got 3"
+
+    def test_setup_and_teardown_actions_run(self, console, solution_path, write_test_case, tmp_path):
+        marker = tmp_path / "teardown.txt"
+        solution_path.write_text(
+            "from pathlib import Path\n"
+            "state = {}\n"
+            "def setup():\n    state['ready'] = True\n"
+            f"def teardown():\n    Path(r'{marker}').write_text('done')\n"
+            "def add(a, b):\n    return a + b\n",
+            "utf-8",
+        )
+        test_case = make_test_case(
+            [make_check(1)],
+            setup_actions=[{"action": "call_function", "target": "setup"}],
+            teardown_actions=[{"action": "call_function", "target": "teardown"}],
+        )
+
+        _, passed = self.run(console, solution_path, write_test_case(test_case))
+
+        assert passed is True
+        assert marker.read_text() == "done"
+
+    def test_invalid_check_fails_run(self, console, solution_path, write_test_case):
+        checks = [make_check(1), {"check_id": 2}]
+
+        tester, passed = self.run(console, solution_path, write_test_case(make_test_case(checks)))
+
+        assert passed is False
+        assert "Invalid check #2" in tester.run_error
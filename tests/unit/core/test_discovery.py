@@ -0,0 +1,190 @@
+import sys
+import textwrap
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from code_tester.config import ExpectConfig, PerformConfig
+from code_tester.core import (
+    DependencyContainer,
+    PluginManager,
+    PluginManifest,
+    PluginRegistry,
+    create_plugin_manager,
+    load_provider,
+)
+from code_tester.core import discovery
+from code_tester.execution import CheckHandler
+from code_tester.utils.exceptions import PluginError
+
+PLUGIN_SOURCE = textwrap.dedent('''
+    from code_tester.core import ComponentMetadata, ComponentProvider, plugin_provider
+    from code_tester.plugins.core_actions import Action, ActionResult
+
+
+    class ConstantAction(Action):
+        def execute(self, environment, context=None):
+            return ActionResult(return_value=42)
+
+
+    @plugin_provider(ComponentMetadata(
+        name="{name}",
+        version="2.0.0",
+        test_types=["{test_type}"],
+        dependencies={dependencies},
+    ))
+    class Provider(ComponentProvider):
+        def register_components(self, container):
+            container.register_factory("action_constant", lambda: ConstantAction)
+''')
+
+
+@pytest.fixture
+def plugin_modules(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = PluginRegistry()
+    registered = registry.get_all_providers()
+    created = []
+
+    def create(module, name, test_type, dependencies=()):
+        source = PLUGIN_SOURCE.format(name=name, test_type=test_type, dependencies=list(dependencies))
+        (tmp_path / f"{module}.py").write_text(source)
+        created.append(module)
+        return EntryPoint(name=name, value=f"{module}:Provider", group=discovery.ENTRY_POINT_GROUP)
+
+    yield create
+    for module in created:
+        sys.modules.pop(module, None)
+    registry.clear()
+    for provider in registered:
+        registry.register(provider)
+
+
+def declare(monkeypatch, *entry_points):
+    monkeypatch.setattr(discovery, "entry_points", lambda group: list(entry_points))
+
+
+class TestLoadProvider:
+    def test_decorated_class_gets_metadata(self):
+        provider = load_provider("code_tester.plugins.core_actions:CoreActionsProvider")
+
+        assert provider.metadata.name == "core_actions"
+
+    def test_missing_module_raises(self):
+        with pytest.raises(PluginError, match="Cannot import"):
+            load_provider("definitely_missing_plugin:Provider")
+
+    def test_non_provider_raises(self):
+        with pytest.raises(PluginError, match="not a plugin provider"):
+            load_provider("code_tester.core.discovery:ENTRY_POINT_GROUP")
+
+
+class TestPluginManifest:
+    def test_discover_includes_builtin_and_entry_point_plugins(self, monkeypatch, plugin_modules):
+        declare(monkeypatch, plugin_modules("fake_plugin_a", "fake_a", "fake_type"))
+
+        manifest = PluginManifest.discover()
+
+        assert {"core_actions", "core_assertions", "fake_a"} <= {entry.name for entry in manifest.entries}
+        assert [entry.name for entry in manifest.for_test_type("fake_type")] == ["fake_a"]
+        assert manifest.get("fake_a").version == "2.0.0"
+
+    def test_broken_plugin_is_reported(self, monkeypatch):
+        broken = EntryPoint(name="broken", value="definitely_missing_plugin:Provider", group=discovery.ENTRY_POINT_GROUP)
+        declare(monkeypatch, broken)
+
+        manifest = PluginManifest.discover()
+
+        assert manifest.get("broken") is None
+        assert "definitely_missing_plugin:Provider" in manifest.errors
+
+    def test_load_reuses_stored_manifest_without_importing(self, tmp_path, monkeypatch, plugin_modules):
+        declare(monkeypatch, plugin_modules("fake_plugin_b", "fake_b", "fake_type"))
+        path = tmp_path / "manifest.json"
+        PluginManifest.load(path)
+        sys.modules.pop("fake_plugin_b")
+        (tmp_path / "fake_plugin_b.py").unlink()
+
+        manifest = PluginManifest.load(path)
+
+        assert manifest.get("fake_b") is not None
+        assert "fake_plugin_b" not in sys.modules
+
+    def test_load_rebuilds_when_entry_points_change(self, tmp_path, monkeypatch, plugin_modules):
+        path = tmp_path / "manifest.json"
+        declare(monkeypatch)
+        PluginManifest.load(path)
+
+        declare(monkeypatch, plugin_modules("fake_plugin_c", "fake_c", "fake_type"))
+        manifest = PluginManifest.load(path)
+
+        assert manifest.get("fake_c") is not None
+
+    def test_load_rebuilds_when_builtin_provider_changes(self, tmp_path, monkeypatch, plugin_modules):
+        path = tmp_path / "manifest.json"
+        declare(monkeypatch)
+        entry_point = plugin_modules("fake_plugin_g", "fake_g", "fake_type")
+        monkeypatch.setitem(discovery.BUILTIN_PLUGINS, "fake_g", entry_point.value)
+        PluginManifest.load(path)
+
+        # Editing a provider of a development checkout keeps the version of the package.
+        sys.modules.pop("fake_plugin_g")
+        plugin_modules("fake_plugin_g", "fake_g", "other_type_with_longer_name")
+        manifest = PluginManifest.load(path)
+
+        assert manifest.get("fake_g").test_types == ["other_type_with_longer_name"]
+
+    def test_unwritable_manifest_is_still_returned(self, tmp_path, monkeypatch):
+        declare(monkeypatch)
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        manifest = PluginManifest.load(blocker / "manifest.json")
+
+        assert manifest.get("core_actions") is not None
+
+
+class TestLazyPluginLoading:
+    def test_plugins_are_imported_per_test_type(self, tmp_path, monkeypatch, plugin_modules):
+        declare(monkeypatch, plugin_modules("fake_plugin_d", "fake_d", "fake_type"))
+        plugin_manager = PluginManager(DependencyContainer(), PluginManifest.load(tmp_path / "manifest.json"))
+        sys.modules.pop("fake_plugin_d")
+
+        plugin_manager.load_plugins_for_test_type("py_general")
+        assert "fake_plugin_d" not in sys.modules
+
+        loaded = plugin_manager.load_plugins_for_test_type("fake_type")
+        assert loaded == ["fake_d"]
+        assert "fake_plugin_d" in sys.modules
+
+    def test_image_assertions_do_not_import_imaging(self, tmp_path, monkeypatch):
+        declare(monkeypatch)
+        for name in [name for name in sys.modules if name.startswith("code_tester.imaging")]:
+            monkeypatch.delitem(sys.modules, name)
+        plugin_manager = PluginManager(DependencyContainer(), PluginManifest.load(tmp_path / "manifest.json"))
+
+        assert "image_assertions" in plugin_manager.load_plugins_for_test_type("py_general")
+        assert "code_tester.imaging" not in sys.modules
+
+    def test_dependencies_are_loaded_from_manifest(self, tmp_path, monkeypatch, plugin_modules):
+        declare(
+            monkeypatch,
+            plugin_modules("fake_plugin_e", "fake_e", "base_type"),
+            plugin_modules("fake_plugin_f", "fake_f", "fake_type", dependencies=["fake_e"]),
+        )
+        plugin_manager = PluginManager(DependencyContainer(), PluginManifest.load(tmp_path / "manifest.json"))
+
+        plugin_manager.load_plugins_for_test_type("fake_type")
+
+        assert plugin_manager._plugins["fake_e"].is_loaded
+
+    def test_check_handler_uses_plugin_components(self, tmp_path, monkeypatch, plugin_modules):
+        declare(monkeypatch, plugin_modules("fake_plugin_g", "fake_g", "fake_type"))
+        plugin_manager = create_plugin_manager(tmp_path / "manifest.json")
+        plugin_manager.load_plugins_for_test_type("fake_type")
+        check_handler = CheckHandler(console=None, container=plugin_manager.container)
+
+        action = check_handler._create_action(PerformConfig(action="constant"))
+
+        assert action.execute(None).return_value == 42
+        assert check_handler._create_assertion(ExpectConfig(assertion="equals", value=42)).check(42)
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from code_tester.config import AppConfig
+from code_tester.execution import DynamicTester
+from code_tester.execution.event_loop import get_thread_event_loop, resolve_awaitable
+
+SOLUTION = '''
+import asyncio
+import time
+
+async def fetch(value):
+    await asyncio.sleep(0.2)
+    print(f"fetched {value}")
+    return value
+
+def blocking(value):
+    time.sleep(0.2)
+    return value
+
+class Client:
+    async def get(self, value):
+        await asyncio.sleep(0.01)
+        return value * 2
+'''
+
+
+@pytest.fixture
+def solution_path(write_solution):
+    return write_solution(SOLUTION)
+
+
+@pytest.fixture
+def make_test_case(tmp_path):
+    def make(checks):
+        path = tmp_path / "test_case.json"
+        path.write_text(json.dumps({
+            "test_id": 1,
+            "test_name": "Async",
+            "description": "Async checks",
+            "test_type": "api",
+            "checks": checks,
+        }))
+        return path
+    return make
+
+
+@pytest.fixture
+def fetch_checks(make_check):
+    def make(count, function="fetch"):
+        return [
+            make_check(
+                index,
+                {"action": "call_function", "target": function, "params": {"args": [index]}},
+                {"return_value": {"assertion": "equals", "value": index}},
+            )
+            for index in range(1, count + 1)
+        ]
+    return make
+
+
+class TestRunAsync:
+    @pytest.mark.parametrize("function", ["fetch", "blocking"])
+    def test_independent_checks_overlap(self, solution_path, make_test_case, fetch_checks, console, function):
+        config = AppConfig(
+            solution_path=solution_path,
+            test_case_path=make_test_case(fetch_checks(4, function)),
+            parallel_checks=4,
+        )
+        tester = DynamicTester(config, console)
+
+        started = time.monotonic()
+        passed = asyncio.run(tester.run_async())
+
+        assert passed
+        assert time.monotonic() - started < 0.6
+
+    def test_semaphore_bounds_concurrency(self, solution_path, make_test_case, fetch_checks, console):
+        config = AppConfig(solution_path=solution_path, test_case_path=make_test_case(fetch_checks(3)))
+        tester = DynamicTester(config, console)
+
+        started = time.monotonic()
+        passed = asyncio.run(tester.run_async())
+
+        assert passed
+        assert time.monotonic() - started >= 0.6
+
+    def test_async_method_and_output(self, solution_path, make_test_case, make_check, console):
+        checks = [
+            make_check(1, {"action": "create_object", "target": "Client", "save_as": "client"},
+                       {"return_value": {"assertion": "is_instance_of", "value": "Client"}}),
+            make_check(2, {"action": "call_method", "target": "get", "params": {"object_ref": "client", "args": [21]}},
+                       {"return_value": {"assertion": "equals", "value": 42}}),
+            make_check(3, {"action": "call_function", "target": "fetch", "params": {"args": [7]}},
+                       {"stdout": {"assertion": "contains", "value": "fetched 7"}}),
+            make_check(4, {"action": "call_function", "target": "fetch", "params": {"args": [8]}},
+                       {"return_value": {"assertion": "equals", "value": 9}}),
+        ]
+        config = AppConfig(solution_path=solution_path, test_case_path=make_test_case(checks), parallel_checks=3)
+        tester = DynamicTester(config, console)
+
+        assert asyncio.run(tester.run_async()) is False
+        assert tester.failed_checks_ids == [4]
+        assert tester.failed_checks[0].error_message == "Got 8"
+
+    def test_sync_run_awaits_coroutine_results(self, solution_path, make_test_case, fetch_checks, console):
+        config = AppConfig(solution_path=solution_path, test_case_path=make_test_case(fetch_checks(2)))
+
+        assert DynamicTester(config, console).run()
+
+
+class TestResolveAwaitable:
+    def test_plain_values_are_returned(self):
+        assert resolve_awaitable(5) == 5
+
+    def test_thread_loop_is_reused(self):
+        async def identity(value):
+            return value
+
+        loop = get_thread_event_loop()
+
+        assert resolve_awaitable(identity(1)) == 1
+        assert get_thread_event_loop() is loop
+
+    def test_works_inside_running_loop(self):
+        async def inner():
+            await asyncio.sleep(0)
+            return "done"
+
+        async def outer():
+            return resolve_awaitable(inner())
+
+        assert asyncio.run(outer()) == "done"
@@ -0,0 +1,98 @@
+import unittest
+from pathlib import Path
+
+from code_tester.execution import ExecutionEnvironment
+from code_tester.execution.capture import CapturePool, OutputCapture, TRUNCATION_MARKER
+from code_tester.logging import LogConfig, LogLevel, setup_logger, Console
+
+FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "solutions" / "py_general"
+
+
+class TestOutputCapture(unittest.TestCase):
+    def test_written_text_is_joined(self):
+        capture = OutputCapture()
+
+        capture.write("Hello, ")
+        capture.write("World!")
+
+        self.assertEqual(capture.getvalue(), "Hello, World!")
+
+    def test_output_beyond_limit_is_truncated(self):
+        capture = OutputCapture()
+        capture.reset(max_bytes=10)
+
+        for _ in range(100):
+            capture.write("abcd")
+
+        self.assertTrue(capture.truncated)
+        self.assertEqual(capture.getvalue(), "abcdabcdab" + TRUNCATION_MARKER.format(limit=10))
+
+    def test_limit_counts_utf8_bytes(self):
+        capture = OutputCapture()
+        capture.reset(max_bytes=5)
+
+        capture.write("привет")
+
+        self.assertEqual(capture.getvalue(), "пр" + TRUNCATION_MARKER.format(limit=5))
+
+    def test_disabled_capture_discards_output(self):
+        capture = OutputCapture()
+        capture.reset(enabled=False)
+
+        self.assertEqual(capture.write("ignored"), 7)
+        self.assertEqual(capture.getvalue(), "")
+
+    def test_non_string_write_is_rejected(self):
+        with self.assertRaises(TypeError):
+            OutputCapture().write(b"bytes")
+
+    def test_pool_reuses_cleared_captures(self):
+        pool = CapturePool()
+        capture = pool.acquire()
+        capture.write("old output")
+        pool.release(capture)
+
+        reused = pool.acquire()
+
+        self.assertIs(reused, capture)
+        self.assertEqual(reused.getvalue(), "")
+
+
+class TestEnvironmentCapture(unittest.TestCase):
+    def setUp(self):
+        log_config = LogConfig(level=LogLevel.CRITICAL, console_enabled=False)
+        logger = setup_logger(log_config)
+        self.console = Console(logger, is_quiet=True)
+
+    def test_output_is_visible_inside_isolation_block(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "simple_io.py", self.console)
+
+        with env.run_in_isolation(stdin_text="World") as (_, captured_output):
+            print("more")
+            self.assertEqual(captured_output["stdout"], "Name: Hello, World!\nmore\n")
+
+    def test_disabled_stream_is_not_captured(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "simple_io.py", self.console)
+        env.capture_streams = (False, True)
+
+        with env.run_in_isolation(stdin_text="World") as (_, captured_output):
+            pass
+
+        self.assertEqual(captured_output["stdout"], "")
+        self.assertEqual(captured_output["stderr"], "Error message\n")
+
+    def test_captured_output_survives_buffer_reuse(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "simple_io.py", self.console, max_output_bytes=8)
+
+        with env.run_in_isolation(stdin_text="World") as (_, first):
+            pass
+        with env.run_in_isolation(stdin_text="Again") as (_, second):
+            pass
+
+        self.assertEqual(first["stdout"], "Name: He" + TRUNCATION_MARKER.format(limit=8))
+        self.assertEqual(second["stdout"], "Name: He" + TRUNCATION_MARKER.format(limit=8))
+        self.assertEqual(first["stderr"], "Error me" + TRUNCATION_MARKER.format(limit=8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from types import ModuleType
 
+from code_tester.config import IsolationMode
 from code_tester.execution import ExecutionEnvironment
 from code_tester.utils.exceptions import SolutionImportError
 from code_tester.logging import LogConfig, LogLevel, setup_logger, Console
@@ -66,3 +68,124 @@ class TestExecutionEnvironment(unittest.TestCase):
             module_name_2 = module2.__name__
 
         self.assertNotEqual(module_name_1, module_name_2, "Each run should use a unique module name.")
+
+
+class TestSessionIsolation(unittest.TestCase):
+    def setUp(self):
+        log_config = LogConfig(level=LogLevel.CRITICAL, console_enabled=False)
+        logger = setup_logger(log_config)
+        self.console = Console(logger, is_quiet=True)
+
+    def test_module_is_imported_once_per_session(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "isolation.py", self.console, isolation_mode=IsolationMode.SESSION)
+
+        with env.session():
+            with env.run_in_isolation() as (module1, _):
+                pass
+            with env.run_in_isolation() as (module2, _):
+                pass
+            self.assertIs(module1, module2)
+            self.assertIn(module1.__name__, sys.modules)
+
+        self.assertNotIn(module1.__name__, sys.modules)
+
+    def test_globals_are_restored_between_blocks(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "isolation.py", self.console, isolation_mode=IsolationMode.SESSION)
+
+        with env.session():
+            with env.run_in_isolation() as (module, _):
+                module.COUNTER = 99
+                module.EXTRA = [1]
+            with env.run_in_isolation() as (module, _):
+                self.assertEqual(module.COUNTER, 1)
+                self.assertFalse(hasattr(module, "EXTRA"))
+
+    def test_mutable_globals_are_restored_between_blocks(self):
+        with TemporaryDirectory() as tmp_dir:
+            solution = Path(tmp_dir) / "solution.py"
+            solution.write_text("ITEMS = []\n\ndef push(x):\n    ITEMS.append(x)\n    return len(ITEMS)\n")
+            env = ExecutionEnvironment(solution, self.console, isolation_mode=IsolationMode.SESSION)
+
+            with env.session():
+                with env.run_in_isolation() as (module, _):
+                    push = module.push
+                    self.assertEqual(module.push(1), 1)
+                    self.assertEqual(module.push(2), 2)
+                with env.run_in_isolation() as (module, _):
+                    self.assertIs(module.push, push)
+                    self.assertEqual(module.push(3), 1)
+
+    def test_class_attributes_and_defaults_are_restored_between_blocks(self):
+        with TemporaryDirectory() as tmp_dir:
+            solution = Path(tmp_dir) / "solution.py"
+            solution.write_text(
+                "class Registry:\n"
+                "    items = []\n"
+                "\n"
+                "    def add(self, x, seen=[]):\n"
+                "        seen.append(x)\n"
+                "        self.items.append(x)\n"
+                "        return len(seen)\n"
+                "\n"
+                "def push(x, acc=[]):\n"
+                "    acc.append(x)\n"
+                "    return len(acc)\n"
+            )
+            env = ExecutionEnvironment(solution, self.console, isolation_mode=IsolationMode.SESSION)
+
+            with env.session():
+                with env.run_in_isolation() as (module, _):
+                    registry = module.Registry
+                    self.assertEqual(module.Registry().add(1), 1)
+                    self.assertEqual(module.push(1), 1)
+                    module.Registry.extra = True
+                with env.run_in_isolation() as (module, _):
+                    self.assertIs(module.Registry, registry)
+                    self.assertEqual(module.Registry.items, [])
+                    self.assertFalse(hasattr(module.Registry, "extra"))
+                    self.assertEqual(module.Registry().add(2), 1)
+                    self.assertEqual(module.push(2), 1)
+
+    def test_dataclasses_and_enums_work_across_blocks(self):
+        with TemporaryDirectory() as tmp_dir:
+            solution = Path(tmp_dir) / "solution.py"
+            solution.write_text(
+                "import dataclasses, enum\n"
+                "\n"
+                "class Color(enum.Enum):\n"
+                "    RED = 1\n"
+                "\n"
+                "@dataclasses.dataclass\n"
+                "class Point:\n"
+                "    tags: list = dataclasses.field(default_factory=list)\n"
+            )
+            env = ExecutionEnvironment(solution, self.console, isolation_mode=IsolationMode.SESSION)
+
+            with env.session():
+                for _ in range(2):
+                    with env.run_in_isolation() as (module, _):
+                        self.assertEqual(module.Point().tags, [])
+                        self.assertIs(module.Color(1), module.Color.RED)
+
+    def test_fresh_block_imports_new_module_inside_session(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "isolation.py", self.console, isolation_mode=IsolationMode.SESSION)
+
+        with env.session():
+            with env.run_in_isolation() as (session_module, _):
+                pass
+            with env.run_in_isolation(fresh=True) as (fresh_module, _):
+                pass
+            self.assertIsNot(session_module, fresh_module)
+            self.assertNotIn(fresh_module.__name__, sys.modules)
+
+    def test_session_is_noop_in_module_mode(self):
+        env = ExecutionEnvironment(FIXTURES_DIR / "isolation.py", self.console)
+
+        with env.session():
+            with env.run_in_isolation() as (module1, _):
+                pass
+            with env.run_in_isolation() as (module2, _):
+                pass
+
+        self.assertIsNot(module1, module2)
+
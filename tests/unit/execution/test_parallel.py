@@ -0,0 +1,130 @@
+import io
+import json
+import sys
+import threading
+
+import pytest
+
+from code_tester.config import AppConfig, ParallelBackend
+from code_tester.execution import DynamicTester
+from code_tester.execution.parallel import resolve_parallel_backend
+from code_tester.execution.stdio import StdioRouter
+
+SOLUTION = '''
+import time
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def increment(self):
+        self.value += 1
+        return self.value
+
+def greet(name):
+    time.sleep(0.01)
+    print(f"hi {name}")
+    return name
+'''
+
+
+@pytest.fixture
+def solution_path(write_solution):
+    return write_solution(SOLUTION)
+
+
+@pytest.fixture
+def test_case_path(tmp_path, make_check):
+    checks = [
+        make_check(
+            index,
+            {"action": "call_function", "target": "greet", "params": {"args": [f"n{index}"]}},
+            {"return_value": {"assertion": "equals", "value": f"n{index}"}},
+        )
+        for index in range(1, 5)
+    ]
+    checks += [
+        make_check(5, {"action": "create_object", "target": "Counter", "save_as": "counter"},
+                   {"return_value": {"assertion": "is_instance_of", "value": "Counter"}}),
+        make_check(6, {"action": "call_method", "target": "increment", "params": {"object_ref": "counter"}},
+                   {"return_value": {"assertion": "equals", "value": 1}}),
+        make_check(7, {"action": "call_method", "target": "increment", "params": {"object_ref": "counter"}},
+                   {"return_value": {"assertion": "equals", "value": 5}}),
+    ]
+    path = tmp_path / "test_case.json"
+    path.write_text(json.dumps({
+        "test_id": 1,
+        "test_name": "Parallel",
+        "description": "Independent checks",
+        "test_type": "py_general",
+        "checks": checks,
+    }))
+    return path
+
+
+class TestParallelChecks:
+    @pytest.mark.parametrize("backend", [ParallelBackend.THREAD, ParallelBackend.PROCESS])
+    def test_results_match_sequential_order(self, solution_path, test_case_path, console, backend):
+        config = AppConfig(
+            solution_path=solution_path,
+            test_case_path=test_case_path,
+            parallel_checks=4,
+            parallel_backend=backend,
+        )
+
+        tester = DynamicTester(config, console)
+        result = tester.run()
+
+        assert result is False
+        assert tester.failed_checks_ids == [7]
+        assert tester.failed_checks[0].error_message == "Got 2"
+
+    def test_exit_on_first_error_reports_first_failure_in_order(self, solution_path, test_case_path, console):
+        config = AppConfig(
+            solution_path=solution_path,
+            test_case_path=test_case_path,
+            parallel_checks=4,
+            parallel_backend=ParallelBackend.THREAD,
+            exit_on_first_error=True,
+        )
+
+        tester = DynamicTester(config, console)
+
+        assert tester.run() is False
+        assert tester.failed_checks_ids == [7]
+
+    def test_auto_backend_resolution(self):
+        assert resolve_parallel_backend(ParallelBackend.AUTO, "api") == ParallelBackend.THREAD
+        assert resolve_parallel_backend(ParallelBackend.AUTO, "py_general") == ParallelBackend.PROCESS
+        assert resolve_parallel_backend(ParallelBackend.THREAD, "py_general") == ParallelBackend.THREAD
+
+
+class TestStdioRouter:
+    def test_redirect_is_local_to_each_thread(self):
+        router = StdioRouter()
+        outputs = {}
+
+        def worker(name):
+            buffer = io.StringIO()
+            with router.redirect(io.StringIO(), buffer, io.StringIO()):
+                for _ in range(100):
+                    print(name, end="")
+            outputs[name] = buffer.getvalue()
+
+        with router.routing():
+            threads = [threading.Thread(target=worker, args=(name,)) for name in "ab"]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert outputs == {"a": "a" * 100, "b": "b" * 100}
+
+    def test_routing_restores_original_streams(self):
+        router = StdioRouter()
+        original = sys.stdout
+
+        with router.routing():
+            assert sys.stdout is not original
+
+        assert sys.stdout is original
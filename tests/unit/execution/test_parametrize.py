@@ -0,0 +1,191 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from code_tester.execution import CheckHandler, ExecutionContext, ExecutionEnvironment
+from code_tester.execution.parallel import make_transferable
+
+SOLUTION = '''
+def add(a, b=0):
+    print(f"add {a} {b}")
+    return a + b
+
+def divide(a, b):
+    return a / b
+
+class Counter:
+    def __init__(self):
+        self.total = 0
+
+    def increment(self, step):
+        self.total += step
+        return self.total
+'''
+
+
+@pytest.fixture
+def make_table_check(make_check_config):
+    def make(perform, expect, parametrize, reason="Expected {expected}, got {actual}"):
+        return make_check_config(1, perform, expect, reason=reason, parametrize=parametrize)
+    return make
+
+
+@pytest.fixture
+def environment(write_solution, console):
+    return ExecutionEnvironment(write_solution(SOLUTION), console)
+
+
+@pytest.fixture
+def check_handler(console):
+    return CheckHandler(console)
+
+
+class TestParametrizeValidation:
+    def test_empty_rows_rejected(self, make_table_check):
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            make_table_check({"action": "call_function", "target": "add"}, {}, [])
+
+    def test_save_as_rejected(self, make_table_check):
+        with pytest.raises(ValidationError, match="save_as"):
+            make_table_check({"action": "call_function", "target": "add", "save_as": "x"}, {}, [{"args": [1]}])
+
+    def test_streamed_output_rejected(self, make_table_check):
+        expect = {"stdout": {"assertion": "contains", "value": "add", "stream": True}}
+        with pytest.raises(ValidationError, match="Streamed"):
+            make_table_check({"action": "call_function", "target": "add"}, expect, [{"args": [1]}])
+
+    def test_expected_requires_return_value_expectation(self, make_table_check):
+        expect = {"stdout": {"assertion": "contains", "value": "add"}}
+        with pytest.raises(ValidationError, match="return_value"):
+            make_table_check({"action": "call_function", "target": "add"}, expect, [{"args": [1], "expected": 1}])
+
+
+class TestParametrizedExecution:
+    def test_rows_run_in_one_isolation_block(self, check_handler, environment, make_table_check):
+        rows = [{"args": [i, i], "expected": 2 * i} for i in range(50)]
+        check = make_table_check(
+            {"action": "call_function", "target": "add"},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            rows,
+        )
+
+        with patch.object(
+            environment, "_import_solution_module", wraps=environment._import_solution_module
+        ) as import_module:
+            result = check_handler.execute_check(check, environment, ExecutionContext())
+
+        assert result.passed is True
+        assert len(result.sub_results) == 50
+        import_module.assert_called_once()
+
+    def test_failing_rows_are_reported_individually(self, check_handler, environment, make_table_check):
+        rows = [
+            {"args": [1, 2], "expected": 3},
+            {"args": [2, 2], "expected": 5, "id": "two plus two"},
+            {"args": [1, 1], "expected": 2},
+            {"args": [4, 4], "expected": 0},
+        ]
+        check = make_table_check(
+            {"action": "call_function", "target": "add"},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            rows,
+        )
+
+        result = check_handler.execute_check(check, environment, ExecutionContext())
+
+        assert result.passed is False
+        assert [sub.passed for sub in result.sub_results] == [True, False, True, False]
+        assert result.error_message == "Row two plus two: Expected 5, got 4\nRow #4: Expected 0, got 8"
+
+    def test_rows_without_expected_use_check_value(self, check_handler, environment, make_table_check):
+        check = make_table_check(
+            {"action": "call_function", "target": "add", "params": {"args": [9], "kwargs": {"b": 1}}},
+            {"return_value": {"assertion": "equals", "value": 10}},
+            [{}, {"args": [5], "kwargs": {"b": 5}}, {"kwargs": {"b": 2}}],
+        )
+
+        result = check_handler.execute_check(check, environment, ExecutionContext())
+
+        assert [sub.passed for sub in result.sub_results] == [True, True, False]
+        assert result.error_message == "Row #3: Expected 10, got 11"
+
+    def test_row_exception_does_not_stop_table(self, check_handler, environment, make_table_check):
+        check = make_table_check(
+            {"action": "call_function", "target": "divide"},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            [{"args": [1, 0], "expected": 0}, {"args": [6, 3], "expected": 2}],
+        )
+
+        result = check_handler.execute_check(check, environment, ExecutionContext())
+
+        assert [sub.passed for sub in result.sub_results] == [False, True]
+        assert isinstance(result.sub_results[0].exception, ZeroDivisionError)
+        assert result.error_message.startswith("Row #1: Action failed with exception")
+
+    def test_missing_row_results_fail_check(self, check_handler, environment, make_table_check):
+        check = make_table_check(
+            {"action": "call_function", "target": "add"},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            [{"args": [1, 1], "expected": 2}, {"args": [2, 2], "expected": 4}],
+        )
+        compiled = check_handler.compile_check(check)
+        execute_rows = compiled.action.execute_rows
+
+        with patch.object(
+            compiled.action, "execute_rows", side_effect=lambda *args: execute_rows(*args)[:1]
+        ):
+            result = check_handler.execute_check(check, environment, ExecutionContext(), compiled)
+
+        assert result.passed is False
+        assert result.error_message == "Expected results of 2 rows, got 1"
+
+    def test_each_row_gets_its_own_output(self, check_handler, environment, make_table_check):
+        check = make_table_check(
+            {"action": "call_function", "target": "add"},
+            {"stdout": {"assertion": "equals", "value": "add 1 1\n"}},
+            [{"args": [1, 1]}, {"args": [2, 2]}],
+            reason="Printed {stdout}",
+        )
+
+        result = check_handler.execute_check(check, environment, ExecutionContext())
+
+        assert [sub.action_result.stdout for sub in result.sub_results] == ["add 1 1\n", "add 2 2\n"]
+        assert result.error_message == "Row #2: Printed \"add 2 2\n\""
+
+    def test_call_method_rows_share_object(self, check_handler, environment, make_table_check):
+        context = ExecutionContext()
+        with environment.run_in_isolation() as (module, _):
+            context.save_object("counter", module.Counter())
+        check = make_table_check(
+            {"action": "call_method", "target": "increment", "params": {"object_ref": "counter"}},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            [{"args": [1], "expected": 1}, {"args": [2], "expected": 3}],
+        )
+
+        result = check_handler.execute_check(check, environment, context)
+
+        assert result.passed is True
+
+    def test_async_execution(self, check_handler, environment, make_table_check):
+        check = make_table_check(
+            {"action": "call_function", "target": "add"},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            [{"args": [1, 2], "expected": 3}, {"args": [1, 2], "expected": 4}],
+        )
+
+        result = asyncio.run(check_handler.execute_check_async(check, environment, ExecutionContext()))
+
+        assert [sub.passed for sub in result.sub_results] == [True, False]
+
+    def test_sub_results_are_transferable(self, check_handler, environment, make_table_check):
+        check = make_table_check(
+            {"action": "call_function", "target": "add"},
+            {"return_value": {"assertion": "equals", "value": 0}},
+            [{"args": [1, 2], "expected": 3}],
+        )
+
+        result = make_transferable(check_handler.execute_check(check, environment, ExecutionContext()))
+
+        assert result.sub_results[0].action_result.return_value == 3
@@ -0,0 +1,195 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from code_tester.config import AppConfig, Expectation, ExpectConfig, PerformConfig, TestCaseConfig
+from code_tester.core import DependencyContainer
+from code_tester.execution import CheckHandler, ExecutionContext, ExecutionEnvironment
+from code_tester.execution.plan import PlanCache, PlanCompiler, get_plan_cache, make_plan_key
+from code_tester.execution.tester import DynamicTester
+from code_tester.plugins.core_actions import ActionResult, CallFunctionAction, CreateObjectAction
+from code_tester.plugins.core_assertions import ContainsAssertion, EqualsAssertion
+
+SOLUTION_PATH = Path("tests/fixtures/solutions/py_general/calculator.py")
+TEST_CASE_PATH = Path("tests/fixtures/test_cases/py_general/calculator_test.json")
+
+
+def make_test_case(checks, **kwargs):
+    return TestCaseConfig(test_id=1, test_name="Plan", description="Plan test", test_type="py_general", checks=checks, **kwargs)
+
+
+@pytest.fixture
+def check_handler(console):
+    return CheckHandler(console)
+
+
+class TestPlanCompiler:
+    def test_binds_actions_and_assertions(self, check_handler, make_check_config):
+        check = make_check_config(
+            1,
+            PerformConfig(action="call_function", target="add"),
+            Expectation(return_value=ExpectConfig(assertion="equals", value=5), stdout=ExpectConfig(assertion="contains", value="x")),
+        )
+
+        compiled = PlanCompiler(check_handler).compile(make_test_case([check])).get(1)
+
+        assert isinstance(compiled.action, CallFunctionAction)
+        assert isinstance(compiled.assertions["return_value"], EqualsAssertion)
+        assert isinstance(compiled.assertions["stdout"], ContainsAssertion)
+        assert "stderr" not in compiled.assertions
+        assert compiled.capture_streams == (True, False)
+
+    def test_resolves_expected_placeholder(self, check_handler, make_check_config):
+        check = make_check_config(
+            1,
+            PerformConfig(action="call_function", target="add"),
+            Expectation(return_value=ExpectConfig(assertion="equals", value=5)),
+            reason="Expected {expected}, got {actual}",
+        )
+
+        compiled = PlanCompiler(check_handler).compile(make_test_case([check])).get(1)
+
+        assert compiled.message_template == "Expected 5, got {actual}"
+
+    def test_precomputes_dependencies_and_groups(self, check_handler, make_check_config):
+        checks = [
+            make_check_config(1, PerformConfig(action="create_object", target="A", save_as="a"), Expectation()),
+            make_check_config(2, PerformConfig(action="call_function", target="f"), Expectation()),
+            make_check_config(3, PerformConfig(action="call_method", target="m", params={"object_ref": "a"}), Expectation()),
+        ]
+
+        plan = PlanCompiler(check_handler).compile(make_test_case(checks))
+
+        assert plan.dependencies[3] == frozenset({1})
+        assert plan.upstream[3] == (1,)
+        assert plan.groups == ((1, 3), (2,))
+
+    def test_streamed_output_can_stop_action(self, check_handler, make_check_config):
+        check = make_check_config(
+            1,
+            PerformConfig(action="run_script"),
+            Expectation(stdout=ExpectConfig(assertion="contains", value="done", stream=True)),
+        )
+
+        compiled = PlanCompiler(check_handler).compile(make_test_case([check])).get(1)
+
+        assert compiled.streamed == ("stdout",)
+        assert compiled.stop_when_decided is True
+        assert compiled.capture_streams == (False, False)
+
+    def test_leaves_out_unknown_components(self, check_handler, make_check_config):
+        checks = [
+            make_check_config(1, PerformConfig(action="missing"), Expectation()),
+            make_check_config(2, PerformConfig(action="call_function", target="f"), Expectation()),
+        ]
+        setup = {"action": "missing", "target": "f"}
+
+        plan = PlanCompiler(check_handler).compile(make_test_case(checks, setup_actions=[setup]))
+
+        assert plan.get(1) is None
+        assert plan.get(2) is not None
+        assert plan.setup_actions == (None,)
+
+    def test_setup_actions_are_compiled(self, check_handler, make_check_config):
+        setup = {"action": "create_object", "target": "A", "params": {}}
+        check = make_check_config(1, PerformConfig(action="call_function", target="f"), Expectation())
+
+        plan = PlanCompiler(check_handler).compile(make_test_case([check], setup_actions=[setup]))
+
+        assert isinstance(plan.setup_actions[0], CreateObjectAction)
+
+
+class TestCompiledExecution:
+    def test_execute_check_uses_compiled_components(self, check_handler, make_check_config):
+        check = make_check_config(
+            1,
+            PerformConfig(action="call_function", target="add"),
+            Expectation(return_value=ExpectConfig(assertion="equals", value=10)),
+            reason="Expected {expected}, got {actual}",
+        )
+        compiled = check_handler.compile_check(check)
+        action = Mock()
+        action.execute.return_value = ActionResult(return_value=5)
+
+        with patch.object(check_handler, "_create_action") as create_action:
+            result = check_handler.execute_check(
+                check, Mock(spec=ExecutionEnvironment), ExecutionContext(),
+                compiled=replace(compiled, action=action),
+            )
+
+        create_action.assert_not_called()
+        assert result.passed is False
+        assert result.error_message == "Expected 10, got 5"
+
+    def test_uncompiled_unknown_action_fails_check(self, check_handler, make_check_config):
+        check = make_check_config(1, PerformConfig(action="missing"), Expectation())
+
+        result = check_handler.execute_check(check, Mock(spec=ExecutionEnvironment), ExecutionContext())
+
+        assert result.passed is False
+        assert "Unknown action" in result.error_message
+
+
+class TestPlanCache:
+    def test_evicts_least_recently_used(self):
+        cache = PlanCache(max_entries=2)
+        plans = [Mock(), Mock(), Mock()]
+
+        cache.put("a", plans[0])
+        cache.put("b", plans[1])
+        cache.get("a")
+        cache.put("c", plans[2])
+
+        assert cache.get("a") is plans[0]
+        assert cache.get("b") is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError):
+            PlanCache(max_entries=0)
+
+    def test_cache_per_container(self):
+        container = DependencyContainer()
+
+        assert get_plan_cache(container) is get_plan_cache(container)
+        assert get_plan_cache(container) is not get_plan_cache(DependencyContainer())
+
+    def test_key_ignores_key_order(self):
+        assert make_plan_key({"a": 1, "b": [1, 2]}) == make_plan_key({"b": [1, 2], "a": 1})
+        assert make_plan_key(b"{}") != make_plan_key(b"{ }")
+
+
+class TestTesterPlanReuse:
+    def test_second_tester_reuses_plan(self, console):
+        config = AppConfig(solution_path=SOLUTION_PATH, test_case_path=TEST_CASE_PATH)
+        plugin_manager = DynamicTester.create_plugin_manager(console)
+
+        first = DynamicTester(config, console, plugin_manager)
+        assert first.run() is True
+
+        with patch("code_tester.execution.tester.create_dataclass_from_dict") as parse:
+            second = DynamicTester(config, console, plugin_manager)
+            assert second.run() is True
+
+        parse.assert_not_called()
+        assert second.execution_plan is first.execution_plan
+        assert len(second.execution_plan.checks) == 3
+
+    def test_second_tester_reuses_plan_of_inline_test_case(self, console):
+        config = AppConfig(solution_path=SOLUTION_PATH, test_case_path=TEST_CASE_PATH)
+        test_case = json.loads(TEST_CASE_PATH.read_text("utf-8"))
+        plugin_manager = DynamicTester.create_plugin_manager(console)
+
+        first = DynamicTester(config, console, plugin_manager, test_case_data=test_case)
+        assert first.run() is True
+
+        with patch("code_tester.execution.tester.create_dataclass_from_dict") as parse:
+            second = DynamicTester(config, console, plugin_manager, test_case_data=dict(test_case))
+            assert second.run() is True
+
+        parse.assert_not_called()
+        assert second.execution_plan is first.execution_plan
+        assert len(second.execution_plan.checks) == 3
@@ -0,0 +1,83 @@
+import unittest
+
+from code_tester.config import CheckConfig, CheckSpec, Expectation, ExpectConfig, PerformConfig
+from code_tester.execution.scheduler import build_check_dependencies, get_upstream_checks, group_dependent_checks
+
+
+def make_check(check_id, action="call_function", target="func", params=None, save_as=None):
+    return CheckConfig(
+        check_id=check_id,
+        name_for_output=f"Check {check_id}",
+        reason_for_output="Failed",
+        explain_for_error="Explanation",
+        spec=CheckSpec(
+            perform=PerformConfig(action=action, target=target, params=params, save_as=save_as),
+            expect=Expectation(return_value=ExpectConfig(assertion="equals", value=None)),
+        ),
+    )
+
+
+class TestBuildCheckDependencies(unittest.TestCase):
+    def test_independent_checks_have_no_dependencies(self):
+        checks = [make_check(1), make_check(2)]
+
+        self.assertEqual(build_check_dependencies(checks), {1: set(), 2: set()})
+
+    def test_object_ref_depends_on_latest_writer(self):
+        checks = [
+            make_check(1, action="create_object", save_as="obj"),
+            make_check(2, action="create_object", save_as="obj"),
+            make_check(3, action="call_method", params={"object_ref": "obj"}),
+        ]
+
+        dependencies = build_check_dependencies(checks)
+
+        self.assertEqual(dependencies[3], {2})
+        self.assertEqual(dependencies[2], {1})
+
+    def test_overwrite_depends_on_earlier_readers(self):
+        checks = [
+            make_check(1, action="create_object", save_as="obj"),
+            make_check(2, action="call_method", params={"object_ref": "obj"}),
+            make_check(3, action="create_object", save_as="obj"),
+        ]
+
+        self.assertEqual(build_check_dependencies(checks)[3], {1, 2})
+
+    def test_reference_to_unknown_object_has_no_dependency(self):
+        checks = [make_check(1, action="call_method", params={"object_ref": "missing"})]
+
+        self.assertEqual(build_check_dependencies(checks), {1: set()})
+
+
+class TestGroupDependentChecks(unittest.TestCase):
+    def test_groups_keep_original_order(self):
+        checks = [
+            make_check(1, action="create_object", save_as="a"),
+            make_check(2),
+            make_check(3, action="call_method", params={"object_ref": "a"}),
+            make_check(4, action="create_object", save_as="b"),
+            make_check(5, action="get_attribute", params={"object_ref": "b"}),
+        ]
+
+        groups = group_dependent_checks(checks)
+
+        self.assertEqual([[check.check_id for check in group] for group in groups], [[1, 3], [2], [4, 5]])
+
+
+class TestGetUpstreamChecks(unittest.TestCase):
+    def test_upstream_is_transitive(self):
+        checks = [
+            make_check(1, action="create_object", save_as="a"),
+            make_check(2, action="call_method", params={"object_ref": "a"}, save_as="b"),
+            make_check(3, action="get_attribute", params={"object_ref": "b"}),
+            make_check(4),
+        ]
+
+        upstream = get_upstream_checks(checks)
+
+        self.assertEqual(upstream, {1: [], 2: [1], 3: [1, 2], 4: []})
+
+
+if __name__ == '__main__':
+    unittest.main()
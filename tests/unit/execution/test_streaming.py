@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from code_tester.execution import CheckHandler, ExecutionContext, ExecutionEnvironment
+
+CHATTY_SOLUTION = '''
+import time
+
+print("READY")
+started = time.monotonic()
+while time.monotonic() - started < 10:
+    try:
+        print("x" * 1000)
+    except Exception:
+        pass
+'''
+
+
+@pytest.fixture
+def environment(write_solution, console):
+    return ExecutionEnvironment(write_solution(CHATTY_SOLUTION, "chatty.py"), console)
+
+
+@pytest.fixture
+def run_check(console, make_check_config):
+    def run(environment, stdout_expect, reason="Unexpected output"):
+        check = make_check_config(1, {"action": "run_script"}, {"stdout": stdout_expect}, reason=reason)
+        started = time.monotonic()
+        result = CheckHandler(console).execute_check(check, environment, ExecutionContext())
+        return result, time.monotonic() - started
+    return run
+
+
+class TestStreamingChecks:
+    def test_contains_passes_and_stops_action(self, run_check, environment):
+        result, elapsed = run_check(environment, {"assertion": "contains", "value": "READY", "stream": True})
+
+        assert result.passed
+        assert elapsed < 5
+
+    def test_golden_mismatch_fails_and_stops_action(self, run_check, environment):
+        result, elapsed = run_check(environment, {"assertion": "equals", "value": "READY\ndone", "stream": True})
+
+        assert not result.passed
+        assert result.error_message == "Unexpected output"
+        assert elapsed < 5
+
+    def test_stdout_placeholder_keeps_output_until_stop(self, run_check, environment):
+        result, _ = run_check(
+            environment, {"assertion": "equals", "value": "READY\ndone", "stream": True}, reason="Got {stdout}"
+        )
+
+        assert not result.passed
+        assert result.error_message.startswith('Got "READY\nxxx')
+
+    def test_streaming_does_not_keep_output(self, run_check, write_solution, console):
+        environment = ExecutionEnvironment(write_solution('print("a")\nprint("b")\n', "short.py"), console)
+
+        result, _ = run_check(environment, {"assertion": "equals", "value": "a\nb", "stream": True})
+
+        assert result.passed
+        assert result.action_result.stdout == ""
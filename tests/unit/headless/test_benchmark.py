@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from code_tester.headless import FrameTimings, HeadlessWindow, LoadBenchmark, headless_arcade, measure_frames
+
+
+class Crowd(HeadlessWindow):
+    def __init__(self):
+        super().__init__(100, 100)
+        self.updates = 0
+        self.draws = 0
+
+    def on_update(self, delta_time):
+        self.updates += 1
+
+    def on_draw(self):
+        self.draws += 1
+
+
+class TestFrameTimings:
+    def test_statistics(self):
+        timings = FrameTimings(10, np.array([1.0, 2.0, 3.0, 4.0]), np.array([1.0, 1.0, 1.0, 1.0]))
+
+        assert timings.statistic("median") == 2.5
+        assert timings.statistic("max", "total") == 5.0
+        assert timings.statistic("p50", "draw") == 1.0
+        with pytest.raises(ValueError, match="Unknown statistic"):
+            timings.statistic("p100")
+        with pytest.raises(ValueError, match="not measured"):
+            FrameTimings(10, np.ones(3)).statistic("mean", "draw")
+
+    def test_for_entities(self):
+        benchmark = LoadBenchmark([FrameTimings(10, np.ones(2)), FrameTimings(100, np.ones(2))])
+
+        assert benchmark.entities == [10, 100]
+        assert benchmark.for_entities(100) is benchmark.runs[1]
+        assert benchmark.for_entities(5) is None
+
+
+class TestMeasureFrames:
+    def test_warmup_is_not_measured(self):
+        with headless_arcade():
+            window = Crowd()
+            timings = measure_frames(window, 0, frames=20, warmup=5, measure_draw=True)
+
+        assert window.updates == 25
+        assert window.draws == 25
+        assert timings.update_times.shape == timings.draw_times.shape == (20,)
+        assert (timings.update_times >= 0).all()
+
+    def test_invalid_frames(self):
+        with pytest.raises(ValueError, match="frames must be positive"):
+            measure_frames(Crowd.__new__(Crowd), 0, frames=0)
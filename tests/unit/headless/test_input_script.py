@@ -0,0 +1,92 @@
+import arcade
+import pytest
+
+from code_tester.headless import HeadlessWindow, InputScript, headless_arcade, replay_input
+
+
+class Player(HeadlessWindow):
+    def __init__(self):
+        super().__init__(200, 100)
+        self.x = 0
+        self.speed = 0
+        self.clicks = []
+
+    def on_key_press(self, symbol, modifiers):
+        if symbol == arcade.key.RIGHT:
+            self.speed = 2 if modifiers & arcade.key.MOD_SHIFT else 1
+
+    def on_key_release(self, symbol, modifiers):
+        self.speed = 0
+
+    def on_mouse_press(self, x, y, button, modifiers):
+        self.clicks.append((x, y, button))
+
+    def on_update(self, delta_time):
+        self.x += self.speed
+
+
+class TestInputScript:
+    def test_parse(self):
+        script = InputScript.parse([
+            "# frame event arguments",
+            "5 key_release RIGHT",
+            "",
+            "2 key_press RIGHT SHIFT+CTRL  # run",
+            "3 mouse_motion 10 20",
+            "4 mouse_drag 15 18 RIGHT",
+            "4 mouse_press 15 18",
+        ])
+
+        assert len(script) == 5
+        assert script.last_frame == 5
+        assert script.events_at(2) == [
+            ("on_key_press", (arcade.key.RIGHT, arcade.key.MOD_SHIFT | arcade.key.MOD_CTRL)),
+        ]
+        assert script.events_at(4) == [
+            ("on_mouse_drag", (15.0, 18.0, 5.0, -2.0, arcade.MOUSE_BUTTON_RIGHT, 0)),
+            ("on_mouse_press", (15.0, 18.0, arcade.MOUSE_BUTTON_LEFT, 0)),
+        ]
+        assert script.events_at(1) == []
+
+    @pytest.mark.parametrize("line,message", [
+        ("key_press LEFT", "Line 1: expected '<frame> <event> \\[arguments\\]'"),
+        ("1 jump", "Line 1: Unknown event 'jump'"),
+        ("1 key_press NOPE", "Line 1: Unknown key 'NOPE'"),
+        ("1 mouse_scroll 1 2", "Line 1: Invalid arguments for 'mouse_scroll'"),
+    ])
+    def test_parse_errors(self, line, message):
+        with pytest.raises(ValueError, match=message):
+            InputScript.parse([line])
+
+    def test_load(self, tmp_path):
+        path = tmp_path / "input.txt"
+        path.write_text("0 key_press 65\n", "utf-8")
+
+        assert InputScript.load(path).events_at(0) == [("on_key_press", (65, 0))]
+
+
+class TestReplayInput:
+    def test_events_interleave_with_updates(self):
+        script = InputScript.parse(["2 key_press RIGHT", "5 key_release RIGHT", "6 mouse_press 10 20 RIGHT"])
+
+        with headless_arcade():
+            window = Player()
+            snapshots = replay_input(window, script, 8, snapshot_frames=[0, 2, 5, 8], attributes=["x", "clicks"])
+
+        assert snapshots == [
+            {"frame": 0, "x": 0, "clicks": []},
+            {"frame": 2, "x": 0, "clicks": []},
+            {"frame": 5, "x": 3, "clicks": []},
+            {"frame": 8, "x": 3, "clicks": [(10.0, 20.0, arcade.MOUSE_BUTTON_RIGHT)]},
+        ]
+        assert window.time == pytest.approx(8 / 60)
+
+    def test_snapshots_are_copies(self):
+        with headless_arcade():
+            window = Player()
+            snapshots = replay_input(
+                window, InputScript.parse(["1 mouse_press 1 1"]), snapshot_frames=[0, 1], attributes=["clicks"]
+            )
+
+        assert snapshots[0]["clicks"] == []
+        assert len(snapshots[1]["clicks"]) == 1
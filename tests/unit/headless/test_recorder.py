@@ -0,0 +1,113 @@
+import arcade
+import numpy as np
+import pytest
+
+from code_tester.headless import DisplayList, HeadlessWindow, headless_arcade, simulate_frames
+
+
+class Scene(HeadlessWindow):
+    def on_draw(self):
+        self.clear()
+        arcade.draw_circle_filled(10, 20, 5, arcade.color.RED)
+        arcade.draw_lbwh_rectangle_outline(0, 0, 40, 20, (0, 0, 255))
+        arcade.draw_rectangle_filled(50, 60, 10, 4, arcade.color.GREEN)
+        arcade.draw_polygon_filled([(0, 0), (10, 0), (5, 8)], arcade.color.WHITE)
+        arcade.draw_text("Score", 1, 2)
+
+
+class TestDisplayList:
+    def test_grows_and_clears(self):
+        display_list = DisplayList(capacity=2)
+        for i in range(5):
+            display_list.record("point", True, i, i, 1, 1, (1, 2, 3))
+
+        assert len(display_list) == 5
+        assert display_list.records["x"].tolist() == [0, 1, 2, 3, 4]
+        assert display_list.records["color"][0].tolist() == [1, 2, 3, 255]
+
+        display_list.clear()
+        assert len(display_list) == 0
+
+    def test_select(self):
+        display_list = DisplayList()
+        display_list.record("circle", True, 0, 0, 2, 2, (255, 0, 0, 128))
+        display_list.record("circle", False, 0, 0, 2, 2, (255, 0, 0))
+        display_list.record("line", False, 0, 0, 2, 2, (0, 0, 0))
+
+        assert display_list.select(kind="circle").tolist() == [0, 1]
+        assert display_list.select(kind="circle", filled=False).tolist() == [1]
+        assert display_list.select(color=(255, 0, 0)).tolist() == [0, 1]
+        assert display_list.select(color=(255, 0, 0, 255)).tolist() == [1]
+        with pytest.raises(ValueError, match="Unknown primitive kind"):
+            display_list.select(kind="hexagon")
+
+    def test_render(self):
+        display_list = DisplayList()
+        display_list.record("rectangle", True, 5, 5, 10, 10, (0, 0, 255))
+        display_list.record("circle", True, 5, 5, 4, 4, (255, 0, 0, 128))
+        display_list.record("text", True, 15, 15, 0, 0, (0, 255, 0))
+
+        image = display_list.render(20, 20, (10, 10, 10))
+
+        assert image.shape == (20, 20, 3)
+        # The rectangle covers the bottom left quarter, as y points up in arcade.
+        assert image[19, 0].tolist() == [0, 0, 255]
+        assert image[9, 0].tolist() == [10, 10, 10]
+        assert image[15, 5].tolist() == [128, 0, 127]
+        assert (image[:10, 10:] == 10).all()
+
+
+class TestRecording:
+    def test_draw_records_primitives(self):
+        with headless_arcade():
+            display_list = Scene(100, 100).draw()
+
+        records = display_list.records
+        assert [display_list.describe(i) for i in range(len(display_list))] == [
+            "filled circle at (x=10, y=20)",
+            "outlined rectangle at (x=20, y=10)",
+            "filled rectangle at (x=50, y=60)",
+            "filled polygon at (x=5, y=4)",
+            'text "Score" at (x=1, y=2)',
+        ]
+        assert records[["width", "height"]][:4].tolist() == [(10, 10), (40, 20), (10, 4), (10, 8)]
+        assert records["color"][1].tolist() == [0, 0, 255, 255]
+
+    def test_legacy_draw_functions_are_removed_afterwards(self):
+        with headless_arcade():
+            assert callable(arcade.draw_rectangle_filled)
+
+        assert not hasattr(arcade, "draw_rectangle_filled")
+
+    def test_sprite_lists_work_without_gpu(self):
+        class Sprites(HeadlessWindow):
+            def __init__(self):
+                super().__init__(100, 100)
+                self.sprites = arcade.SpriteList()
+                self.sprites.append(arcade.SpriteSolidColor(8, 6, 30, 40, arcade.color.YELLOW))
+
+            def on_draw(self):
+                self.sprites.draw()
+
+        with headless_arcade():
+            display_list = Sprites().draw()
+
+        assert display_list.describe(0) == "sprite at (x=30, y=40)"
+        assert display_list.records["color"][0].tolist() == list(arcade.color.YELLOW)
+
+    def test_every_frame_draws_latest_state(self):
+        class Moving(HeadlessWindow):
+            x = 0
+
+            def on_update(self, delta_time):
+                self.x += 1
+
+            def on_draw(self):
+                self.clear()
+                arcade.draw_point(self.x, 0, arcade.color.WHITE)
+
+        with headless_arcade():
+            window = Moving()
+            simulate_frames(window, 3, draw_every_frame=True)
+
+        assert np.array_equal(window.display_list.records["x"], [3])
@@ -0,0 +1,93 @@
+import arcade
+import pytest
+
+from code_tester.headless import EVENT_HANDLED, HeadlessWindow, headless_arcade, simulate_frames
+
+
+class Game(HeadlessWindow):
+    def __init__(self):
+        super().__init__(320, 240, "Game")
+        self.updates = 0
+        self.fixed_updates = 0
+        self.keys = []
+
+    def on_update(self, delta_time):
+        self.updates += 1
+
+    def on_fixed_update(self, delta_time):
+        self.fixed_updates += 1
+
+    def on_key_press(self, symbol, modifiers):
+        self.keys.append(symbol)
+
+
+class TestHeadlessArcade:
+    def test_patches_are_restored(self):
+        window_class, run = arcade.Window, arcade.run
+
+        with headless_arcade():
+            assert arcade.Window is HeadlessWindow
+            window = arcade.Window(100, 50)
+            assert arcade.get_window() is window
+            arcade.set_background_color(arcade.color.RED)
+            assert window.background_color == arcade.color.RED
+            arcade.run()
+
+        assert arcade.Window is window_class
+        assert arcade.run is run
+
+    def test_schedule_follows_simulated_clock(self):
+        calls = []
+
+        with headless_arcade():
+            window = Game()
+            arcade.schedule(calls.append, 0.5)
+            arcade.schedule_once(lambda dt: calls.append("once"), 0.25)
+            simulate_frames(window, 60)
+            arcade.unschedule(calls.append)
+            simulate_frames(window, 60)
+
+        assert calls[0] == "once"
+        assert calls[1:] == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+class TestHeadlessWindow:
+    def test_view_handles_events_first(self):
+        class View(arcade.View):
+            def on_key_press(self, symbol, modifiers):
+                return EVENT_HANDLED if symbol == 1 else None
+
+        with headless_arcade():
+            window = Game()
+            view = View()
+            window.show_view(view)
+            window.dispatch_event("on_key_press", 1, 0)
+            window.dispatch_event("on_key_press", 2, 0)
+
+        assert view.window is window
+        assert window.keys == [2]
+
+    def test_fixed_updates_use_fixed_rate(self):
+        with headless_arcade():
+            window = Game()
+            simulate_frames(window, 10, delta_time=1 / 30)
+
+        assert window.updates == 10
+        assert window.fixed_updates == 20
+        assert window.time == pytest.approx(10 / 30)
+
+
+class TestSimulateFrames:
+    def test_thousand_frames_run_fast(self):
+        with headless_arcade():
+            window = Game()
+            result = simulate_frames(window, 1000)
+
+        assert window.updates == 1000
+        assert result.simulated_time == pytest.approx(1000 / 60)
+        assert result.elapsed < 1
+
+    @pytest.mark.parametrize("frames,delta_time", [(-1, 1 / 60), (1, 0)])
+    def test_invalid_arguments(self, frames, delta_time):
+        with pytest.raises(ValueError):
+            simulate_frames(Game.__new__(Game), frames, delta_time)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from code_tester.headless import HeadlessWindow, Trajectory, TrajectoryRecorder, headless_arcade, record_trajectory
+from code_tester.headless.trajectory import compile_path
+
+
+class Body:
+    def __init__(self, x):
+        self.x = x
+
+
+class Orbit(HeadlessWindow):
+    def __init__(self):
+        super().__init__(100, 100)
+        self.bodies = [Body(0), Body(10)]
+        self.ticks = 0
+
+    def on_update(self, delta_time):
+        self.ticks += 1
+        for body in self.bodies:
+            body.x += 1
+        if self.ticks == 2:
+            self.bodies.append(Body(50))
+
+
+class TestPaths:
+    def test_compile(self):
+        assert compile_path("bodies[*].x") == [("attr", "bodies"), ("each", None), ("attr", "x")]
+        assert compile_path("grid[0][-1]") == [("attr", "grid"), ("index", 0), ("index", -1)]
+        with pytest.raises(ValueError, match="Invalid attribute path"):
+            compile_path("bodies[x]")
+
+    def test_label(self):
+        assert Trajectory.label("bodies[*].x", 2) == "bodies[2].x"
+        assert Trajectory.label("ticks", 0) == "ticks"
+
+
+class TestRecorder:
+    def test_grows_rows_and_columns(self):
+        recorder = TrajectoryRecorder(["x[*]"], capacity=1)
+        recorder.sample(Body([1.0]), 0, 0.0)
+        recorder.sample(Body([2.0, 3.0]), 1, 0.5)
+        recorder.sample(Body([4.0]), 2, 1.0)
+
+        trajectory = recorder.trajectory()
+        np.testing.assert_array_equal(trajectory["x[*]"], [[1, np.nan], [2, 3], [4, np.nan]])
+        assert trajectory.frames.tolist() == [0, 1, 2]
+        assert trajectory.times.tolist() == [0, 0.5, 1]
+
+    def test_record_trajectory(self):
+        with headless_arcade():
+            trajectory = record_trajectory(Orbit(), ["bodies[*].x", "ticks"], frames=4, every=2)
+
+        assert trajectory.paths == ["bodies[*].x", "ticks"]
+        assert trajectory.frames.tolist() == [0, 2, 4]
+        np.testing.assert_array_equal(trajectory["bodies[*].x"], [[0, 10, np.nan], [2, 12, 50], [4, 14, 52]])
+        np.testing.assert_allclose(trajectory.times, [0, 2 / 60, 4 / 60])
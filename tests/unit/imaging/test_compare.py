@@ -0,0 +1,197 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from code_tester.imaging import (
+    ImagePyramid,
+    compare_exact,
+    compare_phash,
+    compare_ssim,
+    compare_within_tolerance,
+    downsample,
+    load_image,
+    perceptual_hash,
+)
+from code_tester.imaging import compare as compare_module
+
+
+def make_frame(width=256, height=192):
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.stack([x % 256, y % 256, (x * y) % 256], axis=2).astype(np.uint8)
+    frame[40:80, 60:120] = (255, 0, 0)
+    return frame
+
+
+class TestLoadImage:
+    def test_pil_image_and_alpha(self):
+        image = Image.new("RGBA", (4, 3), (10, 20, 30, 40))
+
+        array = load_image(image)
+
+        assert array.shape == (3, 4, 3)
+        assert array.dtype == np.uint8
+        assert tuple(array[0, 0]) == (10, 20, 30)
+
+    def test_grayscale_array(self):
+        array = load_image(np.full((2, 2), 7))
+
+        assert array.shape == (2, 2, 3)
+        assert (array == 7).all()
+
+    def test_file_and_bytes(self, tmp_path):
+        path = tmp_path / "frame.png"
+        Image.fromarray(make_frame(8, 8)).save(path)
+
+        np.testing.assert_array_equal(load_image(path), make_frame(8, 8))
+        np.testing.assert_array_equal(load_image(str(path)), make_frame(8, 8))
+        np.testing.assert_array_equal(load_image(path.read_bytes()), make_frame(8, 8))
+
+    @pytest.mark.parametrize("value", [np.zeros((2, 2, 5)), np.array(["a"]), np.zeros((0, 3, 3))])
+    def test_invalid_arrays(self, value):
+        with pytest.raises(ValueError):
+            load_image(value)
+
+
+class TestImagePyramid:
+    def test_levels_average_blocks(self):
+        image = np.arange(16, dtype=np.uint8).reshape(4, 4, 1)
+        pyramid = ImagePyramid(image)
+
+        np.testing.assert_array_equal(pyramid.level(1)[:, :, 0], [[2.5, 4.5], [10.5, 12.5]])
+        assert pyramid.level(2).shape == (1, 1, 1)
+        with pytest.raises(IndexError):
+            pyramid.level(3)
+
+    def test_levels_are_built_from_nearest_finer_level(self):
+        pyramid = ImagePyramid(np.zeros((8, 8, 1), dtype=np.uint8), {2: np.ones((2, 2, 1), dtype=np.float32)})
+
+        assert (pyramid.level(3) == 1).all()
+        assert (pyramid.level(1) == 0).all()
+        assert list(pyramid.built_levels) == [0, 1, 2, 3]
+
+    def test_odd_edges_are_dropped(self):
+        assert downsample(np.zeros((5, 7, 3))).shape == (2, 3, 3)
+
+    def test_coarsest_index(self):
+        pyramid = ImagePyramid(np.zeros((600, 800, 3), dtype=np.uint8))
+
+        assert pyramid.coarsest_index(32) == 4
+        assert pyramid.coarsest_index(1000) == 0
+
+
+class TestPixelComparisons:
+    def test_exact(self):
+        frame = make_frame()
+        changed = frame.copy()
+        changed[5, 7] = (0, 0, 0)
+
+        assert compare_exact(ImagePyramid(frame), ImagePyramid(frame.copy())).passed is True
+        result = compare_exact(ImagePyramid(changed), ImagePyramid(frame))
+        assert result.passed is False
+        assert result.level == 2
+        assert result.score == 1
+        assert result.details.startswith("Pixels differ in 1 of 3072 4x4 blocks, first at (x=7, y=5)")
+
+    def test_exact_falls_back_to_full_resolution(self):
+        frame = make_frame()
+        # Swapping two pixels of a block keeps every block average.
+        swapped = frame.copy()
+        swapped[[0, 1], 0] = frame[[1, 0], 0]
+
+        result = compare_exact(ImagePyramid(swapped), ImagePyramid(frame))
+
+        assert result.passed is False
+        assert result.level == 0
+        assert result.score == 2
+        assert result.details.startswith("2 of 49152 pixels differ, first at (x=0, y=0)")
+
+    def test_size_mismatch(self):
+        result = compare_exact(ImagePyramid(make_frame(10, 20)), ImagePyramid(make_frame(20, 10)))
+
+        assert result.passed is False
+        assert result.details == "Expected a 20x10 image, got 10x20"
+
+    def test_tolerance(self):
+        frame = make_frame()
+        noisy = np.clip(frame.astype(int) + 3, 0, 255).astype(np.uint8)
+
+        assert compare_within_tolerance(ImagePyramid(noisy), ImagePyramid(frame), 3).passed is True
+        result = compare_within_tolerance(ImagePyramid(noisy), ImagePyramid(frame), 2)
+        assert result.passed is False
+        assert result.level > 0
+        assert result.score == 3
+
+    def test_tolerance_is_not_decided_by_averages_within_it(self):
+        frame = make_frame()
+        # One pixel exceeds the tolerance, but its block average stays within it.
+        spike = frame.copy()
+        spike[0, 0] = frame[0, 0] + 10
+
+        result = compare_within_tolerance(ImagePyramid(spike), ImagePyramid(frame), 5)
+
+        assert result.passed is False
+        assert result.level == 0
+        assert result.score == 10
+
+
+class TestSSIM:
+    def test_identical_frames_skip_ssim(self):
+        frame = make_frame()
+
+        with patch.object(compare_module, "structural_similarity") as ssim:
+            result = compare_ssim(ImagePyramid(frame), ImagePyramid(frame.copy()), 0.9)
+
+        ssim.assert_not_called()
+        assert result.passed is True
+
+    def test_similar_frames_pass(self):
+        rng = np.random.default_rng(0)
+        frame = make_frame()
+        noisy = np.clip(frame + rng.normal(0, 2, frame.shape), 0, 255).astype(np.uint8)
+
+        result = compare_ssim(ImagePyramid(noisy), ImagePyramid(frame), 0.9)
+
+        assert result.passed is True
+        assert 0.9 <= result.score < 1
+
+    def test_different_frames_fail(self):
+        frame = make_frame()
+        other = np.ascontiguousarray(frame[::-1, ::-1])
+
+        result = compare_ssim(ImagePyramid(other), ImagePyramid(frame), 0.95)
+
+        assert result.passed is False
+        assert "below the threshold 0.95" in result.details
+
+    def test_brightness_ramp_on_noise_passes(self):
+        # SSIM of coarse levels is far lower here, since averaging removes the noise but keeps the ramp.
+        rng = np.random.default_rng(0)
+        reference = rng.integers(0, 256, (256, 256, 3)).astype(np.float64)
+        ramp = 12 * np.sin(np.linspace(0, 4 * np.pi, 256))[np.newaxis, :, np.newaxis]
+        actual = np.clip(reference + ramp, 0, 255).astype(np.uint8)
+
+        result = compare_ssim(ImagePyramid(actual), ImagePyramid(reference.astype(np.uint8)), 0.99)
+
+        assert result.passed is True
+        assert result.score >= 0.99
+
+
+class TestPerceptualHash:
+    def test_hash_survives_small_changes(self):
+        frame = make_frame()
+        reference_hash = perceptual_hash(ImagePyramid(frame))
+        brighter = np.clip(frame.astype(int) + 4, 0, 255).astype(np.uint8)
+
+        assert compare_phash(ImagePyramid(brighter), reference_hash, 4).passed is True
+
+    def test_different_images_are_far_apart(self):
+        reference_hash = perceptual_hash(ImagePyramid(make_frame()))
+        other = np.ascontiguousarray(make_frame()[::-1])
+
+        result = compare_phash(ImagePyramid(other), reference_hash, 4)
+
+        assert result.passed is False
+        assert result.score > 4
+        assert "differ in" in result.details
@@ -0,0 +1,117 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from code_tester.imaging import ReferenceImageStore, get_reference_store, perceptual_hash
+from code_tester.imaging import store as store_module
+
+
+def make_frame(width=160, height=120):
+    y, x = np.mgrid[0:height, 0:width]
+    return np.stack([x % 256, y % 256, (x ^ y) % 256], axis=2).astype(np.uint8)
+
+
+@pytest.fixture
+def reference_path(tmp_path):
+    path = tmp_path / "reference.png"
+    Image.fromarray(make_frame()).save(path)
+    return path
+
+
+class TestReferenceImageStore:
+    def test_decodes_file_once(self, reference_path):
+        store = ReferenceImageStore()
+
+        first = store.load(reference_path)
+        with patch.object(store_module, "load_image") as load_image:
+            second = store.load(str(reference_path))
+
+        load_image.assert_not_called()
+        assert first is second
+        np.testing.assert_array_equal(first.pyramid.image, make_frame())
+        assert (store.misses, store.hits) == (1, 1)
+
+    def test_precomputes_levels_and_hash(self, reference_path):
+        reference = ReferenceImageStore().load(reference_path)
+
+        # Only the level that exact and tolerance compares check first is kept.
+        assert {index: level.shape[:2] for index, level in reference.pyramid.built_levels.items()} == {
+            0: (120, 160),
+            1: (60, 80),
+        }
+        assert reference.phash == perceptual_hash(reference.pyramid)
+
+    def test_same_content_shares_entry(self, reference_path, tmp_path):
+        copy = tmp_path / "copy.png"
+        copy.write_bytes(reference_path.read_bytes())
+        store = ReferenceImageStore()
+
+        assert store.load(reference_path) is store.load(copy)
+
+    def test_modified_file_is_decoded_again(self, reference_path):
+        store = ReferenceImageStore()
+        first = store.load(reference_path)
+
+        Image.fromarray(make_frame()[::-1].copy()).save(reference_path)
+        stat = reference_path.stat()
+        os.utime(reference_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert store.load(reference_path).key != first.key
+
+    def test_disk_store_memory_maps_arrays(self, reference_path, tmp_path):
+        cache_dir = tmp_path / "store"
+        built = ReferenceImageStore(cache_dir=cache_dir).load(reference_path)
+
+        with patch("PIL.Image.open") as open_image:
+            restored = ReferenceImageStore(cache_dir=cache_dir).load(reference_path)
+
+        open_image.assert_not_called()
+        assert isinstance(restored.pyramid.image, np.memmap)
+        assert restored.phash == built.phash
+        assert list(restored.pyramid.built_levels) == list(built.pyramid.built_levels)
+        for index, level in built.pyramid.built_levels.items():
+            np.testing.assert_array_equal(restored.pyramid.built_levels[index], level)
+        assert sorted(path.name for path in next(cache_dir.iterdir()).iterdir()) == [
+            "level0.npy", "level1.npy", "meta.json"
+        ]
+
+    def test_corrupt_disk_entry_is_rebuilt(self, reference_path, tmp_path):
+        cache_dir = tmp_path / "store"
+        ReferenceImageStore(cache_dir=cache_dir).load(reference_path)
+        for entry in cache_dir.iterdir():
+            (entry / "meta.json").write_text("garbage")
+
+        restored = ReferenceImageStore(cache_dir=cache_dir).load(reference_path)
+
+        np.testing.assert_array_equal(restored.pyramid.image, make_frame())
+
+    def test_in_memory_images_are_keyed_by_pixels(self):
+        store = ReferenceImageStore()
+
+        first = store.load(make_frame().tolist())
+        second = store.load(make_frame())
+
+        assert first is second
+        assert store.load(make_frame(80, 240)) is not first
+
+    def test_unreadable_image_raises(self, tmp_path):
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not a png")
+
+        with pytest.raises(OSError):
+            ReferenceImageStore().load(path)
+
+    def test_lru_eviction(self):
+        store = ReferenceImageStore(max_entries=1)
+
+        store.load(make_frame())
+        store.load(make_frame(80, 60))
+
+        assert len(store) == 1
+
+    def test_shared_store_per_directory(self, tmp_path):
+        assert get_reference_store(tmp_path) is get_reference_store(tmp_path)
+        assert get_reference_store(tmp_path) is not get_reference_store(tmp_path / "other")
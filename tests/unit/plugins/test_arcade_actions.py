@@ -0,0 +1,150 @@
+from pathlib import Path
+
+import arcade
+import numpy as np
+import pytest
+
+from code_tester.config import PerformConfig
+from code_tester.core import DependencyContainer
+from code_tester.core.discovery import BUILTIN_PLUGINS, load_provider
+from code_tester.execution import ExecutionEnvironment
+from code_tester.headless import HeadlessWindow
+from code_tester.logging import Console, LogConfig, LogLevel, setup_logger
+
+SOLUTIONS = Path(__file__).parents[2] / "fixtures" / "solutions" / "arcade"
+
+
+@pytest.fixture
+def container():
+    container = DependencyContainer()
+    load_provider(BUILTIN_PLUGINS["arcade_actions"]).register_components(container)
+    return container
+
+
+@pytest.fixture
+def action_class(container):
+    return container.resolve("action_simulate_frames")
+
+
+def make_environment(name):
+    logger = setup_logger(LogConfig(level=LogLevel.CRITICAL, console_enabled=False))
+    return ExecutionEnvironment(SOLUTIONS / name, Console(logger, is_quiet=True))
+
+
+@pytest.fixture
+def environment():
+    return make_environment("simple_game.py")
+
+
+def simulate(action_class, environment, context, **config):
+    return action_class(PerformConfig(action="simulate_frames", **config)).execute(environment, context)
+
+
+class TestSimulateFramesAction:
+    def test_simulates_student_window(self, action_class, environment):
+        result = simulate(action_class, environment, {}, target="SimpleGame", params={"frames": 1000, "seed": 3})
+
+        assert result.exception is None
+        game = result.return_value
+        assert isinstance(game, HeadlessWindow)
+        assert len(game.balls) == 3
+        assert game.time == pytest.approx(1000 / 60)
+        assert all(0 <= ball.x <= game.width for ball in game.balls)
+        assert len(game.display_list.select(kind="circle")) == 3
+        assert not isinstance(arcade.Window, HeadlessWindow)
+
+    def test_seed_makes_runs_repeatable(self, action_class, environment):
+        params = {"frames": 30, "seed": 7}
+        first = simulate(action_class, environment, {}, target="SimpleGame", params=params).return_value
+        second = simulate(action_class, environment, {}, target="SimpleGame", params=params).return_value
+
+        assert [(b.x, b.y) for b in first.balls] == [(b.x, b.y) for b in second.balls]
+
+    def test_continues_saved_window(self, action_class, environment):
+        context = {}
+        simulate(action_class, environment, context, target="SimpleGame", params={"frames": 10}, save_as="game")
+        result = simulate(
+            action_class, environment, context, target="SimpleGame", params={"frames": 5}, start_from_object_ref="game"
+        )
+
+        assert result.return_value is context["game"]
+        assert result.return_value.time == pytest.approx(15 / 60)
+        assert len(result.return_value.display_list.select(kind="circle")) == 3
+
+    def test_missing_class_raises(self, action_class, environment):
+        with pytest.raises(AttributeError, match="Missing"):
+            simulate(action_class, environment, {}, target="Missing")
+
+
+class TestReplayInputAction:
+    def test_replays_script_file(self, container, tmp_path):
+        script = tmp_path / "input.txt"
+        script.write_text("0 key_press LEFT\n1 key_press LEFT\n2 mouse_press 100 500\n", "utf-8")
+        config = PerformConfig(
+            action="replay_input",
+            target="SimpleGame",
+            params={"script": str(script), "frames": 3, "snapshot_frames": [3], "snapshot_attributes": ["paddle.x"]},
+            save_as="game",
+        )
+        context = {}
+
+        result = container.resolve("action_replay_input")(config).execute(make_environment("keyboard_game.py"), context)
+
+        assert result.return_value == [{"frame": 3, "paddle.x": 390}]
+        assert len(context["game"].balls) == 4
+
+    def test_inline_events_without_snapshots_return_window(self, container):
+        config = PerformConfig(action="replay_input", target="SimpleGame", params={"events": ["0 key_press RIGHT"]})
+
+        result = container.resolve("action_replay_input")(config).execute(make_environment("mouse_game.py"), {})
+
+        assert result.return_value.paddle.x == 405
+        assert result.return_value.time == 0
+
+
+class TestRecordTrajectoryAction:
+    def test_balls_stay_within_bounds(self, container):
+        config = PerformConfig(
+            action="record_trajectory",
+            target="SimpleGame",
+            params={"paths": ["balls[*].x", "balls[*].y"], "frames": 2000, "seed": 1},
+        )
+
+        result = container.resolve("action_record_trajectory")(config).execute(make_environment("dynamics_game.py"), {})
+
+        trajectory = result.return_value
+        assert len(trajectory) == 2001
+        assert trajectory["balls[*].x"].shape == (2001, 3)
+        assert np.nanmax(trajectory["balls[*].x"]) <= 800 + 3
+
+
+class TestBenchmarkFramesAction:
+    def test_measures_each_entity_count(self, container):
+        config = PerformConfig(
+            action="benchmark_frames",
+            target="SimpleGame",
+            params={
+                "entities": [10, 200],
+                "factory": "Ball",
+                "factory_args": [400, 300],
+                "collection": "balls",
+                "frames": 30,
+                "warmup": 5,
+                "measure_draw": True,
+            },
+        )
+
+        result = container.resolve("action_benchmark_frames")(config).execute(make_environment("simple_game.py"), {})
+
+        assert result.exception is None
+        benchmark = result.return_value
+        assert benchmark.entities == [10, 200]
+        assert benchmark.runs[1].draw_times.shape == (30,)
+        assert benchmark.runs[1].statistic("median") > 0
+
+    def test_requires_factory_or_populate(self, container):
+        config = PerformConfig(action="benchmark_frames", target="SimpleGame", params={"entities": [10]})
+
+        result = container.resolve("action_benchmark_frames")(config).execute(make_environment("simple_game.py"), {})
+
+        assert isinstance(result.exception, ValueError)
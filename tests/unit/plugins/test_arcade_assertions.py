@@ -0,0 +1,179 @@
+import numpy as np
+import pytest
+
+from code_tester.config import ExpectConfig
+from code_tester.headless import DisplayList, FrameTimings, LoadBenchmark, Trajectory
+from code_tester.plugins.arcade_assertions import (
+    DrawColorsAssertion,
+    DrawCountAssertion,
+    DrawsWithinAssertion,
+    FrameTimeBudgetAssertion,
+    FrameTimeScalingAssertion,
+    TrajectoryConservedAssertion,
+    TrajectoryMaxSpeedAssertion,
+    TrajectoryMonotonicAssertion,
+    TrajectoryWithinAssertion,
+)
+from code_tester.utils.exceptions import AssertionError as CodeTesterAssertionError
+
+
+class Frame:
+    width = 100
+    height = 80
+
+    def __init__(self):
+        self.display_list = DisplayList()
+        self.display_list.record("circle", True, 10, 10, 10, 10, (255, 255, 255))
+        self.display_list.record("circle", True, 95, 40, 20, 20, (255, 0, 0))
+        self.display_list.record("rectangle", False, 50, 40, 100, 80, (0, 0, 255))
+
+
+def make(assertion_class, name, **value):
+    return assertion_class(ExpectConfig(assertion=name, value=value))
+
+
+class TestDrawCount:
+    def test_count(self):
+        assert make(DrawCountAssertion, "draw_count", kind="circle", count=2).check(Frame())
+        assert make(DrawCountAssertion, "draw_count", kind="circle", color=[255, 0, 0], count=1).check(Frame())
+        assert make(DrawCountAssertion, "draw_count", min=3, max=3).check(Frame())
+
+    def test_describe_mismatch(self):
+        assertion = make(DrawCountAssertion, "draw_count", kind="circle", filled=True, min=3)
+
+        assert not assertion.check(Frame())
+        assert assertion.describe_mismatch(Frame()) == "Drew 2 filled circles, expected at least 3"
+        assert assertion.describe_mismatch(42) == "Expected a recorded frame, got int"
+
+    @pytest.mark.parametrize("value", [{"kind": "hexagon", "count": 1}, {"kind": "circle"}])
+    def test_invalid_expectation(self, value):
+        with pytest.raises(CodeTesterAssertionError):
+            DrawCountAssertion(ExpectConfig(assertion="draw_count", value=value))
+
+
+class TestDrawsWithin:
+    def test_defaults_to_window(self):
+        assertion = make(DrawsWithinAssertion, "draws_within", kind="circle")
+
+        assert not assertion.check(Frame())
+        assert assertion.describe_mismatch(Frame()) == (
+            "1 of 2 circles extend outside (left=0, bottom=0, right=100, top=80), "
+            "first filled circle at (x=95, y=40)"
+        )
+
+    def test_explicit_bounds_and_tolerance(self):
+        assert make(DrawsWithinAssertion, "draws_within", bounds=[0, 0, 105, 80]).check(Frame())
+        assert DrawsWithinAssertion(ExpectConfig(assertion="draws_within", tolerance=5)).check(Frame())
+
+
+class TestDrawColors:
+    def test_rgb_matches_any_alpha(self):
+        assert make(DrawColorsAssertion, "draw_colors", kind="circle", colors=[[255, 255, 255], [255, 0, 0]]).check(
+            Frame()
+        )
+
+    def test_describe_mismatch(self):
+        assertion = make(DrawColorsAssertion, "draw_colors", colors=[[255, 255, 255, 255]])
+
+        assert assertion.describe_mismatch(Frame()) == (
+            "filled circle at (x=95, y=40) has color (255, 0, 0, 255), expected one of (255, 255, 255, 255)"
+        )
+
+
+def make_trajectory():
+    frames = np.arange(5)
+    columns = {
+        "balls[*].x": np.array([[0, 10], [1, 12], [2, 14], [3, 16], [4, 18.0]]),
+        "balls[*].y": np.array([[0, 0], [0, 0], [0, 0], [0, 0], [0, 0.0]]),
+        "score": np.array([[0], [10], [10], [5], [20.0]]),
+    }
+    return Trajectory(frames, frames / 2, columns)
+
+
+class TestTrajectoryAssertions:
+    def test_within(self):
+        assertion = make(TrajectoryWithinAssertion, "trajectory_within", path="balls[*].x", min=0, max=16)
+
+        assert not assertion.check(make_trajectory())
+        assert assertion.describe_mismatch(make_trajectory()) == (
+            "balls[1].x = 18 at frame 4 is outside [0, 16] (1 samples outside)"
+        )
+        assert make(TrajectoryWithinAssertion, "trajectory_within", path="balls[*].x", min=0).check(make_trajectory())
+
+    def test_monotonic(self):
+        assertion = make(TrajectoryMonotonicAssertion, "trajectory_monotonic", path="score")
+
+        assert assertion.describe_mismatch(make_trajectory()) == (
+            "score goes from 10 to 5 at frame 3, expected it to keep increasing"
+        )
+        assert make(TrajectoryMonotonicAssertion, "trajectory_monotonic", path="balls[*].x", strict=True).check(
+            make_trajectory()
+        )
+
+    def test_max_speed(self):
+        per_frame = make(TrajectoryMaxSpeedAssertion, "trajectory_max_speed", paths=["balls[*].x", "balls[*].y"],
+                         max=2, per="frame")
+        per_second = make(TrajectoryMaxSpeedAssertion, "trajectory_max_speed", paths=["balls[*].x", "balls[*].y"],
+                          max=3)
+
+        assert per_frame.check(make_trajectory())
+        assert per_second.describe_mismatch(make_trajectory()) == (
+            "(balls[1].x, balls[1].y) moves at 4 per second at frame 1, expected at most 3"
+        )
+
+    def test_conserved(self):
+        momentum = make(TrajectoryConservedAssertion, "trajectory_conserved", path="balls[*].y")
+        energy = TrajectoryConservedAssertion(ExpectConfig(
+            assertion="trajectory_conserved", value={"paths": ["balls[*].x", "balls[*].y"]}, rtol=0.5
+        ))
+
+        assert momentum.check(make_trajectory())
+        assert energy.describe_mismatch(make_trajectory()) == (
+            "Sum of squares of balls[*].x, balls[*].y changes from 100 to 200 at frame 2"
+        )
+
+    def test_missing_path_and_wrong_type(self):
+        assertion = make(TrajectoryWithinAssertion, "trajectory_within", path="lives", min=0)
+
+        assert assertion.describe_mismatch(make_trajectory()) == "Path 'lives' was not recorded"
+        assert assertion.describe_mismatch([1, 2]) == "Expected a recorded trajectory, got list"
+
+    @pytest.mark.parametrize("value", [{"min": 0}, {"path": "a[", "min": 0}, {"path": "a"}])
+    def test_invalid_expectation(self, value):
+        with pytest.raises(CodeTesterAssertionError):
+            TrajectoryWithinAssertion(ExpectConfig(assertion="trajectory_within", value=value))
+
+
+def make_benchmark():
+    # Update times grow quadratically with the entity count.
+    return LoadBenchmark([
+        FrameTimings(entities, np.full(10, entities ** 2 * 1e-7), np.full(10, 1e-4))
+        for entities in (10, 100, 200)
+    ])
+
+
+class TestFrameTimeAssertions:
+    def test_budget(self):
+        assertion = make(FrameTimeBudgetAssertion, "frame_time_budget", max_ms=2)
+
+        assert assertion.describe_mismatch(make_benchmark()) == (
+            "p95 update time with 200 entities is 4 ms, budget 2 ms"
+        )
+        assert make(FrameTimeBudgetAssertion, "frame_time_budget", entities=100, max_ms=2).check(make_benchmark())
+        assert make(FrameTimeBudgetAssertion, "frame_time_budget", phase="draw", max_ms=0.2).check(make_benchmark())
+
+    def test_budget_for_unmeasured_count(self):
+        assertion = make(FrameTimeBudgetAssertion, "frame_time_budget", entities=5, max_ms=1)
+
+        assert assertion.describe_mismatch(make_benchmark()) == "No frames were measured with 5 entities"
+
+    def test_scaling(self):
+        assert make(FrameTimeScalingAssertion, "frame_time_scaling", max_exponent=2.1).check(make_benchmark())
+        assert make(FrameTimeScalingAssertion, "frame_time_scaling", max_exponent=1).describe_mismatch(
+            make_benchmark()
+        ) == "median update time grows like N^2.00 between 10 and 200 entities, expected at most N^1"
+
+    @pytest.mark.parametrize("value", [{}, {"max_ms": 1, "statistic": "average"}, {"max_ms": 1, "phase": "render"}])
+    def test_invalid_expectation(self, value):
+        with pytest.raises(CodeTesterAssertionError):
+            FrameTimeBudgetAssertion(ExpectConfig(assertion="frame_time_budget", value=value))
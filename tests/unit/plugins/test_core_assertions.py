@@ -7,6 +7,7 @@ from code_tester.plugins.core_assertions import (
     IsCloseToAssertion,
     IsInRangeAssertion,
     IsInstanceOfAssertion,
+    MatchesRegexAssertion,
     RaisesExceptionAssertion,
 )
 
@@ -224,5 +225,32 @@ class TestRaisesExceptionAssertion(unittest.TestCase):
         self.assertFalse(assertion.check(None))
 
 
+class TestMatchesRegexAssertion(unittest.TestCase):
+    def test_any_line_matches(self):
+        config = ExpectConfig(assertion="matches_regex", value=r"^Total: \d+$")
+        assertion = MatchesRegexAssertion(config)
+
+        self.assertTrue(assertion.check("Start\nTotal: 42\nEnd"))
+        self.assertFalse(assertion.check("Total: many"))
+
+    def test_whole_text_is_searched(self):
+        config = ExpectConfig(assertion="matches_regex", value=r"Start\s+Total")
+        assertion = MatchesRegexAssertion(config)
+
+        self.assertTrue(assertion.check("Start\nTotal: 42"))
+        self.assertIsNone(assertion.stream_matcher())
+
+    def test_line_scoped_pattern_streams(self):
+        config = ExpectConfig(assertion="matches_regex", value=r"^Total: \d+$")
+
+        self.assertIsNotNone(MatchesRegexAssertion(config).stream_matcher())
+
+    def test_non_string_does_not_match(self):
+        config = ExpectConfig(assertion="matches_regex", value=r"\d")
+        assertion = MatchesRegexAssertion(config)
+
+        self.assertFalse(assertion.check(42))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,147 @@
+import os
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+import numpy as np
+from PIL import Image
+
+from code_tester.config import CheckConfig, ExpectConfig
+from code_tester.core import DependencyContainer
+from code_tester.core.discovery import BUILTIN_PLUGINS, load_provider
+from code_tester.execution import CheckHandler, ExecutionContext, ExecutionEnvironment
+from code_tester.logging import Console, LogConfig, LogLevel, setup_logger
+from code_tester.plugins.core_actions import ActionResult
+from code_tester.plugins.image_assertions import (
+    ImageCloseAssertion,
+    ImageEqualsAssertion,
+    ImagePHashAssertion,
+    ImageSSIMAssertion,
+)
+from code_tester.utils.exceptions import AssertionError as CodeTesterAssertionError
+
+
+def make_frame():
+    y, x = np.mgrid[0:96, 0:128]
+    frame = np.stack([x * 2, y * 2, (x + y) % 256], axis=2).astype(np.uint8)
+    frame[20:40, 30:70] = (255, 255, 0)
+    return frame
+
+
+class TestImageAssertions(unittest.TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.enterContext(patch.dict(os.environ, {"XDG_CACHE_HOME": self._tmp.name}))
+        self.reference_path = Path(self._tmp.name) / "reference.png"
+        self.frame = make_frame()
+        Image.fromarray(self.frame).save(self.reference_path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def make_config(self, assertion, **kwargs):
+        return ExpectConfig(assertion=assertion, value=str(self.reference_path), **kwargs)
+
+    def test_equals_accepts_screenshot_types(self):
+        assertion = ImageEqualsAssertion(self.make_config("image_equals"))
+
+        self.assertTrue(assertion.check(self.frame))
+        self.assertTrue(assertion.check(Image.fromarray(self.frame).convert("RGBA")))
+        self.assertFalse(assertion.check(np.zeros_like(self.frame)))
+        self.assertFalse(assertion.check(None))
+
+    def test_close_uses_tolerance(self):
+        brighter = self.frame.astype(int) + 2
+        brighter[brighter > 255] = 255
+
+        self.assertTrue(ImageCloseAssertion(self.make_config("image_close", tolerance=2)).check(brighter))
+        self.assertFalse(ImageCloseAssertion(self.make_config("image_close", tolerance=1)).check(brighter))
+
+    def test_ssim_threshold(self):
+        rng = np.random.default_rng(1)
+        noisy = np.clip(self.frame + rng.normal(0, 3, self.frame.shape), 0, 255)
+
+        self.assertTrue(ImageSSIMAssertion(self.make_config("image_ssim", threshold=0.8)).check(noisy))
+        self.assertFalse(ImageSSIMAssertion(self.make_config("image_ssim", threshold=0.999)).check(noisy))
+
+    def test_phash_distance(self):
+        assertion = ImagePHashAssertion(self.make_config("image_phash", tolerance=6))
+
+        self.assertTrue(assertion.check(np.clip(self.frame.astype(int) + 3, 0, 255)))
+        self.assertFalse(assertion.check(np.ascontiguousarray(self.frame[::-1, ::-1])))
+
+    def test_describe_mismatch(self):
+        assertion = ImageEqualsAssertion(self.make_config("image_equals"))
+
+        self.assertEqual(assertion.describe_mismatch("not an image"), "Expected an image, got str")
+        self.assertEqual(assertion.describe_mismatch(self.frame[:10]), "Expected a 128x96 image, got 128x10")
+
+    def test_reference_is_shared_through_store(self):
+        first = ImageEqualsAssertion(self.make_config("image_equals"))
+        second = ImageSSIMAssertion(self.make_config("image_ssim"))
+
+        self.assertIs(first._reference, second._reference)
+        self.assertTrue((Path(self._tmp.name) / "code-tester" / "references").is_dir())
+
+    def test_missing_reference_raises(self):
+        with self.assertRaises(CodeTesterAssertionError):
+            ImageEqualsAssertion(ExpectConfig(assertion="image_equals", value="missing.png"))
+
+
+class TestImageExpectationInChecks(unittest.TestCase):
+    def setUp(self):
+        self.enterContext(patch.dict(os.environ, {"XDG_CACHE_HOME": self.enterContext(TemporaryDirectory())}))
+        logger = setup_logger(LogConfig(level=LogLevel.CRITICAL, console_enabled=False))
+        self.console = Console(logger, is_quiet=True)
+        self.container = DependencyContainer()
+        load_provider(BUILTIN_PLUGINS["image_assertions"]).register_components(self.container)
+        self.check_handler = CheckHandler(self.console, self.container)
+
+    def make_check(self):
+        return CheckConfig.model_validate({
+            "check_id": 1,
+            "name_for_output": "Frame",
+            "reason_for_output": "Frame differs",
+            "explain_for_error": "Explanation",
+            "spec": {
+                "perform": {"action": "call_function", "target": "draw"},
+                "expect": {"image": {"assertion": "image_equals", "value": make_frame().tolist()}},
+            },
+        })
+
+    def run_check(self, screenshot):
+        check = self.make_check()
+        action = Mock()
+        action.execute.return_value = ActionResult(screenshot=screenshot)
+        compiled = self.check_handler.compile_check(check)
+        return self.check_handler.execute_check(
+            check, Mock(spec=ExecutionEnvironment), ExecutionContext(), compiled=replace(compiled, action=action)
+        )
+
+    def test_screenshot_is_checked(self):
+        self.assertTrue(self.run_check(make_frame()).passed)
+
+    def test_failed_check_reports_difference(self):
+        frame = make_frame()
+        frame[3, 4] = (0, 0, 0)
+
+        result = self.run_check(frame)
+
+        self.assertFalse(result.passed)
+        self.assertTrue(result.error_message.startswith(
+            "Frame differs\nPixels differ in 1 of 3072 2x2 blocks, first at (x=4, y=3)"
+        ))
+
+    def test_references_are_stored_in_configured_directory(self):
+        store_dir = Path(self.enterContext(TemporaryDirectory())) / "references"
+        check_handler = CheckHandler(self.console, self.container, reference_store_dir=store_dir)
+
+        check_handler.compile_check(self.make_check())
+
+        self.assertTrue(any(store_dir.iterdir()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+import subprocess
+import sys
+import unittest
+from dataclasses import replace
+from unittest.mock import Mock
+
+import numpy as np
+
+from code_tester.config import CheckConfig, ExpectConfig
+from code_tester.core import DependencyContainer
+from code_tester.core.discovery import BUILTIN_PLUGINS, load_provider
+from code_tester.execution import CheckHandler, ExecutionContext, ExecutionEnvironment
+from code_tester.logging import Console, LogConfig, LogLevel, setup_logger
+from code_tester.plugins.core_actions import ActionResult
+from code_tester.plugins.numeric_assertions import (
+    AllCloseAssertion,
+    AllInRangeAssertion,
+    ElementwiseEqualsAssertion,
+)
+
+
+class TestAllCloseAssertion(unittest.TestCase):
+    def test_lists_tuples_and_arrays(self):
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=[1.0, 2.0, 3.0]))
+
+        self.assertTrue(assertion.check([1.0, 2.0, 3.0 + 1e-9]))
+        self.assertTrue(assertion.check((1, 2, 3)))
+        self.assertTrue(assertion.check(np.array([1.0, 2.0, 3.0])))
+        self.assertFalse(assertion.check([1.0, 2.0, 3.1]))
+
+    def test_tolerances(self):
+        config = ExpectConfig(assertion="all_close", value=[100.0], tolerance=0.0, rtol=0.01)
+        assertion = AllCloseAssertion(config)
+
+        self.assertTrue(assertion.check([100.9]))
+        self.assertFalse(assertion.check([101.1]))
+
+    def test_scalar_expected_broadcasts(self):
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=0.0, tolerance=1e-6))
+
+        self.assertTrue(assertion.check(np.zeros((100, 100))))
+        self.assertFalse(assertion.check(np.ones((2, 2))))
+
+    def test_shape_mismatch_fails(self):
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=[[1.0, 2.0]]))
+
+        self.assertFalse(assertion.check([1.0, 2.0]))
+        self.assertEqual(assertion.describe_mismatch([1.0, 2.0]), "Expected shape (1, 2), got (2,)")
+
+    def test_non_numeric_fails(self):
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=[1.0]))
+
+        self.assertFalse(assertion.check(["1.0"]))
+        self.assertFalse(assertion.check([[1.0], [1.0, 2.0]]))
+        self.assertFalse(assertion.check(None))
+
+    def test_reports_first_mismatching_indices(self):
+        expected = np.zeros((4, 4))
+        actual = expected.copy()
+        actual[0, 1] = 1.0
+        actual[2, 3] = 2.5
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=expected.tolist()))
+
+        self.assertEqual(
+            assertion.describe_mismatch(actual),
+            "2 of 16 elements differ, first at [0, 1]: 1.0 != 0.0; [2, 3]: 2.5 != 0.0",
+        )
+
+    def test_report_is_limited(self):
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=0.0))
+
+        details = assertion.describe_mismatch(np.arange(1, 1_000_001, dtype=float))
+
+        self.assertTrue(details.startswith("1000000 of 1000000 elements differ"))
+        self.assertEqual(details.count("!="), AllCloseAssertion.max_reported)
+
+    def test_matching_values_have_no_details(self):
+        assertion = AllCloseAssertion(ExpectConfig(assertion="all_close", value=[1.0]))
+
+        self.assertIsNone(assertion.describe_mismatch([1.0]))
+
+
+class TestAllInRangeAssertion(unittest.TestCase):
+    def test_range(self):
+        assertion = AllInRangeAssertion(ExpectConfig(assertion="all_in_range", value={"min": 0, "max": 1}))
+
+        self.assertTrue(assertion.check(np.linspace(0, 1, 1000)))
+        self.assertTrue(assertion.check([[0, 1], [0.5, 0.25]]))
+        self.assertFalse(assertion.check([0.5, 1.5]))
+        self.assertFalse(assertion.check([0.5, float("nan")]))
+
+    def test_invalid_range_fails(self):
+        assertion = AllInRangeAssertion(ExpectConfig(assertion="all_in_range", value={"min": 0}))
+
+        self.assertFalse(assertion.check([0.5]))
+        self.assertIn("not a valid array", assertion.describe_mismatch([0.5]))
+
+    def test_booleans_are_not_numbers(self):
+        assertion = AllInRangeAssertion(ExpectConfig(assertion="all_in_range", value={"min": 0, "max": 1}))
+
+        self.assertFalse(assertion.check([True, False]))
+
+    def test_reports_values_outside_range(self):
+        assertion = AllInRangeAssertion(ExpectConfig(assertion="all_in_range", value={"min": 0, "max": 1}))
+
+        self.assertEqual(
+            assertion.describe_mismatch([0.5, -1.0, 0.25]),
+            "1 of 3 elements differ, first at [1]: -1.0 not in [0, 1]",
+        )
+
+
+class TestElementwiseEqualsAssertion(unittest.TestCase):
+    def test_exact_by_default(self):
+        assertion = ElementwiseEqualsAssertion(ExpectConfig(assertion="elementwise_equals", value=[1, 2, 3]))
+
+        self.assertTrue(assertion.check(np.array([1, 2, 3])))
+        self.assertFalse(assertion.check([1.0, 2.0, 3.0 + 1e-12]))
+
+    def test_tolerances(self):
+        config = ExpectConfig(assertion="elementwise_equals", value=[1.0, 2.0], tolerance=1e-6)
+        assertion = ElementwiseEqualsAssertion(config)
+
+        self.assertTrue(assertion.check([1.0 + 1e-7, 2.0]))
+        self.assertFalse(assertion.check([1.0 + 1e-5, 2.0]))
+
+    def test_non_numeric_elements(self):
+        assertion = ElementwiseEqualsAssertion(ExpectConfig(assertion="elementwise_equals", value=["a", "b"]))
+
+        self.assertTrue(assertion.check(("a", "b")))
+        self.assertFalse(assertion.check(["a", "c"]))
+        self.assertEqual(assertion.describe_mismatch(["a", "c"]), "1 of 2 elements differ, first at [1]: 'c' != 'b'")
+
+
+class TestNumericAssertionsInChecks(unittest.TestCase):
+    def setUp(self):
+        logger = setup_logger(LogConfig(level=LogLevel.CRITICAL, console_enabled=False))
+        self.console = Console(logger, is_quiet=True)
+        container = DependencyContainer()
+        load_provider(BUILTIN_PLUGINS["numeric_assertions"]).register_components(container)
+        self.check_handler = CheckHandler(self.console, container)
+
+    def test_failed_check_reports_mismatches(self):
+        check = CheckConfig.model_validate({
+            "check_id": 1,
+            "name_for_output": "Solve",
+            "reason_for_output": "Wrong solution",
+            "explain_for_error": "Explanation",
+            "spec": {
+                "perform": {"action": "call_function", "target": "solve"},
+                "expect": {"return_value": {"assertion": "all_close", "value": [1.0, 2.0, 3.0]}},
+            },
+        })
+        action = Mock()
+        action.execute.return_value = ActionResult(return_value=np.array([1.0, 2.5, 3.0]))
+        compiled = self.check_handler.compile_check(check)
+
+        result = self.check_handler.execute_check(
+            check, Mock(spec=ExecutionEnvironment), ExecutionContext(),
+            compiled=replace(compiled, action=action),
+        )
+
+        self.assertFalse(result.passed)
+        self.assertEqual(result.error_message, "Wrong solution\n1 of 3 elements differ, first at [1]: 2.5 != 2.0")
+
+
+class TestNumericAssertionsProvider(unittest.TestCase):
+    def test_loading_does_not_import_numpy(self):
+        # The provider is loaded for every test type, numpy only for array assertions.
+        code = (
+            "import sys\n"
+            "from code_tester.core import DependencyContainer\n"
+            "from code_tester.core.discovery import BUILTIN_PLUGINS, load_provider\n"
+            "load_provider(BUILTIN_PLUGINS['numeric_assertions']).register_components(DependencyContainer())\n"
+            "print('numpy' in sys.modules)"
+        )
+
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        self.assertEqual(completed.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
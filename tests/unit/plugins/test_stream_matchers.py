@@ -0,0 +1,90 @@
+import unittest
+
+from code_tester.config import ExpectConfig
+from code_tester.plugins.core_assertions import EqualsAssertion
+from code_tester.plugins.stream_matchers import (
+    GoldenOutputStreamMatcher,
+    RegexLineStreamMatcher,
+    SubstringStreamMatcher,
+    is_line_scoped,
+)
+
+
+def feed_all(matcher, chunks):
+    for chunk in chunks:
+        matcher.feed(chunk)
+    return matcher.finish()
+
+
+class TestSubstringStreamMatcher(unittest.TestCase):
+    def test_match_across_chunk_boundary(self):
+        matcher = SubstringStreamMatcher("Hello")
+
+        matcher.feed("say He")
+        self.assertFalse(matcher.decided)
+        matcher.feed("llo!")
+
+        self.assertTrue(matcher.verdict)
+
+    def test_missing_substring_fails_on_finish(self):
+        self.assertFalse(feed_all(SubstringStreamMatcher("World"), ["Hello, ", "Wor", "ld"[:1]]))
+
+
+class TestRegexLineStreamMatcher(unittest.TestCase):
+    def test_line_is_matched_once_complete(self):
+        matcher = RegexLineStreamMatcher(r"^result: \d+$")
+
+        matcher.feed("result: 4")
+        self.assertFalse(matcher.decided)
+        matcher.feed("2\nmore")
+
+        self.assertTrue(matcher.verdict)
+
+    def test_last_line_without_newline_is_checked_on_finish(self):
+        self.assertTrue(feed_all(RegexLineStreamMatcher(r"done$"), ["work\n", "done"]))
+
+    def test_pattern_does_not_span_lines(self):
+        self.assertFalse(feed_all(RegexLineStreamMatcher(r"a\nb"), ["a\nb\n"]))
+
+
+class TestIsLineScoped(unittest.TestCase):
+    def test_patterns_within_a_line(self):
+        for pattern in [r"^result: \d+$", r"[^\n]+", r"\w+\b", r"(a|b)+(?=c)", r"(x)?y(?(1)z|w)", r"(?i)done"]:
+            with self.subTest(pattern=pattern):
+                self.assertTrue(is_line_scoped(pattern))
+
+    def test_patterns_crossing_lines(self):
+        for pattern in [r"a\nb", r"[^x]", r"a\sb", r"\D", r"[\x00-\x7f]", r"(?s:.)", r"\Aa", r"a(?!\s)", r"("]:
+            with self.subTest(pattern=pattern):
+                self.assertFalse(is_line_scoped(pattern))
+
+
+class TestGoldenOutputStreamMatcher(unittest.TestCase):
+    CASES = [
+        ("hello\nworld", "hello\nworld\n"),
+        ("hello\nworld", "  \nhello\nworld  \n\n"),
+        ("hello\nworld", "hello\nworld!\n"),
+        ("hello\nworld", "hello\n"),
+        ("hello", "hello world"),
+        ("", "\n\n"),
+        ("", "text"),
+    ]
+
+    def test_matches_equals_assertion_for_every_chunking(self):
+        for expected, output in self.CASES:
+            reference = EqualsAssertion(ExpectConfig(assertion="equals", value=expected)).check(output)
+            for split in range(len(output) + 1):
+                with self.subTest(expected=expected, output=output, split=split):
+                    matcher = GoldenOutputStreamMatcher(expected)
+                    self.assertEqual(feed_all(matcher, [output[:split], output[split:]]), reference)
+
+    def test_mismatch_is_decided_early(self):
+        matcher = GoldenOutputStreamMatcher("1\n2\n3")
+
+        matcher.feed("1\n3")
+
+        self.assertFalse(matcher.verdict)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
+from typing import Any, Dict, List, Optional, Union
+
 import pytest
 from pydantic import BaseModel
 
-from code_tester.utils import create_dataclass_from_dict, create_pydantic_from_dict
+from code_tester.utils import construct_pydantic_from_dict, create_dataclass_from_dict, create_pydantic_from_dict
 
 
 class TestHelpers:
@@ -76,4 +78,36 @@ class TestHelpers:
         result2 = create_pydantic_from_dict(Simple, data)
         
         assert result1.name == result2.name
-        assert type(result1) == type(result2)
\ No newline at end of file
+        assert type(result1) == type(result2)
+
+    def test_construct_pydantic_from_dict_rebuilds_nested_models(self):
+        class Item(BaseModel):
+            id: int
+
+        class Container(BaseModel):
+            items: Optional[List[Item]] = None
+            main: Optional[Item] = None
+            by_name: Dict[str, Item] = {}
+            target: Optional[Union[str, Dict[str, Any]]] = None
+
+        original = create_pydantic_from_dict(
+            Container, {"items": [{"id": 1}], "main": {"id": 2}, "by_name": {"a": {"id": 3}}, "target": {"x": 1}}
+        )
+        result = construct_pydantic_from_dict(Container, original.model_dump(exclude_unset=True))
+
+        assert result == original
+        assert isinstance(result.items[0], Item)
+        assert isinstance(result.main, Item)
+        assert isinstance(result.by_name["a"], Item)
+        assert result.target == {"x": 1}
+
+    def test_construct_pydantic_from_dict_skips_validation(self):
+        class Simple(BaseModel):
+            id: int
+            name: str = "default"
+
+        result = construct_pydantic_from_dict(Simple, {"id": "not validated"})
+
+        assert result.id == "not validated"
+        assert result.name == "default"
+        assert result.model_fields_set == {"id"}
@@ -0,0 +1,65 @@
+import gc
+from pathlib import Path
+
+import pytest
+
+from code_tester.config import BatchExecutor
+from code_tester.utils.exceptions import WorkerError
+from code_tester.workers import BatchRunner, collect_solutions, read_test_types
+
+SOLUTIONS_DIR = Path("tests/fixtures/solutions/py_general")
+TEST_CASES_DIR = Path("tests/fixtures/test_cases/py_general")
+
+
+class TestCollectSolutions:
+    def test_directory_lists_python_files(self):
+        solutions = collect_solutions(str(SOLUTIONS_DIR))
+
+        assert SOLUTIONS_DIR / "calculator.py" in solutions
+        assert solutions == sorted(solutions)
+
+    def test_glob_pattern(self):
+        solutions = collect_solutions(str(SOLUTIONS_DIR / "simple_*.py"))
+
+        assert all(path.name.startswith("simple_") for path in solutions)
+        assert len(solutions) > 1
+
+    def test_no_matches(self, tmp_path):
+        assert collect_solutions(str(tmp_path / "*.py")) == []
+
+
+class TestBatchRunner:
+    def teardown_method(self):
+        # The fork executor freezes the heap of the test process before forking workers.
+        gc.unfreeze()
+
+    def test_read_test_types(self):
+        test_types = read_test_types([TEST_CASES_DIR / "calculator_test.json", TEST_CASES_DIR / "function_tests.json"])
+
+        assert test_types == ["py_general"]
+
+    def test_make_jobs_pairs_every_solution_with_every_test_case(self):
+        jobs = BatchRunner.make_jobs([Path("a.py"), Path("b.py")], [Path("1.json"), Path("2.json")])
+
+        assert [(job.solution_path.name, job.test_case_path.name) for job in jobs] == [
+            ("a.py", "1.json"), ("a.py", "2.json"), ("b.py", "1.json"), ("b.py", "2.json"),
+        ]
+
+    def test_invalid_worker_count_raises(self):
+        with pytest.raises(WorkerError):
+            BatchRunner(max_workers=0)
+
+    @pytest.mark.parametrize("executor", [BatchExecutor.POOL, BatchExecutor.FORK])
+    def test_run_yields_result_for_every_job(self, executor):
+        runner = BatchRunner(max_workers=2, executor=executor, test_types=["py_general"])
+        jobs = runner.make_jobs(
+            [SOLUTIONS_DIR / "calculator.py", SOLUTIONS_DIR / "simple_functions.py"],
+            [TEST_CASES_DIR / "calculator_test.json"],
+        )
+
+        results = list(runner.run(jobs))
+
+        by_solution = {Path(result.solution_path).name: result for result in results}
+        assert len(results) == 2
+        assert by_solution["calculator.py"].passed is True
+        assert by_solution["simple_functions.py"].passed is False
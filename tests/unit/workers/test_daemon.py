@@ -0,0 +1,192 @@
+import gc
+import json
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from code_tester.execution.plan import get_plan_cache
+from code_tester.utils.exceptions import WorkerError
+from code_tester.workers import GradingDaemon, GradingJob, send_request, submit_job
+from code_tester.workers.job import INLINE_TEST_CASE_PATH
+
+SOLUTIONS_DIR = Path("tests/fixtures/solutions/py_general")
+TEST_CASES_DIR = Path("tests/fixtures/test_cases/py_general")
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 bytes, so avoid the long pytest tmp_path.
+    directory = tempfile.mkdtemp(prefix="ct-")
+    yield Path(directory) / "daemon.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def start_daemon(socket_path):
+    daemons = []
+
+    def start(**options):
+        daemon = GradingDaemon(socket_path, **options)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        assert daemon.wait_until_ready(timeout=30)
+        daemons.append((daemon, thread))
+        return daemon
+
+    yield start
+    for daemon, thread in daemons:
+        daemon.stop()
+        thread.join(timeout=5)
+
+
+@pytest.fixture
+def daemon(start_daemon):
+    return start_daemon()
+
+
+class TestGradingDaemon:
+    def teardown_method(self):
+        # Warming up freezes the heap of the test process before the first fork.
+        gc.unfreeze()
+
+    def test_grades_test_case_path(self, daemon):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json")
+
+        result = submit_job(daemon.socket_path, job, timeout=30)
+
+        assert result.passed is True
+        assert result.total_checks == 3
+        assert result.error is None
+
+    def test_grades_inline_test_case(self, daemon):
+        test_case = json.loads((TEST_CASES_DIR / "calculator_test.json").read_text("utf-8"))
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", INLINE_TEST_CASE_PATH, test_case_data=test_case)
+
+        result = submit_job(daemon.socket_path, job, timeout=30)
+
+        assert result.passed is True
+        assert result.test_case_path == str(INLINE_TEST_CASE_PATH)
+
+    def test_reuses_plugin_manager_between_jobs(self, daemon):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json")
+        plugin_manager = daemon._plugin_manager
+
+        submit_job(daemon.socket_path, job, timeout=30)
+        submit_job(daemon.socket_path, job, timeout=30)
+
+        assert daemon._plugin_manager is plugin_manager
+        assert send_request(daemon.socket_path, {"command": "ping"})["jobs_graded"] == 2
+
+    def test_warm_up_loads_plugins_of_served_test_types(self, start_daemon):
+        daemon = start_daemon(test_types=["py_general"])
+
+        assert daemon._plugin_manager.get_providers_for_test_type("py_general")
+
+    def test_test_cases_are_prepared_once_in_daemon(self, daemon):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json")
+        plan_cache = get_plan_cache(daemon._plugin_manager.container)
+
+        submit_job(daemon.socket_path, job, timeout=30)
+        submit_job(daemon.socket_path, job, timeout=30)
+
+        assert (plan_cache.misses, plan_cache.hits) == (1, 1)
+
+    def test_several_requests_on_one_connection(self, daemon):
+        request = {
+            "solution_path": str((SOLUTIONS_DIR / "calculator.py").resolve()),
+            "test_case_path": str((TEST_CASES_DIR / "calculator_test.json").resolve()),
+        }
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(daemon.socket_path))
+            with connection.makefile("rwb") as stream:
+                stream.write((json.dumps(request) + "\n" + json.dumps({"command": "ping"}) + "\n").encode())
+                stream.flush()
+                responses = [json.loads(stream.readline()) for _ in range(2)]
+
+        assert responses[0]["result"]["passed"] is True
+        assert responses[1]["jobs_graded"] == 1
+
+    def test_rejects_request_without_test_case(self, daemon):
+        with pytest.raises(WorkerError, match="test_case"):
+            send_request(daemon.socket_path, {"solution_path": "solution.py"})
+
+    def test_rejects_invalid_json(self, daemon):
+        response = daemon.handle_request(b"{not json")
+
+        assert response["ok"] is False
+        assert "JSONDecodeError" in response["error"]
+
+    def test_reports_load_error_in_result(self, daemon):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", INLINE_TEST_CASE_PATH, test_case_data={"checks": "x"})
+
+        result = submit_job(daemon.socket_path, job, timeout=30)
+
+        assert result.passed is False
+        assert result.error is not None
+
+    def test_survives_solution_that_exits(self, daemon, tmp_path):
+        solution = tmp_path / "exits.py"
+        solution.write_text("import sys\nsys.exit(3)\n", "utf-8")
+        job = GradingJob(solution, TEST_CASES_DIR / "calculator_test.json")
+
+        result = submit_job(daemon.socket_path, job, timeout=30)
+
+        assert result.passed is False
+        assert send_request(daemon.socket_path, {"command": "ping"}, timeout=5)["ok"] is True
+
+    def test_kills_job_after_timeout(self, start_daemon, tmp_path):
+        daemon = start_daemon(job_timeout=0.5)
+        solution = tmp_path / "hangs.py"
+        solution.write_text("while True:\n    pass\n", "utf-8")
+        job = GradingJob(solution, TEST_CASES_DIR / "calculator_test.json")
+
+        result = submit_job(daemon.socket_path, job, timeout=30)
+
+        assert result.passed is False
+        assert "timed out" in result.error
+        assert send_request(daemon.socket_path, {"command": "ping"}, timeout=5)["ok"] is True
+
+    def test_drops_silent_client(self, start_daemon):
+        daemon = start_daemon(client_timeout=0.2)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+            silent.connect(str(daemon.socket_path))
+            response = send_request(daemon.socket_path, {"command": "ping"}, timeout=5)
+
+        assert response["ok"] is True
+
+    def test_shutdown_removes_socket(self, socket_path):
+        daemon = GradingDaemon(socket_path)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        assert daemon.wait_until_ready(timeout=30)
+
+        send_request(socket_path, {"command": "shutdown"})
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+    def test_refuses_socket_of_running_daemon(self, daemon):
+        with pytest.raises(WorkerError, match="already listening"):
+            GradingDaemon(daemon.socket_path)._listen()
+
+    def test_replaces_stale_socket_file(self, socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(socket_path))
+
+        daemon = GradingDaemon(socket_path)
+        daemon._listen()
+        try:
+            assert daemon.wait_until_ready(timeout=0)
+        finally:
+            daemon._close()
+
+    def test_unreachable_daemon_raises(self, socket_path):
+        with pytest.raises(WorkerError, match="Cannot reach"):
+            send_request(socket_path, {"command": "ping"})
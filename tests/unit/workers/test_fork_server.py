@@ -0,0 +1,109 @@
+import gc
+import os
+from pathlib import Path
+
+import pytest
+
+from code_tester.utils.exceptions import WorkerError
+from code_tester.workers import ForkServer, GradingJob, preload_dependencies, run_grading_job
+
+SOLUTIONS_DIR = Path("tests/fixtures/solutions/py_general")
+TEST_CASES_DIR = Path("tests/fixtures/test_cases/py_general")
+
+
+class TestGradingJob:
+    def test_run_grading_job_success(self):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json")
+
+        result = run_grading_job(job)
+
+        assert result.passed is True
+        assert result.failed_check_ids == []
+        assert result.total_checks == 3
+        assert result.error is None
+
+    def test_run_grading_job_reports_load_error(self):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", Path("tests/fixtures/missing.json"))
+
+        result = run_grading_job(job)
+
+        assert result.passed is False
+        assert result.error is not None
+
+    def test_result_is_json_serializable(self):
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json")
+
+        data = run_grading_job(job).to_dict()
+
+        assert data["solution_path"] == str(job.solution_path)
+        assert data["passed"] is True
+
+
+class TestPreload:
+    def test_preload_skips_missing_modules(self, monkeypatch):
+        from code_tester.workers import fork_server
+
+        monkeypatch.setitem(fork_server.PRELOAD_MODULES, "api", ("definitely_missing_module",))
+
+        imported = preload_dependencies(["api"])
+
+        assert "code_tester.execution.tester" in imported
+        assert "definitely_missing_module" not in imported
+
+    def test_preload_unknown_test_type_raises(self):
+        with pytest.raises(WorkerError):
+            preload_dependencies(["unknown"])
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+class TestForkServer:
+    def teardown_method(self):
+        gc.unfreeze()
+
+    def test_preload_loads_plugins_inherited_by_children(self):
+        server = ForkServer(test_types=["py_general"])
+
+        server.preload()
+
+        providers = server.plugin_manager.get_providers_for_test_type("py_general")
+        assert {"core_actions", "core_assertions"} <= {provider.metadata.name for provider in providers}
+
+    def test_run_grades_job_in_child(self):
+        server = ForkServer(test_types=["py_general"])
+        job = GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json")
+
+        result = server.run(job)
+
+        assert result.passed is True
+        assert result.total_checks == 3
+
+    def test_imap_yields_result_for_every_job(self):
+        server = ForkServer(test_types=["py_general"])
+        jobs = [
+            GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json"),
+            GradingJob(SOLUTIONS_DIR / "simple_functions.py", TEST_CASES_DIR / "function_tests.json"),
+            GradingJob(SOLUTIONS_DIR / "syntax_error.py", TEST_CASES_DIR / "function_tests.json"),
+        ]
+
+        results = list(server.imap(jobs, max_workers=2))
+
+        by_solution = {Path(result.solution_path).name: result for result in results}
+        assert len(results) == 3
+        assert by_solution["calculator.py"].passed is True
+        assert by_solution["simple_functions.py"].passed is True
+        assert by_solution["syntax_error.py"].passed is False
+
+    def test_imap_reaps_children_when_consumer_stops_early(self):
+        server = ForkServer(test_types=["py_general"])
+        jobs = [
+            GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json"),
+            GradingJob(SOLUTIONS_DIR / "simple_functions.py", TEST_CASES_DIR / "function_tests.json"),
+            GradingJob(SOLUTIONS_DIR / "calculator.py", TEST_CASES_DIR / "calculator_test.json"),
+        ]
+
+        results = server.imap(jobs, max_workers=2)
+        next(results)
+        results.close()
+
+        with pytest.raises(ChildProcessError):
+            os.waitpid(-1, os.WNOHANG)